@@ -15,6 +15,19 @@ const WebSocket = require('ws');
 const bg = require('./background');
 const BackendConnector = require('./backend_connector');
 const { createMagpieState } = require('./magpie');
+const {
+  OVERLAY_PROTOCOL_ADVERTISEMENT,
+  OVERLAY_PROTOCOL_HELLO,
+  OVERLAY_BOXES_ACK,
+  WORD_BOXES_DELTA_V1,
+  createOverlayBoxDecoder,
+  isOverlayBoxFrame,
+} = require('./overlay_box_protocol');
+const {
+  BACKGROUND_TILES_V1,
+  createOverlayBackgroundState,
+  isOverlayBackgroundFrame,
+} = require('./overlay_background_protocol');
 const { JitenParseCache, postJitenSrs, DEFAULT_JITEN_PARSE_URL: JITEN_DEFAULT_PARSE_URL } = require('./jiten_cache');
 const { forceForegroundWindow } = require('./win_foreground');
 const {
@@ -2197,6 +2210,60 @@ function closeOverlayWebSocket(type, options = {}) {
   }
 }
 
+function negotiateOverlayBoxProtocol(socket, data) {
+  if (typeof data !== "string" || !data.includes(`"${OVERLAY_PROTOCOL_ADVERTISEMENT}"`)) {
+    return false;
+  }
+  let message;
+  try {
+    message = JSON.parse(data);
+  } catch (_error) {
+    return false;
+  }
+  if (!message || message.type !== OVERLAY_PROTOCOL_ADVERTISEMENT) {
+    return false;
+  }
+  const hello = { type: OVERLAY_PROTOCOL_HELLO };
+  if (Array.isArray(message.word_boxes) && message.word_boxes.includes(WORD_BOXES_DELTA_V1)) {
+    hello.word_boxes = WORD_BOXES_DELTA_V1;
+  }
+  if (Array.isArray(message.background) && message.background.includes(BACKGROUND_TILES_V1)) {
+    hello.background = BACKGROUND_TILES_V1;
+  }
+  if (hello.word_boxes || hello.background) {
+    socket.send(JSON.stringify(hello));
+  }
+  return true;
+}
+
+function handleOverlayBackgroundFrame(type, backgroundState, buffer) {
+  let picture;
+  try {
+    picture = backgroundState.apply(buffer);
+  } catch (e) {
+    console.warn(`[OverlayWS] Dropping malformed background frame on ${type}:`, e.message);
+    return;
+  }
+  if (mainWindow && !mainWindow.isDestroyed()) {
+    mainWindow.webContents.send("overlay-background-frame", picture);
+  }
+}
+
+function handleOverlayBoxFrame(type, socket, decoder, payload) {
+  let decoded;
+  try {
+    decoded = decoder.decode(Buffer.isBuffer(payload) ? payload : Buffer.from(payload));
+  } catch (e) {
+    console.warn(`[OverlayWS] Dropping malformed word-box frame on ${type}:`, e.message);
+    return;
+  }
+  // Unknown base version: ack 0 so the backend resends a full snapshot.
+  socket.send(JSON.stringify({ type: OVERLAY_BOXES_ACK, version: decoded ? decoded.version : 0 }));
+  if (decoded) {
+    publishOverlaySocketData(type, JSON.stringify(decoded.payload));
+  }
+}
+
 function connectOverlayWebSocket(type, url) {
   const state = overlayWebSockets[type];
   if (!state) {
@@ -2225,6 +2292,8 @@ function connectOverlayWebSocket(type, url) {
 
   console.log(`[OverlayWS] Connecting ${type} -> ${normalizedUrl}`);
   const socket = new WebSocket(normalizedUrl);
+  const boxDecoder = createOverlayBoxDecoder();
+  const backgroundState = createOverlayBackgroundState();
   state.socket = socket;
 
   socket.on("open", () => {
@@ -2233,10 +2302,19 @@ function connectOverlayWebSocket(type, url) {
     publishOverlaySocketState(type, true);
   });
 
-  socket.on("message", (payload) => {
+  socket.on("message", (payload, isBinary) => {
     if (state.socket !== socket) return;
+    if (isBinary || isOverlayBoxFrame(payload) || isOverlayBackgroundFrame(payload)) {
+      const buffer = Buffer.isBuffer(payload) ? payload : Buffer.from(payload);
+      if (isOverlayBackgroundFrame(buffer)) {
+        handleOverlayBackgroundFrame(type, backgroundState, buffer);
+      } else {
+        handleOverlayBoxFrame(type, socket, boxDecoder, buffer);
+      }
+      return;
+    }
     const data = Buffer.isBuffer(payload) ? payload.toString("utf8") : String(payload);
-    if (handleOverlayWebSocketControlMessage(type, data)) {
+    if (negotiateOverlayBoxProtocol(socket, data) || handleOverlayWebSocketControlMessage(type, data)) {
       return;
     }
     publishOverlaySocketData(type, data);
@@ -0,0 +1,97 @@
+// Parser for GSM's binary manual-mode background frames (see
+// GameSentenceMiner/web/overlay_background_protocol.py for the wire layout).
+// The main process keeps the latest JPEG for every tile so the renderer always
+// receives a complete tile set, even if it reloaded between frames.
+
+const BACKGROUND_TILES_V1 = "tiles-v1";
+
+const MAGIC = "GSMI";
+const PROTOCOL_VERSION = 1;
+const FLAG_KEYFRAME = 0x01;
+const HEADER_SIZE = 20;
+const TILE_HEADER_SIZE = 12;
+
+function isOverlayBackgroundFrame(buffer) {
+  return (
+    Buffer.isBuffer(buffer) &&
+    buffer.length >= HEADER_SIZE &&
+    buffer.toString("latin1", 0, 4) === MAGIC
+  );
+}
+
+function parseOverlayBackgroundFrame(buffer) {
+  if (!isOverlayBackgroundFrame(buffer) || buffer.readUInt8(4) !== PROTOCOL_VERSION) {
+    throw new Error("Not an overlay background frame");
+  }
+  const tileCount = buffer.readUInt16LE(6);
+  const frame = {
+    keyframe: (buffer.readUInt8(5) & FLAG_KEYFRAME) !== 0,
+    frameId: buffer.readUInt32LE(8),
+    baseFrameId: buffer.readUInt32LE(12),
+    width: buffer.readUInt16LE(16),
+    height: buffer.readUInt16LE(18),
+    tiles: [],
+  };
+  let offset = HEADER_SIZE;
+  for (let i = 0; i < tileCount; i++) {
+    const length = buffer.readUInt32LE(offset + 8);
+    const start = offset + TILE_HEADER_SIZE;
+    frame.tiles.push({
+      x: buffer.readUInt16LE(offset),
+      y: buffer.readUInt16LE(offset + 2),
+      width: buffer.readUInt16LE(offset + 4),
+      height: buffer.readUInt16LE(offset + 6),
+      jpeg: new Uint8Array(buffer.subarray(start, start + length)),
+    });
+    offset = start + length;
+  }
+  return frame;
+}
+
+function createOverlayBackgroundState() {
+  let frameId = 0;
+  let width = 0;
+  let height = 0;
+  let tiles = new Map();
+
+  // Returns the complete picture ({ frameId, width, height, tiles }) after applying the frame.
+  function apply(buffer) {
+    const frame = parseOverlayBackgroundFrame(buffer);
+    if (frame.keyframe || frame.width !== width || frame.height !== height) {
+      tiles = new Map();
+      width = frame.width;
+      height = frame.height;
+    } else if (frame.baseFrameId !== frameId) {
+      console.warn(`[OverlayBackground] Frame ${frame.frameId} expected base ${frame.baseFrameId}, have ${frameId}.`);
+    }
+    for (const tile of frame.tiles) {
+      if (frame.keyframe) {
+        tiles.set("key", tile);
+        continue;
+      }
+      tiles.set(`${tile.x},${tile.y}`, tile);
+    }
+    frameId = frame.frameId;
+    return { frameId, width, height, tiles: Array.from(tiles.values()) };
+  }
+
+  function reset() {
+    frameId = 0;
+    width = 0;
+    height = 0;
+    tiles = new Map();
+  }
+
+  return { apply, reset };
+}
+
+const exported = {
+  BACKGROUND_TILES_V1,
+  createOverlayBackgroundState,
+  isOverlayBackgroundFrame,
+  parseOverlayBackgroundFrame,
+};
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = exported;
+}
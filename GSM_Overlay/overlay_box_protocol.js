@@ -0,0 +1,146 @@
+// Decoder for GSM's delta-encoded word-box frames (see
+// GameSentenceMiner/web/overlay_box_protocol.py for the wire layout). Binary
+// frames are rebuilt into the same `word_coordinates` JSON the renderer has
+// always received, so only the socket layer knows about the protocol.
+
+const OVERLAY_PROTOCOL_ADVERTISEMENT = "overlay_protocol";
+const OVERLAY_PROTOCOL_HELLO = "overlay_protocol_hello";
+const OVERLAY_BOXES_ACK = "overlay_boxes_ack";
+const WORD_BOXES_DELTA_V1 = "delta-v1";
+
+const MAGIC = "GSMB";
+const PROTOCOL_VERSION = 1;
+const FLAG_SNAPSHOT = 0x01;
+const QUANT_SCALE = 16384;
+const RECT_KEYS = ["x1", "y1", "x2", "y2", "x3", "y3", "x4", "y4"];
+const HEADER_SIZE = 16;
+const RECT_SIZE = 16;
+const HISTORY_SIZE = 16;
+
+function isOverlayBoxFrame(buffer) {
+  return (
+    Buffer.isBuffer(buffer) &&
+    buffer.length >= HEADER_SIZE &&
+    buffer.toString("latin1", 0, 4) === MAGIC
+  );
+}
+
+function readRect(buffer, offset) {
+  const rect = [];
+  for (let i = 0; i < 8; i++) {
+    rect.push(buffer.readInt16LE(offset + i * 2));
+  }
+  return rect;
+}
+
+function dequantizeRect(rect) {
+  const result = {};
+  RECT_KEYS.forEach((key, index) => {
+    result[key] = rect[index] / QUANT_SCALE;
+  });
+  return result;
+}
+
+function createOverlayBoxDecoder(historySize = HISTORY_SIZE) {
+  const states = new Map();
+
+  // Returns { version, payload } or null when the frame's base is unknown (ack 0 to resync).
+  function decode(buffer) {
+    if (!isOverlayBoxFrame(buffer) || buffer.readUInt8(4) !== PROTOCOL_VERSION) {
+      throw new Error("Not an overlay box frame");
+    }
+    const flags = buffer.readUInt8(5);
+    const version = buffer.readUInt32LE(8);
+    const baseVersion = buffer.readUInt32LE(12);
+
+    let boxes;
+    if (flags & FLAG_SNAPSHOT) {
+      boxes = new Map();
+    } else if (states.has(baseVersion)) {
+      boxes = new Map(states.get(baseVersion));
+    } else {
+      return null;
+    }
+
+    let offset = HEADER_SIZE;
+    const metaLength = buffer.readUInt32LE(offset);
+    offset += 4;
+    const meta = JSON.parse(buffer.toString("utf8", offset, offset + metaLength));
+    offset += metaLength;
+
+    let count = buffer.readUInt32LE(offset);
+    offset += 4;
+    for (let i = 0; i < count; i++) {
+      boxes.delete(buffer.readUInt32LE(offset));
+      offset += 4;
+    }
+
+    count = buffer.readUInt32LE(offset);
+    offset += 4;
+    for (let i = 0; i < count; i++) {
+      const id = buffer.readUInt32LE(offset);
+      const textLength = buffer.readUInt16LE(offset + 5);
+      offset += 7;
+      const text = buffer.toString("utf8", offset, offset + textLength);
+      offset += textLength;
+      boxes.set(id, { text, rect: readRect(buffer, offset) });
+      offset += RECT_SIZE;
+    }
+
+    count = buffer.readUInt32LE(offset);
+    offset += 4;
+    for (let i = 0; i < count; i++) {
+      const id = buffer.readUInt32LE(offset);
+      const box = boxes.get(id);
+      if (box) {
+        boxes.set(id, { text: box.text, rect: readRect(buffer, offset + 4) });
+      }
+      offset += 4 + RECT_SIZE;
+    }
+
+    count = buffer.readUInt32LE(offset);
+    offset += 4;
+    const data = [];
+    for (let i = 0; i < count; i++) {
+      const line = boxes.get(buffer.readUInt32LE(offset));
+      const wordCount = buffer.readUInt16LE(offset + 4);
+      offset += 6;
+      const words = [];
+      for (let j = 0; j < wordCount; j++) {
+        const word = boxes.get(buffer.readUInt32LE(offset));
+        offset += 4;
+        if (word) {
+          words.push({ text: word.text, bounding_rect: dequantizeRect(word.rect) });
+        }
+      }
+      if (line) {
+        data.push({ text: line.text, bounding_rect: dequantizeRect(line.rect), words });
+      }
+    }
+
+    states.set(version, boxes);
+    while (states.size > historySize) {
+      states.delete(states.keys().next().value);
+    }
+    return { version, payload: { ...meta, data } };
+  }
+
+  function reset() {
+    states.clear();
+  }
+
+  return { decode, reset };
+}
+
+const exported = {
+  OVERLAY_PROTOCOL_ADVERTISEMENT,
+  OVERLAY_PROTOCOL_HELLO,
+  OVERLAY_BOXES_ACK,
+  WORD_BOXES_DELTA_V1,
+  createOverlayBoxDecoder,
+  isOverlayBoxFrame,
+};
+
+if (typeof module !== "undefined" && module.exports) {
+  module.exports = exported;
+}
@@ -26,6 +26,19 @@ def _get_ai_service_components():
     return AIService, snapshot_config
 
 
+_provider_registry = None
+
+
+def get_provider_registry():
+    """Provider clients are reused across requests instead of rebuilt per call."""
+    global _provider_registry
+    if _provider_registry is None:
+        from GameSentenceMiner.ai.registry import ProviderRegistry
+
+        _provider_registry = ProviderRegistry(logger)
+    return _provider_registry
+
+
 def _get_character_summary_service():
     from GameSentenceMiner.ai.features.character_summary import CharacterSummaryService
 
@@ -44,7 +57,7 @@ def get_ai_prompt_result(
         config = get_config()
         AIService, snapshot_config = _get_ai_service_components()
         snapshot = snapshot_config(config.ai, config.general)
-        service = AIService(config_snapshot=snapshot, logger=logger)
+        service = AIService(config_snapshot=snapshot, logger=logger, registry=get_provider_registry())
         return service.translate(
             lines=lines,
             sentence=sentence,
@@ -129,6 +142,6 @@ def generate_character_summary(character_data: dict) -> Optional[str]:
     AIService, snapshot_config = _get_ai_service_components()
     CharacterSummaryService = _get_character_summary_service()
     snapshot = snapshot_config(config.ai, config.general)
-    service = AIService(config_snapshot=snapshot, logger=logger)
+    service = AIService(config_snapshot=snapshot, logger=logger, registry=get_provider_registry())
     summary_service = CharacterSummaryService(logger=logger)
     return summary_service.generate_from_vndb(character_data, service)
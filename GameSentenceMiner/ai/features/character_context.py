@@ -8,7 +8,7 @@ class CharacterContextProvider:
         self.summary_service = summary_service
         self.logger = logger
 
-    def get_character_context(self, game_title: str, ai_service) -> str:
+    def get_character_context(self, game_title: str, ai_service, generate: bool = True) -> str:
         if not game_title:
             return ""
 
@@ -26,7 +26,7 @@ class CharacterContextProvider:
             if game.character_summary:
                 return game.character_summary
 
-            if game.vndb_character_data:
+            if generate and game.vndb_character_data:
                 try:
                     if isinstance(game.vndb_character_data, dict):
                         vndb_data = game.vndb_character_data
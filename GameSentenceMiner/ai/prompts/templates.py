@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+# Bump whenever a template below changes wording; cached translations are keyed on it.
+PROMPT_TEMPLATE_VERSION = "1"
+
 
 def build_translation_prompt(native_language_name: str) -> str:
     return f"""
@@ -13,6 +13,8 @@ class DeepLClient:
         self.logger = logger
         self.target_lang = target_lang or "EN"  # ← Use provided value or fallback to "EN"
         self.url = "https://api-free.deepl.com/v2/translate"
+        # Reused across calls so repeated translations skip the TLS handshake.
+        self.session = requests.Session()
 
     def generate(self, request: AIRequest) -> AIResponse:
         self.logger.debug("[DEEPL CLIENT] generate() CALLED")
@@ -56,7 +58,7 @@ class DeepLClient:
                 "Content-Type": "application/x-www-form-urlencoded",
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.url,
                 headers=headers,  # ← Move API key to header
                 data={
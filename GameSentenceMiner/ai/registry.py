@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import hashlib
+import threading
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from urllib.parse import urlparse
 
 from GameSentenceMiner.ai.providers.base import ProviderClient
@@ -47,6 +48,8 @@ class ProviderRegistry:
     def __init__(self, logger):
         self.logger = logger
         self._clients: Dict[ProviderKey, ProviderClient] = {}
+        # Speculative and prefetch workers share the registry; each key gets exactly one client.
+        self._lock = threading.Lock()
 
     def _build_key(self, provider: str, model: str, api_url: Optional[str], api_key: Optional[str]) -> ProviderKey:
         return ProviderKey(
@@ -56,29 +59,38 @@ class ProviderRegistry:
             api_key_fingerprint=_fingerprint_api_key(api_key),
         )
 
+    def _get_or_create(self, key: ProviderKey, create: Callable[[], ProviderClient]) -> ProviderClient:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = create()
+            return client
+
     def get_client(self, config: Ai) -> ProviderClient:
         if config.provider == AI_GEMINI:
             from GameSentenceMiner.ai.providers.gemini_client import GeminiClient
 
             key = self._build_key(config.provider, config.gemini_model, None, config.gemini_api_key)
-            if key not in self._clients:
-                self._clients[key] = GeminiClient(
+            return self._get_or_create(
+                key,
+                lambda: GeminiClient(
                     api_key=config.gemini_api_key,
                     model_name=config.gemini_model,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_GROQ:
             from GameSentenceMiner.ai.providers.groq_client import GroqClient
 
             key = self._build_key(config.provider, config.groq_model, None, config.groq_api_key)
-            if key not in self._clients:
-                self._clients[key] = GroqClient(
+            return self._get_or_create(
+                key,
+                lambda: GroqClient(
                     api_key=config.groq_api_key,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_OPENAI:
             from GameSentenceMiner.ai.providers.openai_client import OpenAIClient
@@ -89,13 +101,14 @@ class ProviderRegistry:
                 config.open_ai_url,
                 config.open_ai_api_key,
             )
-            if key not in self._clients:
-                self._clients[key] = OpenAIClient(
+            return self._get_or_create(
+                key,
+                lambda: OpenAIClient(
                     api_url=config.open_ai_url,
                     api_key=config.open_ai_api_key,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_GSM_CLOUD:
             from GameSentenceMiner.ai.providers.openai_client import OpenAIClient
@@ -108,24 +121,26 @@ class ProviderRegistry:
                 gsm_cloud_url,
                 config.gsm_cloud_access_token,
             )
-            if key not in self._clients:
-                self._clients[key] = OpenAIClient(
+            return self._get_or_create(
+                key,
+                lambda: OpenAIClient(
                     api_url=gsm_cloud_url,
                     api_key=config.gsm_cloud_access_token,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_OLLAMA:
             from GameSentenceMiner.ai.providers.ollama_client import OllamaClient
 
             key = self._build_key(config.provider, config.ollama_model, config.ollama_url, None)
-            if key not in self._clients:
-                self._clients[key] = OllamaClient(
+            return self._get_or_create(
+                key,
+                lambda: OllamaClient(
                     api_url=config.ollama_url,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_LM_STUDIO:
             from GameSentenceMiner.ai.providers.openai_client import OpenAIClient
@@ -136,31 +151,32 @@ class ProviderRegistry:
                 config.lm_studio_url,
                 config.lm_studio_api_key,
             )
-            if key not in self._clients:
-                self._clients[key] = OpenAIClient(
+            return self._get_or_create(
+                key,
+                lambda: OpenAIClient(
                     api_url=config.lm_studio_url,
                     api_key=config.lm_studio_api_key,
                     logger=self.logger,
-                )
-            return self._clients[key]
+                ),
+            )
 
         if config.provider == AI_DEEPL:
             from GameSentenceMiner.ai.providers.deepl_client import DeepLClient
 
             key = self._build_key(
                 config.provider,
-                "deepl",
+                f"deepl:{config.deepl_target_lang}",
                 None,
                 config.deepl_api_key,
             )
 
-            if key not in self._clients:
-                self._clients[key] = DeepLClient(
+            return self._get_or_create(
+                key,
+                lambda: DeepLClient(
                     api_key=config.deepl_api_key,
                     logger=self.logger,
                     target_lang=config.deepl_target_lang,  # ← Pass from config
-                )
-
-            return self._clients[key]
+                ),
+            )
 
         raise ValueError(f"Unsupported AI provider: {config.provider}")
@@ -0,0 +1,236 @@
+"""Latency-aware routing between a provider's primary and backup model.
+
+``AIService`` used to wait for the primary model to fail, including a full
+provider timeout, before trying the backup. ``ModelRouter`` keeps a short
+history of latencies and outcomes per ``(provider, model)`` and uses it two
+ways:
+
+* **Circuit breaking.** After ``failure_threshold`` consecutive failures, or
+  once the recent error rate reaches ``error_rate_threshold``, the model's
+  circuit opens and requests go straight to the backup. After
+  ``cooldown_seconds`` one probe request is let through (half-open). Its
+  outcome closes or re-opens the circuit.
+* **Hedging.** Once the primary has enough samples, a request still running
+  past the primary's p95 latency also starts on the backup. The first
+  successful answer wins.
+
+With no backup model configured, requests always go to the primary.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from GameSentenceMiner.ai.contracts import AIError, AIRequest, AIResponse
+
+LATENCY_HISTORY = 50
+OUTCOME_HISTORY = 20
+MIN_LATENCY_SAMPLES = 5
+FAILURE_THRESHOLD = 3
+ERROR_RATE_THRESHOLD = 0.5
+COOLDOWN_SECONDS = 30.0
+# Never hedge sooner than this, so ordinary jitter on fast models doesn't double spend.
+MIN_HEDGE_DELAY_SECONDS = 0.75
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class ModelHealth:
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_HISTORY)
+        self.outcomes: Deque[bool] = deque(maxlen=OUTCOME_HISTORY)
+        self.consecutive_failures = 0
+        self.state = CIRCUIT_CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for ok in self.outcomes if not ok) / len(self.outcomes)
+
+    def snapshot(self) -> dict:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "state": self.state,
+            "samples": len(self.latencies),
+            "p50_ms": round(p50 * 1000) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000) if p95 is not None else None,
+            "error_rate": round(self.error_rate(), 3),
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class ModelRouter:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        error_rate_threshold: float = ERROR_RATE_THRESHOLD,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        min_hedge_delay: float = MIN_HEDGE_DELAY_SECONDS,
+        max_workers: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+        logger=None,
+    ):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.error_rate_threshold = float(error_rate_threshold)
+        self.cooldown_seconds = float(cooldown_seconds)
+        self.min_hedge_delay = float(min_hedge_delay)
+        self._clock = clock
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._health: Dict[Tuple[str, str], ModelHealth] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(2, int(max_workers)), thread_name_prefix="gsm-ai-route")
+        self._stats = {"primary": 0, "backup_fallback": 0, "backup_circuit": 0, "hedged": 0, "hedge_wins": 0}
+
+    def _get_health(self, request: AIRequest) -> ModelHealth:
+        key = (request.provider, request.model)
+        health = self._health.get(key)
+        if health is None:
+            health = self._health[key] = ModelHealth()
+        return health
+
+    def _allow(self, request: AIRequest) -> bool:
+        """Whether the model's circuit lets this request through (claiming the half-open probe if so)."""
+        with self._lock:
+            health = self._get_health(request)
+            if health.state == CIRCUIT_CLOSED:
+                return True
+            if health.state == CIRCUIT_OPEN and self._clock() - health.opened_at >= self.cooldown_seconds:
+                health.state = CIRCUIT_HALF_OPEN
+            if health.state == CIRCUIT_HALF_OPEN and not health.probe_in_flight:
+                health.probe_in_flight = True
+                return True
+            return False
+
+    def _record(self, request: AIRequest, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            health = self._get_health(request)
+            health.outcomes.append(ok)
+            health.probe_in_flight = False
+            if ok:
+                health.latencies.append(elapsed)
+                health.consecutive_failures = 0
+                health.state = CIRCUIT_CLOSED
+                return
+            health.consecutive_failures += 1
+            tripped = health.consecutive_failures >= self.failure_threshold or (
+                len(health.outcomes) >= MIN_LATENCY_SAMPLES and health.error_rate() >= self.error_rate_threshold
+            )
+            if health.state == CIRCUIT_HALF_OPEN or tripped:
+                if health.state != CIRCUIT_OPEN and self.logger is not None:
+                    self.logger.warning(
+                        f"AI model '{request.model}' circuit opened after "
+                        f"{health.consecutive_failures} consecutive failures."
+                    )
+                health.state = CIRCUIT_OPEN
+                health.opened_at = self._clock()
+
+    def _call(self, call: Callable[[AIRequest], AIResponse], request: AIRequest) -> AIResponse:
+        started = self._clock()
+        try:
+            response = call(request)
+        except Exception:
+            self._record(request, self._clock() - started, ok=False)
+            raise
+        self._record(request, self._clock() - started, ok=True)
+        return response
+
+    def _hedge_delay(self, request: AIRequest) -> Optional[float]:
+        with self._lock:
+            p95 = self._get_health(request).percentile(0.95)
+        if p95 is None:
+            return None
+        return max(self.min_hedge_delay, p95)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def execute(
+        self,
+        request: AIRequest,
+        backup_request: Optional[AIRequest],
+        call: Callable[[AIRequest], AIResponse],
+    ) -> AIResponse:
+        """Run ``request``, routing to ``backup_request`` when the primary is failing, open or slow."""
+        if backup_request is None:
+            self._count("primary")
+            return self._call(call, request)
+
+        if not self._allow(request):
+            self._count("backup_circuit")
+            if self.logger is not None:
+                self.logger.info(f"AI model '{request.model}' circuit is open; using backup '{backup_request.model}'.")
+            return self._call(call, backup_request)
+
+        self._count("primary")
+        hedge_delay = self._hedge_delay(request)
+        primary: Optional[Future] = None
+        try:
+            if hedge_delay is None:
+                return self._call(call, request)
+            primary = self._executor.submit(self._call, call, request)
+            return primary.result(timeout=hedge_delay)
+        except AIError as primary_error:
+            if self.logger is not None:
+                self.logger.warning(
+                    f"Primary AI model failed ({request.model}). Retrying with backup model '{backup_request.model}'."
+                )
+            self._count("backup_fallback")
+            try:
+                return self._call(call, backup_request)
+            except AIError as backup_error:
+                if self.logger is not None:
+                    self.logger.error(
+                        f"Backup AI model '{backup_request.model}' also failed after primary model "
+                        f"'{request.model}': {backup_error}"
+                    )
+                raise primary_error
+        except FutureTimeoutError:
+            pass
+
+        if self.logger is not None:
+            self.logger.info(
+                f"AI model '{request.model}' exceeded its p95 ({hedge_delay * 1000:.0f} ms); "
+                f"hedging with backup '{backup_request.model}'."
+            )
+        self._count("hedged")
+        backup: Future = self._executor.submit(self._call, call, backup_request)
+        pending = {primary, backup}
+        hedged_primary_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is backup:
+                        self._count("hedge_wins")
+                    return future.result()
+                if future is primary:
+                    hedged_primary_error = error
+        raise hedged_primary_error if hedged_primary_error is not None else backup.exception()
+
+    def health_snapshot(self) -> dict:
+        with self._lock:
+            models = {f"{provider}/{model}": health.snapshot() for (provider, model), health in self._health.items()}
+            return {"models": models, **self._stats}
+
+
+model_router = ModelRouter()
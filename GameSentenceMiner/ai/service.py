@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
 import logging
 from dataclasses import dataclass
 from typing import List, Optional
@@ -12,6 +13,8 @@ from GameSentenceMiner.ai.features.character_summary import CharacterSummaryServ
 from GameSentenceMiner.ai.parsing.output_parser import OutputParser
 from GameSentenceMiner.ai.prompts.builder import PromptBuilder
 from GameSentenceMiner.ai.registry import ProviderRegistry
+from GameSentenceMiner.ai.routing import ModelRouter, model_router
+from GameSentenceMiner.ai.translation_cache import TranslationCache, configure_from_ai_config
 from GameSentenceMiner.util.config.configuration import (
     AI_GEMINI,
     AI_GROQ,
@@ -23,7 +26,7 @@ from GameSentenceMiner.util.config.configuration import (
     Ai,
     General,
 )
-from GameSentenceMiner.util.gsm_utils import is_connected
+from GameSentenceMiner.util.gsm_utils import is_connected_cached
 from GameSentenceMiner.util.text_log import GameLine
 
 
@@ -65,11 +68,17 @@ class AIService:
         logger,
         registry: Optional[ProviderRegistry] = None,
         output_parser: Optional[OutputParser] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        router: Optional[ModelRouter] = None,
     ):
         self.config_snapshot = config_snapshot
         self.logger = logger or logging.getLogger(__name__)
         self.registry = registry or ProviderRegistry(logger)
         self.output_parser = output_parser or OutputParser(compat_mode=True)
+        self.router = router or model_router
+        if self.router.logger is None:
+            self.router.logger = self.logger
+        self.translation_cache = translation_cache or configure_from_ai_config(config_snapshot.ai)
         self.prompt_builder = PromptBuilder(native_language_name=config_snapshot.general.get_native_language_name())
         self.character_summary_service = CharacterSummaryService(logger)
         self.character_context_provider = CharacterContextProvider(
@@ -126,15 +135,20 @@ class AIService:
         return ""
 
     def _ensure_connectivity(self) -> bool:
-        if _requires_internet(self.config_snapshot.ai) and not is_connected():
+        if _requires_internet(self.config_snapshot.ai) and not is_connected_cached():
             self.logger.error("No internet connection. Unable to proceed with AI prompt.")
             return False
         return True
 
     def _execute_request(self, request: AIRequest) -> AIResponse:
         client = self.registry.get_client(self.config_snapshot.ai)
-        try:
-            response = client.generate(request)
+        backup_model = self._get_backup_model_for_provider(self.config_snapshot.ai)
+        backup_request = None
+        if backup_model and backup_model != request.model:
+            backup_request = dataclasses.replace(request, model=backup_model)
+
+        def generate(routed_request: AIRequest) -> AIResponse:
+            response = client.generate(routed_request)
             parsed_text = self.output_parser.parse(response.raw_text)
             return AIResponse(
                 provider=response.provider,
@@ -144,46 +158,8 @@ class AIService:
                 latency_ms=response.latency_ms,
                 usage=response.usage,
             )
-        except AIError as primary_error:
-            backup_model = self._get_backup_model_for_provider(self.config_snapshot.ai)
-            if not backup_model or backup_model == request.model:
-                raise
 
-            self.logger.warning(
-                "Primary AI model failed (%s). Retrying with backup model '%s'.",
-                request.model,
-                backup_model,
-            )
-            backup_request = AIRequest(
-                provider=request.provider,
-                model=backup_model,
-                prompt=request.prompt,
-                temperature=request.temperature,
-                top_p=request.top_p,
-                max_tokens=request.max_tokens,
-                game_title=request.game_title,
-                request_kind=request.request_kind,
-                metadata=request.metadata,
-            )
-            try:
-                response = client.generate(backup_request)
-                parsed_text = self.output_parser.parse(response.raw_text)
-                return AIResponse(
-                    provider=response.provider,
-                    model=response.model,
-                    text=parsed_text,
-                    raw_text=response.raw_text,
-                    latency_ms=response.latency_ms,
-                    usage=response.usage,
-                )
-            except AIError as backup_error:
-                self.logger.error(
-                    "Backup AI model '%s' also failed after primary model '%s': %s",
-                    backup_model,
-                    request.model,
-                    backup_error,
-                )
-                raise primary_error
+        return self.router.execute(request, backup_request, generate)
 
     def translate(
         self,
@@ -199,42 +175,70 @@ class AIService:
             )
             return "Invalid input."
 
-        if not self._ensure_connectivity():
-            return ""
+        def build_request(character_context: str) -> AIRequest:
+            full_prompt, prompt_kind = self.prompt_builder.build(
+                lines=lines,
+                sentence=sentence,
+                current_line=current_line,
+                game_title=game_title,
+                dialogue_context_length=self.config_snapshot.ai.dialogue_context_length,
+                use_canned_translation_prompt=self.config_snapshot.ai.use_canned_translation_prompt,
+                use_canned_context_prompt=self.config_snapshot.ai.use_canned_context_prompt,
+                custom_prompt=self.config_snapshot.ai.custom_prompt,
+                custom_prompt_override=custom_prompt,
+                character_context=character_context,
+            )
+
+            self.logger.debug(f"DeepL Prompt being sent: {full_prompt[:500]}")
+
+            # NOTE:
+            # DeepL is now primarily handled directly in prefetch_ai_translation() (anki.py)
+            # to avoid going through the LLM prompt pipeline.
+            # This branch is kept for compatibility with other flows (e.g. manual translate).
 
+            if self.config_snapshot.ai.provider == AI_DEEPL:
+                # DeepL should only receive the raw sentence
+                prompt_to_send = sentence
+                self.logger.debug(f"SENTENCE SENT TO DEEPL: {sentence}")
+            else:
+                prompt_to_send = full_prompt
+
+            return self._make_request(prompt_to_send, request_kind=prompt_kind)
+
+        def cached_translation(request: AIRequest) -> Optional[str]:
+            cached = self.translation_cache.get(request)
+            if cached is not None:
+                self.logger.debug(f"AI translation cache hit for: {sentence[:50]}")
+                if current_line is not None:
+                    current_line.translation = cached
+            return cached
+
+        # Only a stored character summary is used before the cache lookup; generating
+        # one calls the AI, so it waits for a cache miss with connectivity confirmed.
         character_context = self.character_context_provider.get_character_context(
             game_title=game_title,
             ai_service=self,
+            generate=False,
         )
+        request = build_request(character_context)
+        cached = cached_translation(request)
+        if cached is not None:
+            return cached
 
-        full_prompt, prompt_kind = self.prompt_builder.build(
-            lines=lines,
-            sentence=sentence,
-            current_line=current_line,
-            game_title=game_title,
-            dialogue_context_length=self.config_snapshot.ai.dialogue_context_length,
-            use_canned_translation_prompt=self.config_snapshot.ai.use_canned_translation_prompt,
-            use_canned_context_prompt=self.config_snapshot.ai.use_canned_context_prompt,
-            custom_prompt=self.config_snapshot.ai.custom_prompt,
-            custom_prompt_override=custom_prompt,
-            character_context=character_context,
-        )
-
-        self.logger.debug(f"DeepL Prompt being sent: {full_prompt[:500]}")
-
-        # NOTE:
-        # DeepL is now primarily handled directly in prefetch_ai_translation() (anki.py)
-        # to avoid going through the LLM prompt pipeline.
-        # This branch is kept for compatibility with other flows (e.g. manual translate).
+        if not self._ensure_connectivity():
+            return ""
 
-        if self.config_snapshot.ai.provider == AI_DEEPL:
-            # DeepL should only receive the raw sentence
-            prompt_to_send = sentence
-            self.logger.debug(f"SENTENCE SENT TO DEEPL: {sentence}")
-        else:
-            prompt_to_send = full_prompt
+        if not character_context:
+            character_context = self.character_context_provider.get_character_context(
+                game_title=game_title,
+                ai_service=self,
+            )
+            if character_context:
+                request = build_request(character_context)
+                cached = cached_translation(request)
+                if cached is not None:
+                    return cached
 
-        request = self._make_request(prompt_to_send, request_kind=prompt_kind)
         try:
             response = self._execute_request(request)
 
@@ -250,6 +254,7 @@ class AIService:
                 self.logger.debug(f"Failed to set translation on current_line: {current_line}")
                 pass
 
+            self.translation_cache.put(request, response.text)
             return response.text
 
         except AIError as e:
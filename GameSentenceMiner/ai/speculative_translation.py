@@ -0,0 +1,208 @@
+"""Opt-in speculative translation of lines as they freeze.
+
+Card creation used to start the AI translation only once the card was being
+updated, so the user waited a full provider round-trip before the note was
+finalized. With ``speculative_translation_enabled`` every frozen text line is
+translated in the background as soon as the text pipeline finalizes it, and
+the result is stored on ``GameLine.translation``. The mining path then finds a
+ready translation, or waits on the in-flight request instead of issuing a
+second one.
+
+Work is bounded three ways:
+
+* at most ``max_concurrency`` requests run at once;
+* only the ``window_size`` most recent lines are kept; queued work for lines
+  that scroll out of that window is cancelled before it reaches the provider;
+* an estimated token budget per minute caps spend when text arrives quickly
+  (``estimate_tokens`` counts the line plus a fixed prompt overhead).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
+
+from GameSentenceMiner.util.config.configuration import get_config, logger
+from GameSentenceMiner.util.text_log import GameLine
+
+# Template, dialogue context and character context dominate a translation prompt.
+PROMPT_OVERHEAD_TOKENS = 400
+BUDGET_WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) + PROMPT_OVERHEAD_TOKENS
+
+
+class SpeculativeTranslator:
+    def __init__(
+        self,
+        translate: Callable[[GameLine], str],
+        *,
+        max_concurrency: int = 1,
+        window_size: int = 5,
+        tokens_per_minute: int = 20000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._translate = translate
+        self.window_size = max(1, int(window_size))
+        self.tokens_per_minute = max(0, int(tokens_per_minute))
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_concurrency)),
+            thread_name_prefix="gsm-ai-speculative",
+        )
+        self._lock = threading.Lock()
+        # line_id -> future, oldest first; doubles as the recent-line window.
+        self._jobs: OrderedDict[str, Future] = OrderedDict()
+        # line_id -> (submitted_at, estimated tokens) for the rolling budget.
+        self._spend: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "over_budget": 0,
+            "ready_hits": 0,
+            "waited_hits": 0,
+            "misses": 0,
+            "total_latency_ms": 0,
+        }
+
+    def _spent_tokens(self, now: float) -> int:
+        while self._spend:
+            _, (submitted_at, _) = next(iter(self._spend.items()))
+            if now - submitted_at < BUDGET_WINDOW_SECONDS:
+                break
+            self._spend.popitem(last=False)
+        return sum(tokens for _, tokens in self._spend.values())
+
+    def submit(self, line: GameLine) -> bool:
+        """Queue ``line`` for background translation; returns False when it was skipped."""
+        text = (line.text or "").strip()
+        if not text or line.translation:
+            return False
+        with self._lock:
+            if line.id in self._jobs:
+                return False
+            now = self._clock()
+            cost = estimate_tokens(text)
+            if self._spent_tokens(now) + cost > self.tokens_per_minute:
+                self._stats["over_budget"] += 1
+                return False
+            self._spend[line.id] = (now, cost)
+            self._jobs[line.id] = self._executor.submit(self._run, line)
+            self._stats["submitted"] += 1
+            while len(self._jobs) > self.window_size:
+                old_id, old_future = self._jobs.popitem(last=False)
+                if old_future.cancel():
+                    self._spend.pop(old_id, None)
+                    self._stats["cancelled"] += 1
+        return True
+
+    def _run(self, line: GameLine) -> str:
+        started = self._clock()
+        try:
+            translation = self._translate(line) or ""
+        except Exception as e:
+            logger.debug(f"Speculative translation failed for line {line.id}: {e}")
+            translation = ""
+        with self._lock:
+            if translation:
+                self._stats["completed"] += 1
+                self._stats["total_latency_ms"] += int((self._clock() - started) * 1000)
+            else:
+                self._stats["failed"] += 1
+        if translation and not line.translation:
+            line.translation = translation
+        return translation
+
+    def result_for(self, line: Optional[GameLine], timeout: float = 0.0) -> Optional[str]:
+        """Translation of ``line`` if speculation already has it, waiting up to ``timeout`` for in-flight work."""
+        if line is None:
+            return None
+        if line.translation:
+            with self._lock:
+                self._stats["ready_hits"] += 1
+            return line.translation
+        with self._lock:
+            future = self._jobs.get(line.id)
+        if future is None:
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        try:
+            translation = future.result(timeout=max(0.0, timeout)) or None
+        except (CancelledError, FutureTimeoutError):
+            translation = None
+        with self._lock:
+            self._stats["waited_hits" if translation else "misses"] += 1
+        return translation
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["in_window"] = len(self._jobs)
+            snapshot["tokens_in_budget_window"] = self._spent_tokens(self._clock())
+        completed = snapshot["completed"]
+        snapshot["avg_latency_ms"] = round(snapshot["total_latency_ms"] / completed) if completed else 0
+        return snapshot
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            for future in self._jobs.values():
+                future.cancel()
+            self._jobs.clear()
+            self._spend.clear()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _translate_with_configured_provider(line: GameLine) -> str:
+    from GameSentenceMiner import anki
+
+    return anki.translate_sentence_for_line(line.text, line)
+
+
+_translator: Optional[SpeculativeTranslator] = None
+_translator_settings: Optional[tuple] = None
+_translator_lock = threading.Lock()
+
+
+def get_speculative_translator() -> Optional[SpeculativeTranslator]:
+    """The shared translator for the current config, or None when speculation is off."""
+    global _translator, _translator_settings
+    ai_config = get_config().ai
+    if not ai_config.speculative_translation_enabled or not ai_config.is_configured():
+        return None
+    settings = (
+        ai_config.speculative_translation_concurrency,
+        ai_config.speculative_translation_window,
+        ai_config.speculative_translation_tokens_per_minute,
+    )
+    with _translator_lock:
+        if _translator is None or _translator_settings != settings:
+            if _translator is not None:
+                _translator.shutdown(wait=False)
+            _translator = SpeculativeTranslator(
+                _translate_with_configured_provider,
+                max_concurrency=settings[0],
+                window_size=settings[1],
+                tokens_per_minute=settings[2],
+            )
+            _translator_settings = settings
+        return _translator
+
+
+def submit_frozen_line(line: GameLine) -> bool:
+    translator = get_speculative_translator()
+    return translator.submit(line) if translator is not None else False
+
+
+def speculative_result_for(line: Optional[GameLine], timeout: float) -> Optional[str]:
+    with _translator_lock:
+        translator = _translator
+    return translator.result_for(line, timeout=timeout) if translator is not None else None
@@ -0,0 +1,143 @@
+"""Persistent cache of AI translation responses.
+
+Re-mining a line, reopening a dialog or hitting a duplicate line used to send
+the exact same prompt to the provider again. Responses are stored in SQLite
+(``AITranslationCacheTable``) under a fingerprint of the provider, model,
+prompt-template version, sampling settings and the prompt text, which already
+carries the sentence and its dialogue-context window. The same line mined twice
+with the same context therefore reuses one entry across cards.
+
+Entries expire after ``ttl_seconds`` and the table is trimmed to
+``max_entries`` by least-recent use. Only successful responses are stored, and
+any database error degrades to a miss so translation never depends on the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from GameSentenceMiner.ai.contracts import AIRequest
+from GameSentenceMiner.ai.prompts.templates import PROMPT_TEMPLATE_VERSION
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+# Trimming runs on every Nth store rather than on every write.
+EVICT_EVERY_STORES = 50
+
+
+def fingerprint(request: AIRequest, prompt_version: str = PROMPT_TEMPLATE_VERSION) -> str:
+    raw = "\x1f".join(
+        [
+            request.provider,
+            request.model,
+            prompt_version,
+            request.request_kind,
+            repr(request.temperature),
+            repr(request.top_p),
+            str(request.max_tokens),
+            request.prompt,
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+        logger=None,
+    ):
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = int(max_entries)
+        self.enabled = bool(enabled)
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evicted": 0, "errors": 0}
+        self._stores_since_evict = 0
+
+    def configure(self, ttl_seconds: float, max_entries: int, enabled: bool = True) -> None:
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = int(max_entries)
+        self.enabled = bool(enabled)
+
+    def _table(self):
+        from GameSentenceMiner.util.database.db import AITranslationCacheTable
+
+        return AITranslationCacheTable
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _report_error(self, action: str, error: Exception) -> None:
+        self._count("errors")
+        if self.logger is not None:
+            self.logger.debug(f"AI translation cache {action} failed: {error}")
+
+    def get(self, request: AIRequest) -> Optional[str]:
+        if not self.enabled:
+            return None
+        try:
+            translation = self._table().lookup(fingerprint(request), min_created_at=time.time() - self.ttl_seconds)
+        except Exception as e:
+            self._report_error("lookup", e)
+            return None
+        self._count("hits" if translation is not None else "misses")
+        return translation
+
+    def put(self, request: AIRequest, translation: str) -> None:
+        if not self.enabled or not translation:
+            return
+        try:
+            table = self._table()
+            table.store(
+                fingerprint(request),
+                provider=request.provider,
+                model=request.model,
+                prompt_version=PROMPT_TEMPLATE_VERSION,
+                translation=translation,
+            )
+            self._count("stores")
+            with self._lock:
+                self._stores_since_evict += 1
+                due = self._stores_since_evict >= EVICT_EVERY_STORES
+                if due:
+                    self._stores_since_evict = 0
+            if due:
+                self._count("evicted", table.evict(time.time() - self.ttl_seconds, self.max_entries))
+        except Exception as e:
+            self._report_error("store", e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round(snapshot["hits"] / lookups, 4) if lookups else 0.0
+        try:
+            snapshot["entries"] = self._table().count()
+        except Exception:
+            snapshot["entries"] = None
+        return snapshot
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+translation_cache = TranslationCache()
+
+
+def configure_from_ai_config(ai_config) -> TranslationCache:
+    """Apply the user's ``Ai`` cache settings to the shared cache and return it."""
+    translation_cache.configure(
+        ttl_seconds=max(0, int(getattr(ai_config, "translation_cache_ttl_days", 30))) * 24 * 60 * 60,
+        max_entries=max(0, int(getattr(ai_config, "translation_cache_max_entries", DEFAULT_MAX_ENTRIES))),
+        enabled=bool(getattr(ai_config, "translation_cache_enabled", True)),
+    )
+    return translation_cache
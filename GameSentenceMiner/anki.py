@@ -91,6 +91,8 @@ def _animated_screenshot_codec(settings) -> str:
 previous_note_ids = set()
 first_run = True
 card_queue = BoundedDeque(256, name="anki-media")
+# How long card creation waits on an in-flight speculative translation before asking the provider itself.
+SPECULATIVE_TRANSLATION_WAIT_SECONDS = 15.0
 translation_prefetch_executor = BoundedWorkPool("gsm-translation", max_workers=2, capacity=256)
 sentence_audio_cache = {}
 anki_beacon_note_queue: "Queue[Dict[str, Any]]" = Queue(maxsize=256)
@@ -1051,6 +1053,18 @@ def prefetch_ai_translation(sentence_to_translate: str, game_line: "GameLine") -
     if not sentence_to_translate:
         return ""
 
+    if game_line is not None and sentence_to_translate.strip() == (game_line.text or "").strip():
+        from GameSentenceMiner.ai.speculative_translation import speculative_result_for
+
+        speculative = speculative_result_for(game_line, timeout=SPECULATIVE_TRANSLATION_WAIT_SECONDS)
+        if speculative:
+            return speculative
+
+    return translate_sentence_for_line(sentence_to_translate, game_line)
+
+
+def translate_sentence_for_line(sentence_to_translate: str, game_line: "GameLine") -> str:
+    """Translate through the configured provider, storing the result on ``game_line``."""
     try:
         config = get_config()
         provider = config.ai.provider
@@ -1067,30 +1081,36 @@ def prefetch_ai_translation(sentence_to_translate: str, game_line: "GameLine") -
 
             logger.error(f"[PREFETCH] Calling DeepL for: {sentence_to_translate[:50]}")
 
-            from GameSentenceMiner.ai.providers.deepl_client import DeepLClient
+            from GameSentenceMiner.ai.ai_prompting import get_provider_registry
             from GameSentenceMiner.ai.contracts import AIRequest
-
-            client = DeepLClient(
-                api_key=config.ai.deepl_api_key, logger=logger, target_lang=config.ai.deepl_target_lang
+            from GameSentenceMiner.ai.translation_cache import configure_from_ai_config
+
+            request = AIRequest(
+                provider=AI_DEEPL,
+                model=f"deepl:{config.ai.deepl_target_lang}",
+                prompt=sentence_to_translate,
+                temperature=0.0,
+                top_p=1.0,
+                max_tokens=0,
+                game_title="",
+                request_kind="deepl_translation",
+                metadata=None,
             )
+            translation_cache = configure_from_ai_config(config.ai)
+            cached = translation_cache.get(request)
+            if cached is not None:
+                game_line.translation = cached
+                return cached
 
-            response = client.generate(
-                AIRequest(
-                    provider=AI_DEEPL,
-                    model="deepl",
-                    prompt=sentence_to_translate,
-                    temperature=0.0,
-                    top_p=1.0,
-                    max_tokens=0,
-                    game_title="",
-                    request_kind="deepl_translation",
-                    metadata=None,
-                )
-            )
+            # The shared registry keeps one DeepL client (and its HTTP session) per key/target language.
+            client = get_provider_registry().get_client(config.ai)
+
+            response = client.generate(request)
 
             logger.error(f"[PREFETCH] DeepL returned: {response.text}")
 
             game_line.translation = response.text
+            translation_cache.put(request, response.text)
             return response.text
 
         # LLM path (UNCHANGED)
@@ -1704,10 +1724,12 @@ def update_anki_card(
         gsm_state.videos_with_pending_operations.add(video_path)
 
         def cleanup_video():
-            if get_config().paths.remove_video and os.path.exists(video_path):
+            if get_config().paths.remove_video:
                 try:
-                    logger.debug(f"Removing source video after background processing: {video_path}")
-                    os.remove(video_path)
+                    if os.path.exists(video_path):
+                        logger.debug(f"Removing source video after background processing: {video_path}")
+                        os.remove(video_path)
+                    ffmpeg.remove_replay_index(video_path)
                 except Exception as e:
                     logger.exception(f"Error removing video file {video_path}: {e}")
             # Remove from pending operations set
@@ -1055,6 +1055,19 @@ def _project_text_domain_event(event: TextDomainEvent) -> None:
         and "nostatspls" not in line.scene.lower()
     ):
         _persist_game_line_async(replace(line, prev=None, next=None))
+    _submit_speculative_translation(line)
+
+
+def _submit_speculative_translation(line: GameLine) -> None:
+    """Start translating a finalized line early so card creation finds it ready (opt-in)."""
+    if not getattr(get_config().ai, "speculative_translation_enabled", False):
+        return
+    from GameSentenceMiner.ai.speculative_translation import submit_frozen_line
+
+    try:
+        submit_frozen_line(line)
+    except Exception as exc:
+        logger.debug(f"Could not queue speculative translation for {line.id}: {exc}")
 
 
 def _project_overlay_event(record: TextRecordSnapshot, line: GameLine) -> None:
@@ -873,10 +873,13 @@ class GSMApplication:
                 except Exception as e:
                     logger.error(f"Error stopping file watcher observer: {e}")
 
+            from GameSentenceMiner.util.media.replay_index import remove_replay_index
+
             for video in gsm_state.videos_to_remove:
                 try:
                     if os.path.exists(video):
                         os.remove(video)
+                    remove_replay_index(video)
                 except Exception as e:
                     logger.error(f"Error removing temporary video file {video}: {e}")
 
@@ -1,15 +1,20 @@
 # Copyright: Ren Tatsumoto <tatsu at autistici.org> and contributors
 # License: GNU AGPL, version 3 or later; http://www.gnu.org/licenses/agpl.html
 
+import atexit
 import functools
 import os
 import subprocess
+import threading
+from collections.abc import Sequence
 from typing import Optional
 
 try:
     from .mecab_exe_finder import IS_WIN, SUPPORT_DIR, find_executable
+    from .mecab_worker_pool import DEFAULT_WORKERS, MecabWorkerPool
 except ImportError:
     from mecab_exe_finder import IS_WIN, SUPPORT_DIR, find_executable
+    from mecab_worker_pool import DEFAULT_WORKERS, MecabWorkerPool
 
 INPUT_BUFFER_SIZE = str(819200)
 MECAB_RC_PATH = os.path.join(SUPPORT_DIR, "mecabrc")
@@ -66,6 +71,12 @@ def mecab_output_to_str(outs: bytes) -> str:
     return outs.rstrip(b"\r\n").decode("utf-8", "replace")
 
 
+def check_mecab_output(str_out: str) -> str:
+    if "tagger.cpp" in str_out and "no such file or directory" in str_out:
+        raise RuntimeError("Please ensure your Windows user name contains only English characters.")
+    return str_out
+
+
 def prepend_library_path() -> None:
     for library_path in ("DYLD_LIBRARY_PATH", "LD_LIBRARY_PATH"):
         try:
@@ -84,22 +95,45 @@ class BasicMecabController:
     ]
     _mecab_args: list[str] = []
     _verbose: bool
+    _persistent: bool
+    _workers: int
+    _pool: Optional[MecabWorkerPool]
 
     def __init__(
         self,
         mecab_cmd: Optional[list[str]] = None,
         mecab_args: Optional[list[str]] = None,
         verbose: bool = False,
+        persistent: bool = True,
+        workers: int = DEFAULT_WORKERS,
     ) -> None:
         super().__init__()
         check_mecab_rc()
         self._verbose = verbose
+        self._persistent = persistent
+        self._workers = workers
+        self._pool = None
+        self._pool_lock = threading.Lock()
         self._mecab_cmd = normalize_for_platform((mecab_cmd or self._mecab_cmd) + (mecab_args or self._mecab_args))
         prepend_library_path()
         if self._verbose:
             print("mecab cmd:", self._mecab_cmd)
 
     def run(self, expr: str) -> str:
+        if not self._persistent:
+            return self.run_once(expr)
+        return self.run_batch([expr])[0]
+
+    def run_batch(self, exprs: Sequence[str]) -> list[str]:
+        """Analyze every expression on a persistent mecab worker. Returns one output per expression."""
+        try:
+            outputs = self._worker_pool().run_batch(exprs)
+        except OSError:
+            raise Exception("Please ensure your Linux system has 64 bit binary support.")
+        return [check_mecab_output(mecab_output_to_str(outs)) for outs in outputs]
+
+    def run_once(self, expr: str) -> str:
+        """Analyze expr in a freshly spawned mecab process."""
         try:
             proc = subprocess.Popen(
                 self._mecab_cmd,
@@ -118,10 +152,29 @@ class BasicMecabController:
             proc.kill()
             outs, errs = proc.communicate()
 
-        str_out = mecab_output_to_str(outs)
-        if "tagger.cpp" in str_out and "no such file or directory" in str_out:
-            raise RuntimeError("Please ensure your Windows user name contains only English characters.")
-        return str_out
+        return check_mecab_output(mecab_output_to_str(outs))
+
+    def _worker_pool(self) -> MecabWorkerPool:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = MecabWorkerPool(
+                    self._mecab_cmd,
+                    size=self._workers,
+                    startupinfo=startup_info(),
+                    verbose=self._verbose,
+                )
+                atexit.register(self.close)
+            return self._pool
+
+    def worker_stats(self) -> Optional[dict]:
+        return self._pool.stats() if self._pool is not None else None
+
+    def close(self) -> None:
+        """Stop the persistent workers. The next call starts new ones."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
 
 
 def main():
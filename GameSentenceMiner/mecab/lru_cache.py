@@ -26,6 +26,9 @@ class LRUCache(Generic[K, V]):
         self._cache.move_to_end(key)
         return value
 
+    def __contains__(self, key: K) -> bool:
+        return key in self._cache
+
     def __setitem__(self, key: K, value: V) -> None:
         self._cache[key] = value
         self._cache.move_to_end(key)
@@ -79,16 +79,40 @@ class MecabController:
         except KeyError:
             return self._cache.setdefault(expr, tuple(self._translate(expr)))
 
+    def translate_batch(self, exprs: Sequence[str]) -> list[Sequence[MecabParsedToken]]:
+        """Like translate(), but streams every uncached expression through mecab in one go."""
+        results: dict[str, Optional[Sequence[MecabParsedToken]]] = {}
+        missing = []
+        for expr in exprs:
+            if expr in results:
+                continue
+            try:
+                results[expr] = self._cache[expr]
+            except KeyError:
+                results[expr] = None
+                missing.append(expr)
+        if missing:
+            outputs = self._mecab.run_batch([escape_text(expr) for expr in missing])
+            for expr, output in zip(missing, outputs):
+                results[expr] = self._cache.setdefault(expr, tuple(self._fix_output(output)))
+        return [results[expr] for expr in exprs]
+
     def _translate(self, expr: str) -> Iterable[MecabParsedToken]:
         """Analyzes expr with mecab. Fixes mecab's mistakes. Returns a parsed token for each word in expr."""
-        for token in replace_mistakes(self._analyze(expr)):
+        return self._fix_output(self._mecab.run(escape_text(expr)))
+
+    def _fix_output(self, output: str) -> Iterable[MecabParsedToken]:
+        for token in replace_mistakes(self._parse_output(output)):
             if self._verbose:
                 print(*dataclasses.astuple(token), sep="\t")
             yield token
 
     def _analyze(self, expr: str) -> Iterable[MecabParsedToken]:
         """Analyzes expr with mecab. Returns a parsed token for each word in expr."""
-        for section in self._mecab.run(escape_text(expr)).split(Separators.node):
+        return self._parse_output(self._mecab.run(escape_text(expr)))
+
+    def _parse_output(self, output: str) -> Iterable[MecabParsedToken]:
+        for section in output.split(Separators.node):
             if not section:
                 # ignore empty sections (can be at the end of a node)
                 continue
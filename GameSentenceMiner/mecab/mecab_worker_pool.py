@@ -0,0 +1,258 @@
+"""
+Long-lived MeCab processes shared by every caller.
+
+MeCab reads one sentence per input line and prints the analysis followed by its
+EOS format, so a single process can serve any number of requests over its
+pipes. Each worker gets a sentinel appended to the EOS format to frame its
+responses; a writer thread feeds stdin and a reader thread drains stdout, so a
+batch can be streamed in without the two pipes deadlocking. Workers that exit
+or stop answering within the timeout are killed and replaced on the next call.
+"""
+
+import queue
+import subprocess
+import threading
+from collections.abc import Sequence
+from typing import Optional
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_EOS_FORMAT = "EOS\\n"
+WORKER_EOS_SENTINEL = "<gsm_worker_eos>"
+_SENTINEL_BYTES = WORKER_EOS_SENTINEL.encode("ascii")
+
+
+def with_worker_eos(mecab_cmd: Sequence[str]) -> list[str]:
+    """
+    Return mecab_cmd with the worker sentinel appended to its (long form) --eos-format.
+    MeCab expands the escaped newline itself, so every response ends on a sentinel line.
+    """
+    eos_format = DEFAULT_EOS_FORMAT
+    cmd = []
+    for arg in mecab_cmd:
+        if arg.startswith("--eos-format="):
+            eos_format = arg[len("--eos-format=") :]
+        else:
+            cmd.append(arg)
+    return cmd + ["--eos-format=" + eos_format + WORKER_EOS_SENTINEL + "\\n"]
+
+
+def expr_to_lines(expr: str) -> list[bytes]:
+    """MeCab answers each input line separately; a multi-line expression becomes several requests."""
+    return [line + b"\n" for line in expr.encode("utf-8", "ignore").split(b"\n")]
+
+
+class WorkerFailed(Exception):
+    """A worker exited or timed out; carries the responses it did finish."""
+
+    def __init__(self, reason: str, completed: list[bytes], partial: bytes) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.completed = completed
+        self.partial = partial
+
+
+class MecabWorker:
+    def __init__(self, mecab_cmd: list[str], startupinfo=None) -> None:
+        self._proc = subprocess.Popen(
+            mecab_cmd,
+            bufsize=-1,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            startupinfo=startupinfo,
+        )
+        self._inbox: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+        self._outbox: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+        threading.Thread(target=self._feed, name="mecab-worker-stdin", daemon=True).start()
+        threading.Thread(target=self._drain, name="mecab-worker-stdout", daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        return self._proc.pid
+
+    def is_alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def _feed(self) -> None:
+        stdin = self._proc.stdin
+        try:
+            while (data := self._inbox.get()) is not None:
+                stdin.write(data)
+                if self._inbox.empty():
+                    stdin.flush()
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                stdin.close()
+            except (OSError, ValueError):
+                pass
+
+    def _drain(self) -> None:
+        try:
+            for line in iter(self._proc.stdout.readline, b""):
+                self._outbox.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._outbox.put(None)
+
+    def _read_response(self, timeout: float) -> tuple[Optional[str], bytes]:
+        """Collect output up to the next sentinel line. Returns (failure reason or None, output)."""
+        buf = bytearray()
+        while True:
+            try:
+                line = self._outbox.get(timeout=timeout)
+            except queue.Empty:
+                return "timed out", bytes(buf)
+            if line is None:
+                self._outbox.put(None)
+                return f"exited with code {self._proc.poll()}", bytes(buf)
+            body = line.rstrip(b"\r\n")
+            if body.endswith(_SENTINEL_BYTES):
+                buf += body[: -len(_SENTINEL_BYTES)]
+                return None, bytes(buf)
+            buf += line
+
+    def run(self, lines: Sequence[bytes], timeout: float) -> list[bytes]:
+        """Stream newline-terminated lines through the process and return one response per line."""
+        for line in lines:
+            self._inbox.put(line)
+        responses = []
+        for _ in lines:
+            failure, output = self._read_response(timeout)
+            if failure is not None:
+                raise WorkerFailed(failure, responses, output)
+            responses.append(output)
+        return responses
+
+    def kill(self) -> None:
+        self._inbox.put(None)
+        try:
+            self._proc.kill()
+            self._proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        if self._proc.stdout is not None:
+            try:
+                self._proc.stdout.close()
+            except (OSError, ValueError):
+                pass
+
+
+class MecabWorkerPool:
+    """
+    Hands requests to up to `size` persistent MeCab workers, starting them on demand.
+    Concurrent callers each lease a whole worker, so responses never interleave.
+    """
+
+    def __init__(
+        self,
+        mecab_cmd: Sequence[str],
+        size: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        startupinfo=None,
+        verbose: bool = False,
+    ) -> None:
+        self._mecab_cmd = with_worker_eos(mecab_cmd)
+        self._size = max(1, int(size))
+        self._timeout = timeout
+        self._startupinfo = startupinfo
+        self._verbose = verbose
+        self._idle: list[MecabWorker] = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"started": 0, "restarts": 0, "timeouts": 0, "requests": 0, "lines": 0}
+
+    def _acquire(self) -> MecabWorker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("MeCab worker pool is closed.")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.is_alive():
+                        return worker
+                    # Died while idle; its replacement isn't charged to any request.
+                    worker.kill()
+                    self._live -= 1
+                    self._stats["restarts"] += 1
+                if self._live < self._size:
+                    self._live += 1
+                    break
+                self._cond.wait()
+        try:
+            worker = MecabWorker(self._mecab_cmd, self._startupinfo)
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["started"] += 1
+        if self._verbose:
+            print("started mecab worker:", worker.pid)
+        return worker
+
+    def _release(self, worker: MecabWorker, healthy: bool) -> None:
+        with self._cond:
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append(worker)
+            else:
+                self._live -= 1
+            self._cond.notify()
+        if not keep:
+            worker.kill()
+
+    def run_lines(self, lines: Sequence[bytes]) -> list[bytes]:
+        """
+        Return MeCab's raw output for each newline-terminated line, in order.
+        A line that kills or hangs its worker gets whatever output it produced;
+        the remaining lines are resent to a fresh worker.
+        """
+        responses: list[bytes] = []
+        pending = list(lines)
+        with self._cond:
+            self._stats["requests"] += 1
+            self._stats["lines"] += len(pending)
+        while pending:
+            worker = self._acquire()
+            healthy = False
+            try:
+                responses.extend(worker.run(pending, self._timeout))
+                pending = []
+                healthy = True
+            except WorkerFailed as failure:
+                responses.extend(failure.completed)
+                responses.append(failure.partial)
+                pending = pending[len(failure.completed) + 1 :]
+                with self._cond:
+                    self._stats["restarts"] += 1
+                    self._stats["timeouts"] += failure.reason == "timed out"
+                if self._verbose:
+                    print(f"mecab worker {worker.pid} {failure.reason}; restarting")
+            finally:
+                self._release(worker, healthy)
+        return responses
+
+    def run_batch(self, exprs: Sequence[str]) -> list[bytes]:
+        """Return MeCab's raw output for each expression, streaming them all through one worker."""
+        lines_per_expr = [expr_to_lines(expr) for expr in exprs]
+        responses = iter(self.run_lines([line for lines in lines_per_expr for line in lines]))
+        return [b"".join(next(responses) for _ in lines) for lines in lines_per_expr]
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {**self._stats, "size": self._size, "live": self._live, "idle": len(self._idle)}
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.kill()
@@ -541,8 +541,16 @@ async def register_scene_change_callback(callback):
 # Screenshots
 # ---------------------------------------------------------------------------
 @with_obs_client(default=None, error_msg="Error getting screenshot")
-def get_screenshot(client: obs.ReqClient, compression=-1):
-    screenshot = os.path.join(configuration.get_temporary_directory(), make_unique_file_name("screenshot.png"))
+def get_screenshot(client: obs.ReqClient, compression=None):
+    # Card screenshots keep their pixels, so they use the lossless preset.
+    from GameSentenceMiner.obs.screenshot_capture import CAPTURE_FORMAT_LOSSLESS
+
+    img_format = CAPTURE_FORMAT_LOSSLESS.img_format
+    if compression is None:
+        compression = CAPTURE_FORMAT_LOSSLESS.compression
+    screenshot = os.path.join(
+        configuration.get_temporary_directory(), make_unique_file_name(f"screenshot.{img_format}")
+    )
     update_current_game()
     if not configuration.current_game:
         logger.error("No active game scene found.")
@@ -558,7 +566,7 @@ def get_screenshot(client: obs.ReqClient, compression=-1):
     logger.debug(f"Current source name: {current_source_name}")
     client.save_source_screenshot(
         name=current_source_name,
-        img_format="png",
+        img_format=img_format,
         width=None,
         height=None,
         file_path=screenshot,
@@ -597,13 +605,14 @@ def get_screenshot_base64(client, compression=75, width=None, height=None):
 
 def get_screenshot_PIL_from_source(
     source_name,
-    compression=75,
-    img_format="png",
+    compression=90,
+    img_format="jpg",
     width=None,
     height=None,
     retry=3,
     force_obs=False,
     capture_fps=None,
+    max_age_ms=None,
 ):
     from GameSentenceMiner.obs.screenshot_capture import screenshot_capture
 
@@ -616,6 +625,7 @@ def get_screenshot_PIL_from_source(
         retry=retry,
         force_obs=force_obs,
         capture_fps=capture_fps,
+        max_age_ms=max_age_ms,
     )
 
 
@@ -683,6 +693,7 @@ def get_screenshot_PIL(
     suppress_errors=False,
     force_obs=False,
     capture_fps=None,
+    max_age_ms=None,
 ):
     import GameSentenceMiner.obs as _obs_pkg
 
@@ -707,6 +718,7 @@ def get_screenshot_PIL(
             retry,
             force_obs=force_obs,
             capture_fps=capture_fps,
+            max_age_ms=max_age_ms,
         )
         img = _apply_ocr_preprocessing(img, preprocess_mode=preprocess_mode, grayscale=grayscale)
         return img
@@ -755,6 +767,7 @@ def get_screenshot_PIL(
                 retry,
                 force_obs=force_obs,
                 capture_fps=capture_fps,
+                max_age_ms=max_age_ms,
             )
             if not img:
                 return None
@@ -777,6 +790,7 @@ def get_screenshot_PIL(
             retry,
             force_obs=force_obs,
             capture_fps=capture_fps,
+            max_age_ms=max_age_ms,
         )
         img = _apply_ocr_preprocessing(img, preprocess_mode=preprocess_mode, grayscale=grayscale)
         return img
@@ -795,6 +809,7 @@ def get_screenshot_PIL(
             retry,
             force_obs=force_obs,
             capture_fps=capture_fps,
+            max_age_ms=max_age_ms,
         )
 
         if not img:
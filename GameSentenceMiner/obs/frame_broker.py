@@ -0,0 +1,187 @@
+"""Share recently captured frames between screenshot consumers.
+
+Within one process, several threads (e.g. the overlay loop, manual background
+captures and card screenshots in the main process) ask ``ScreenshotCapture``
+for the same source within a few hundred milliseconds of each other, and every
+call used to cost a full OBS ``GetSourceScreenshot`` round-trip plus a
+base64/PNG decode (or a WGC frame conversion).
+
+The broker lives in process memory, so it only deduplicates captures within
+one process. The OCR subprocess has its own broker: OCR and the overlay still
+capture separately.
+
+``FrameBroker`` keeps the latest decoded frame per ``(source, backend, format,
+quality)`` together with its capture time and the size it was requested at.
+A caller that passes ``max_age_ms`` gets that frame back (downscaled if it
+asked for a smaller size) instead of triggering a new capture, and callers
+that arrive while a capture for the same key is already running wait for it
+rather than starting their own. Callers that don't pass ``max_age_ms`` always
+capture, but their frames are still published for everyone else.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+from PIL import Image
+
+# Default freshness for callers that poll a source continuously (OCR, overlay).
+SHARED_FRAME_MAX_AGE_MS = 100
+
+
+def _resolve_size(
+    source_size: tuple[int, int],
+    width: Optional[int],
+    height: Optional[int],
+) -> tuple[int, int]:
+    source_width, source_height = source_size
+    if not width and not height:
+        return source_width, source_height
+    target_width = width or max(1, int(source_width * (height / source_height)))
+    target_height = height or max(1, int(source_height * (width / source_width)))
+    return int(target_width), int(target_height)
+
+
+@dataclass
+class _Frame:
+    image: Image.Image
+    captured_at: float
+    requested_size: tuple[Optional[int], Optional[int]]
+
+    @property
+    def is_native(self) -> bool:
+        return not self.requested_size[0] and not self.requested_size[1]
+
+    def age_ms(self, now: float) -> float:
+        return (now - self.captured_at) * 1000
+
+    def can_serve(self, width: Optional[int], height: Optional[int]) -> bool:
+        if not width and not height:
+            return self.is_native
+        if self.requested_size == (width, height):
+            return True
+        target_width, target_height = _resolve_size(self.image.size, width, height)
+        # Never upscale: a downscaled frame can't stand in for a larger request.
+        return target_width <= self.image.width and target_height <= self.image.height
+
+    def render(self, width: Optional[int], height: Optional[int]) -> Image.Image:
+        target = _resolve_size(self.image.size, width, height)
+        if target == self.image.size:
+            # Callers own the image they get back; don't hand out the shared one.
+            return self.image.copy()
+        return self.image.resize(target, Image.LANCZOS)
+
+
+class FrameBroker:
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._frames: dict[Hashable, _Frame] = {}
+        self._in_flight: dict[Hashable, tuple[tuple[Optional[int], Optional[int]], Future]] = {}
+        self._stats = {
+            "requests": 0,
+            "captures": 0,
+            "cache_hits": 0,
+            "shared_captures": 0,
+        }
+
+    def get_frame(
+        self,
+        key: Hashable,
+        capture_fn: Callable[[], Any],
+        *,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        max_age_ms: Optional[float] = None,
+    ) -> Any:
+        """Return a frame for ``key`` no older than ``max_age_ms``.
+
+        ``capture_fn`` performs the real capture at ``width`` x ``height`` and
+        returns a PIL image or ``None``. Without ``max_age_ms`` it is always
+        called; the result is published either way.
+        """
+        if max_age_ms is None:
+            with self._lock:
+                self._stats["requests"] += 1
+            return self._capture(key, capture_fn, (width, height))
+
+        while True:
+            with self._lock:
+                frame = self._frames.get(key)
+                if (
+                    frame is not None
+                    and frame.age_ms(self._clock()) <= max_age_ms
+                    and frame.can_serve(width, height)
+                ):
+                    self._stats["requests"] += 1
+                    self._stats["cache_hits"] += 1
+                    return frame.render(width, height)
+                pending = self._in_flight.get(key)
+                if pending is None or not self._pending_can_serve(pending[0], width, height):
+                    self._stats["requests"] += 1
+                    break
+                future = pending[1]
+            # Another caller is already capturing this key; share its result.
+            image = future.result()
+            with self._lock:
+                frame = self._frames.get(key)
+                if image is not None and frame is not None and frame.image is image and frame.can_serve(width, height):
+                    self._stats["requests"] += 1
+                    self._stats["shared_captures"] += 1
+                    return frame.render(width, height)
+            # The shared capture failed or doesn't fit; retry with our own.
+
+        return self._capture(key, capture_fn, (width, height))
+
+    @staticmethod
+    def _pending_can_serve(
+        pending_size: tuple[Optional[int], Optional[int]],
+        width: Optional[int],
+        height: Optional[int],
+    ) -> bool:
+        if not pending_size[0] and not pending_size[1]:
+            return True
+        return pending_size == (width, height)
+
+    def _capture(self, key: Hashable, capture_fn: Callable[[], Any], requested_size) -> Any:
+        future: Future = Future()
+        with self._lock:
+            owns_slot = key not in self._in_flight
+            if owns_slot:
+                self._in_flight[key] = (requested_size, future)
+            self._stats["captures"] += 1
+        published = None
+        try:
+            image = capture_fn()
+            if image is not None:
+                # The capturing caller owns the image it gets back; publish a copy of it.
+                published = image.copy()
+                with self._lock:
+                    self._frames[key] = _Frame(
+                        image=published, captured_at=self._clock(), requested_size=requested_size
+                    )
+            return image
+        finally:
+            with self._lock:
+                if owns_slot:
+                    self._in_flight.pop(key, None)
+            future.set_result(published)
+
+    def invalidate(self, source_name: Optional[str] = None) -> None:
+        """Drop cached frames (for one source, or all of them)."""
+        with self._lock:
+            if source_name is None:
+                self._frames.clear()
+                return
+            for key in [key for key in self._frames if isinstance(key, tuple) and key[:1] == (source_name,)]:
+                self._frames.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["saved"] = snapshot["cache_hits"] + snapshot["shared_captures"]
+        return snapshot
@@ -8,6 +8,10 @@ The ScreenshotCapture singleton chooses a backend from the advanced config:
 Public API (drop-in replacement for get_screenshot_PIL_from_source):
     from GameSentenceMiner.obs.screenshot_capture import screenshot_capture
     img = screenshot_capture.capture(source_name, ...)
+
+Every successful capture is published to the process's ``FrameBroker``;
+callers in the same process that pass ``max_age_ms`` reuse a recent frame (or
+an in-flight capture) instead of issuing another OBS request.
 """
 
 from __future__ import annotations
@@ -17,11 +21,13 @@ import ctypes
 import io
 import threading
 import time
+from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
 from PIL import Image
 
+from GameSentenceMiner.obs.frame_broker import FrameBroker
 from GameSentenceMiner.util.config.configuration import (
     DEFAULT_MAIN_WGC_CAPTURE_FPS,
     SCREENSHOT_CAPTURE_BACKEND_AUTO,
@@ -73,6 +79,96 @@ def _resolve_output_size(
     return target_width, target_height
 
 
+# ---------------------------------------------------------------------------
+# OBS websocket capture formats and decoding
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CaptureFormat:
+    """Image format/quality OBS encodes a ``GetSourceScreenshot`` response with."""
+
+    img_format: str
+    compression: int
+
+
+# Cheapest acceptable encoding per consumer. PNG is only worth its encode/decode
+# cost where the pixels are kept (e.g. card screenshots); change detection and
+# OCR frames are thrown away after one look.
+CAPTURE_FORMAT_CHANGE_DETECTION = CaptureFormat("jpg", 50)
+CAPTURE_FORMAT_OCR = CaptureFormat("jpg", 90)
+CAPTURE_FORMAT_LOSSLESS = CaptureFormat("png", -1)
+
+_JPEG_MAGIC = b"\xff\xd8"
+_PNG_MAGIC = b"\x89PNG"
+_simplejpeg = None
+_simplejpeg_checked = False
+
+
+def _get_simplejpeg():
+    global _simplejpeg, _simplejpeg_checked
+    if not _simplejpeg_checked:
+        _simplejpeg_checked = True
+        try:
+            import simplejpeg
+
+            _simplejpeg = simplejpeg
+        except ImportError:
+            _simplejpeg = None
+    return _simplejpeg
+
+
+def screenshot_decoder_name(img_format: str) -> str:
+    """Name of the decoder ``decode_screenshot_data`` will use for ``img_format``."""
+    fmt = str(img_format or "").lower()
+    if fmt in ("jpg", "jpeg") and _get_simplejpeg() is not None:
+        return "simplejpeg"
+    if fmt == "png":
+        return "opencv"
+    return "pillow"
+
+
+def _decode_png_opencv(data: bytes) -> Optional[Image.Image]:
+    try:
+        import cv2
+    except ImportError:
+        return None
+    buf = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    if buf is None or buf.dtype != np.uint8:
+        return None
+    if buf.ndim == 2:
+        return Image.fromarray(buf)
+    if buf.shape[2] == 4:
+        return Image.fromarray(cv2.cvtColor(buf, cv2.COLOR_BGRA2RGBA))
+    return Image.fromarray(cv2.cvtColor(buf, cv2.COLOR_BGR2RGB))
+
+
+def decode_screenshot_data(image_data: str) -> Image.Image:
+    """Decode a ``GetSourceScreenshot`` payload (optionally a data URL) into a loaded PIL image.
+
+    JPEG goes through simplejpeg when it is installed and PNG through OpenCV,
+    both noticeably faster than Pillow for full frames; anything else, or a
+    fast-path failure, falls back to Pillow.
+    """
+    comma = image_data.find(",", 0, 64)
+    data = base64.b64decode(image_data[comma + 1 :] if comma >= 0 else image_data)
+
+    img = None
+    try:
+        if data.startswith(_JPEG_MAGIC) and _get_simplejpeg() is not None:
+            img = Image.fromarray(_simplejpeg.decode_jpeg(data, colorspace="RGB"))
+        elif data.startswith(_PNG_MAGIC):
+            img = _decode_png_opencv(data)
+    except Exception as e:
+        logger.debug(f"ScreenshotCapture: fast decode failed, falling back to Pillow: {e}")
+        img = None
+    if img is None:
+        img = Image.open(io.BytesIO(data))
+        # Decode now so capture timings (and callers' threads) own the cost.
+        img.load()
+    return img
+
+
 class WinGraphicsCaptureUnavailable(RuntimeError):
     pass
 
@@ -409,6 +505,7 @@ class ScreenshotCapture:
         self._wgc_failed_count: int = 0
         # After N consecutive WGC failures, stop trying until next HWND refresh.
         self._wgc_max_consecutive_failures: int = 3
+        self.frame_broker = FrameBroker()
 
     # ------------------------------------------------------------------
     # Public API
@@ -417,16 +514,21 @@ class ScreenshotCapture:
     def capture(
         self,
         source_name: str,
-        compression: int = 75,
-        img_format: str = "png",
+        compression: int = CAPTURE_FORMAT_OCR.compression,
+        img_format: str = CAPTURE_FORMAT_OCR.img_format,
         width: Optional[int] = None,
         height: Optional[int] = None,
         retry: int = 3,
         force_obs: bool = False,
         capture_fps: Optional[int] = None,
+        max_age_ms: Optional[float] = None,
     ):
         """Capture a screenshot from the given OBS source, using WGC when possible.
 
+        With ``max_age_ms`` a frame of this source captured with the same backend
+        at most that long ago (by any caller in this process) is returned instead
+        of capturing again.
+
         Returns a PIL Image or None on failure.
         """
         if not source_name:
@@ -434,7 +536,19 @@ class ScreenshotCapture:
             return None
 
         capture_backend = SCREENSHOT_CAPTURE_BACKEND_OBS if force_obs else self._get_configured_capture_backend()
+        return self.frame_broker.get_frame(
+            (source_name, capture_backend, img_format, compression),
+            lambda: self._capture_uncached(
+                source_name, compression, img_format, width, height, retry, capture_backend, capture_fps
+            ),
+            width=width,
+            height=height,
+            max_age_ms=max_age_ms,
+        )
 
+    def _capture_uncached(
+        self, source_name, compression, img_format, width, height, retry, capture_backend, capture_fps
+    ):
         # Try WGC first on Windows unless the profile is configured for OBS.
         if capture_backend != SCREENSHOT_CAPTURE_BACKEND_OBS and self._should_use_wgc(source_name):
             fps = self._get_configured_wgc_fps() if capture_fps is None else capture_fps
@@ -456,6 +570,7 @@ class ScreenshotCapture:
         self._hwnd_timestamp = 0.0
         self._hwnd_source_name = None
         self._wgc_failed_count = 0
+        self.frame_broker.invalidate()
 
     # ------------------------------------------------------------------
     # Windows Graphics Capture
@@ -686,8 +801,6 @@ class ScreenshotCapture:
         """Capture via OBS websocket — the original method."""
         from GameSentenceMiner.obs.service import _call_with_obs_client
 
-        from PIL import Image
-
         def _capture(client):
             response = client.get_source_screenshot(
                 name=source_name,
@@ -698,10 +811,7 @@ class ScreenshotCapture:
             )
             if not response or not hasattr(response, "image_data") or not response.image_data:
                 raise AttributeError("Invalid screenshot response")
-            image_data = response.image_data.split(",", 1)[-1]
-            image_data = base64.b64decode(image_data)
-            img = Image.open(io.BytesIO(image_data))
-            return img
+            return decode_screenshot_data(response.image_data)
 
         return _call_with_obs_client(
             _capture,
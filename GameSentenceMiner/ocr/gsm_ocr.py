@@ -53,6 +53,12 @@ from GameSentenceMiner.ocr.gsm_ocr_config import (
     get_scene_furigana_filter_sensitivity,
 )
 from GameSentenceMiner.ocr.process_logging import start_ocr_process_log
+from GameSentenceMiner.ocr.second_pass_scheduler import (
+    MAX_PARALLEL_WORKERS,
+    DeliverySequencer,
+    SecondPassScheduler,
+    parallelism_for_engine,
+)
 from GameSentenceMiner.owocr.owocr import ocr_runtime
 from GameSentenceMiner.owocr.owocr.ocr import normalize_japanese_ocr_dashes, normalize_japanese_ocr_text_and_segments
 from GameSentenceMiner.owocr.owocr.ocr_runtime import TextFiltering
@@ -3176,28 +3182,37 @@ class OCRProcessor:
         image_metadata=None,
         response_dict=None,
         source=TextSource.OCR,
+        delivery_ticket=None,
     ):
-        ctrl = get_controller()
-        debug_enabled = get_ocr_advanced_debug_logging()
-        ocr2_started = perf_counter()
-        emit_ocr_debug(
-            debug_enabled,
-            "ocr2.execution_runtime",
-            outcome="started",
-            engine=get_ocr_ocr2(),
-            ocr1_text=text_preview(ocr1_text),
-            source=source,
-            image_size=getattr(img, "size", None),
-            ignore_previous_result=ignore_previous_result,
-            ignore_furigana_filter=ignore_furigana_filter,
-        )
+        ctrl = None
+        debug_enabled = False
         detection_completion_crop = None
         should_mark_detection_completion = False
         detection_duplicate = False
-        if hasattr(ctrl, "mark_v2_detection_ocr2_complete") and _looks_like_detection_payload(response_dict):
-            detection_completion_crop = _resolve_detection_crop_coords(None, None, response_dict)
-            should_mark_detection_completion = detection_completion_crop is not None
         try:
+            # Other calls from outside the worker queue line up behind queued
+            # deliveries. Interactive OCR (whole-window, area select) never dedups
+            # against them and the user is waiting on it, so it skips the line.
+            if delivery_ticket is None and not ignore_previous_result:
+                delivery_ticket = second_pass_delivery.take_ticket()
+            ctrl = get_controller()
+            debug_enabled = get_ocr_advanced_debug_logging()
+            ocr2_started = perf_counter()
+            emit_ocr_debug(
+                debug_enabled,
+                "ocr2.execution_runtime",
+                outcome="started",
+                engine=get_ocr_ocr2(),
+                ocr1_text=text_preview(ocr1_text),
+                source=source,
+                image_size=getattr(img, "size", None),
+                ignore_previous_result=ignore_previous_result,
+                ignore_furigana_filter=ignore_furigana_filter,
+            )
+            if hasattr(ctrl, "mark_v2_detection_ocr2_complete") and _looks_like_detection_payload(response_dict):
+                detection_completion_crop = _resolve_detection_crop_coords(None, None, response_dict)
+                should_mark_detection_completion = detection_completion_crop is not None
+
             ocr2_input_img = img
             working_image_metadata = image_metadata
             if source == TextSource.SECONDARY and is_beangate:
@@ -3256,6 +3271,10 @@ class OCRProcessor:
                 has_geometry=bool(generated_payload),
             )
 
+            # OCR above may run in parallel; comparing with and updating the last
+            # sent result happens one task at a time, in dequeue order.
+            if delivery_ticket is not None:
+                second_pass_delivery.wait_for_turn(delivery_ticket)
             # Area-select / ad-hoc OCR (screen cropper, whole-window, secondary)
             # passes ignore_previous_result: the user explicitly chose this region,
             # so always return text and never dedup against the last result.
@@ -3337,6 +3356,8 @@ class OCRProcessor:
             logger.exception(e)
             print(f"Error processing message: {e}")
         finally:
+            if delivery_ticket is not None:
+                second_pass_delivery.finish(delivery_ticket)
             if should_mark_detection_completion:
                 ctrl.mark_v2_detection_ocr2_complete(
                     detection_completion_crop,
@@ -3867,8 +3888,49 @@ def ocr_result_callback(
 done = False
 _ocr_deadline_scheduler = None
 
+
+def _second_pass_task_field(task, index, default=None):
+    return task[index] if len(task) > index and task[index] is not None else default
+
+
+def _second_pass_task_key(task):
+    """Coalescing key: the task's source plus the OCR region it covers."""
+    source = _second_pass_task_field(task, 9, TextSource.OCR)
+    image_metadata = _second_pass_task_field(task, 7, {})
+    rectangles = image_metadata.get("ocr_area_rectangles") if isinstance(image_metadata, dict) else None
+    if rectangles:
+        region = tuple(tuple(int(value) for value in rect) for rect in rectangles)
+    else:
+        region = getattr(_second_pass_task_field(task, 2), "size", None)
+    return (source, region)
+
+
+def _second_pass_task_supersedes(pending_task, new_task) -> bool:
+    """A newer frame replaces a pending one when it is the same line, evolved or re-read."""
+    if _second_pass_task_field(new_task, 5, False) or _second_pass_task_field(new_task, 6, False):
+        return False
+    pending_text = _second_pass_task_field(pending_task, 0, "")
+    new_text = _second_pass_task_field(new_task, 0, "")
+    if not isinstance(pending_text, str) or not isinstance(new_text, str):
+        return False
+    if not pending_text.strip() or not new_text.strip():
+        return False
+    return _v2_text_is_evolving(pending_text, new_text) or compare_ocr_results(pending_text, new_text, 90)
+
+
 # Create a queue for tasks
-second_ocr_queue = queue.Queue(maxsize=2048)
+second_ocr_queue = SecondPassScheduler(
+    maxsize=2048,
+    key_fn=_second_pass_task_key,
+    source_fn=lambda task: _second_pass_task_field(task, 9, TextSource.OCR),
+    supersedes_fn=_second_pass_task_supersedes,
+    parallelism_fn=lambda: parallelism_for_engine(get_ocr_ocr2()),
+    debug_enabled=get_ocr_advanced_debug_logging,
+    queue_id_fn=lambda task: _second_pass_task_field(task, 10),
+)
+second_pass_delivery = DeliverySequencer()
+# Held across get() so tickets follow the order tasks leave the queue.
+_second_pass_dequeue_lock = threading.Lock()
 
 
 def get_ocr2_image(crop_coords, og_image: Image.Image, ocr2_engine=None, extra_padding=0):
@@ -3948,8 +4010,12 @@ def get_ocr2_image(crop_coords, og_image: Image.Image, ocr2_engine=None, extra_p
 
 def process_task_queue():
     while True:
+        delivery_ticket = None
         try:
-            task = second_ocr_queue.get()
+            with _second_pass_dequeue_lock:
+                task = second_ocr_queue.get()
+                if task is not None:
+                    delivery_ticket = second_pass_delivery.take_ticket()
             if task is None:  # Exit signal
                 break
             ignore_furigana_filter = False
@@ -3979,6 +4045,7 @@ def process_task_queue():
                 queue_depth=second_ocr_queue.qsize(),
                 queue_wait_ms=round((perf_counter() - enqueued_at) * 1000, 3) if enqueued_at is not None else None,
                 source=source,
+                scheduler=second_ocr_queue.metrics_snapshot(),
             )
             get_second_ocr_processor().do_second_ocr(
                 ocr1_text,
@@ -3991,10 +4058,13 @@ def process_task_queue():
                 image_metadata,
                 response_dict,
                 source=source or TextSource.OCR,
+                delivery_ticket=delivery_ticket,
             )
         except Exception as e:
             logger.exception(f"Error processing task: {e}")
         finally:
+            if delivery_ticket is not None:
+                second_pass_delivery.finish(delivery_ticket)
             second_ocr_queue.task_done()
 
 
@@ -4551,9 +4621,11 @@ if __name__ == "__main__":
             oneocr_threads = []
             ocr_thread = threading.Thread(target=run_oneocr, args=(ocr_config, rectangles), daemon=True)
             ocr_thread.start()
-            # Always start worker thread to process manual screenshots from screen cropper
-            worker_thread = threading.Thread(target=process_task_queue, daemon=True)
-            worker_thread.start()
+            # Always start worker threads to process manual screenshots from screen cropper.
+            # Extra workers only pick up tasks while the OCR2 engine allows parallel calls.
+            for _ in range(MAX_PARALLEL_WORKERS):
+                worker_thread = threading.Thread(target=process_task_queue, daemon=True)
+                worker_thread.start()
 
             # Start IPC listener for Electron communication
             ocr_ipc.register_command_handler(handle_ipc_command)
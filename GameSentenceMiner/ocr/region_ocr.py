@@ -0,0 +1,253 @@
+"""Per-rectangle OCR for multi-area scenes.
+
+The first pass normally OCRs one composite of every configured rectangle, so a
+blinking cursor in a choice menu re-OCRs the name box and dialogue box as well.
+``RegionOCRRunner`` splits the composite back into its rectangles, keeps the
+last pixels and engine result for each one, and only sends rectangles whose
+pixels changed to the engine (concurrently when the engine allows it).
+
+``stitch_region_results`` shifts every per-rectangle result back into
+composite coordinates and returns the same 6-tuple (and OcrResult-shaped
+response dict) the engine would have produced for the whole composite, so the
+rest of the pipeline - filtering, ``order_paragraphs_and_lines``, back-mapping
+through ``CompositeLayout`` - is unchanged.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+
+from PIL import Image
+
+from GameSentenceMiner.ocr.composite_layout import CompositeLayout
+from GameSentenceMiner.util.concurrency.actor import MailboxFull
+from GameSentenceMiner.util.concurrency.work_pool import BoundedWorkPool
+
+Box = tuple[int, int, int, int]
+EngineCall = Callable[[Image.Image], Any]
+
+MAX_REGION_WORKERS = 3
+_QUAD_KEY_RE = re.compile(r"^[xy]\d$")
+
+
+def composite_region_boxes(image_metadata: dict | None, composite_size: Sequence[int]) -> list[Box]:
+    """Return ``(left, top, right, bottom)`` of each OCR rectangle inside the composite.
+
+    Overlapping rectangles can't be OCR'd independently without duplicating
+    text, so they yield an empty list and the caller OCRs the whole composite.
+    """
+    if not isinstance(image_metadata, dict):
+        return []
+    width, height = int(composite_size[0]), int(composite_size[1])
+    layout = CompositeLayout.from_metadata(image_metadata.get("ocr_area_crop_offset"))
+    boxes: list[Box] = []
+    if layout.regions:
+        for region in layout.regions:
+            boxes.append((region.dest_x, region.dest_y, region.dest_x + region.width, region.dest_y + region.height))
+    else:
+        for rect in image_metadata.get("ocr_area_rectangles") or []:
+            try:
+                x, y, w, h = (int(round(float(value))) for value in list(rect)[:4])
+            except (TypeError, ValueError):
+                return []
+            boxes.append((x - layout.offset_x, y - layout.offset_y, x - layout.offset_x + w, y - layout.offset_y + h))
+
+    clamped = []
+    for left, top, right, bottom in boxes:
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(width, right), min(height, bottom)
+        if right > left and bottom > top:
+            clamped.append((left, top, right, bottom))
+    for index, a in enumerate(clamped):
+        for b in clamped[index + 1 :]:
+            if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                return []
+    # Reading order, matching pack_rectangles.
+    clamped.sort(key=lambda box: (box[1], box[0]))
+    return clamped
+
+
+def _shift_quad(rect: Any, dx: int, dy: int) -> Any:
+    if not isinstance(rect, dict):
+        return rect
+    shifted = dict(rect)
+    for key, value in rect.items():
+        if _QUAD_KEY_RE.match(key) and isinstance(value, (int, float)):
+            shifted[key] = value + (dx if key[0] == "x" else dy)
+    return shifted
+
+
+def _shift_line(line: Any, dx: int, dy: int) -> Any:
+    if not isinstance(line, dict):
+        return line
+    shifted = dict(line)
+    if "bounding_rect" in line:
+        shifted["bounding_rect"] = _shift_quad(line["bounding_rect"], dx, dy)
+    if isinstance(line.get("words"), list):
+        shifted["words"] = [
+            {**word, "bounding_rect": _shift_quad(word.get("bounding_rect"), dx, dy)}
+            if isinstance(word, dict) and "bounding_rect" in word
+            else word
+            for word in line["words"]
+        ]
+    return shifted
+
+
+def _rescale_bounding_boxes(node: Any, box: Box, region_size: Sequence[int], composite_size: Sequence[int]) -> Any:
+    """Map normalized boxes from region space to composite space, recursively."""
+    if isinstance(node, list):
+        return [_rescale_bounding_boxes(item, box, region_size, composite_size) for item in node]
+    if not isinstance(node, dict):
+        return node
+    rw, rh = float(region_size[0] or 1), float(region_size[1] or 1)
+    cw, ch = float(composite_size[0] or 1), float(composite_size[1] or 1)
+    mapped = {}
+    for key, value in node.items():
+        if key == "bounding_box" and isinstance(value, dict) and "center_x" in value:
+            value = dict(value)
+            value["center_x"] = (float(value["center_x"]) * rw + box[0]) / cw
+            value["center_y"] = (float(value["center_y"]) * rh + box[1]) / ch
+            value["width"] = float(value["width"]) * rw / cw
+            value["height"] = float(value["height"]) * rh / ch
+            mapped[key] = value
+        else:
+            mapped[key] = _rescale_bounding_boxes(value, box, region_size, composite_size)
+    return mapped
+
+
+def stitch_region_results(parts: Sequence[tuple[Box, Any]], composite_size: Sequence[int]) -> tuple:
+    """Merge per-rectangle engine results into one composite-space result tuple."""
+    texts: list[str] = []
+    lines: list[Any] = []
+    crop_coords_list: list[tuple] = []
+    paragraphs: list[Any] = []
+    capabilities = None
+    has_structured = False
+
+    for box, result in parts:
+        res, text, coords, region_crop_list, _crop, raw = (list(result) + [None] * 6)[:6]
+        if not res:
+            continue
+        dx, dy = box[0], box[1]
+        if isinstance(text, str) and text.strip():
+            texts.append(text.strip())
+        for line in coords or []:
+            lines.append(_shift_line(line, dx, dy))
+        for entry in region_crop_list or []:
+            entry = list(entry)
+            if len(entry) >= 4:
+                entry[0:4] = [entry[0] + dx, entry[1] + dy, entry[2] + dx, entry[3] + dy]
+            crop_coords_list.append(tuple(entry))
+        if isinstance(raw, dict) and isinstance(raw.get("paragraphs"), list):
+            has_structured = True
+            props = raw.get("image_properties") or {}
+            region_size = (props.get("width") or box[2] - box[0], props.get("height") or box[3] - box[1])
+            paragraphs.extend(_rescale_bounding_boxes(raw["paragraphs"], box, region_size, composite_size))
+            capabilities = capabilities or raw.get("engine_capabilities")
+
+    crop_coords = None
+    if crop_coords_list:
+        crop_coords = (
+            min(entry[0] for entry in crop_coords_list),
+            min(entry[1] for entry in crop_coords_list),
+            max(entry[2] for entry in crop_coords_list),
+            max(entry[3] for entry in crop_coords_list),
+        )
+    raw_response = None
+    if has_structured:
+        raw_response = {
+            "image_properties": {"width": int(composite_size[0]), "height": int(composite_size[1])},
+            "engine_capabilities": capabilities,
+            "paragraphs": paragraphs,
+        }
+    return (True, "\n".join(texts), lines, crop_coords_list, crop_coords, raw_response)
+
+
+class RegionOCRRunner:
+    """OCR only the rectangles whose pixels changed since the previous frame."""
+
+    def __init__(self, max_workers: int = MAX_REGION_WORKERS):
+        self.max_workers = int(max_workers)
+        self._pool = None
+        self._lock = threading.Lock()
+        self._previous: dict[Box, tuple[bytes, Any]] = {}
+        self._context: Any = None
+
+    def _get_pool(self) -> BoundedWorkPool:
+        with self._lock:
+            if self._pool is None:
+                self._pool = BoundedWorkPool(
+                    "gsm-ocr-regions",
+                    max_workers=self.max_workers,
+                    capacity=self.max_workers * 2,
+                )
+            return self._pool
+
+    def reset(self) -> None:
+        with self._lock:
+            self._previous.clear()
+
+    def run(
+        self,
+        image: Image.Image,
+        boxes: Sequence[Box],
+        call_engine: EngineCall,
+        *,
+        context: Any = None,
+        parallelism: int = 1,
+    ) -> tuple[tuple, dict]:
+        """OCR ``image`` region by region; returns ``(result_tuple, stats)``.
+
+        ``context`` identifies everything besides pixels that affects a result
+        (engine, language, filter settings); a new context drops all history.
+        """
+        with self._lock:
+            if context != self._context:
+                self._previous.clear()
+                self._context = context
+            # Forget rectangles that are no longer configured.
+            for stale in set(self._previous) - set(boxes):
+                self._previous.pop(stale, None)
+            previous = dict(self._previous)
+
+        crops = {box: image.crop(box) for box in boxes}
+        pixels = {box: crop.tobytes() for box, crop in crops.items()}
+        results: dict[Box, Any] = {}
+        changed = []
+        for box in boxes:
+            cached = previous.get(box)
+            if cached is not None and cached[0] == pixels[box]:
+                results[box] = copy.deepcopy(cached[1])
+            else:
+                changed.append(box)
+
+        futures: dict[Box, Future] = {}
+        if parallelism > 1 and len(changed) > 1:
+            pool = self._get_pool()
+            # The calling thread takes the first rectangle itself.
+            for box in changed[1 : min(parallelism, self.max_workers)]:
+                try:
+                    futures[box] = pool.submit(call_engine, crops[box], timeout=0)
+                except MailboxFull:
+                    break
+        for box in changed:
+            if box not in futures:
+                results[box] = call_engine(crops[box])
+        for box, future in futures.items():
+            results[box] = future.result()
+
+        failed = [box for box in changed if not (results[box] and results[box][0])]
+        with self._lock:
+            for box in changed:
+                if box not in failed:
+                    self._previous[box] = (pixels[box], copy.deepcopy(results[box]))
+
+        stats = {"regions": len(boxes), "changed": len(changed), "reused": len(boxes) - len(changed)}
+        if failed:
+            # Let the caller's engine-failure handling see the first error.
+            return results[failed[0]], stats
+        return stitch_region_results([(box, results[box]) for box in boxes], image.size), stats
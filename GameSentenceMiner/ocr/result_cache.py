@@ -0,0 +1,189 @@
+"""Content-addressed cache of OCR engine results.
+
+Backlog scrolling, menus and re-displayed dialogue send the same pixels to the
+OCR engines over and over. Results are cached under a digest of the exact image
+handed to the engine, together with the engine name, language, furigana
+sensitivity and image size, so repeated frames skip the engine call.
+
+Only exact matches are served: a dialogue box that gains a single character is
+a new line, and any similarity threshold loose enough to absorb capture noise
+also absorbs that character.
+
+Entries live in a size-bounded in-memory LRU. An optional disk tier stores
+JSON-serialisable results so they survive restarts; it keeps at most
+``MAX_DISK_ENTRIES`` files, dropping the least recently used.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from PIL import Image
+
+MAX_MEMORY_ENTRIES = 256
+MAX_DISK_ENTRIES = 4096
+DISK_PRUNE_INTERVAL = 64
+DISK_CACHE_DIRNAME = os.path.join("cache", "ocr_results")
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    engine: str
+    language: str
+    furigana_filter_sensitivity: int
+    size: tuple[int, int]
+
+    def digest(self) -> str:
+        raw = f"{self.engine}|{self.language}|{self.furigana_filter_sensitivity}|{self.size[0]}x{self.size[1]}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def image_digest(image: Image.Image) -> str:
+    """Digest of the exact pixels (and mode/size) of ``image``."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{image.mode}|{image.size[0]}x{image.size[1]}|".encode("ascii"))
+    hasher.update(image.tobytes())
+    return hasher.hexdigest()
+
+
+class OCRResultCache:
+    def __init__(
+        self,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+        disk_dir: str | None = None,
+        max_disk_entries: int = MAX_DISK_ENTRIES,
+    ):
+        self.max_entries = int(max_entries)
+        self.max_disk_entries = int(max_disk_entries)
+        self.disk_dir = disk_dir
+        self._entries: OrderedDict[tuple[CacheKey, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "disk_evictions": 0}
+
+    def lookup(self, key: CacheKey, image_hash: str) -> Any | None:
+        with self._lock:
+            cached = self._entries.get((key, image_hash))
+            if cached is not None:
+                self._entries.move_to_end((key, image_hash))
+                self._stats["hits"] += 1
+                return copy.deepcopy(cached)
+
+        result = self._load_from_disk(key, image_hash)
+        with self._lock:
+            if result is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember_locked(key, image_hash, result)
+        return copy.deepcopy(result)
+
+    def store(self, key: CacheKey, image_hash: str, result: Any) -> None:
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._remember_locked(key, image_hash, result)
+            self._stats["stores"] += 1
+        self._write_to_disk(key, image_hash, result)
+
+    def _remember_locked(self, key: CacheKey, image_hash: str, result: Any) -> None:
+        self._entries[(key, image_hash)] = result
+        self._entries.move_to_end((key, image_hash))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: CacheKey, image_hash: str) -> str | None:
+        if not self.disk_dir:
+            return None
+        return os.path.join(self.disk_dir, f"{key.digest()}-{image_hash}.json")
+
+    def _load_from_disk(self, key: CacheKey, image_hash: str) -> Any | None:
+        path = self._disk_path(key, image_hash)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # mtime doubles as the disk tier's recency for pruning.
+            os.utime(path)
+            return result
+        except (OSError, ValueError):
+            return None
+
+    def _write_to_disk(self, key: CacheKey, image_hash: str, result: Any) -> None:
+        path = self._disk_path(key, image_hash)
+        if not path:
+            return
+        try:
+            payload = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError):
+            # Engine-specific objects stay memory-only.
+            return
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._disk_writes += 1
+            # Prune on the first write (catching up on earlier sessions) and then every interval.
+            should_prune = (self._disk_writes - 1) % DISK_PRUNE_INTERVAL == 0
+        if should_prune:
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """Delete the least recently used disk entries beyond ``max_disk_entries``."""
+        if not self.disk_dir:
+            return 0
+        entries = []
+        try:
+            with os.scandir(self.disk_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        try:
+                            entries.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            continue
+        except OSError:
+            return 0
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        removed = 0
+        for _mtime, path in entries[:excess]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._stats["disk_evictions"] += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["entries"] = len(self._entries)
+        lookups = snapshot["hits"] + snapshot["disk_hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round((lookups - snapshot["misses"]) / lookups, 4) if lookups else 0.0
+        return snapshot
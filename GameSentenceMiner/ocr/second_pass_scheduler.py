@@ -0,0 +1,263 @@
+"""Scheduler for queued OCR second-pass tasks.
+
+Stable first-pass frames used to be drained FIFO by a single worker, so a slow
+cloud engine would OCR every intermediate frame of a line that had already been
+replaced by a newer frame of the same rectangle. The scheduler keeps pending
+tasks grouped by ``(source, region)`` and:
+
+* replaces a pending task in place when a newer task for the same key
+  supersedes it (the caller decides what "supersedes" means),
+* hands manual / hotkey work out before automatic OCR,
+* never runs two tasks for the same key at once, so per-region ordering and
+  duplicate suppression in ``do_second_ocr`` still hold, and
+* lets more than one worker run when the active engine is safe to call
+  concurrently.
+
+It keeps the ``put``/``put_nowait``/``get``/``qsize`` shape of ``queue.Queue``
+so existing producers don't change; ``put(None)`` is the shutdown signal.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Hashable
+
+from GameSentenceMiner.ocr.debug_logging import emit_ocr_debug
+from GameSentenceMiner.util.text_log import TextSource
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_AUTOMATIC = 1
+
+AUTOMATIC_SOURCES = frozenset({TextSource.OCR, TextSource.OVERLAY})
+
+# Engines that only wrap a remote HTTP API and keep no per-call native state.
+CONCURRENT_SAFE_ENGINES = frozenset(
+    {
+        "glens",
+        "googlelens",
+        "lens",
+        "gvision",
+        "bing",
+        "azure",
+        "ocrspace",
+        "gemini",
+        "groq",
+        "localllmocr",
+    }
+)
+MAX_PARALLEL_WORKERS = 2
+
+
+def normalize_engine_key(engine: Any) -> str:
+    return str(engine or "").strip().lower().replace(" ", "").replace("_", "").replace("-", "")
+
+
+def parallelism_for_engine(engine: Any) -> int:
+    """Number of second-pass tasks that may run at once for ``engine``."""
+    if normalize_engine_key(engine) in CONCURRENT_SAFE_ENGINES:
+        return MAX_PARALLEL_WORKERS
+    return 1
+
+
+def source_priority(source: Any) -> int:
+    return PRIORITY_AUTOMATIC if (source or TextSource.OCR) in AUTOMATIC_SOURCES else PRIORITY_INTERACTIVE
+
+
+@dataclass
+class _PendingTask:
+    item: Any
+    key: Hashable
+    priority: int
+    seq: int
+    enqueued_at: float = field(default_factory=perf_counter)
+
+
+class SecondPassScheduler:
+    def __init__(
+        self,
+        *,
+        maxsize: int = 2048,
+        key_fn: Callable[[Any], Hashable],
+        source_fn: Callable[[Any], Any],
+        supersedes_fn: Callable[[Any, Any], bool] | None = None,
+        parallelism_fn: Callable[[], int] | None = None,
+        debug_enabled: Callable[[], bool] | None = None,
+        queue_id_fn: Callable[[Any], Any] | None = None,
+    ):
+        self.maxsize = int(maxsize)
+        self._key_fn = key_fn
+        self._source_fn = source_fn
+        self._supersedes_fn = supersedes_fn
+        self._parallelism_fn = parallelism_fn or (lambda: 1)
+        self._debug_enabled = debug_enabled or (lambda: False)
+        self._queue_id_fn = queue_id_fn or (lambda _item: None)
+        self._cond = threading.Condition()
+        self._pending: list[_PendingTask] = []
+        self._in_flight: dict[int, Hashable] = {}
+        self._seq = 0
+        self._closed = False
+        self._metrics = {
+            "enqueued": 0,
+            "dispatched": 0,
+            "superseded": 0,
+            "rejected": 0,
+            "max_queue_wait_ms": 0.0,
+        }
+
+    # -- producer side -----------------------------------------------------
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        if item is None:
+            self.close()
+            return
+        key = self._key_fn(item)
+        source = self._source_fn(item)
+        priority = source_priority(source)
+        with self._cond:
+            superseded = self._supersede_locked(key, priority, item)
+            if superseded is None:
+                if not self._cond.wait_for(lambda: len(self._pending) < self.maxsize, timeout if block else 0):
+                    self._metrics["rejected"] += 1
+                    raise queue.Full
+                self._seq += 1
+                self._pending.append(_PendingTask(item=item, key=key, priority=priority, seq=self._seq))
+            self._metrics["enqueued"] += 1
+            self._cond.notify_all()
+            superseded_total = self._metrics["superseded"]
+        if superseded is not None:
+            emit_ocr_debug(
+                self._debug_enabled(),
+                "ocr2.queue_runtime",
+                outcome="superseded",
+                queue_id=self._queue_id_fn(superseded.item),
+                replaced_by=self._queue_id_fn(item),
+                queue_wait_ms=round((perf_counter() - superseded.enqueued_at) * 1000, 3),
+                superseded_total=superseded_total,
+                source=source,
+            )
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def _supersede_locked(self, key: Hashable, priority: int, item: Any) -> _PendingTask | None:
+        # Only automatic frames are coalesced; every manual request is honoured.
+        if priority != PRIORITY_AUTOMATIC or self._supersedes_fn is None:
+            return None
+        for index in range(len(self._pending) - 1, -1, -1):
+            pending = self._pending[index]
+            if pending.key != key:
+                continue
+            if not self._supersedes_fn(pending.item, item):
+                return None
+            # Keep the old slot so a continuously updating line isn't starved.
+            self._pending[index] = _PendingTask(
+                item=item,
+                key=key,
+                priority=priority,
+                seq=pending.seq,
+            )
+            self._metrics["superseded"] += 1
+            return pending
+        return None
+
+    # -- consumer side -----------------------------------------------------
+
+    def get(self) -> Any:
+        """Block until a runnable task is available; ``None`` once closed and drained."""
+        with self._cond:
+            while True:
+                task = self._next_runnable_locked()
+                if task is not None:
+                    self._pending.remove(task)
+                    self._in_flight[threading.get_ident()] = task.key
+                    wait_ms = (perf_counter() - task.enqueued_at) * 1000
+                    self._metrics["dispatched"] += 1
+                    self._metrics["max_queue_wait_ms"] = max(self._metrics["max_queue_wait_ms"], round(wait_ms, 3))
+                    self._cond.notify_all()
+                    return task.item
+                if self._closed and not self._pending:
+                    return None
+                self._cond.wait()
+
+    def _next_runnable_locked(self) -> _PendingTask | None:
+        if len(self._in_flight) >= max(1, int(self._parallelism_fn() or 1)):
+            return None
+        busy_keys = set(self._in_flight.values())
+        best = None
+        for task in self._pending:
+            if task.key in busy_keys:
+                continue
+            if best is None or (task.priority, task.seq) < (best.priority, best.seq):
+                best = task
+        return best
+
+    def task_done(self) -> None:
+        """Mark the calling worker's current task as finished."""
+        with self._cond:
+            self._in_flight.pop(threading.get_ident(), None)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # -- introspection -----------------------------------------------------
+
+    def qsize(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def in_flight(self) -> int:
+        with self._cond:
+            return len(self._in_flight)
+
+    def metrics_snapshot(self) -> dict:
+        with self._cond:
+            snapshot = dict(self._metrics)
+            snapshot["pending"] = len(self._pending)
+            snapshot["in_flight"] = len(self._in_flight)
+            return snapshot
+
+
+class DeliverySequencer:
+    """Serialize the compare-and-send step of parallel second-pass workers in ticket order.
+
+    Workers take a ticket when they dequeue a task, run OCR concurrently, then
+    wait for their turn before checking for duplicates against (and updating)
+    the last sent result. Every ticket must be finished, whether or not it
+    reached delivery, so the next one can proceed.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._turn = 0
+        self._finished: set[int] = set()
+
+    def take_ticket(self) -> int:
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            return ticket
+
+    def wait_for_turn(self, ticket: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._turn >= ticket)
+
+    def finish(self, ticket: int) -> None:
+        """Release ``ticket``; finishing one twice is harmless."""
+        with self._cond:
+            if ticket < self._turn:
+                return
+            self._finished.add(ticket)
+            while self._turn in self._finished:
+                self._finished.remove(self._turn)
+                self._turn += 1
+            self._cond.notify_all()
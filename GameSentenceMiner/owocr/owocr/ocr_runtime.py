@@ -13,6 +13,9 @@ from GameSentenceMiner.ocr.coordinate_math import scale_percentage_rectangle_to_
 from GameSentenceMiner.ocr.compare import compare_ocr_results
 from GameSentenceMiner.ocr.composite_layout import CompositeLayout, pack_rectangles
 from GameSentenceMiner.ocr.debug_logging import emit_ocr_debug, text_preview
+from GameSentenceMiner.ocr.region_ocr import RegionOCRRunner, composite_region_boxes
+from GameSentenceMiner.ocr.second_pass_scheduler import parallelism_for_engine
+from GameSentenceMiner.ocr.result_cache import DISK_CACHE_DIRNAME, CacheKey, OCRResultCache, image_digest
 from GameSentenceMiner.ocr.gsm_ocr_config import set_dpi_awareness, get_scene_ocr_config
 from GameSentenceMiner.util.gsm_utils import do_text_replacements, OCR_REPLACEMENTS_FILE
 from GameSentenceMiner.util.config.electron_config import (
@@ -27,7 +30,10 @@ from GameSentenceMiner.util.config.electron_config import (
     get_ocr_obs_capture_preprocess_mode,
     get_ocr_ocr1,
     get_ocr_ocr2,
+    get_ocr_per_rectangle_ocr,
     get_ocr_requires_open_window,
+    get_ocr_result_cache,
+    get_ocr_result_cache_disk,
     get_ocr_scan_rate,
     get_ocr_two_pass_ocr,
     get_ocr_wgc_capture_fps,
@@ -39,6 +45,7 @@ from GameSentenceMiner.ocr.image_scaling import (
 )
 from GameSentenceMiner.native import ocr as native_ocr
 from GameSentenceMiner.native.runtime import NativeMode, get_native_mode
+from GameSentenceMiner.obs.frame_broker import SHARED_FRAME_MAX_AGE_MS
 from GameSentenceMiner.obs.screenshot_capture import (
     _capture_hwnd_windows_graphics_capture,
     is_image_empty,
@@ -74,7 +81,7 @@ from PIL import Image, ImageDraw, ImageFilter
 from loguru import logger
 
 from GameSentenceMiner.owocr.owocr.config import Config
-from GameSentenceMiner.util.config.configuration import get_config
+from GameSentenceMiner.util.config.configuration import get_app_directory, get_config
 
 # Set to True to use synthetic OCR results for CPU benchmarking (no actual OCR computation).
 # The mock returns rotating Japanese text that changes every 5 calls.
@@ -3142,6 +3149,7 @@ class OBSScreenshotThread(threading.Thread):
                     grayscale=False,
                     preprocess_mode=capture_preprocess_mode,
                     capture_fps=get_ocr_wgc_capture_fps(),
+                    max_age_ms=SHARED_FRAME_MAX_AGE_MS,
                 )
 
                 if img is None:
@@ -4052,6 +4060,121 @@ def dict_to_ocr_result(data):
         return None
 
 
+_ocr_result_cache = None
+_ocr_result_cache_lock = threading.Lock()
+
+
+def _get_ocr_result_cache():
+    """Return the shared OCR result cache, or None when it is disabled."""
+    global _ocr_result_cache
+    if not get_ocr_result_cache():
+        return None
+    disk_dir = os.path.join(get_app_directory(), DISK_CACHE_DIRNAME) if get_ocr_result_cache_disk() else None
+    with _ocr_result_cache_lock:
+        if _ocr_result_cache is None:
+            _ocr_result_cache = OCRResultCache(disk_dir=disk_dir)
+        else:
+            _ocr_result_cache.disk_dir = disk_dir
+        return _ocr_result_cache
+
+
+def clear_ocr_result_cache():
+    with _ocr_result_cache_lock:
+        if _ocr_result_cache is not None:
+            _ocr_result_cache.clear()
+
+
+def _run_engine_cached(engine_instance, img_or_path, furigana_filter_sensitivity, *, debug_enabled, pass_number):
+    """Call ``engine_instance``, reusing the result for a pixel-identical second-pass image."""
+    # The first (stability) pass sees a new frame every tick while text types out; caching it only churns.
+    cache = _get_ocr_result_cache() if pass_number != 1 else None
+    if cache is None or not isinstance(img_or_path, Image.Image):
+        return engine_instance(img_or_path, furigana_filter_sensitivity)
+
+    engine_name = str(getattr(engine_instance, "name", "") or "")
+    key = CacheKey(
+        engine=engine_name,
+        language=str(get_ocr_language() or ""),
+        furigana_filter_sensitivity=_safe_int(furigana_filter_sensitivity),
+        size=tuple(img_or_path.size),
+    )
+    image_hash = image_digest(img_or_path)
+    cached = cache.lookup(key, image_hash)
+    if cached is not None:
+        emit_ocr_debug(
+            debug_enabled,
+            "ocr_engine.cache",
+            outcome="hit",
+            pass_number=pass_number,
+            engine=engine_name,
+            **cache.stats(),
+        )
+        return cached
+
+    result = engine_instance(img_or_path, furigana_filter_sensitivity)
+    if result and result[0]:
+        cache.store(key, image_hash, result)
+    emit_ocr_debug(
+        debug_enabled,
+        "ocr_engine.cache",
+        outcome="miss",
+        pass_number=pass_number,
+        engine=engine_name,
+        **cache.stats(),
+    )
+    return result
+
+
+_region_ocr_runner = RegionOCRRunner()
+
+
+def _run_engine_for_frame(
+    engine_instance,
+    img_or_path,
+    furigana_filter_sensitivity,
+    *,
+    image_metadata,
+    is_second_ocr,
+    debug_enabled,
+):
+    """Run OCR on a frame, per rectangle when that mode is enabled for a multi-area first pass."""
+    pass_number = 2 if is_second_ocr else 1
+    boxes = []
+    if not is_second_ocr and isinstance(img_or_path, Image.Image) and get_ocr_per_rectangle_ocr():
+        boxes = composite_region_boxes(image_metadata, img_or_path.size)
+    if len(boxes) < 2:
+        return _run_engine_cached(
+            engine_instance,
+            img_or_path,
+            furigana_filter_sensitivity,
+            debug_enabled=debug_enabled,
+            pass_number=pass_number,
+        )
+
+    engine_name = getattr(engine_instance, "name", "")
+    result, stats = _region_ocr_runner.run(
+        img_or_path,
+        boxes,
+        lambda crop: _run_engine_cached(
+            engine_instance,
+            crop,
+            furigana_filter_sensitivity,
+            debug_enabled=debug_enabled,
+            pass_number=pass_number,
+        ),
+        context=(engine_name, get_ocr_language(), _safe_int(furigana_filter_sensitivity)),
+        parallelism=parallelism_for_engine(engine_name),
+    )
+    emit_ocr_debug(
+        debug_enabled,
+        "ocr_engine.regions",
+        pass_number=pass_number,
+        engine=engine_name,
+        **stats,
+    )
+    return result
+
+
 def process_and_write_results(
     img_or_path,
     write_to=None,
@@ -4101,7 +4224,14 @@ def process_and_write_results(
         apply_area_filters=apply_area_filters,
         source=source,
     )
-    result = engine_instance(img_or_path, furigana_filter_sensitivity)
+    result = _run_engine_for_frame(
+        engine_instance,
+        img_or_path,
+        furigana_filter_sensitivity,
+        image_metadata=image_metadata,
+        is_second_ocr=is_second_ocr,
+        debug_enabled=debug_enabled,
+    )
     # logger.info(f"OCR Result from {engine_instance.readable_name}: {result}")
     res, text, coords, crop_coords_list, crop_coords, raw_response_dict = (list(result) + [None] * 6)[:6]
     emit_ocr_debug(
@@ -4149,7 +4279,13 @@ def process_and_write_results(
                     last_result = []
                 break
         start_time = time.time()
-        result = engine_instance(img_or_path, furigana_filter_sensitivity)
+        result = _run_engine_cached(
+            engine_instance,
+            img_or_path,
+            furigana_filter_sensitivity,
+            debug_enabled=debug_enabled,
+            pass_number=2 if is_second_ocr else 1,
+        )
         res, text, coords, crop_coords_list, crop_coords, raw_response_dict = (list(result) + [None] * 6)[:6]
 
     end_time = time.time()
@@ -325,6 +325,7 @@ class ReplayAudioExtractor:
                 try:
                     if os.path.exists(video_path):
                         os.remove(video_path)
+                    ffmpeg.remove_replay_index(video_path)
                 except Exception as exc:
                     logger.exception(f"Failed removing follow-up dialogue replay {video_path}: {exc}")
 
@@ -596,6 +597,7 @@ class ReplayAudioExtractor:
                     if os.path.exists(video_path):
                         logger.debug(f"Removing video: {video_path}")
                         os.remove(video_path)
+                    ffmpeg.remove_replay_index(video_path)
                 except Exception as e:
                     logger.exception(f"Error removing video file {video_path}: {e}")
 
@@ -213,6 +213,9 @@ class SudachiClient:
                     self._cache.popitem(last=False)
             return tokens
 
+    def translate_batch(self, expressions: Sequence[str]) -> list[Sequence[SudachiToken]]:
+        return [self.translate(expression) for expression in expressions]
+
     def reading(self, expression: str) -> str:
         output: list[str] = []
         for token in self.translate(expression):
@@ -18,6 +18,8 @@ DEFAULT_SUDACHI_DICTIONARY = "small"
 class _TokenizerBackend(Protocol):
     def translate(self, expression: str) -> Sequence[Any]: ...
 
+    def translate_batch(self, expressions: Sequence[str]) -> list[Sequence[Any]]: ...
+
     def reading(self, expression: str) -> str: ...
 
     def to_hiragana(self, expression: str) -> str: ...
@@ -104,7 +106,7 @@ class Tokenizer:
             return SUDACHI_BACKEND, sudachi
         return MECAB_BACKEND, _load_mecab()
 
-    def _call(self, method_name: str, expression: str):
+    def _call(self, method_name: str, expression: Any):
         backend_name, backend = self._select_backend()
         try:
             return getattr(backend, method_name)(expression)
@@ -121,6 +123,10 @@ class Tokenizer:
     def translate(self, expression: str) -> Sequence[Any]:
         return self._call("translate", expression)
 
+    def translate_batch(self, expressions: Sequence[str]) -> list[Sequence[Any]]:
+        """Translate many expressions at once; MeCab streams them through a single worker process."""
+        return self._call("translate_batch", list(expressions))
+
     def reading(self, expression: str) -> str:
         return self._call("reading", expression)
 
@@ -1068,6 +1068,13 @@ class ConfigWindow(QWidget):
                     top_p=float(self.ai_top_p_edit.text() or 0.0),
                     custom_texthooker_prompt=self.custom_texthooker_prompt_textedit.toPlainText(),
                     custom_full_prompt=self.custom_full_prompt_textedit.toPlainText(),
+                    translation_cache_enabled=self.settings.ai.translation_cache_enabled,
+                    translation_cache_ttl_days=self.settings.ai.translation_cache_ttl_days,
+                    translation_cache_max_entries=self.settings.ai.translation_cache_max_entries,
+                    speculative_translation_enabled=self.settings.ai.speculative_translation_enabled,
+                    speculative_translation_concurrency=self.settings.ai.speculative_translation_concurrency,
+                    speculative_translation_window=self.settings.ai.speculative_translation_window,
+                    speculative_translation_tokens_per_minute=self.settings.ai.speculative_translation_tokens_per_minute,
                 ),
                 overlay=Overlay(
                     websocket_port=self.settings.overlay.websocket_port,
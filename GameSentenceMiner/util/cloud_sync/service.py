@@ -3,10 +3,12 @@ import socket
 import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 import requests
 
+from GameSentenceMiner.util.cloud_sync.transport import CloudSyncTransport
 from GameSentenceMiner.util.config.configuration import (
     get_config,
     gsm_state,
@@ -30,6 +32,7 @@ class CloudSyncService:
         self._rollup_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._transport = CloudSyncTransport()
         self._last_result: Dict[str, Any] = {
             "status": "never_ran",
             "last_started_at": None,
@@ -342,6 +345,7 @@ class CloudSyncService:
             self._set_last_result(result)
             return result
 
+        prefetch_executor: Optional[ThreadPoolExecutor] = None
         try:
             cfg = self._load_runtime_config()
 
@@ -420,13 +424,31 @@ class CloudSyncService:
             if cfg["api_token"]:
                 headers["Authorization"] = f"Bearer {cfg['api_token']}"
 
+            # Round N+1's outgoing batch is read on this worker while round N is
+            # on the wire; only since_seq has to wait for N's response.
+            prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gsm-cloud-sync-prep")
+            prefetched: Optional[Future] = None
+            prefetched_limit = 0
+            overwritten_ids: set = set()
+
             while True:
                 if round_limit is not None and rounds >= round_limit:
                     stop_reason = "round_limit_reached"
                     break
                 request_retries = 0
                 while True:
-                    outgoing_changes = GameLinesTable.get_pending_sync_changes(limit=effective_push_batch_size)
+                    if (
+                        request_retries == 0
+                        and prefetched is not None
+                        and prefetched_limit == effective_push_batch_size
+                    ):
+                        # Lines the previous round's server changes overwrote are no longer pending.
+                        outgoing_changes = [
+                            change for change in prefetched.result() if change.get("id") not in overwritten_ids
+                        ]
+                    else:
+                        outgoing_changes = GameLinesTable.get_pending_sync_changes(limit=effective_push_batch_size)
+                    prefetched = None
                     payload = {
                         "mac_address": cfg["device_id"],
                         "since_seq": since_seq,
@@ -436,10 +458,19 @@ class CloudSyncService:
                     if cfg["email"]:
                         payload["email"] = cfg["email"]
 
+                    if outgoing_changes and len(outgoing_changes) >= effective_push_batch_size:
+                        cursor = (outgoing_changes[-1]["changed_at"], outgoing_changes[-1]["id"])
+                        prefetched_limit = effective_push_batch_size
+                        prefetched = prefetch_executor.submit(
+                            GameLinesTable.get_pending_sync_changes,
+                            limit=prefetched_limit,
+                            after=cursor,
+                        )
+
                     try:
-                        response = requests.post(
+                        response = self._transport.post_json(
                             f"{cfg['api_url']}/api/sync-db",
-                            json=payload,
+                            payload,
                             headers=headers,
                             timeout=cfg["timeout_seconds"],
                         )
@@ -500,17 +531,18 @@ class CloudSyncService:
                 body = response.json()
                 rounds += 1
 
-                sent_ids = [
-                    str(change.get("id", "")).strip()
+                sent_changes = [
+                    (str(change.get("id", "")).strip(), change.get("changed_at"))
                     for change in outgoing_changes
                     if str(change.get("id", "")).strip()
                 ]
-                if sent_ids:
-                    total_acked += GameLinesTable.acknowledge_sync_changes(sent_ids)
-                total_sent += len(sent_ids)
+                if sent_changes:
+                    total_acked += GameLinesTable.acknowledge_sync_changes(sent_changes)
+                total_sent += len(sent_changes)
 
                 server_changes = body.get("server_changes", [])
                 apply_stats = GameLinesTable.apply_remote_sync_changes(server_changes, clear_local_tracking=True)
+                overwritten_ids = {str(change.get("id", "")).strip() for change in server_changes}
                 total_received += len(server_changes)
                 total_applied_upserts += int(apply_stats.get("upserts", 0))
                 total_applied_deletes += int(apply_stats.get("deletes", 0))
@@ -591,6 +623,8 @@ class CloudSyncService:
             logger.error("Cloud sync failed: {}", exc)
             return result
         finally:
+            if prefetch_executor is not None:
+                prefetch_executor.shutdown(wait=False, cancel_futures=True)
             self._sync_lock.release()
 
 
@@ -0,0 +1,116 @@
+"""HTTP transport for cloud sync rounds.
+
+Each sync round used to be an uncompressed ``requests.post`` on a fresh
+connection. ``CloudSyncTransport`` keeps one pooled ``requests.Session`` for
+the life of the service and compresses request bodies (zstd when the optional
+``zstandard`` package is installed and asked for, gzip otherwise). A server
+that rejects an encoded body with 400/415 is retried once uncompressed; if that
+succeeds the transport stays uncompressed from then on.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from GameSentenceMiner.util.config.configuration import logger
+
+DEFAULT_CONTENT_ENCODING = "gzip"
+# Bodies smaller than this aren't worth the compression round-trip.
+MIN_COMPRESS_BYTES = 1024
+POOL_SIZE = 4
+
+_zstd_compressor = None
+_zstd_checked = False
+
+
+def _get_zstd_compressor():
+    global _zstd_compressor, _zstd_checked
+    if not _zstd_checked:
+        _zstd_checked = True
+        try:
+            import zstandard
+
+            _zstd_compressor = zstandard.ZstdCompressor(level=3)
+        except ImportError:
+            _zstd_compressor = None
+    return _zstd_compressor
+
+
+def encode_body(payload: Dict[str, Any], content_encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+    """Serialize ``payload`` and compress it; returns ``(body, Content-Encoding or None)``."""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if not content_encoding or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if content_encoding == "zstd":
+        compressor = _get_zstd_compressor()
+        if compressor is not None:
+            return compressor.compress(body), "zstd"
+    return gzip.compress(body, compresslevel=6), "gzip"
+
+
+class CloudSyncTransport:
+    def __init__(
+        self,
+        content_encoding: Optional[str] = DEFAULT_CONTENT_ENCODING,
+        session: Optional[requests.Session] = None,
+    ):
+        self.content_encoding = content_encoding
+        self._session = session
+        self._session_lock = threading.Lock()
+        self.stats = {"requests": 0, "sent_bytes": 0}
+
+    @property
+    def session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def post_json(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> requests.Response:
+        body, applied_encoding = encode_body(payload, self.content_encoding)
+        request_headers = dict(headers)
+        request_headers["Content-Type"] = "application/json"
+        if applied_encoding:
+            request_headers["Content-Encoding"] = applied_encoding
+        response = self.session.post(url, data=body, headers=request_headers, timeout=timeout)
+        self.stats["requests"] += 1
+        self.stats["sent_bytes"] += len(body)
+
+        if applied_encoding and response.status_code in (400, 415):
+            body, _ = encode_body(payload, None)
+            request_headers.pop("Content-Encoding", None)
+            retry = self.session.post(url, data=body, headers=request_headers, timeout=timeout)
+            self.stats["requests"] += 1
+            self.stats["sent_bytes"] += len(body)
+            # A 400 that persists uncompressed is a payload problem, not an encoding one.
+            if retry.status_code != response.status_code:
+                logger.warning(
+                    "Cloud sync server rejected a {}-encoded body (HTTP {}); sending uncompressed from now on.",
+                    applied_encoding,
+                    response.status_code,
+                )
+                self.content_encoding = None
+            response = retry
+        return response
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -1397,6 +1397,13 @@ class Ai:
     temperature: float = 0.3
     max_output_tokens: int = 4096
     top_p: float = 0.9
+    translation_cache_enabled: bool = True
+    translation_cache_ttl_days: int = 30
+    translation_cache_max_entries: int = 5000
+    speculative_translation_enabled: bool = False
+    speculative_translation_concurrency: int = 1
+    speculative_translation_window: int = 5
+    speculative_translation_tokens_per_minute: int = 20000
 
     def __post_init__(self):
         provider_alias_map = {
@@ -74,6 +74,9 @@ DEFAULT_STORE_CONFIG: Dict[str, Any] = {
         "optimize_second_scan": True,
         "text_appears_instantly": False,
         "advanced_debug_logging": False,
+        "result_cache": True,
+        "result_cache_disk": False,
+        "per_rectangle_ocr": False,
         "ocr1": DEFAULT_STABILITY_OCR,
         "ocr2": "glens",
         "scanRate": 0.5,
@@ -425,6 +428,18 @@ def get_ocr_advanced_debug_logging() -> bool:
     return bool(_get_ocr_value("advanced_debug_logging", False))
 
 
+def get_ocr_result_cache() -> bool:
+    return bool(_get_ocr_value("result_cache", True))
+
+
+def get_ocr_result_cache_disk() -> bool:
+    return bool(_get_ocr_value("result_cache_disk", False))
+
+
+def get_ocr_per_rectangle_ocr() -> bool:
+    return bool(_get_ocr_value("per_rectangle_ocr", False))
+
+
 def get_ocr_ocr1() -> str:
     ocr_config = _get_ocr_config()
     if not _is_advanced_mode():
@@ -702,6 +702,7 @@ def replace_rollup_for_date(date_str: str) -> dict:
                 (date_str,),
                 commit=True,
             )
+            StatsRollupTable.mark_data_changed()
         return {
             "date": date_str,
             "deleted": bool(existing),
@@ -724,6 +725,7 @@ def replace_rollup_for_date(date_str: str) -> dict:
                 (date_str,),
                 commit=True,
             )
+            StatsRollupTable.mark_data_changed()
         return {"date": date_str, "deleted": bool(existing), "updated": False, "created": False}
 
     if existing:
@@ -799,6 +801,21 @@ def replace_rollup_for_date(date_str: str) -> dict:
     return {"date": date_str, "deleted": False, "updated": False, "created": True}
 
 
+def reconcile_word_novelty_aggregates() -> None:
+    """Rebuild the word-novelty tables so line edits since the last rollup are reflected."""
+    from GameSentenceMiner.util.config.feature_flags import is_tokenization_enabled
+
+    if not is_tokenization_enabled():
+        return
+
+    from GameSentenceMiner.util.database.word_novelty_tables import reconcile_word_novelty
+
+    try:
+        reconcile_word_novelty(GameLinesTable._db)
+    except Exception as e:
+        logger.exception(f"Failed to reconcile word-novelty aggregates: {e}")
+
+
 def run_daily_rollup() -> Dict:
     """
     Run the daily statistics rollup for all dates up to yesterday.
@@ -972,6 +989,8 @@ def run_daily_rollup() -> Dict:
                 errors += 1
                 continue
 
+        reconcile_word_novelty_aggregates()
+
         elapsed_time = time.time() - start_time
 
         # Log summary
@@ -13,7 +13,8 @@ import multiprocessing
 import queue
 import threading
 import time
-from typing import Dict
+from collections.abc import Sequence
+from typing import Any, Dict
 
 from GameSentenceMiner.util.config.configuration import logger
 from GameSentenceMiner.util.config.feature_flags import (
@@ -208,10 +209,16 @@ def _get_progress_milestone(
     return milestone
 
 
-def tokenize_line(line_id: str, line_text: str, line_timestamp: float | None = None) -> bool:
+def tokenize_line(
+    line_id: str,
+    line_text: str,
+    line_timestamp: float | None = None,
+    tokens: Sequence[Any] | None = None,
+) -> bool:
     """
     Tokenize a single game line and insert word/kanji occurrences.
     If line_timestamp is provided, updates last_seen for each word.
+    If tokens is provided (already translated by a batch call), the tokenizer is skipped.
     Returns True on success, False on failure.
     """
     from GameSentenceMiner.tokenizer import is_word_token, tokenizer
@@ -222,6 +229,7 @@ def tokenize_line(line_id: str, line_text: str, line_timestamp: float | None = N
         KanjiOccurrencesTable,
     )
     from GameSentenceMiner.util.database.db import GameLinesTable
+    from GameSentenceMiner.util.database.word_novelty_tables import record_tokenized_line
 
     # Coerce to str in case the ORM returned a non-string (e.g. JSON-parsed dict)
     if not isinstance(line_text, str):
@@ -229,14 +237,20 @@ def tokenize_line(line_id: str, line_text: str, line_timestamp: float | None = N
 
     # Skip empty or whitespace-only lines
     if not line_text or not line_text.strip():
-        GameLinesTable.mark_tokenized(line_id)
+
+        def _mark_empty(conn):
+            GameLinesTable.mark_tokenized(line_id)
+            record_tokenized_line(GameLinesTable._db, line_id)
+
+        GameLinesTable._db.run_transaction(_mark_empty, priority=DB_PRIORITY_LOW)
         return True
 
-    try:
-        tokens = tokenizer.translate(line_text)
-    except Exception as e:
-        logger.error(f"Tokenization failed for line {line_id}: {e}")
-        return False
+    if tokens is None:
+        try:
+            tokens = tokenizer.translate(line_text)
+        except Exception as e:
+            logger.error(f"Tokenization failed for line {line_id}: {e}")
+            return False
 
     try:
 
@@ -275,6 +289,7 @@ def tokenize_line(line_id: str, line_text: str, line_timestamp: float | None = N
 
             # Mark line as tokenized (last — ensures crash recovery works)
             GameLinesTable.mark_tokenized(line_id)
+            record_tokenized_line(WordsTable._db, line_id)
 
         WordsTable._db.run_transaction(_tokenize, priority=DB_PRIORITY_LOW)
 
@@ -285,6 +300,23 @@ def tokenize_line(line_id: str, line_text: str, line_timestamp: float | None = N
         return False
 
 
+def _translate_backfill_batch(lines) -> dict[str, Sequence[Any]]:
+    """
+    Tokenize a backfill batch in one call so MeCab streams it through a single worker.
+    Returns tokens by line id; lines missing from the result are tokenized one by one.
+    """
+    from GameSentenceMiner.tokenizer import tokenizer
+
+    texts = {line.id: line.line_text for line in lines if isinstance(line.line_text, str) and line.line_text.strip()}
+    if not texts:
+        return {}
+    try:
+        return dict(zip(texts, tokenizer.translate_batch(list(texts.values()))))
+    except Exception as e:
+        logger.warning(f"Batch tokenization failed, falling back to per-line: {e}")
+        return {}
+
+
 def cleanup_orphaned_occurrences() -> int:
     """
     Delete orphaned tokenization rows whose backing data no longer exists.
@@ -425,6 +457,8 @@ def run_tokenize_backfill() -> Dict:
         if not batch:
             break
 
+        batch_tokens = _translate_backfill_batch(batch)
+
         for line in batch:
             if attempted_lines >= total_lines:
                 break
@@ -433,7 +467,7 @@ def run_tokenize_backfill() -> Dict:
             last_id = line.id
 
             try:
-                success = tokenize_line(line.id, line.line_text, line.timestamp)
+                success = tokenize_line(line.id, line.line_text, line.timestamp, tokens=batch_tokens.get(line.id))
                 if success:
                     processed += 1
                 else:
@@ -457,6 +491,14 @@ def run_tokenize_backfill() -> Dict:
             batch_elapsed = time.time() - batch_started_at
             time.sleep(_calculate_adaptive_batch_sleep(batch_elapsed))
 
+    # Phase 3: Rebuild novelty aggregates that cleanup or edits marked dirty
+    try:
+        from GameSentenceMiner.util.database.word_novelty_tables import refresh_word_novelty
+
+        refresh_word_novelty(GameLinesTable._db)
+    except Exception as e:
+        logger.error(f"Word-novelty refresh failed: {e}")
+
     elapsed = time.time() - start_time
 
     if total_lines > 0 and attempted_lines == total_lines and last_logged_milestone < 100:
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from GameSentenceMiner.util.database.db import SQLiteDB, SQLiteDBTable
+
+
+class AITranslationCacheTable(SQLiteDBTable):
+    """Persistent AI translation responses keyed by a prompt fingerprint."""
+
+    _table = "ai_translation_cache"
+    _fields = [
+        "provider",
+        "model",
+        "prompt_version",
+        "translation",
+        "hit_count",
+        "created_at",
+        "last_used_at",
+    ]
+    _types = [
+        str,  # cache_key (primary key)
+        str,
+        str,
+        str,
+        str,
+        int,
+        float,
+        float,
+    ]
+    _pk = "cache_key"
+    _auto_increment = False
+
+    def __init__(
+        self,
+        cache_key: Optional[str] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None,
+        translation: Optional[str] = None,
+        hit_count: Optional[int] = None,
+        created_at: Optional[float] = None,
+        last_used_at: Optional[float] = None,
+    ):
+        self.cache_key = cache_key or ""
+        self.provider = provider or ""
+        self.model = model or ""
+        self.prompt_version = prompt_version or ""
+        self.translation = translation or ""
+        self.hit_count = hit_count if hit_count is not None else 0
+        self.created_at = created_at if created_at is not None else time.time()
+        self.last_used_at = last_used_at if last_used_at is not None else self.created_at
+
+    @classmethod
+    def _ensure_bound_db(cls) -> SQLiteDB:
+        from GameSentenceMiner.util.database.db import GameLinesTable
+
+        db = GameLinesTable._db
+        if db is None:
+            raise RuntimeError("AITranslationCacheTable is not bound to a database.")
+        if cls._db is None:
+            cls.set_db(db)
+        return cls._db
+
+    @classmethod
+    def lookup(cls, cache_key: str, min_created_at: float, now: Optional[float] = None) -> Optional[str]:
+        """Return the cached translation if it is newer than ``min_created_at``, bumping its LRU stamp."""
+        db = cls._ensure_bound_db()
+        row = db.fetchone(
+            f"SELECT translation, created_at FROM {cls._table} WHERE cache_key = ?",
+            (cache_key,),
+        )
+        if row is None:
+            return None
+        translation, created_at = row
+        if float(created_at or 0) < min_created_at:
+            db.execute(f"DELETE FROM {cls._table} WHERE cache_key = ?", (cache_key,), commit=True)
+            return None
+        db.execute(
+            f"UPDATE {cls._table} SET last_used_at = ?, hit_count = CAST(hit_count AS INTEGER) + 1 "
+            "WHERE cache_key = ?",
+            (now if now is not None else time.time(), cache_key),
+            commit=True,
+        )
+        return translation
+
+    @classmethod
+    def store(
+        cls,
+        cache_key: str,
+        provider: str,
+        model: str,
+        prompt_version: str,
+        translation: str,
+        now: Optional[float] = None,
+    ) -> None:
+        db = cls._ensure_bound_db()
+        now = now if now is not None else time.time()
+        db.execute(
+            f"INSERT OR REPLACE INTO {cls._table} "
+            "(cache_key, provider, model, prompt_version, translation, hit_count, created_at, last_used_at) "
+            "VALUES (?, ?, ?, ?, ?, 0, ?, ?)",
+            (cache_key, provider, model, prompt_version, translation, now, now),
+            commit=True,
+        )
+
+    @classmethod
+    def evict(cls, min_created_at: float, max_entries: int) -> int:
+        """Drop expired rows, then the least recently used rows beyond ``max_entries``."""
+        db = cls._ensure_bound_db()
+        expired = db.execute(
+            f"DELETE FROM {cls._table} WHERE CAST(created_at AS REAL) < ?",
+            (min_created_at,),
+            commit=True,
+        ).rowcount
+        overflow = db.execute(
+            f"DELETE FROM {cls._table} WHERE cache_key IN ("
+            f"SELECT cache_key FROM {cls._table} ORDER BY CAST(last_used_at AS REAL) DESC LIMIT -1 OFFSET ?)",
+            (max(0, int(max_entries)),),
+            commit=True,
+        ).rowcount
+        return max(0, expired or 0) + max(0, overflow or 0)
+
+    @classmethod
+    def count(cls) -> int:
+        db = cls._ensure_bound_db()
+        row = db.fetchone(f"SELECT COUNT(*) FROM {cls._table}")
+        return int(row[0]) if row else 0
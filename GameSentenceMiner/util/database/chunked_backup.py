@@ -0,0 +1,346 @@
+"""Deduplicated, content-addressed storage for daily database backups.
+
+A verified SQLite snapshot is split into page-aligned chunks. Each distinct
+chunk is stored once, zlib-compressed, under ``chunks/<prefix>/<sha256>.z``,
+and every daily backup is a small JSON manifest listing its chunks in order.
+The SQLite backup API copies pages to the same page numbers, so consecutive
+snapshots share almost all of their chunks and a new daily backup only writes
+the pages that changed.
+
+Manifests are published last, after every chunk they reference is on disk, so
+a crash mid-backup leaves at most unreferenced chunks for the next garbage
+collection.
+
+Restore a backup from the command line with::
+
+    python -m GameSentenceMiner.util.database.chunked_backup restore gsm_2026-01-01.manifest.json gsm.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+from GameSentenceMiner.util.config.configuration import logger
+from GameSentenceMiner.util.database.sqlite_core import (
+    DatabaseIntegrityError,
+    durable_replace,
+    verify_connection_integrity,
+)
+
+BACKUP_MANIFEST_FORMAT = "gsm-chunked-backup"
+BACKUP_MANIFEST_VERSION = 1
+BACKUP_MANIFEST_SUFFIX = ".manifest.json"
+BACKUP_CHUNK_DIRNAME = "chunks"
+BACKUP_CHUNK_SUFFIX = ".z"
+BACKUP_CHUNK_PAGES = 64
+BACKUP_CHUNK_COMPRESSLEVEL = 6
+SQLITE_DEFAULT_PAGE_SIZE = 4096
+_SQLITE_HEADER_MAGIC = b"SQLite format 3\x00"
+
+PathLike = Union[str, os.PathLike]
+
+
+@dataclass(frozen=True)
+class BackupManifest:
+    page_size: int
+    chunk_size: int
+    size: int
+    sha256: str
+    chunks: List[str]
+    created_at: float = 0.0
+    source: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "format": BACKUP_MANIFEST_FORMAT,
+            "version": BACKUP_MANIFEST_VERSION,
+            "created_at": self.created_at,
+            "source": self.source,
+            "page_size": self.page_size,
+            "chunk_size": self.chunk_size,
+            "size": self.size,
+            "sha256": self.sha256,
+            "chunks": list(self.chunks),
+        }
+
+
+@dataclass(frozen=True)
+class ChunkedBackupResult:
+    manifest_path: str
+    chunk_count: int
+    new_chunks: int
+    new_chunk_bytes: int
+
+
+def is_manifest_filename(name: str) -> bool:
+    return name.startswith("gsm_") and name.endswith(BACKUP_MANIFEST_SUFFIX)
+
+
+def _chunk_path(backup_dir: PathLike, digest: str) -> Path:
+    return Path(backup_dir) / BACKUP_CHUNK_DIRNAME / digest[:2] / f"{digest}{BACKUP_CHUNK_SUFFIX}"
+
+
+def sqlite_page_size(path: PathLike) -> int:
+    """Read the page size from an SQLite file header, defaulting for empty files."""
+    with open(path, "rb") as handle:
+        header = handle.read(100)
+    if len(header) < 100 or not header.startswith(_SQLITE_HEADER_MAGIC):
+        return SQLITE_DEFAULT_PAGE_SIZE
+    page_size = int.from_bytes(header[16:18], "big")
+    return 65536 if page_size == 1 else page_size
+
+
+def _iter_file_chunks(path: PathLike, chunk_size: int) -> Iterator[bytes]:
+    with open(path, "rb") as handle:
+        while True:
+            data = handle.read(chunk_size)
+            if not data:
+                return
+            yield data
+
+
+def _write_chunk(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(zlib.compress(data, BACKUP_CHUNK_COMPRESSLEVEL))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+    finally:
+        try:
+            temporary.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _sync_directory(path: Path) -> None:
+    if os.name == "nt":
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def write_chunked_backup(
+    snapshot_path: PathLike,
+    backup_dir: PathLike,
+    manifest_path: PathLike,
+    *,
+    chunk_pages: int = BACKUP_CHUNK_PAGES,
+) -> ChunkedBackupResult:
+    """Store a verified snapshot as deduplicated chunks plus a manifest."""
+    page_size = sqlite_page_size(snapshot_path)
+    chunk_size = page_size * max(1, int(chunk_pages))
+    whole_file = hashlib.sha256()
+    chunks: List[str] = []
+    touched_dirs: Set[Path] = set()
+    new_chunks = 0
+    new_chunk_bytes = 0
+    size = 0
+
+    for data in _iter_file_chunks(snapshot_path, chunk_size):
+        whole_file.update(data)
+        size += len(data)
+        digest = hashlib.sha256(data).hexdigest()
+        chunks.append(digest)
+        path = _chunk_path(backup_dir, digest)
+        if path.exists():
+            continue
+        _write_chunk(path, data)
+        touched_dirs.add(path.parent)
+        new_chunks += 1
+        new_chunk_bytes += path.stat().st_size
+
+    for directory in touched_dirs | {parent.parent for parent in touched_dirs}:
+        _sync_directory(directory)
+
+    manifest = BackupManifest(
+        page_size=page_size,
+        chunk_size=chunk_size,
+        size=size,
+        sha256=whole_file.hexdigest(),
+        chunks=chunks,
+        created_at=time.time(),
+        source=os.path.basename(os.fspath(snapshot_path)),
+    )
+    manifest_path = Path(manifest_path)
+    temporary = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(manifest.to_dict(), handle, indent=1)
+            handle.flush()
+            os.fsync(handle.fileno())
+        durable_replace(temporary, manifest_path)
+    finally:
+        try:
+            temporary.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    return ChunkedBackupResult(
+        manifest_path=str(manifest_path),
+        chunk_count=len(chunks),
+        new_chunks=new_chunks,
+        new_chunk_bytes=new_chunk_bytes,
+    )
+
+
+def load_backup_manifest(manifest_path: PathLike) -> BackupManifest:
+    with open(manifest_path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict) or data.get("format") != BACKUP_MANIFEST_FORMAT:
+        raise ValueError(f"Not a GSM chunked backup manifest: {manifest_path}")
+    if int(data.get("version", 0)) > BACKUP_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported backup manifest version {data.get('version')}: {manifest_path}")
+    return BackupManifest(
+        page_size=int(data["page_size"]),
+        chunk_size=int(data["chunk_size"]),
+        size=int(data["size"]),
+        sha256=str(data["sha256"]),
+        chunks=[str(digest) for digest in data["chunks"]],
+        created_at=float(data.get("created_at") or 0.0),
+        source=str(data.get("source") or ""),
+    )
+
+
+def _read_chunk(backup_dir: PathLike, digest: str) -> bytes:
+    path = _chunk_path(backup_dir, digest)
+    try:
+        with open(path, "rb") as handle:
+            data = zlib.decompress(handle.read())
+    except FileNotFoundError:
+        raise DatabaseIntegrityError(f"Backup chunk is missing: {path}") from None
+    except zlib.error as e:
+        raise DatabaseIntegrityError(f"Backup chunk is unreadable: {path}: {e}") from e
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise DatabaseIntegrityError(f"Backup chunk does not match its hash: {path}")
+    return data
+
+
+def _reassemble(manifest_path: PathLike, destination: Path) -> None:
+    manifest = load_backup_manifest(manifest_path)
+    backup_dir = Path(manifest_path).parent
+    whole_file = hashlib.sha256()
+    with open(destination, "wb") as handle:
+        for digest in manifest.chunks:
+            data = _read_chunk(backup_dir, digest)
+            whole_file.update(data)
+            handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    if whole_file.hexdigest() != manifest.sha256:
+        raise DatabaseIntegrityError(f"Reassembled backup does not match its manifest: {manifest_path}")
+
+
+def _verify_sqlite_file(path: Path, *, full: bool) -> None:
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        verify_connection_integrity(conn, full=full)
+    finally:
+        conn.close()
+
+
+def restore_database_backup(manifest_path: PathLike, destination_path: PathLike, *, full: bool = False) -> None:
+    """Reassemble a backup, verify it, and atomically publish it at ``destination_path``.
+
+    The destination must not be open by GSM while it is being replaced.
+    """
+    destination = Path(destination_path)
+    temporary = destination.with_name(f".{destination.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        _reassemble(manifest_path, temporary)
+        _verify_sqlite_file(temporary, full=full)
+        durable_replace(temporary, destination)
+    finally:
+        try:
+            temporary.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def verify_database_backup(manifest_path: PathLike, *, full: bool = False) -> None:
+    """Raise :class:`DatabaseIntegrityError` unless the backup reassembles into a healthy database."""
+    manifest_path = Path(manifest_path)
+    temporary = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.{uuid.uuid4().hex}.verify.db")
+    try:
+        _reassemble(manifest_path, temporary)
+        _verify_sqlite_file(temporary, full=full)
+    finally:
+        try:
+            temporary.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _iter_chunk_files(backup_dir: PathLike) -> Iterable[Path]:
+    chunk_root = Path(backup_dir) / BACKUP_CHUNK_DIRNAME
+    if not chunk_root.is_dir():
+        return []
+    return (path for path in chunk_root.glob(f"*/*{BACKUP_CHUNK_SUFFIX}") if path.is_file())
+
+
+def collect_unreferenced_chunks(backup_dir: PathLike) -> Optional[int]:
+    """Delete chunks no manifest references; return the count, or ``None`` if skipped.
+
+    Collection is skipped entirely when any manifest cannot be read, since its
+    chunks cannot be told apart from garbage.
+    """
+    referenced: Set[str] = set()
+    for name in os.listdir(backup_dir):
+        if not is_manifest_filename(name):
+            continue
+        try:
+            referenced.update(load_backup_manifest(os.path.join(backup_dir, name)).chunks)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Skipping backup chunk cleanup because {name} is unreadable: {e}")
+            return None
+
+    removed = 0
+    for path in list(_iter_chunk_files(backup_dir)):
+        if path.name[: -len(BACKUP_CHUNK_SUFFIX)] in referenced:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify or restore a GSM chunked database backup.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    verify_parser = subparsers.add_parser("verify", help="Reassemble a backup and run an integrity check")
+    verify_parser.add_argument("manifest")
+    verify_parser.add_argument("--full", action="store_true", help="Run a full integrity_check")
+    restore_parser = subparsers.add_parser("restore", help="Reassemble a backup into a database file")
+    restore_parser.add_argument("manifest")
+    restore_parser.add_argument("destination")
+    restore_parser.add_argument("--full", action="store_true", help="Run a full integrity_check")
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        verify_database_backup(args.manifest, full=args.full)
+        print(f"Backup OK: {args.manifest}")
+    else:
+        restore_database_backup(args.manifest, args.destination, full=args.full)
+        print(f"Restored {args.manifest} to {args.destination}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Process-wide generation counters for data behind memoized stats payloads.
+
+Writers bump the domain they touched; readers key cached results on a
+``snapshot`` of the domains they depend on, so any write turns the next lookup
+into a miss. Counters live in memory only, which means a restart simply starts
+every memo cold.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+LINES = "lines"
+ROLLUPS = "rollups"
+THIRD_PARTY = "third_party"
+GAMES = "games"
+GOALS = "goals"
+ANKI = "anki"
+
+_lock = threading.Lock()
+_generations: dict[str, int] = {}
+
+
+def bump(domain: Optional[str]) -> int:
+    """Record a write to ``domain`` and return its new generation."""
+    if not domain:
+        return 0
+    with _lock:
+        generation = _generations.get(domain, 0) + 1
+        _generations[domain] = generation
+    return generation
+
+
+def current(domain: str) -> int:
+    with _lock:
+        return _generations.get(domain, 0)
+
+
+def snapshot(domains: Iterable[str]) -> tuple[int, ...]:
+    """Generations of ``domains`` in the given order, for use inside memo keys."""
+    with _lock:
+        return tuple(_generations.get(domain, 0) for domain in domains)
+
+
+class GenerationMemo:
+    """Small LRU of computed values whose keys embed generation snapshots.
+
+    Stale entries are never looked up again once a generation moves on, so they
+    simply age out of the LRU. Values that also depend on data no generation
+    tracks can be given a lifetime instead.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        lifetime: Optional[Callable[[Any], Optional[float]]] = None,
+    ) -> Any:
+        """Return the value memoized under ``key``, computing it on a miss.
+
+        ``lifetime`` maps a freshly computed value to the seconds it may be
+        served for: None keeps it until evicted, zero or less skips storing it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return value
+                del self._entries[key]
+            self._stats["misses"] += 1
+
+        # Computed outside the lock: concurrent misses may both build the value,
+        # which is cheaper than serializing every dashboard request behind one.
+        value = compute()
+        seconds = lifetime(value) if lifetime is not None else None
+        if seconds is not None and seconds <= 0:
+            return value
+        expires_at = None if seconds is None else time.monotonic() + seconds
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
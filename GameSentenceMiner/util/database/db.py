@@ -1,9 +1,7 @@
 import concurrent.futures
-import gzip
 import json
 import os
 import regex
-import shutil
 import sqlite3
 import sys
 import threading
@@ -13,6 +11,7 @@ from datetime import datetime
 from datetime import timedelta
 from functools import lru_cache
 from sys import platform
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple, Union, Type, TypeVar
 
 from GameSentenceMiner.util.config.configuration import (
@@ -22,13 +21,19 @@ from GameSentenceMiner.util.config.configuration import (
     sanitize_and_resolve_path,
 )
 from GameSentenceMiner.util.text_log import GameLine
+from GameSentenceMiner.util.database import data_generation
+from GameSentenceMiner.util.database.chunked_backup import (
+    BACKUP_MANIFEST_SUFFIX,
+    collect_unreferenced_chunks,
+    is_manifest_filename,
+    write_chunked_backup,
+)
 from GameSentenceMiner.util.database.sqlite_core import (
     DB_PRIORITY_HIGH as DB_PRIORITY_HIGH,
     DB_PRIORITY_LOW as DB_PRIORITY_LOW,
     DB_PRIORITY_NORMAL as DB_PRIORITY_NORMAL,
     SQLiteDB,
     atomic_sqlite_backup,
-    durable_replace,
     sqlite_file_uri,
 )
 
@@ -81,6 +86,26 @@ repeating_chars_regex = regex.compile(r"(.+?)\1{2,}")
 # Abstract base for table-mapped classes
 T = TypeVar("T", bound="SQLiteDBTable")
 
+_column_update_stats: Dict[str, Dict[str, int]] = {}
+_column_update_stats_lock = threading.Lock()
+
+
+def _record_column_update(table: str, counter: str, written: int = 0, skipped: int = 0) -> None:
+    with _column_update_stats_lock:
+        stats = _column_update_stats.setdefault(
+            table,
+            {"diff_updates": 0, "field_updates": 0, "noop_saves": 0, "columns_written": 0, "columns_skipped": 0},
+        )
+        stats[counter] += 1
+        stats["columns_written"] += written
+        stats["columns_skipped"] += skipped
+
+
+def get_column_update_stats() -> Dict[str, Dict[str, int]]:
+    """Per-table counts of column-diff UPDATEs and how many columns they touched."""
+    with _column_update_stats_lock:
+        return {table: dict(stats) for table, stats in _column_update_stats.items()}
+
 
 class SQLiteDBTable:
     _db: SQLiteDB = None
@@ -89,6 +114,7 @@ class SQLiteDBTable:
     _types: List[type] = []
     _pk: str = "id"
     _auto_increment: bool = True
+    _data_domain: Optional[str] = None  # data_generation domain bumped on writes
     _column_order_cache: Optional[List[str]] = None  # Cache for actual column order
     _row_field_mapping_cache: Optional[List[Tuple[int, str, type, bool]]] = None
 
@@ -104,6 +130,7 @@ class SQLiteDBTable:
         cls._db = db
         cls._column_order_cache = None  # Reset cache when database changes
         cls._row_field_mapping_cache = None
+        cls.mark_data_changed()
         if db.read_only or not ensure_schema:
             return
         # Ensure table exists
@@ -124,6 +151,11 @@ class SQLiteDBTable:
                 cls._column_order_cache = None  # Reset cache when schema changes
                 cls._row_field_mapping_cache = None
 
+    @classmethod
+    def mark_data_changed(cls) -> None:
+        """Invalidate memoized payloads built from this table (see data_generation)."""
+        data_generation.bump(cls._data_domain)
+
     @classmethod
     def all(cls: Type[T]) -> List[T]:
         rows = cls._db.fetchall(f"SELECT * FROM {cls._table}")
@@ -174,6 +206,8 @@ class SQLiteDBTable:
                     row_value,
                     is_pk,
                 )
+            # Kept by reference only; save() derives the persisted values from it on demand.
+            obj._loaded_row = row
 
         except Exception as e:
             # Fallback to original behavior if schema-based mapping fails
@@ -242,20 +276,100 @@ class SQLiteDBTable:
         else:
             setattr(obj, field, row_value)
 
+    @staticmethod
+    def _serialize_field_value(value: Any) -> Any:
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        if isinstance(value, bool):
+            return 1 if value else 0
+        return value
+
+    def _persisted_field_values(self) -> Optional[Dict[str, Any]]:
+        """Serialized column values as last read from or written to the database.
+
+        ``None`` means the instance was built in memory, so every field is dirty.
+        """
+        persisted = self.__dict__.get("_persisted_values")
+        if persisted is not None:
+            return persisted
+        row = self.__dict__.get("_loaded_row")
+        if row is None:
+            return None
+        scratch = SimpleNamespace()
+        persisted = {}
+        for actual_pos, field, field_type, is_pk in self.get_row_field_mapping():
+            if is_pk or actual_pos >= len(row):
+                continue
+            self._set_field_value(scratch, field, field_type, row[actual_pos])
+            persisted[field] = self._serialize_field_value(getattr(scratch, field))
+        return persisted
+
+    def _mark_persisted(self, data: Dict[str, Any]) -> None:
+        self._persisted_values = dict(data)
+        self.__dict__.pop("_loaded_row", None)
+
+    def dirty_fields(self) -> List[str]:
+        """Fields whose current value differs from what the database holds."""
+        persisted = self._persisted_field_values()
+        if persisted is None:
+            return list(self._fields)
+        return [
+            field
+            for field in self._fields
+            if field not in persisted or self._serialize_field_value(getattr(self, field)) != persisted[field]
+        ]
+
+    @classmethod
+    def update_fields(cls, pk_value: Any, **fields: Any) -> int:
+        """UPDATE only ``fields`` on one row without reading it first.
+
+        Returns the number of rows updated, so ``0`` means no row has ``pk_value``.
+        """
+        unknown = [field for field in fields if field not in cls._fields]
+        if unknown:
+            raise ValueError(f"Unknown columns for {cls._table}: {', '.join(unknown)}")
+        if not fields:
+            return 0
+        data = {field: cls._serialize_field_value(value) for field, value in fields.items()}
+        set_clause = ", ".join(f"{field}=?" for field in data)
+        cur = cls._db.execute(
+            f"UPDATE {cls._table} SET {set_clause} WHERE {cls._pk}=?",
+            tuple(data.values()) + (pk_value,),
+            commit=True,
+        )
+        updated = cur.rowcount or 0
+        _record_column_update(cls._table, "field_updates", len(data), len(cls._fields) - len(data))
+        if updated:
+            cls.mark_data_changed()
+        return updated
+
     def save(self, retry=1):
         try:
             # Build serialized data dict WITHOUT mutating self, so list/dict/bool
             # fields remain usable as their original Python types after save().
-            data = {}
-            for field in self._fields:
-                field_value = getattr(self, field)
-                if isinstance(field_value, (list, dict)):
-                    data[field] = json.dumps(field_value)
-                elif isinstance(field_value, bool):
-                    data[field] = 1 if field_value else 0
-                else:
-                    data[field] = field_value
+            data = {field: self._serialize_field_value(getattr(self, field)) for field in self._fields}
             pk_val = getattr(self, self._pk, None)
+            persisted = self._persisted_field_values() if pk_val is not None else None
+            if persisted is not None:
+                # Row is known to exist: write only the columns that changed.
+                changed = {
+                    field: value for field, value in data.items() if field not in persisted or value != persisted[field]
+                }
+                if not changed:
+                    _record_column_update(self._table, "noop_saves", 0, len(data))
+                    return
+                set_clause = ", ".join([f"{k}=?" for k in changed.keys()])
+                query = f"UPDATE {self._table} SET {set_clause} WHERE {self._pk}=?"
+                cur = self._db.execute(query, tuple(changed.values()) + (pk_val,), commit=True)
+                if cur.rowcount:
+                    _record_column_update(self._table, "diff_updates", len(changed), len(data) - len(changed))
+                    logger.debug(f"Updated {self._table} {self._pk}={pk_val} columns={list(changed)}")
+                    self._mark_persisted(data)
+                    self.mark_data_changed()
+                    return
+                # The row vanished since it was read; fall through and write it in full.
+                self.__dict__.pop("_persisted_values", None)
+                self.__dict__.pop("_loaded_row", None)
             if pk_val is None:
                 # Insert (auto-increment: pk assigned by DB)
                 keys = ", ".join(data.keys())
@@ -283,6 +397,8 @@ class SQLiteDBTable:
                 query = f"UPDATE {self._table} SET {set_clause} WHERE {self._pk}=?"
                 self._db.execute(query, values + (pk_val,), commit=True)
                 logger.debug(f"Updated {self._table} id={pk_val}")
+            self._mark_persisted(data)
+            self.mark_data_changed()
         except sqlite3.OperationalError as e:
             if retry <= 0:
                 logger.error(f"Failed to save record to {self._table}: {e}")
@@ -304,21 +420,15 @@ class SQLiteDBTable:
                 raise ValueError(f"Primary key {self._pk} must be set for non-auto-increment tables.")
             else:
                 # Serialize list/dict/bool fields WITHOUT mutating self
-                serialized = {}
-                for field in self._fields:
-                    field_value = getattr(self, field)
-                    if isinstance(field_value, (list, dict)):
-                        serialized[field] = json.dumps(field_value)
-                    elif isinstance(field_value, bool):
-                        serialized[field] = 1 if field_value else 0
-                    else:
-                        serialized[field] = field_value
+                serialized = {field: self._serialize_field_value(getattr(self, field)) for field in self._fields}
 
                 keys = ", ".join(self._fields + [self._pk])
                 placeholders = ", ".join(["?"] * (len(self._fields) + 1))
                 values = tuple(serialized[field] for field in self._fields) + (pk_val,)
                 query = f"INSERT INTO {self._table} ({keys}) VALUES ({placeholders})"
                 self._db.execute(query, values, commit=True)
+                self._mark_persisted(serialized)
+                self.mark_data_changed()
         except sqlite3.OperationalError as e:
             if retry <= 0:
                 logger.error(f"Failed to add record to {self._table}: {e}")
@@ -350,6 +460,7 @@ class SQLiteDBTable:
         if pk_val is not None:
             query = f"DELETE FROM {self._table} WHERE {self._pk}=?"
             self._db.execute(query, (pk_val,), commit=True)
+            self.mark_data_changed()
 
     def print(self):
         pk_val = getattr(self, self._pk, None)
@@ -659,6 +770,7 @@ class GameLinesTable(SQLiteDBTable):
     ]
     _pk = "id"
     _auto_increment = False  # Use string IDs
+    _data_domain = data_generation.LINES
 
     def __init__(
         self,
@@ -736,30 +848,35 @@ class GameLinesTable(SQLiteDBTable):
         translation: Optional[str] = None,
         note_id: Optional[str] = None,
     ):
-        line = cls.get(line_id)
-        if not line:
+        fields = {
+            name: value
+            for name, value in (
+                ("screenshot_path", screenshot_path),
+                ("audio_path", audio_path),
+                ("replay_path", replay_path),
+                ("screenshot_in_anki", screenshot_in_anki),
+                ("audio_in_anki", audio_in_anki),
+                ("translation", translation),
+            )
+            if value is not None
+        }
+        if note_id is not None:
+            # Appending needs the current list, but only that one column.
+            row = cls._db.fetchone(f"SELECT note_ids FROM {cls._table} WHERE {cls._pk}=?", (line_id,))
+            if row is None:
+                logger.warning(f"GameLine with id {line_id} not found for update, maybe testing?")
+                return
+            try:
+                note_ids = json.loads(row[0]) if row[0] else []
+            except json.JSONDecodeError:
+                note_ids = []
+            if note_id not in note_ids:
+                fields["note_ids"] = note_ids + [note_id]
+        fields["last_modified"] = time.time()
+        if not cls.update_fields(line_id, **fields):
             logger.warning(f"GameLine with id {line_id} not found for update, maybe testing?")
             return
-        if screenshot_path is not None:
-            line.screenshot_path = screenshot_path
-        if audio_path is not None:
-            line.audio_path = audio_path
-        if replay_path is not None:
-            line.replay_path = replay_path
-        if screenshot_in_anki is not None:
-            line.screenshot_in_anki = screenshot_in_anki
-        if audio_in_anki is not None:
-            line.audio_in_anki = audio_in_anki
-        if translation is not None:
-            line.translation = translation
-        if note_id is not None:
-            if note_id not in line.note_ids:
-                if not line.note_ids:
-                    line.note_ids = []
-                line.note_ids.append(note_id)
-        line.last_modified = time.time()
-        line.save()
-        logger.debug(f"Updated GameLine id={line_id} paths.")
+        logger.debug(f"Updated GameLine id={line_id} columns={list(fields)}.")
 
     @classmethod
     def add_line(cls, gameline: GameLine, game_id: Optional[str] = None):
@@ -832,6 +949,7 @@ class GameLinesTable(SQLiteDBTable):
             params,
             commit=True,
         )
+        cls.mark_data_changed()
         if _is_tokenization_enabled():
             from GameSentenceMiner.util.cron.tokenize_lines import (
                 enqueue_realtime_tokenization_batch,
@@ -882,50 +1000,115 @@ class GameLinesTable(SQLiteDBTable):
                 return str(value)
         return str(value)
 
+    @staticmethod
+    def _to_sync_float(value: Any) -> Optional[float]:
+        """Coerce a stored REAL/TEXT column the same way ``from_row`` does for float fields."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                try:
+                    return datetime.fromisoformat(value.replace(" ", "T")).timestamp()
+                except (ValueError, AttributeError):
+                    return None
+        return float(value)
+
+    @staticmethod
+    def _note_ids_from_column(value: Any) -> List[Any]:
+        if not value:
+            return []
+        try:
+            parsed = json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            return []
+        return parsed if isinstance(parsed, list) else [parsed]
+
     @classmethod
-    def _serialize_line_for_sync(cls, line: "GameLinesTable") -> Dict[str, Any]:
+    def _serialize_sync_fields(
+        cls,
+        game_name: Any,
+        line_text: Any,
+        language: Any,
+        timestamp: Optional[float],
+        note_ids: Any,
+        last_modified: Optional[float],
+    ) -> Dict[str, Any]:
         return {
-            "game_name": cls._to_sync_string(line.game_name),
-            "line_text": cls._to_sync_string(line.line_text),
-            "language": cls._to_sync_string(
-                line.language if line.language else str(get_config().general.target_language)
-            ),
-            "timestamp": float(line.timestamp) if line.timestamp is not None else 0.0,
-            "note_ids": cls._to_sync_note_ids(line.note_ids),
-            "last_modified": float(line.last_modified) if line.last_modified is not None else time.time(),
+            "game_name": cls._to_sync_string(game_name),
+            "line_text": cls._to_sync_string(line_text),
+            "language": cls._to_sync_string(language if language else str(get_config().general.target_language)),
+            "timestamp": float(timestamp) if timestamp is not None else 0.0,
+            "note_ids": cls._to_sync_note_ids(note_ids),
+            "last_modified": float(last_modified) if last_modified is not None else time.time(),
         }
 
     @classmethod
-    def get_pending_sync_changes(cls, limit: int = 500) -> List[Dict[str, Any]]:
+    def _serialize_line_for_sync(cls, line: "GameLinesTable") -> Dict[str, Any]:
+        return cls._serialize_sync_fields(
+            line.game_name,
+            line.line_text,
+            line.language,
+            line.timestamp,
+            line.note_ids,
+            line.last_modified,
+        )
+
+    @classmethod
+    def get_pending_sync_changes(
+        cls,
+        limit: int = 500,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Return pending gameline changes for cloud sync.
         Each line id appears once with the latest operation (upsert/delete).
+
+        The batch is read with one JOIN against game_lines instead of a lookup
+        per change. ``after`` is a ``(changed_at, line_id)`` cursor from a
+        previous batch so the next one can be prepared before that batch is
+        acknowledged.
         """
         if limit <= 0:
             return []
 
+        where = ""
+        params: Tuple[Any, ...] = (limit,)
+        if after is not None:
+            where = "WHERE (c.changed_at > ? OR (c.changed_at = ? AND c.line_id > ?))"
+            params = (after[0], after[0], after[1], limit)
+
         rows = cls._db.fetchall(
-            f"SELECT line_id, change_type, changed_at FROM {cls._sync_changes_table} ORDER BY changed_at ASC LIMIT ?",
-            (limit,),
+            f"""
+            SELECT c.line_id, c.change_type, c.changed_at,
+                   g.id, g.game_name, g.line_text, g.language, g.timestamp, g.note_ids, g.last_modified
+            FROM {cls._sync_changes_table} c
+            LEFT JOIN {cls._table} g ON g.id = c.line_id
+            {where}
+            ORDER BY c.changed_at ASC, c.line_id ASC
+            LIMIT ?
+            """,
+            params,
         )
 
         payload: List[Dict[str, Any]] = []
-        for line_id, change_type, changed_at in rows:
-            normalized_change_type = "upsert" if change_type == "upsert" else "delete"
+        for (
+            line_id,
+            change_type,
+            changed_at,
+            existing_id,
+            game_name,
+            line_text,
+            language,
+            timestamp,
+            note_ids,
+            last_modified,
+        ) in rows:
             changed_at_value = float(changed_at) if changed_at is not None else time.time()
 
-            if normalized_change_type == "delete":
-                payload.append(
-                    {
-                        "id": line_id,
-                        "operation": "delete",
-                        "changed_at": changed_at_value,
-                    }
-                )
-                continue
-
-            line = cls.get(line_id)
-            if not line:
+            # Upserts whose line has since disappeared are sent as deletes.
+            if change_type != "upsert" or existing_id is None:
                 payload.append(
                     {
                         "id": line_id,
@@ -940,26 +1123,45 @@ class GameLinesTable(SQLiteDBTable):
                     "id": line_id,
                     "operation": "upsert",
                     "changed_at": changed_at_value,
-                    "data": cls._serialize_line_for_sync(line),
+                    "data": cls._serialize_sync_fields(
+                        game_name or "",
+                        line_text or "",
+                        language,
+                        cls._to_sync_float(timestamp),
+                        cls._note_ids_from_column(note_ids),
+                        cls._to_sync_float(last_modified),
+                    ),
                 }
             )
 
         return payload
 
     @classmethod
-    def acknowledge_sync_changes(cls, line_ids: List[str]) -> int:
+    def acknowledge_sync_changes(cls, sent_changes: List[Tuple[str, float]]) -> int:
         """
         Remove pending changes after the cloud service acknowledges them.
+
+        Takes the (line_id, changed_at) pairs that were sent. A line edited again
+        after it was read for sending has a newer changed_at and stays pending.
         """
-        unique_line_ids = sorted({line_id for line_id in line_ids if line_id})
-        if not unique_line_ids:
+        acknowledged: Dict[str, float] = {}
+        for line_id, changed_at in sent_changes:
+            if line_id and changed_at is not None:
+                acknowledged[line_id] = max(float(changed_at), acknowledged.get(line_id, float("-inf")))
+        if not acknowledged:
             return 0
-        deleted = cls._db.delete_where_in(
-            cls._sync_changes_table,
-            "line_id",
-            unique_line_ids,
-        )
-        return deleted if deleted > 0 else len(unique_line_ids)
+
+        def _acknowledge(conn) -> int:
+            deleted = 0
+            for line_id, changed_at in acknowledged.items():
+                cursor = conn.execute(
+                    f"DELETE FROM {cls._sync_changes_table} WHERE line_id = ? AND changed_at <= ?",
+                    (line_id, changed_at),
+                )
+                deleted += max(cursor.rowcount or 0, 0)
+            return deleted
+
+        return cls._db.run_transaction(_acknowledge)
 
     @classmethod
     def queue_all_lines_for_sync(cls) -> int:
@@ -992,91 +1194,87 @@ class GameLinesTable(SQLiteDBTable):
             return stats
 
         ordered_changes = sorted(changes, key=lambda change: float(change.get("changed_at", 0) or 0))
+        upsert_sql = f"""
+            INSERT INTO {cls._table} (
+                id, game_name, line_text, language, timestamp,
+                original_game_name, game_id, note_ids, last_modified, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                game_name=excluded.game_name,
+                line_text=excluded.line_text,
+                language=excluded.language,
+                timestamp=excluded.timestamp,
+                note_ids=excluded.note_ids,
+                last_modified=excluded.last_modified
+        """
+        delete_sql = f"DELETE FROM {cls._table} WHERE id=?"
+
+        # Consecutive changes of the same kind are written with one executemany;
+        # switching kinds flushes, so per-line ordering (delete then re-add) holds.
+        batches: List[Tuple[str, List[Tuple]]] = []
+        tracked_ids: List[str] = []
+        now = time.time()
+        for change in ordered_changes:
+            line_id = str(change.get("id", "")).strip()
+            operation = str(change.get("operation", "")).strip().lower()
+
+            if not line_id or operation not in {"upsert", "delete"}:
+                stats["ignored"] += 1
+                continue
 
-        def _apply(conn):
-            for change in ordered_changes:
-                line_id = str(change.get("id", "")).strip()
-                operation = str(change.get("operation", "")).strip().lower()
-
-                if not line_id or operation not in {"upsert", "delete"}:
-                    stats["ignored"] += 1
-                    continue
-
-                if operation == "delete":
-                    cls._db.execute(
-                        f"DELETE FROM {cls._table} WHERE id=?",
-                        (line_id,),
-                        commit=True,
-                    )
-                    if clear_local_tracking:
-                        cls._db.execute(
-                            f"DELETE FROM {cls._sync_changes_table} WHERE line_id=?",
-                            (line_id,),
-                            commit=True,
-                        )
-                    stats["deletes"] += 1
-                    continue
-
+            if operation == "delete":
+                params: Tuple = (line_id,)
+            else:
                 line_data = change.get("data")
                 if not isinstance(line_data, dict):
                     stats["ignored"] += 1
                     continue
-
                 timestamp = float(line_data.get("timestamp", 0) or 0)
-                changed_at = float(line_data.get("last_modified", change.get("changed_at", time.time())) or time.time())
+                changed_at = float(line_data.get("last_modified", change.get("changed_at", now)) or now)
                 language = str(line_data.get("language") or get_config().general.target_language)
-
-                cls._db.execute(
-                    f"""
-                    INSERT INTO {cls._table} (
-                        id, game_name, line_text, language, timestamp,
-                        original_game_name, game_id, note_ids, last_modified, created_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        game_name=excluded.game_name,
-                        line_text=excluded.line_text,
-                        language=excluded.language,
-                        timestamp=excluded.timestamp,
-                        note_ids=excluded.note_ids,
-                        last_modified=excluded.last_modified
-                    """,
-                    (
-                        line_id,
-                        line_data.get("game_name", ""),
-                        line_data.get("line_text", ""),
-                        language,
-                        timestamp,
-                        line_data.get("game_name") or "",
-                        "",
-                        json.dumps(cls._to_sync_note_ids(line_data.get("note_ids"))),
-                        changed_at,
-                        time.time(),
-                    ),
-                    commit=True,
+                params = (
+                    line_id,
+                    line_data.get("game_name", ""),
+                    line_data.get("line_text", ""),
+                    language,
+                    timestamp,
+                    line_data.get("game_name") or "",
+                    "",
+                    json.dumps(cls._to_sync_note_ids(line_data.get("note_ids"))),
+                    changed_at,
+                    now,
                 )
-                if clear_local_tracking:
-                    cls._db.execute(
-                        f"DELETE FROM {cls._sync_changes_table} WHERE line_id=?",
-                        (line_id,),
-                        commit=True,
+
+            if batches and batches[-1][0] == operation:
+                batches[-1][1].append(params)
+            else:
+                batches.append((operation, [params]))
+            tracked_ids.append(line_id)
+            stats["upserts" if operation == "upsert" else "deletes"] += 1
+
+        def _apply(conn):
+            for operation, rows in batches:
+                conn.executemany(upsert_sql if operation == "upsert" else delete_sql, rows)
+            if clear_local_tracking and tracked_ids:
+                unique_ids = list(dict.fromkeys(tracked_ids))
+                for start in range(0, len(unique_ids), 500):
+                    chunk = unique_ids[start : start + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    conn.execute(
+                        f"DELETE FROM {cls._sync_changes_table} WHERE line_id IN ({placeholders})",
+                        tuple(chunk),
                     )
-                stats["upserts"] += 1
 
         cls._db.run_transaction(_apply)
+        cls.mark_data_changed()
 
         # Link any newly inserted lines that are missing game_id.
         # link_game_lines() may UPDATE game_lines rows (setting game_id),
         # which fires the sync-tracking trigger and re-creates entries we
         # just deleted.  Collect all applied IDs so we can scrub them once
         # more after linking.
-        applied_ids: List[str] = []
-        if clear_local_tracking:
-            for change in ordered_changes:
-                line_id = str(change.get("id", "")).strip()
-                op = str(change.get("operation", "")).strip().lower()
-                if line_id and op in {"upsert", "delete"}:
-                    applied_ids.append(line_id)
+        applied_ids = tracked_ids if clear_local_tracking else []
 
         if stats["upserts"] > 0:
             try:
@@ -1105,6 +1303,7 @@ class GameLinesTable(SQLiteDBTable):
             (line_id,),
             commit=True,
         )
+        cls.mark_data_changed()
 
     @classmethod
     def get_lines_filtered_by_timestamp(
@@ -1213,6 +1412,7 @@ class GoalsTable(SQLiteDBTable):
     ]
     _pk = "id"
     _auto_increment = True
+    _data_domain = data_generation.GOALS
 
     def __init__(
         self,
@@ -1381,8 +1581,6 @@ DATABASE_BACKUP_DEFAULT_RETENTION_COUNT = 2
 DATABASE_BACKUP_PAGE_COUNT = 512
 DATABASE_BACKUP_SLEEP_SECONDS = 0.05
 DATABASE_BACKUP_BUSY_TIMEOUT_MS = 5000
-DATABASE_BACKUP_GZIP_COMPRESSLEVEL = 1
-DATABASE_BACKUP_COPY_BUFFER_SIZE = 1024 * 1024
 DATABASE_BACKUP_LOCK_STALE_SECONDS = 6 * 60 * 60
 
 
@@ -1405,7 +1603,12 @@ def _daily_database_backup_path(
     backup_dir: Optional[str] = None,
 ) -> str:
     destination_dir = backup_dir or _database_backup_dir(db_path)
-    return os.path.join(destination_dir, f"gsm_{_backup_date_string(now)}.db.gz")
+    return os.path.join(destination_dir, f"gsm_{_backup_date_string(now)}{BACKUP_MANIFEST_SUFFIX}")
+
+
+def _is_database_backup_filename(fname: str) -> bool:
+    # Legacy full ``.db.gz`` copies still count toward retention until they age out.
+    return is_manifest_filename(fname) or (fname.startswith("gsm_") and fname.endswith(".db.gz"))
 
 
 def _remove_excess_database_backups(
@@ -1416,7 +1619,7 @@ def _remove_excess_database_backups(
     backups: List[Tuple[float, str]] = []
     for fname in os.listdir(backup_dir):
         fpath = os.path.join(backup_dir, fname)
-        if not (fname.startswith("gsm_") and fname.endswith(".db.gz")):
+        if not _is_database_backup_filename(fname):
             continue
         if not os.path.isfile(fpath):
             continue
@@ -1434,6 +1637,10 @@ def _remove_excess_database_backups(
         except Exception as e:
             logger.warning(f"Failed to remove old backup {fpath}: {e}")
 
+    removed_chunks = collect_unreferenced_chunks(backup_dir)
+    if removed_chunks:
+        logger.info(f"Removed {removed_chunks} unreferenced backup chunks from {backup_dir}")
+
 
 @contextmanager
 def _database_backup_lock(backup_dir: str):
@@ -1492,18 +1699,6 @@ def _create_sqlite_backup(source_path: str, destination_path: str) -> None:
         source_conn.close()
 
 
-def _gzip_file(source_path: str, destination_path: str) -> None:
-    with open(source_path, "rb") as f_in, open(destination_path, "wb") as f_out:
-        with gzip.GzipFile(
-            fileobj=f_out,
-            mode="wb",
-            compresslevel=DATABASE_BACKUP_GZIP_COMPRESSLEVEL,
-        ) as gz_out:
-            shutil.copyfileobj(f_in, gz_out, length=DATABASE_BACKUP_COPY_BUFFER_SIZE)
-        f_out.flush()
-        os.fsync(f_out.fileno())
-
-
 def backup_db(
     db_path: str,
     *,
@@ -1511,7 +1706,12 @@ def backup_db(
     retention_count: int = DATABASE_BACKUP_DEFAULT_RETENTION_COUNT,
     now: Optional[Union[float, datetime]] = None,
 ) -> Optional[str]:
-    """Create today's compressed SQLite backup if one does not already exist."""
+    """Create today's deduplicated SQLite backup if one does not already exist.
+
+    The snapshot is stored as chunks shared with earlier backups plus a daily
+    manifest; see :mod:`GameSentenceMiner.util.database.chunked_backup` for the
+    format and for restoring.
+    """
     if not os.path.exists(db_path):
         logger.debug(f"Skipping database backup because database does not exist: {db_path}")
         return None
@@ -1525,33 +1725,33 @@ def backup_db(
         if not lock_acquired:
             logger.debug("Skipping database backup because another backup is already running.")
             return None
-        if os.path.exists(backup_file):
+        legacy_backup_file = os.path.join(backup_dir, f"gsm_{_backup_date_string(now)}.db.gz")
+        if os.path.exists(backup_file) or os.path.exists(legacy_backup_file):
             logger.debug(f"Database backup already exists for today: {backup_file}")
             _remove_excess_database_backups(backup_dir, retention_count=retention_count)
             return None
 
         temp_prefix = f".{os.path.basename(backup_file)}.{os.getpid()}.{threading.get_ident()}"
         temp_db = os.path.join(backup_dir, f"{temp_prefix}.tmp.db")
-        temp_gz = os.path.join(backup_dir, f"{temp_prefix}.tmp.gz")
 
         try:
-            for temp_path in (temp_db, temp_gz):
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            if os.path.exists(temp_db):
+                os.remove(temp_db)
 
             _create_sqlite_backup(db_path, temp_db)
-            _gzip_file(temp_db, temp_gz)
-            durable_replace(temp_gz, backup_file)
+            result = write_chunked_backup(temp_db, backup_dir, backup_file)
             _remove_excess_database_backups(backup_dir, retention_count=retention_count)
-            logger.success(f"Database backup created: {backup_file}")
+            logger.success(
+                f"Database backup created: {backup_file} "
+                f"({result.new_chunks}/{result.chunk_count} new chunks, {result.new_chunk_bytes} bytes written)"
+            )
             return backup_file
         finally:
-            for temp_path in (temp_db, temp_gz):
-                try:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                except OSError:
-                    pass
+            try:
+                if os.path.exists(temp_db):
+                    os.remove(temp_db)
+            except OSError:
+                pass
 
 
 def _get_database_backup_settings() -> Dict[str, Any]:
@@ -1651,6 +1851,7 @@ from GameSentenceMiner.util.database.game_daily_rollup_table import GameDailyRol
 from GameSentenceMiner.util.database.stats_rollup_table import StatsRollupTable  # noqa: E402
 from GameSentenceMiner.util.database.stats_export_state_table import StatsExportStateTable  # noqa: E402
 from GameSentenceMiner.util.database.third_party_stats_table import ThirdPartyStatsTable  # noqa: E402
+from GameSentenceMiner.util.database.ai_translation_cache_table import AITranslationCacheTable  # noqa: E402
 
 _DATABASE_TABLE_CLASSES = [
     AIModelsTable,
@@ -1662,6 +1863,7 @@ _DATABASE_TABLE_CLASSES = [
     StatsRollupTable,
     StatsExportStateTable,
     ThirdPartyStatsTable,
+    AITranslationCacheTable,
 ]
 for cls in _DATABASE_TABLE_CLASSES:
     # Binding is read-only from an import-lifecycle perspective. Application
@@ -1728,6 +1930,31 @@ def check_and_run_migrations():
             GameLinesTable.alter_column_type("timestamp_old", "timestamp", "REAL")
             logger.success("Migrated 'timestamp' column to REAL type in GameLinesTable.")
 
+    def migrate_gameline_timestamp_indexes():
+        """
+        Index game_lines.timestamp so date-bounded queries can compare the REAL
+        column directly instead of scanning with CAST(timestamp AS REAL).
+        """
+        table = GameLinesTable._table
+        existing = GameLinesTable._db.fetchone(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_game_lines_game_id_timestamp'"
+        )
+        if existing is None:
+            # Rows written as text before the REAL migration would sort apart from
+            # numeric ones once the predicates stop casting, so normalize them once.
+            GameLinesTable._db.execute(
+                f"UPDATE {table} SET timestamp = CAST(timestamp AS REAL) WHERE typeof(timestamp) = 'text'",
+                commit=True,
+            )
+        GameLinesTable._db.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_game_lines_timestamp ON {table}(timestamp)",
+            commit=True,
+        )
+        GameLinesTable._db.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_game_lines_game_id_timestamp ON {table}(game_id, timestamp)",
+            commit=True,
+        )
+
     def migrate_gameline_sync_tracking():
         """
         Track pending gameline changes (upsert/delete) in a compact table.
@@ -2185,6 +2412,7 @@ def check_and_run_migrations():
                 logger.info("You can manually run the update with: python -m GameSentenceMiner.util.cron.jiten_update")
 
     migrate_timestamp()
+    migrate_gameline_timestamp_indexes()
     migrate_gameline_sync_tracking()
     migrate_gameline_language()
     migrate_obs_scene_name()
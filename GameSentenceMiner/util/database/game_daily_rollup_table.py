@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import time
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 from GameSentenceMiner.util.database.db import SQLiteDB, SQLiteDBTable
 
@@ -122,6 +122,36 @@ class GameDailyRollupTable(SQLiteDBTable):
         )
         return [cls.from_row(row) for row in rows]
 
+    @classmethod
+    def iter_date_range(
+        cls,
+        start_date: str,
+        end_date: str,
+        chunk_size: int = 1000,
+    ) -> Iterator["GameDailyRollupTable"]:
+        """Like ``get_date_range`` but reads the range in keyset-paginated chunks."""
+        db = cls._ensure_bound_db()
+        keyset: Optional[tuple] = None
+        while True:
+            where_clause, params = "date >= ? AND date <= ?", (start_date, end_date)
+            if keyset is not None:
+                where_clause += " AND (date > ? OR (date = ? AND (game_id > ? OR (game_id = ? AND id > ?))))"
+                params = (*params, keyset[0], keyset[0], keyset[1], keyset[1], keyset[2])
+            rows = db.fetchall(
+                f"""
+                SELECT * FROM {cls._table}
+                WHERE {where_clause}
+                ORDER BY date ASC, game_id ASC, id ASC
+                LIMIT ?
+                """,
+                (*params, chunk_size),
+            )
+            entries = [cls.from_row(row) for row in rows]
+            yield from entries
+            if len(entries) < chunk_size:
+                return
+            keyset = (entries[-1].date, entries[-1].game_id, entries[-1].id)
+
     @classmethod
     def get_first_date_for_game(cls, game_id: str) -> Optional[str]:
         db = cls._ensure_bound_db()
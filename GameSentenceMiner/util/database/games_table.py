@@ -5,6 +5,7 @@ from difflib import SequenceMatcher
 from typing import Optional, List, Dict
 
 from GameSentenceMiner.util.config.configuration import logger
+from GameSentenceMiner.util.database import data_generation
 from GameSentenceMiner.util.database.db import SQLiteDBTable
 
 
@@ -57,6 +58,7 @@ class GamesTable(SQLiteDBTable):
     ]
     _pk = "id"
     _auto_increment = False  # UUID-based primary key
+    _data_domain = data_generation.GAMES
     _name_to_id_cache: Dict[str, str] = {}
     _name_to_id_cache_db: Optional[object] = None
     _name_to_id_cache_lock = threading.RLock()
@@ -73,6 +75,7 @@ class GamesTable(SQLiteDBTable):
         with cls._name_to_id_cache_lock:
             cls._name_to_id_cache.clear()
             cls._name_to_id_cache_db = cls._db
+        cls.mark_data_changed()
 
     @classmethod
     def _ensure_name_id_cache_for_current_db(cls) -> None:
@@ -164,6 +167,18 @@ class GamesTable(SQLiteDBTable):
         rows = cls._db.fetchall(f"SELECT {col_list} FROM {cls._table}")
         return [cls.from_row(row) for row in rows]
 
+    @classmethod
+    def get_images_by_ids(cls, game_ids: list[str]) -> dict[str, str]:
+        """Fetch only the image column for the given game IDs, for callers that load images in batches."""
+        if not game_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in game_ids)
+        rows = cls._db.fetchall(
+            f"SELECT id, image FROM {cls._table} WHERE id IN ({placeholders})",
+            tuple(game_ids),
+        )
+        return {str(row[0]): row[1] or "" for row in rows}
+
     @classmethod
     def get_by_deck_id(cls, deck_id: int) -> Optional["GamesTable"]:
         """Get a game by its jiten.moe deck ID."""
@@ -383,6 +398,8 @@ class GamesTable(SQLiteDBTable):
             )
             if result and hasattr(result, "rowcount"):
                 linked += result.rowcount
+        if linked:
+            GameLinesTable.mark_data_changed()
 
         return {"created": created, "linked": linked}
 
@@ -0,0 +1,121 @@
+"""Rolling per-query latency metrics for SQLite reads.
+
+Queries are grouped by a normalized fingerprint (literals and ``IN`` lists
+replaced by ``?``, whitespace collapsed) so the same statement built with
+different values lands in one bucket. Each fingerprint keeps cumulative
+counters, a fixed log-scale histogram, and a bounded window of recent samples
+for percentiles.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional
+
+import regex
+
+QUERY_METRICS_MAX_FINGERPRINTS = 512
+QUERY_METRICS_WINDOW = 256
+# Upper bounds in milliseconds; the last bucket catches everything slower.
+QUERY_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+_STRING_LITERAL = regex.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = regex.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_PLACEHOLDER_LIST = regex.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = regex.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(query: str) -> str:
+    """Collapse a statement to a fingerprint shared by every set of bound values."""
+    normalized = _STRING_LITERAL.sub("?", str(query))
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip().rstrip(";").strip()
+    return _PLACEHOLDER_LIST.sub("(?...)", normalized)
+
+
+class _QueryLatency:
+    __slots__ = ("count", "total_ms", "max_ms", "rows", "buckets", "recent")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(QUERY_LATENCY_BUCKETS_MS) + 1)
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def add(self, elapsed_ms: float, rows: Optional[int]) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if rows:
+            self.rows += rows
+        self.buckets[bisect.bisect_left(QUERY_LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.recent.append(elapsed_ms)
+
+    def summary(self, fingerprint: str) -> dict:
+        recent = sorted(self.recent)
+
+        def percentile(fraction: float) -> float:
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(fraction * len(recent)))], 3)
+
+        labels = [f"<={bound:g}ms" for bound in QUERY_LATENCY_BUCKETS_MS] + [f">{QUERY_LATENCY_BUCKETS_MS[-1]:g}ms"]
+        return {
+            "query": fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "rows": self.rows,
+            "histogram": {label: count for label, count in zip(labels, self.buckets) if count},
+        }
+
+
+class QueryLatencyMetrics:
+    """Thread-safe latency histograms keyed by normalized SQL fingerprint."""
+
+    def __init__(
+        self,
+        max_fingerprints: int = QUERY_METRICS_MAX_FINGERPRINTS,
+        window: int = QUERY_METRICS_WINDOW,
+    ):
+        self.max_fingerprints = max(1, int(max_fingerprints))
+        self.window = max(1, int(window))
+        self._queries: OrderedDict[str, _QueryLatency] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def record(self, query: str, elapsed_seconds: float, rows: Optional[int] = None) -> None:
+        fingerprint = normalize_sql(query)
+        with self._lock:
+            latency = self._queries.get(fingerprint)
+            if latency is None:
+                latency = _QueryLatency(self.window)
+                self._queries[fingerprint] = latency
+                if len(self._queries) > self.max_fingerprints:
+                    self._queries.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._queries.move_to_end(fingerprint)
+            latency.add(elapsed_seconds * 1000.0, rows)
+
+    def snapshot(self, *, sort_by: str = "total_ms", limit: Optional[int] = None) -> List[Dict]:
+        with self._lock:
+            summaries = [latency.summary(fingerprint) for fingerprint, latency in self._queries.items()]
+        if summaries and sort_by in summaries[0]:
+            summaries.sort(key=lambda item: item[sort_by], reverse=True)
+        return summaries[:limit] if limit else summaries
+
+    def reset(self) -> None:
+        with self._lock:
+            self._queries.clear()
+            self.evicted = 0
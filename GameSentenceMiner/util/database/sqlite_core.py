@@ -1,7 +1,7 @@
 """Durable, concurrent SQLite primitives used by GameSentenceMiner.
 
-The application has one writer thread per process and one read connection per
-calling thread.  Writes are explicit transactions on the writer connection;
+The application has one writer thread per process and a bounded pool of read
+connections, each leased to one calling thread at a time.  Writes are explicit transactions on the writer connection;
 read connections are ``query_only`` so a missing ``commit=True`` cannot create a
 second, accidental writer.  WAL keeps reads concurrent with writes, while FULL
 synchronous mode preserves acknowledged commits across an OS or power failure.
@@ -16,12 +16,16 @@ import queue
 import sqlite3
 import sys
 import threading
+import time
 import uuid
+import weakref
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import quote
 
+from GameSentenceMiner.util.database.query_metrics import QueryLatencyMetrics
+
 
 DB_PRIORITY_HIGH = 0
 DB_PRIORITY_NORMAL = 50
@@ -33,7 +37,26 @@ SQLITE_JOURNAL_SIZE_LIMIT_BYTES = 64 * 1024 * 1024
 SQLITE_WRITER_START_TIMEOUT_SECONDS = 10.0
 SQLITE_CLOSE_TIMEOUT_SECONDS = 30.0
 SQLITE_WRITE_QUEUE_SIZE = 4_096
-SQLITE_CACHED_STATEMENTS = 256
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+SQLITE_CACHED_STATEMENTS = _env_int("GSM_SQLITE_CACHED_STATEMENTS", 256)
+# Readers beyond this many concurrent threads share the least-leased connection.
+SQLITE_READ_POOL_SIZE = _env_int("GSM_SQLITE_READ_POOL_SIZE", 8)
+SQLITE_READER_MMAP_SIZE = _env_int("GSM_SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_READER_CACHE_SIZE_KIB = _env_int("GSM_SQLITE_CACHE_SIZE_KIB", 16 * 1024)
+SQLITE_QUERY_METRICS_ENABLED = os.environ.get("GSM_SQLITE_QUERY_METRICS", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+    "off",
+}
 
 _WRITER_SHUTDOWN = object()
 
@@ -156,13 +179,34 @@ class SQLiteDB:
 
     ``execute(..., commit=True)``, ``executemany(..., commit=True)``, and
     ``run_transaction`` are routed through one priority-aware writer thread.
-    Reads use per-thread query-only connections, which remain concurrent under
-    WAL.  Every successful write call is an explicit transaction.
+    Reads use query-only connections from a bounded pool, which remain
+    concurrent under WAL; a connection leased by a thread that has exited is
+    handed to the next thread instead of opening a new one.  Every successful
+    write call is an explicit transaction.
     """
 
-    def __init__(self, db_path: str, read_only: bool = False, force_gameline_protection: bool = False):
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        force_gameline_protection: bool = False,
+        *,
+        read_pool_size: Optional[int] = None,
+        cached_statements: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+        cache_size_kib: Optional[int] = None,
+        query_metrics: Optional[bool] = None,
+    ):
         self.db_path = db_path
         self.read_only = read_only
+        self.read_pool_size = max(1, int(SQLITE_READ_POOL_SIZE if read_pool_size is None else read_pool_size))
+        self.cached_statements = max(
+            0, int(SQLITE_CACHED_STATEMENTS if cached_statements is None else cached_statements)
+        )
+        self.mmap_size = max(0, int(SQLITE_READER_MMAP_SIZE if mmap_size is None else mmap_size))
+        self.cache_size_kib = max(0, int(SQLITE_READER_CACHE_SIZE_KIB if cache_size_kib is None else cache_size_kib))
+        metrics_enabled = SQLITE_QUERY_METRICS_ENABLED if query_metrics is None else query_metrics
+        self.query_metrics: Optional[QueryLatencyMetrics] = QueryLatencyMetrics() if metrics_enabled else None
         testing_process = os.environ.get("GAME_SENTENCE_MINER_TESTING", "0") == "1" or "pytest" in sys.modules
         test_data_root = os.environ.get("GSM_TEST_DATA_ROOT", "").strip()
         is_isolated_test_database = (
@@ -181,6 +225,12 @@ class SQLiteDB:
         self._local = threading.local()
         self._read_connections: List[sqlite3.Connection] = []
         self._read_conn_lock = threading.Lock()
+        self._reader_leases: Dict[sqlite3.Connection, List[weakref.ref]] = {}
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._reader_stats = {"created": 0, "reused": 0, "shared": 0}
+        self._generation_token = uuid.uuid4().hex
+        self._generation_conn: Optional[sqlite3.Connection] = None
+        self._generation_lock = threading.Lock()
 
         self._write_queue: queue.PriorityQueue = queue.PriorityQueue(maxsize=SQLITE_WRITE_QUEUE_SIZE)
         self._seq = itertools.count()
@@ -229,7 +279,7 @@ class SQLiteDB:
             timeout=SQLITE_BUSY_TIMEOUT_MS / 1_000,
             isolation_level=None,
             check_same_thread=False,
-            cached_statements=SQLITE_CACHED_STATEMENTS,
+            cached_statements=self.cached_statements,
         )
         try:
             conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
@@ -243,6 +293,10 @@ class SQLiteDB:
                 conn.execute(f"PRAGMA journal_size_limit = {SQLITE_JOURNAL_SIZE_LIMIT_BYTES}")
             else:
                 conn.execute("PRAGMA query_only = ON")
+                if self.mmap_size:
+                    conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+                if self.cache_size_kib:
+                    conn.execute(f"PRAGMA cache_size = -{self.cache_size_kib}")
             return conn
         except BaseException:
             conn.close()
@@ -533,12 +587,80 @@ class SQLiteDB:
             raise RuntimeError("Cannot read from a closed or closing database.")
         conn = getattr(self._local, "conn", None)
         if conn is None:
-            conn = self._create_connection()
+            conn = self._lease_read_connection()
             self._local.conn = conn
-            with self._read_conn_lock:
+        return conn
+
+    def _lease_read_connection(self) -> sqlite3.Connection:
+        """Hand the calling thread a pooled reader.
+
+        Readers whose leasing threads have all exited are reused first, then a
+        new reader is opened while the pool is below ``read_pool_size``.  Past
+        that, the thread shares the least-leased reader: connections opened with
+        ``check_same_thread=False`` serialize internally, so sharing costs
+        concurrency rather than correctness.
+        """
+
+        owner = weakref.ref(threading.current_thread())
+        with self._read_conn_lock:
+            self._reclaim_idle_readers_locked()
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+                self._reader_stats["reused"] += 1
+            elif len(self._reader_leases) < self.read_pool_size:
+                conn = self._create_connection()
                 self._read_connections.append(conn)
+                self._reader_stats["created"] += 1
+            else:
+                conn = min(self._reader_leases, key=lambda candidate: len(self._reader_leases[candidate]))
+                self._reader_stats["shared"] += 1
+            self._reader_leases.setdefault(conn, []).append(owner)
         return conn
 
+    def _reclaim_idle_readers_locked(self) -> None:
+        for conn, owners in list(self._reader_leases.items()):
+            owners[:] = [ref for ref in owners if (thread := ref()) is not None and thread.is_alive()]
+            if not owners:
+                del self._reader_leases[conn]
+                self._idle_readers.append(conn)
+
+    def reader_pool_stats(self) -> Dict[str, int]:
+        with self._read_conn_lock:
+            self._reclaim_idle_readers_locked()
+            return {
+                "max_size": self.read_pool_size,
+                "open": len(self._reader_leases) + len(self._idle_readers),
+                "leased": len(self._reader_leases),
+                "idle": len(self._idle_readers),
+                "leasing_threads": sum(len(owners) for owners in self._reader_leases.values()),
+                **self._reader_stats,
+            }
+
+    def _record_query(self, query: str, started: float, rows: Optional[int] = None) -> None:
+        if self.query_metrics is not None:
+            self.query_metrics.record(query, time.perf_counter() - started, rows)
+
+    def write_generation(self) -> Tuple[str, int]:
+        """Return a token that changes whenever any connection commits to the database.
+
+        ``PRAGMA data_version`` on a private connection moves after commits from
+        every other connection, which covers this process's writer as well as
+        other processes such as the realtime tokenizer, so read-side caches can
+        key on it without hooking each write path.
+        """
+
+        with self._generation_lock:
+            if self._closed:
+                raise RuntimeError("Cannot read from a closed or closing database.")
+            conn = self._generation_conn
+            if conn is None:
+                conn = self._create_connection()
+                self._generation_conn = conn
+                with self._read_conn_lock:
+                    self._read_connections.append(conn)
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return self._generation_token, int(version)
+
     def execute(
         self,
         query: str,
@@ -557,8 +679,10 @@ class SQLiteDB:
             return cursor
 
         if not commit:
+            started = time.perf_counter()
             cursor = self._get_read_connection().cursor()
             cursor.execute(query, params)
+            self._record_query(query, started)
             return cursor
 
         def op(conn: sqlite3.Connection) -> _WriteResult:
@@ -623,10 +747,16 @@ class SQLiteDB:
         return self.run_transaction(op, priority=priority, wait=wait)
 
     def fetchall(self, query: str, params: Union[Tuple, Dict] = ()) -> List[Tuple]:
-        return self._get_read_connection().execute(query, params).fetchall()
+        started = time.perf_counter()
+        rows = self._get_read_connection().execute(query, params).fetchall()
+        self._record_query(query, started, len(rows))
+        return rows
 
     def fetchone(self, query: str, params: Union[Tuple, Dict] = ()) -> Optional[Tuple]:
-        return self._get_read_connection().execute(query, params).fetchone()
+        started = time.perf_counter()
+        row = self._get_read_connection().execute(query, params).fetchone()
+        self._record_query(query, started, 1 if row is not None else 0)
+        return row
 
     def check_integrity(self, *, full: bool = False, max_errors: int = 1) -> List[str]:
         """Run SQLite's quick (default) or full integrity check."""
@@ -695,11 +825,15 @@ class SQLiteDB:
 
         with self._read_conn_lock:
             connections, self._read_connections = self._read_connections, []
+            self._reader_leases = {}
+            self._idle_readers = []
         for conn in connections:
             try:
                 conn.close()
             except sqlite3.Error:
                 pass
+        with self._generation_lock:
+            self._generation_conn = None
         self._local = threading.local()
 
     def __enter__(self) -> "SQLiteDB":
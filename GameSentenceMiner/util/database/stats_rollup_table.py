@@ -2,6 +2,7 @@ import time
 from datetime import datetime
 from typing import Optional
 
+from GameSentenceMiner.util.database import data_generation
 from GameSentenceMiner.util.database.db import SQLiteDBTable
 
 
@@ -78,6 +79,7 @@ class StatsRollupTable(SQLiteDBTable):
     ]
     _pk = "id"
     _auto_increment = True
+    _data_domain = data_generation.ROLLUPS
 
     def __init__(
         self,
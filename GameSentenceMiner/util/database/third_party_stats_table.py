@@ -1,6 +1,7 @@
 import time
-from typing import Optional, List
+from typing import Iterator, List, Optional
 
+from GameSentenceMiner.util.database import data_generation
 from GameSentenceMiner.util.database.db import SQLiteDBTable
 
 
@@ -31,6 +32,7 @@ class ThirdPartyStatsTable(SQLiteDBTable):
     ]
     _pk = "id"
     _auto_increment = True
+    _data_domain = data_generation.THIRD_PARTY
 
     def __init__(
         self,
@@ -66,6 +68,35 @@ class ThirdPartyStatsTable(SQLiteDBTable):
         )
         return [cls.from_row(row) for row in rows]
 
+    @classmethod
+    def _iter_by_date(cls, where_clause: str, params: tuple, chunk_size: int) -> Iterator["ThirdPartyStatsTable"]:
+        """Yield rows matching ``where_clause`` ordered by (date, id), ``chunk_size`` rows per query."""
+        keyset: Optional[tuple] = None
+        while True:
+            page_where, page_params = where_clause, params
+            if keyset is not None:
+                page_where = f"({where_clause}) AND (date > ? OR (date = ? AND id > ?))"
+                page_params = (*params, keyset[0], keyset[0], keyset[1])
+            rows = cls._db.fetchall(
+                f"SELECT * FROM {cls._table} WHERE {page_where} ORDER BY date ASC, id ASC LIMIT ?",
+                (*page_params, chunk_size),
+            )
+            entries = [cls.from_row(row) for row in rows]
+            yield from entries
+            if len(entries) < chunk_size:
+                return
+            keyset = (entries[-1].date, entries[-1].id)
+
+    @classmethod
+    def iter_date_range(cls, start_date: str, end_date: str, chunk_size: int = 1000) -> Iterator["ThirdPartyStatsTable"]:
+        """Like ``get_date_range`` but reads the range in keyset-paginated chunks."""
+        return cls._iter_by_date("date >= ? AND date <= ?", (start_date, end_date), chunk_size)
+
+    @classmethod
+    def iter_created_after(cls, created_at: float, chunk_size: int = 1000) -> Iterator["ThirdPartyStatsTable"]:
+        """Rows added after ``created_at``, ordered by date and read in keyset-paginated chunks."""
+        return cls._iter_by_date("created_at > ?", (created_at,), chunk_size)
+
     @classmethod
     def get_all_by_source(cls, source: str) -> List["ThirdPartyStatsTable"]:
         """Get all entries for a given source (e.g. 'mokuro')."""
@@ -81,6 +112,7 @@ class ThirdPartyStatsTable(SQLiteDBTable):
         count_row = cls._db.fetchone(f"SELECT COUNT(*) FROM {cls._table} WHERE source = ?", (source,))
         count = count_row[0] if count_row else 0
         cls._db.execute(f"DELETE FROM {cls._table} WHERE source = ?", (source,), commit=True)
+        cls.mark_data_changed()
         return count
 
     @classmethod
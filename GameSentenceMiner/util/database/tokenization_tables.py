@@ -11,6 +11,11 @@ from GameSentenceMiner.util.database.global_frequency_tables import (
     start_global_frequency_source_sync,
     teardown_global_frequency_sources,
 )
+from GameSentenceMiner.util.database.word_novelty_tables import (
+    create_word_novelty_tables,
+    drop_word_novelty_tables,
+    ensure_word_novelty_current,
+)
 
 WORD_STATS_CACHE_TABLE = "word_stats_cache"
 
@@ -458,6 +463,10 @@ def create_tokenization_indexes(db: SQLiteDB):
         "CREATE INDEX IF NOT EXISTS idx_game_lines_timestamp ON game_lines(timestamp)",
         commit=True,
     )
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_game_lines_tokenized_timestamp ON game_lines(tokenized, timestamp)",
+        commit=True,
+    )
     db.execute(
         "CREATE INDEX IF NOT EXISTS idx_game_lines_game_id ON game_lines(game_id)",
         commit=True,
@@ -466,6 +475,7 @@ def create_tokenization_indexes(db: SQLiteDB):
     create_word_stats_cache_table(db)
     create_word_stats_cache_indexes(db)
     create_global_frequency_tables(db, create_indexes=False)
+    create_word_novelty_tables(db)
 
 
 def _migrate_kanji_unique_index(db: SQLiteDB):
@@ -623,7 +633,7 @@ def recompute_word_first_seen_metadata(
         FROM word_occurrences wo
         JOIN game_lines gl ON gl.id = wo.line_id
         WHERE wo.word_id IN ({placeholders})
-        ORDER BY wo.word_id ASC, CAST(gl.timestamp AS REAL) ASC, gl.id ASC
+        ORDER BY wo.word_id ASC, gl.timestamp ASC, gl.id ASC
         """,
         tuple(target_word_ids),
     )
@@ -761,6 +771,8 @@ def setup_tokenization(db: SQLiteDB):
     # (or right after upgrading from a version that didn't track first-seen) this
     # can touch huge numbers of rows and must not block app launch.
     _schedule_first_seen_backfill(db)
+    # Likewise, aggregates left dirty by an upgrade or an earlier session rebuild in the background.
+    ensure_word_novelty_current(db)
 
     # 5. Register crons
     _migrate_tokenize_backfill_cron_job()
@@ -800,6 +812,7 @@ def teardown_tokenization(db: SQLiteDB):
     db.execute("DROP TABLE IF EXISTS words", commit=True)
     db.execute("DROP TABLE IF EXISTS kanji", commit=True)
     db.execute(f"DROP TABLE IF EXISTS {WORD_STATS_CACHE_TABLE}", commit=True)
+    drop_word_novelty_tables(db)
 
     # 3. Disable crons
     _disable_tokenize_backfill_cron()
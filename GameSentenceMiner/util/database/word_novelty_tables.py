@@ -0,0 +1,388 @@
+"""
+Materialized word-novelty aggregates for the stats pages.
+
+The novelty charts used to join ``word_occurrences`` to ``game_lines`` and bucket
+``words.first_seen`` in Python on every page load. These tables hold the same
+numbers pre-aggregated so the endpoints read one row per day (or per tokenized
+line for the per-game character positions):
+
+- ``word_novelty_lines``: one row per tokenized line with its local date,
+  character count and the number of words first seen on it.
+- ``word_novelty_words``: distinct words seen per (date, game_id), for unique
+  word counts over arbitrary ranges.
+- ``word_novelty_daily``: per (date, game_id) totals.
+- ``word_novelty_state``: a dirty flag. Triggers set it when a recorded line is
+  edited or deleted, loses occurrences, or has first-seen metadata moved onto
+  or off it (orphan cleanup, first-seen repairs), so checking it is O(1).
+
+``record_tokenized_line`` keeps the tables current from the tokenizer. Dirty
+aggregates are rebuilt by the tokenize cron or a background job queued by the
+first read that notices, never on the request path; the daily rollup also
+reconciles them with a full rebuild.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from GameSentenceMiner.util.config.configuration import logger
+from GameSentenceMiner.util.database.db import SQLiteDB
+
+WORD_NOVELTY_LINES_TABLE = "word_novelty_lines"
+WORD_NOVELTY_WORDS_TABLE = "word_novelty_words"
+WORD_NOVELTY_DAILY_TABLE = "word_novelty_daily"
+WORD_NOVELTY_STATE_TABLE = "word_novelty_state"
+
+# Source-table writes that invalidate recorded lines. Tokenizing a new line is not
+# one of them: its first-seen words are counted when the line is recorded.
+_DIRTY_TRIGGERS = {
+    "trg_word_novelty_line_delete": f"""
+        AFTER DELETE ON game_lines
+        WHEN EXISTS (SELECT 1 FROM {WORD_NOVELTY_LINES_TABLE} WHERE line_id = OLD.id)
+    """,
+    "trg_word_novelty_line_update": f"""
+        AFTER UPDATE OF tokenized, line_text, timestamp, game_id, game_name ON game_lines
+        WHEN (
+            OLD.tokenized IS NOT NEW.tokenized
+            OR OLD.line_text IS NOT NEW.line_text
+            OR OLD.timestamp IS NOT NEW.timestamp
+            OR OLD.game_id IS NOT NEW.game_id
+            OR OLD.game_name IS NOT NEW.game_name
+        )
+        AND EXISTS (SELECT 1 FROM {WORD_NOVELTY_LINES_TABLE} WHERE line_id = OLD.id)
+    """,
+    "trg_word_novelty_occurrence_delete": f"""
+        AFTER DELETE ON word_occurrences
+        WHEN EXISTS (SELECT 1 FROM {WORD_NOVELTY_LINES_TABLE} WHERE line_id = OLD.line_id)
+    """,
+    "trg_word_novelty_first_seen_update": f"""
+        AFTER UPDATE OF first_seen, first_seen_line_id ON words
+        WHEN (OLD.first_seen IS NOT NEW.first_seen OR OLD.first_seen_line_id IS NOT NEW.first_seen_line_id)
+        AND EXISTS (
+            SELECT 1 FROM {WORD_NOVELTY_LINES_TABLE}
+            WHERE line_id IN (OLD.first_seen_line_id, NEW.first_seen_line_id)
+        )
+    """,
+    "trg_word_novelty_word_delete": f"""
+        AFTER DELETE ON words
+        WHEN EXISTS (SELECT 1 FROM {WORD_NOVELTY_LINES_TABLE} WHERE line_id = OLD.first_seen_line_id)
+    """,
+}
+
+_rebuild_lock = threading.Lock()
+_refresh_queue_lock = threading.Lock()
+_refresh_queued: set[int] = set()  # id() of databases with a refresh pending
+
+
+def create_word_novelty_tables(db: SQLiteDB) -> None:
+    """Create the novelty aggregate tables and their indexes."""
+    db.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {WORD_NOVELTY_LINES_TABLE} (
+            line_id TEXT PRIMARY KEY,
+            game_id TEXT NOT NULL DEFAULT '',
+            game_name TEXT NOT NULL DEFAULT '',
+            date TEXT,
+            timestamp REAL,
+            char_count INTEGER NOT NULL DEFAULT 0,
+            new_words INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        commit=True,
+    )
+    db.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{WORD_NOVELTY_LINES_TABLE}_game_timestamp
+        ON {WORD_NOVELTY_LINES_TABLE}(game_id, timestamp, line_id)
+        """,
+        commit=True,
+    )
+    db.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {WORD_NOVELTY_WORDS_TABLE} (
+            date TEXT NOT NULL,
+            game_id TEXT NOT NULL,
+            word_id INTEGER NOT NULL,
+            PRIMARY KEY (date, game_id, word_id)
+        )
+        """,
+        commit=True,
+    )
+    db.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{WORD_NOVELTY_WORDS_TABLE}_game_word
+        ON {WORD_NOVELTY_WORDS_TABLE}(game_id, word_id)
+        """,
+        commit=True,
+    )
+    db.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {WORD_NOVELTY_DAILY_TABLE} (
+            date TEXT NOT NULL,
+            game_id TEXT NOT NULL,
+            game_name TEXT NOT NULL DEFAULT '',
+            new_words INTEGER NOT NULL DEFAULT 0,
+            tokenized_chars INTEGER NOT NULL DEFAULT 0,
+            tokenized_lines INTEGER NOT NULL DEFAULT 0,
+            unique_words INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, game_id)
+        )
+        """,
+        commit=True,
+    )
+    db.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_{WORD_NOVELTY_DAILY_TABLE}_game_date
+        ON {WORD_NOVELTY_DAILY_TABLE}(game_id, date)
+        """,
+        commit=True,
+    )
+    if db.table_exists(WORD_NOVELTY_STATE_TABLE) and not any(
+        str(column[1]) == "dirty" for column in db.fetchall(f"PRAGMA table_info({WORD_NOVELTY_STATE_TABLE})")
+    ):
+        # Older databases stored a count-based signature; without a state row the
+        # aggregates read as dirty and are rebuilt once.
+        db.execute(f"DROP TABLE {WORD_NOVELTY_STATE_TABLE}", commit=True)
+    db.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {WORD_NOVELTY_STATE_TABLE} (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            dirty INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        commit=True,
+    )
+    if db.table_exists("words") and db.table_exists("word_occurrences"):
+        for name, condition in _DIRTY_TRIGGERS.items():
+            db.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {name}
+                {condition}
+                BEGIN
+                    UPDATE {WORD_NOVELTY_STATE_TABLE} SET dirty = 1 WHERE id = 1 AND dirty = 0;
+                END;
+                """,
+                commit=True,
+            )
+
+
+def drop_word_novelty_tables(db: SQLiteDB) -> None:
+    for name in _DIRTY_TRIGGERS:
+        db.execute(f"DROP TRIGGER IF EXISTS {name}", commit=True)
+    for table in (
+        WORD_NOVELTY_LINES_TABLE,
+        WORD_NOVELTY_WORDS_TABLE,
+        WORD_NOVELTY_DAILY_TABLE,
+        WORD_NOVELTY_STATE_TABLE,
+    ):
+        db.execute(f"DROP TABLE IF EXISTS {table}", commit=True)
+
+
+def word_novelty_is_dirty(db: SQLiteDB) -> bool:
+    """True when the aggregates were never built or a source write invalidated them."""
+    row = db.fetchone(f"SELECT dirty FROM {WORD_NOVELTY_STATE_TABLE} WHERE id = 1")
+    return not row or bool(row[0])
+
+
+def rebuild_word_novelty(db: SQLiteDB) -> None:
+    """Recompute every novelty aggregate from the tokenization tables."""
+    create_word_novelty_tables(db)
+
+    def _rebuild(conn):
+        for table in (
+            WORD_NOVELTY_LINES_TABLE,
+            WORD_NOVELTY_WORDS_TABLE,
+            WORD_NOVELTY_DAILY_TABLE,
+            WORD_NOVELTY_STATE_TABLE,
+        ):
+            db.execute(f"DELETE FROM {table}", commit=True)
+
+        db.execute(
+            f"""
+            INSERT INTO {WORD_NOVELTY_LINES_TABLE} (
+                line_id, game_id, game_name, date, timestamp, char_count, new_words
+            )
+            SELECT
+                gl.id,
+                COALESCE(gl.game_id, ''),
+                COALESCE(gl.game_name, ''),
+                CASE
+                    WHEN gl.timestamp IS NULL THEN NULL
+                    ELSE date(CAST(gl.timestamp AS REAL), 'unixepoch', 'localtime')
+                END,
+                CAST(gl.timestamp AS REAL),
+                LENGTH(COALESCE(gl.line_text, '')),
+                COALESCE(fs.new_words, 0)
+            FROM game_lines gl
+            LEFT JOIN (
+                SELECT first_seen_line_id AS line_id, COUNT(*) AS new_words
+                FROM words
+                WHERE first_seen IS NOT NULL AND first_seen_line_id IS NOT NULL
+                GROUP BY first_seen_line_id
+            ) fs ON fs.line_id = gl.id
+            WHERE gl.tokenized = 1
+            """,
+            commit=True,
+        )
+        db.execute(
+            f"""
+            INSERT OR IGNORE INTO {WORD_NOVELTY_WORDS_TABLE} (date, game_id, word_id)
+            SELECT nl.date, nl.game_id, wo.word_id
+            FROM word_occurrences wo
+            JOIN {WORD_NOVELTY_LINES_TABLE} nl ON nl.line_id = wo.line_id
+            WHERE nl.date IS NOT NULL
+            """,
+            commit=True,
+        )
+        db.execute(
+            f"""
+            INSERT INTO {WORD_NOVELTY_DAILY_TABLE} (
+                date, game_id, game_name, new_words, tokenized_chars, tokenized_lines, unique_words
+            )
+            SELECT
+                nl.date,
+                nl.game_id,
+                MAX(nl.game_name),
+                SUM(nl.new_words),
+                SUM(nl.char_count),
+                COUNT(*),
+                (
+                    SELECT COUNT(*)
+                    FROM {WORD_NOVELTY_WORDS_TABLE} nw
+                    WHERE nw.date = nl.date AND nw.game_id = nl.game_id
+                )
+            FROM {WORD_NOVELTY_LINES_TABLE} nl
+            WHERE nl.date IS NOT NULL
+            GROUP BY nl.date, nl.game_id
+            """,
+            commit=True,
+        )
+        db.execute(
+            f"""
+            INSERT INTO {WORD_NOVELTY_STATE_TABLE} (id, dirty)
+            VALUES (1, 0)
+            """,
+            commit=True,
+        )
+
+    db.run_transaction(_rebuild)
+
+
+def refresh_word_novelty(db: SQLiteDB) -> bool:
+    """Rebuild the aggregates if they are dirty; returns True when rebuilt."""
+    if db.read_only or not db.table_exists(WORD_NOVELTY_STATE_TABLE):
+        return False
+    with _rebuild_lock:
+        if not word_novelty_is_dirty(db):
+            return False
+        rebuild_word_novelty(db)
+        return True
+
+
+def ensure_word_novelty_current(db: SQLiteDB) -> bool:
+    """
+    Queue a background refresh if the aggregates are dirty; returns True when they are.
+
+    Readers keep serving the current aggregates meanwhile instead of rebuilding inline.
+    """
+    if db.read_only or not db.table_exists(WORD_NOVELTY_STATE_TABLE) or not word_novelty_is_dirty(db):
+        return False
+    with _refresh_queue_lock:
+        if id(db) in _refresh_queued:
+            return True
+        _refresh_queued.add(id(db))
+
+    from GameSentenceMiner.util.concurrency.work_pool import submit_background_work
+
+    def _run() -> None:
+        with _refresh_queue_lock:
+            _refresh_queued.discard(id(db))
+        try:
+            refresh_word_novelty(db)
+        except Exception as exc:
+            logger.warning(f"Failed to rebuild word-novelty aggregates: {exc}")
+
+    submit_background_work(_run)
+    return True
+
+
+def record_tokenized_line(db: SQLiteDB, line_id: str) -> None:
+    """
+    Fold one freshly tokenized line into the aggregates.
+
+    Must run inside the tokenizer's transaction, after the line's occurrences and
+    first-seen metadata were written. Lines that were already recorded are ignored.
+    """
+    line_row = db.fetchone(
+        """
+        SELECT
+            COALESCE(game_id, ''),
+            COALESCE(game_name, ''),
+            CASE
+                WHEN timestamp IS NULL THEN NULL
+                ELSE date(CAST(timestamp AS REAL), 'unixepoch', 'localtime')
+            END,
+            CAST(timestamp AS REAL),
+            LENGTH(COALESCE(line_text, ''))
+        FROM game_lines
+        WHERE id = ?
+        """,
+        (line_id,),
+    )
+    if not line_row:
+        return
+    game_id, game_name, date, timestamp, char_count = line_row
+    new_words_row = db.fetchone(
+        "SELECT COUNT(*) FROM words WHERE first_seen_line_id = ? AND first_seen IS NOT NULL",
+        (line_id,),
+    )
+    new_words = int(new_words_row[0] or 0) if new_words_row else 0
+
+    cursor = db.execute(
+        f"""
+        INSERT OR IGNORE INTO {WORD_NOVELTY_LINES_TABLE} (
+            line_id, game_id, game_name, date, timestamp, char_count, new_words
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (line_id, game_id, game_name, date, timestamp, int(char_count or 0), new_words),
+        commit=True,
+    )
+    if cursor.rowcount <= 0:
+        return
+
+    if date is not None:
+        cursor = db.execute(
+            f"""
+            INSERT OR IGNORE INTO {WORD_NOVELTY_WORDS_TABLE} (date, game_id, word_id)
+            SELECT DISTINCT ?, ?, word_id FROM word_occurrences WHERE line_id = ?
+            """,
+            (date, game_id, line_id),
+            commit=True,
+        )
+        unique_words = max(cursor.rowcount, 0)
+        db.execute(
+            f"""
+            INSERT INTO {WORD_NOVELTY_DAILY_TABLE} (
+                date, game_id, game_name, new_words, tokenized_chars, tokenized_lines, unique_words
+            )
+            VALUES (?, ?, ?, ?, ?, 1, ?)
+            ON CONFLICT(date, game_id) DO UPDATE SET
+                game_name = excluded.game_name,
+                new_words = new_words + excluded.new_words,
+                tokenized_chars = tokenized_chars + excluded.tokenized_chars,
+                tokenized_lines = tokenized_lines + 1,
+                unique_words = unique_words + excluded.unique_words
+            """,
+            (date, game_id, game_name, new_words, int(char_count or 0), unique_words),
+            commit=True,
+        )
+
+
+def reconcile_word_novelty(db: SQLiteDB) -> None:
+    """Full rebuild used by the daily rollup to catch anything the dirty triggers miss."""
+    if db.read_only or not db.table_exists("words") or not db.table_exists("word_occurrences"):
+        return
+    with _rebuild_lock:
+        rebuild_word_novelty(db)
+    logger.debug("Reconciled word-novelty aggregates")
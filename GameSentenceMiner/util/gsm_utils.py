@@ -7,6 +7,7 @@ import re
 import socket
 import string
 import subprocess
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -212,13 +213,37 @@ def open_audio_in_external(fileabspath, shell=False):
         return False
 
 
+# is_connected_cached() re-probes at most this often; failures are re-checked sooner.
+CONNECTIVITY_TTL_SECONDS = 30.0
+CONNECTIVITY_FAILURE_TTL_SECONDS = 5.0
+_connectivity_checked_at = 0.0
+_connectivity_result = False
+_connectivity_lock = threading.Lock()
+
+
 def is_connected():
+    global _connectivity_checked_at, _connectivity_result
     try:
         # Attempt to connect to a well-known host
-        socket.create_connection(("www.google.com", 80), timeout=2)
-        return True
+        connection = socket.create_connection(("www.google.com", 80), timeout=2)
+        close = getattr(connection, "close", None)
+        if close is not None:
+            close()
+        connected = True
     except OSError:
-        return False
+        connected = False
+    _connectivity_result = connected
+    _connectivity_checked_at = time.monotonic()
+    return connected
+
+
+def is_connected_cached() -> bool:
+    """``is_connected()`` behind a short TTL, for callers that check before every request."""
+    with _connectivity_lock:
+        ttl = CONNECTIVITY_TTL_SECONDS if _connectivity_result else CONNECTIVITY_FAILURE_TTL_SECONDS
+        if _connectivity_checked_at and time.monotonic() - _connectivity_checked_at < ttl:
+            return _connectivity_result
+        return is_connected()
 
 
 TEXT_REPLACEMENTS_FILE = os.path.join(get_app_directory(), "config", "text_replacements.json")
@@ -0,0 +1,162 @@
+"""
+Black-bar crop cache keyed by OBS scene and source resolution.
+
+cropdetect decodes several frames (up to five seconds for ratio snapping) for
+every card, even though a game's letterboxing rarely changes. Detected crops
+are remembered per (scene, width, height, mode) and re-validated against the
+current frame with a border-luminance check on a small grayscale sample:
+
+* the bar regions outside a cached crop must still be black, and
+* no new pair of bars may appear just inside the kept area.
+
+When the game switches aspect ratio (e.g. a 4:3 cutscene inside 16:9 gameplay)
+one of those checks fails and the caller falls back to full detection.
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageStat
+
+from GameSentenceMiner.util.config.configuration import logger
+
+# Luma at or below which a border region counts as a black bar.
+BAR_MEAN_LUMA = 24
+BAR_PEAK_LUMA = 64
+# Fraction of the frame sampled on each side of a crop edge.
+EDGE_STRIP_FRACTION = 0.02
+SAMPLE_WIDTH = 192
+
+_CROP_RE = re.compile(r"crop=(\d+):(\d+):(\d+):(\d+)")
+
+CropKey = Tuple[str, int, int, str]
+
+
+@dataclass
+class CachedCrop:
+    crop_filter: Optional[str]
+    detected_at: float
+
+
+_cache: Dict[CropKey, CachedCrop] = {}
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def make_key(scene: str, width: int, height: int, mode: str) -> CropKey:
+    return (scene or "", int(width), int(height), mode)
+
+
+def get(key: CropKey) -> Optional[CachedCrop]:
+    with _cache_lock:
+        return _cache.get(key)
+
+
+def store(key: CropKey, crop_filter: Optional[str]) -> None:
+    with _cache_lock:
+        _cache[key] = CachedCrop(crop_filter=crop_filter, detected_at=time.time())
+
+
+def invalidate(key: CropKey) -> None:
+    with _cache_lock:
+        if _cache.pop(key, None) is not None:
+            _stats["invalidations"] += 1
+
+
+def clear() -> None:
+    with _cache_lock:
+        _cache.clear()
+        for name in _stats:
+            _stats[name] = 0
+
+
+def record(hit: bool) -> None:
+    with _cache_lock:
+        _stats["hits" if hit else "misses"] += 1
+
+
+def get_stats() -> dict:
+    with _cache_lock:
+        return dict(_stats)
+
+
+def parse_crop_filter(crop_filter: Optional[str]) -> Optional[Tuple[int, int, int, int]]:
+    if not crop_filter:
+        return None
+    match = _CROP_RE.search(crop_filter)
+    if not match:
+        return None
+    return tuple(int(value) for value in match.groups())
+
+
+def prepare_sample(frame: Image.Image) -> Image.Image:
+    """Downscale a frame to a small grayscale image for border checks."""
+    gray = frame.convert("L")
+    if gray.width > SAMPLE_WIDTH:
+        height = max(1, round(gray.height * SAMPLE_WIDTH / gray.width))
+        gray = gray.resize((SAMPLE_WIDTH, height), Image.Resampling.BILINEAR)
+    return gray
+
+
+def _region_is_dark(sample: Image.Image, box: Tuple[int, int, int, int]) -> bool:
+    left, top, right, bottom = box
+    if right - left <= 0 or bottom - top <= 0:
+        return True
+    stat = ImageStat.Stat(sample.crop(box))
+    return stat.mean[0] <= BAR_MEAN_LUMA and stat.extrema[0][1] <= BAR_PEAK_LUMA
+
+
+def validate(
+    sample: Image.Image,
+    source_width: int,
+    source_height: int,
+    crop_filter: Optional[str],
+) -> bool:
+    """
+    Return True when ``crop_filter`` still matches the black bars in ``sample``.
+
+    ``sample`` may be any size; coordinates are scaled from the source resolution.
+    A ``None`` crop is valid only while no edge pair of the frame has turned black.
+    """
+    if not source_width or not source_height:
+        return False
+    sx = sample.width / float(source_width)
+    sy = sample.height / float(source_height)
+    strip_w = max(1, round(sample.width * EDGE_STRIP_FRACTION))
+    strip_h = max(1, round(sample.height * EDGE_STRIP_FRACTION))
+
+    crop = parse_crop_filter(crop_filter)
+    if crop is None and crop_filter:
+        return False
+    if crop is None:
+        left, top, right, bottom = 0, 0, sample.width, sample.height
+    else:
+        crop_w, crop_h, crop_x, crop_y = crop
+        left = round(crop_x * sx)
+        top = round(crop_y * sy)
+        right = round((crop_x + crop_w) * sx)
+        bottom = round((crop_y + crop_h) * sy)
+        # Keep a one-pixel guard band so scaling blur at the edge doesn't count.
+        bar_regions = [
+            (0, 0, left - 1, sample.height),
+            (right + 1, 0, sample.width, sample.height),
+            (0, 0, sample.width, top - 1),
+            (0, bottom + 1, sample.width, sample.height),
+        ]
+        for box in bar_regions:
+            if box[2] - box[0] > 0 and box[3] - box[1] > 0 and not _region_is_dark(sample, box):
+                return False
+
+    # New bars inside the kept area mean the letterboxing grew (or the frame is black).
+    inset = 0 if crop is None else 1
+    left_dark = _region_is_dark(sample, (left + inset, top, left + inset + strip_w, bottom))
+    right_dark = _region_is_dark(sample, (right - inset - strip_w, top, right - inset, bottom))
+    top_dark = _region_is_dark(sample, (left, top + inset, right, top + inset + strip_h))
+    bottom_dark = _region_is_dark(sample, (left, bottom - inset - strip_h, right, bottom - inset))
+    if (left_dark and right_dark) or (top_dark and bottom_dark):
+        logger.debug("Black bars found inside the cached crop; re-running detection.")
+        return False
+    return True
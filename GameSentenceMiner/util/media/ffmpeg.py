@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import re
@@ -31,6 +32,12 @@ from GameSentenceMiner.util.gsm_utils import (
     get_file_modification_time,
 )
 from GameSentenceMiner.util.config import configuration
+from GameSentenceMiner.util.media import crop_cache
+from GameSentenceMiner.util.media.replay_index import (
+    get_cached_replay_index,
+    keyframe_seek_args,
+    remove_replay_index,
+)
 from GameSentenceMiner.util.text_log import initial_time, TextSource
 
 
@@ -469,12 +476,13 @@ def _build_screenshot_video_filters(
     source_video_path: str | Path | None = None,
     screenshot_timing: float | None = None,
     use_negative_two: bool = False,
+    frame_image: str | Path | None = None,
 ) -> List[str]:
     screenshot_config = get_config().screenshot
     video_filters = []
 
     if screenshot_config.trim_black_bars_wip and source_video_path and screenshot_timing is not None:
-        crop_filter = find_black_bars(source_video_path, screenshot_timing)
+        crop_filter = find_black_bars(source_video_path, screenshot_timing, frame_image)
         if crop_filter:
             video_filters.append(crop_filter)
 
@@ -581,8 +589,8 @@ def video_to_anim(
 
     # Build command
     cmd = ffmpeg_base_command_list.copy()
-    if start:
-        cmd += ["-ss", str(start)]
+    seek_input_args, seek_output_args = keyframe_seek_args(input_path, start) if start else ([], [])
+    cmd += seek_input_args
 
     if codec == "avif":
         hwaccel_args = FFmpegHelper.extract_hwaccel_args(get_config().screenshot.custom_ffmpeg_settings)
@@ -590,6 +598,7 @@ def video_to_anim(
             cmd += hwaccel_args
 
     cmd += ["-i", str(input_path)]
+    cmd += seek_output_args
 
     cmd += ["-t", str(duration)]
 
@@ -787,15 +796,14 @@ def get_raw_screenshot(video_file, screenshot_timing, try_selector=False):
         os.path.join(get_temporary_directory(), f"{obs.get_current_game(sanitize=True)}_raw.png")
     )
 
-    ffmpeg_command = ffmpeg_base_command_list + [
-        "-ss",
-        f"{screenshot_timing}",
-        "-i",
-        f"{video_file}",
-        "-vframes",
-        "1",
-        output_image,
-    ]
+    seek_input_args, seek_output_args = keyframe_seek_args(video_file, screenshot_timing)
+    ffmpeg_command = (
+        ffmpeg_base_command_list
+        + seek_input_args
+        + ["-i", f"{video_file}"]
+        + seek_output_args
+        + ["-vframes", "1", output_image]
+    )
 
     try:
         FFmpegHelper.run(ffmpeg_command, check=True)
@@ -824,7 +832,9 @@ def encode_screenshot(input_image, source_video_path=None, screenshot_timing=Non
 
     ffmpeg_command_base = ffmpeg_base_command_list + pre_input_args + ["-i", input_image]
 
-    video_filters = _build_screenshot_video_filters(source_video_path, screenshot_timing, use_negative_two=True)
+    video_filters = _build_screenshot_video_filters(
+        source_video_path, screenshot_timing, use_negative_two=True, frame_image=input_image
+    )
     _extend_video_filters(ffmpeg_command_base, video_filters)
 
     if get_config().screenshot.custom_ffmpeg_settings:
@@ -880,14 +890,14 @@ def get_screenshot(video_file, screenshot_timing, try_selector=False):
     # Parse custom settings
     pre_input_args, post_input_args = FFmpegHelper.parse_custom_settings(get_config().screenshot.custom_ffmpeg_settings)
 
+    seek_input_args, seek_output_args = keyframe_seek_args(video_file, screenshot_timing)
     ffmpeg_command = (
         ffmpeg_base_command_list
-        + [
-            "-ss",
-            f"{screenshot_timing}",
-        ]
+        + seek_input_args
         + pre_input_args
-        + ["-i", f"{video_file}", "-vframes", "1"]
+        + ["-i", f"{video_file}"]
+        + seek_output_args
+        + ["-vframes", "1"]
     )
 
     video_filters = _build_screenshot_video_filters(video_file, screenshot_timing)
@@ -975,169 +985,222 @@ def _calculate_target_crop(orig_width, orig_height, target_ratio):
     return new_width, new_height, x_offset, y_offset
 
 
-def find_black_bars_with_ratio_snapping(video_file, screenshot_timing):
-    # NOTE: We intentionally do NOT cache black bar detection results.
-    # Games can dynamically change resolution/aspect ratio (e.g., 4:3 cutscenes -> 16:9 gameplay),
-    # and caching would apply incorrect crops until the app restarts.
-    # Since this only runs once per Anki card creation, the performance impact is negligible.
+def _load_crop_validation_sample(video_file, screenshot_timing, frame_image=None):
+    """Small grayscale frame for crop-cache validation, preferring an already-extracted image."""
+    from PIL import Image
+
+    if frame_image is not None:
+        try:
+            with Image.open(frame_image) as image:
+                return crop_cache.prepare_sample(image)
+        except Exception as e:
+            logger.debug(f"Could not read {frame_image} for crop validation: {e}")
+
+    seek_input_args, seek_output_args = keyframe_seek_args(video_file, screenshot_timing)
+    command = (
+        ffmpeg_base_command_list
+        + seek_input_args
+        + ["-i", str(video_file)]
+        + seek_output_args
+        + ["-an", "-frames:v", "1", "-vf", f"scale={crop_cache.SAMPLE_WIDTH}:-2,format=gray"]
+        + ["-f", "image2pipe", "-c:v", "pgm", "-"]
+    )
+    result = FFmpegHelper.run(command, check=False, text=False)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    try:
+        with Image.open(io.BytesIO(result.stdout)) as image:
+            return crop_cache.prepare_sample(image)
+    except Exception as e:
+        logger.debug(f"Could not decode crop validation frame: {e}")
+        return None
+
+
+def _cached_black_bar_detection(mode, video_file, screenshot_timing, orig_width, orig_height, frame_image, detect):
+    """
+    Reuse the last crop detected for this scene and resolution while a border
+    sample of the current frame still agrees with it; otherwise run ``detect``.
+    Games can switch aspect ratio at any time (4:3 cutscenes in 16:9 gameplay),
+    so a cached crop is never applied without that check.
+    """
+    key = crop_cache.make_key(obs.get_current_scene(), orig_width, orig_height, mode)
+    cached = crop_cache.get(key)
+    if cached is not None:
+        sample = _load_crop_validation_sample(video_file, screenshot_timing, frame_image)
+        if sample is not None and crop_cache.validate(sample, orig_width, orig_height, cached.crop_filter):
+            crop_cache.record(hit=True)
+            logger.info(f"Reusing cached black bar detection for {key[0] or 'scene'}: {cached.crop_filter or 'no crop'}")
+            return cached.crop_filter
+        crop_cache.invalidate(key)
+
+    crop_cache.record(hit=False)
+    crop_filter = detect()
+    crop_cache.store(key, crop_filter)
+    return crop_filter
 
+
+def find_black_bars_with_ratio_snapping(video_file, screenshot_timing, frame_image=None):
     logger.info("Attempting to detect black bars with aspect ratio snapping...")
-    crop_filter = None
     try:
         orig_width, orig_height = get_video_dimensions(video_file)
         if not orig_width or not orig_height:
             logger.warning("Could not determine video dimensions. Skipping black bar detection.")
             return None
 
-        orig_aspect = orig_width / orig_height
-        logger.debug(f"Original video dimensions: {orig_width}x{orig_height} (Ratio: {orig_aspect:.3f})")
-
-        cropdetect_command = ffmpeg_base_command_list_info + [
-            "-i",
+        return _cached_black_bar_detection(
+            "snap",
             video_file,
-            "-ss",
-            f"{screenshot_timing}",
-            "-t",
-            "5",
-            "-vf",
-            "cropdetect=limit=16",
-            "-f",
-            "null",
-            "-",
-        ]
+            screenshot_timing,
+            orig_width,
+            orig_height,
+            frame_image,
+            lambda: _detect_black_bars_with_ratio_snapping(video_file, screenshot_timing, orig_width, orig_height),
+        )
+    except Exception as e:
+        logger.error(f"Error during black bar detection: {e}. Proceeding without cropping.")
+    return None
 
-        result = FFmpegHelper.run(cropdetect_command, check=False)
 
-        crop_lines = re.findall(r"crop=\d+:\d+:\d+:\d+", result.stderr)
-        if not crop_lines:
-            logger.debug("cropdetect did not find any black bars to remove.")
-            return None
+def _detect_black_bars_with_ratio_snapping(video_file, screenshot_timing, orig_width, orig_height):
+    orig_aspect = orig_width / orig_height
+    logger.debug(f"Original video dimensions: {orig_width}x{orig_height} (Ratio: {orig_aspect:.3f})")
 
-        last_crop_params = crop_lines[-1]
-        match = re.match(r"crop=(\d+):(\d+):(\d+):(\d+)", last_crop_params)
-        if not match:
-            logger.warning(f"Could not parse cropdetect output: {last_crop_params}")
-            return None
+    seek_input_args, seek_output_args = keyframe_seek_args(video_file, screenshot_timing)
+    cropdetect_command = (
+        ffmpeg_base_command_list_info
+        + seek_input_args
+        + ["-i", video_file]
+        + seek_output_args
+        + ["-t", "5", "-vf", "cropdetect=limit=16", "-f", "null", "-"]
+    )
 
-        detected_width = int(match.group(1))
-        detected_height = int(match.group(2))
+    result = FFmpegHelper.run(cropdetect_command, check=False)
 
-        if detected_width == orig_width and detected_height == orig_height:
-            logger.info("cropdetect suggests no cropping is needed.")
-            return None
+    crop_lines = re.findall(r"crop=\d+:\d+:\d+:\d+", result.stderr)
+    if not crop_lines:
+        logger.debug("cropdetect did not find any black bars to remove.")
+        return None
 
-        detected_aspect = detected_width / detected_height
+    last_crop_params = crop_lines[-1]
+    match = re.match(r"crop=(\d+):(\d+):(\d+):(\d+)", last_crop_params)
+    if not match:
+        logger.warning(f"Could not parse cropdetect output: {last_crop_params}")
+        return None
 
-        best_match = None
-        min_diff = float("inf")
+    detected_width = int(match.group(1))
+    detected_height = int(match.group(2))
 
-        for known in KNOWN_ASPECT_RATIOS:
-            diff = abs(detected_aspect - known["ratio"]) / known["ratio"]
-            if diff < min_diff:
-                min_diff = diff
-                best_match = known
+    if detected_width == orig_width and detected_height == orig_height:
+        logger.info("cropdetect suggests no cropping is needed.")
+        return None
 
-        if best_match and min_diff <= RATIO_TOLERANCE:
-            target_ratio = best_match["ratio"]
+    detected_aspect = detected_width / detected_height
 
-            crop_width, crop_height, crop_x, crop_y = _calculate_target_crop(orig_width, orig_height, target_ratio)
+    best_match = None
+    min_diff = float("inf")
 
-            area_ratio = (crop_width * crop_height) / (orig_width * orig_height)
-            if area_ratio < 0.50:
-                logger.warning("Calculated crop would remove too much video. Skipping.")
-                return None
+    for known in KNOWN_ASPECT_RATIOS:
+        diff = abs(detected_aspect - known["ratio"]) / known["ratio"]
+        if diff < min_diff:
+            min_diff = diff
+            best_match = known
 
-            crop_filter = f"crop={crop_width}:{crop_height}:{crop_x}:{crop_y}"
-            logger.info(f"Applying snapped aspect ratio filter: {crop_filter}")
+    if best_match and min_diff <= RATIO_TOLERANCE:
+        target_ratio = best_match["ratio"]
 
-        else:
-            return None
+        crop_width, crop_height, crop_x, crop_y = _calculate_target_crop(orig_width, orig_height, target_ratio)
 
-    except Exception as e:
-        logger.error(f"Error during black bar detection: {e}. Proceeding without cropping.")
+        area_ratio = (crop_width * crop_height) / (orig_width * orig_height)
+        if area_ratio < 0.50:
+            logger.warning("Calculated crop would remove too much video. Skipping.")
+            return None
 
-    return crop_filter
+        crop_filter = f"crop={crop_width}:{crop_height}:{crop_x}:{crop_y}"
+        logger.info(f"Applying snapped aspect ratio filter: {crop_filter}")
+        return crop_filter
 
+    return None
 
-def find_black_bars(video_file, screenshot_timing):
-    # NOTE: We intentionally do NOT cache black bar detection results.
-    # Games can dynamically change resolution/aspect ratio (e.g., 4:3 cutscenes -> 16:9 gameplay),
-    # and caching would apply incorrect crops until the app restarts.
-    # Since this only runs once per Anki card creation, the performance impact is negligible.
 
+def find_black_bars(video_file, screenshot_timing, frame_image=None):
     logger.info("Attempting to detect black bars...")
-    crop_filter = None
     try:
         orig_width, orig_height = get_video_dimensions(video_file)
         if not orig_width or not orig_height:
             logger.warning("Could not determine video dimensions. Skipping black bar detection.")
             return None
 
-        ss_seek = max(0, float(screenshot_timing) - 0.5)
-        cropdetect_command = ffmpeg_base_command_list_info + [
-            "-ss",
-            str(ss_seek),
-            "-i",
+        return _cached_black_bar_detection(
+            "detect",
             video_file,
-            "-t",
-            "1",
-            "-an",
-            "-vf",
-            "cropdetect=limit=16:round=2",
-            "-frames:v",
-            "8",
-            "-f",
-            "null",
-            "-",
-        ]
+            screenshot_timing,
+            orig_width,
+            orig_height,
+            frame_image,
+            lambda: _detect_black_bars(video_file, screenshot_timing, orig_width, orig_height),
+        )
+    except Exception as e:
+        logger.error(f"Error during black bar detection: {e}. Proceeding without cropping.")
+    return None
 
-        result = FFmpegHelper.run(cropdetect_command, check=False)
 
-        crop_lines = re.findall(r"crop=\d+:\d+:\d+:\d+", result.stderr)
-        if crop_lines:
-            crop_params = crop_lines[-1]
-            match = re.match(r"crop=(\d+):(\d+):(\d+):(\d+)", crop_params)
-            if match:
-                crop_width = int(match.group(1))
-                crop_height = int(match.group(2))
+def _detect_black_bars(video_file, screenshot_timing, orig_width, orig_height):
+    crop_filter = None
+    ss_seek = max(0, float(screenshot_timing) - 0.5)
+    seek_input_args, seek_output_args = keyframe_seek_args(video_file, ss_seek)
+    cropdetect_command = (
+        ffmpeg_base_command_list_info
+        + seek_input_args
+        + ["-i", video_file]
+        + seek_output_args
+        + ["-t", "1", "-an", "-vf", "cropdetect=limit=16:round=2", "-frames:v", "8", "-f", "null", "-"]
+    )
 
-                area_ratio = (crop_width * crop_height) / (orig_width * orig_height)
-                # cropdetect rounds dimensions to multiples of two, so an odd-height
-                # source can lose one pixel even when only pillarboxing is removed.
-                is_pillarbox_only_crop = crop_height >= orig_height - 2
+    result = FFmpegHelper.run(cropdetect_command, check=False)
 
-                if area_ratio > 0.95:
-                    logger.info("Detected crop would only remove minimal area. Skipping.")
-                    return None
+    crop_lines = re.findall(r"crop=\d+:\d+:\d+:\d+", result.stderr)
+    if crop_lines:
+        crop_params = crop_lines[-1]
+        match = re.match(r"crop=(\d+):(\d+):(\d+):(\d+)", crop_params)
+        if match:
+            crop_width = int(match.group(1))
+            crop_height = int(match.group(2))
+
+            area_ratio = (crop_width * crop_height) / (orig_width * orig_height)
+            # cropdetect rounds dimensions to multiples of two, so an odd-height
+            # source can lose one pixel even when only pillarboxing is removed.
+            is_pillarbox_only_crop = crop_height >= orig_height - 2
 
-                if area_ratio < 0.25 and not is_pillarbox_only_crop:
-                    logger.warning("Crop would remove too much of the video. Skipping.")
+            if area_ratio > 0.95:
+                logger.info("Detected crop would only remove minimal area. Skipping.")
+                return None
+
+            if area_ratio < 0.25 and not is_pillarbox_only_crop:
+                logger.warning("Crop would remove too much of the video. Skipping.")
+                return None
+
+            orig_aspect = orig_width / orig_height
+            crop_aspect = crop_width / crop_height
+            aspect_diff = abs(orig_aspect - crop_aspect) / orig_aspect
+
+            if aspect_diff > 0.30 and not is_pillarbox_only_crop:
+                found_match = False
+                for ratio in KNOWN_ASPECT_RATIOS:
+                    known_diff = abs(crop_aspect - ratio["ratio"]) / ratio["ratio"]
+                    if known_diff < RATIO_TOLERANCE:
+                        found_match = True
+                        break
+                if not found_match:
+                    logger.warning("Crop would significantly change aspect ratio. Skipping.")
                     return None
 
-                orig_aspect = orig_width / orig_height
-                crop_aspect = crop_width / crop_height
-                aspect_diff = abs(orig_aspect - crop_aspect) / orig_aspect
-
-                if aspect_diff > 0.30 and not is_pillarbox_only_crop:
-                    found_match = False
-                    for ratio in KNOWN_ASPECT_RATIOS:
-                        known_diff = abs(crop_aspect - ratio["ratio"]) / ratio["ratio"]
-                        if known_diff < RATIO_TOLERANCE:
-                            found_match = True
-                            break
-                    if not found_match:
-                        logger.warning("Crop would significantly change aspect ratio. Skipping.")
-                        return None
-
-                crop_filter = crop_params
-                logger.info(f"Detected valid black bars. Applying filter: {crop_filter}")
-            else:
-                logger.warning("Could not parse crop parameters.")
+            crop_filter = crop_params
+            logger.info(f"Detected valid black bars. Applying filter: {crop_filter}")
         else:
-            logger.debug("cropdetect did not find any black bars to remove.")
+            logger.warning("Could not parse crop parameters.")
+    else:
+        logger.debug("cropdetect did not find any black bars to remove.")
 
-    except Exception as e:
-        logger.error(f"Error during black bar detection: {e}. Proceeding without cropping.")
     return crop_filter
 
 
@@ -1230,7 +1293,7 @@ def process_image(image_file, source_video_path: str | Path | None = None, scree
 
     ffmpeg_command_base = ffmpeg_base_command_list + pre_input_args + ["-i", image_file]
 
-    video_filters = _build_screenshot_video_filters(source_video_path, screenshot_timing)
+    video_filters = _build_screenshot_video_filters(source_video_path, screenshot_timing, frame_image=image_file)
     _extend_video_filters(ffmpeg_command_base, video_filters)
 
     if get_config().screenshot.custom_ffmpeg_settings:
@@ -1315,6 +1378,11 @@ def get_audio_and_trim(video_path, game_line, next_line_time, anki_card_creation
 
 
 def get_video_duration(file_path):
+    # Replays that were already indexed know their duration; skip the extra ffprobe.
+    index = get_cached_replay_index(file_path)
+    if index and index.duration > 0:
+        return index.duration
+
     info = FFmpegHelper.get_probe_json(file_path, "format=duration", "")
     # Original used specific ffprobe command that outputted plain text, not JSON
     # get_probe_json might not work if "default=noprint..." is used with "-of json" which overrides?
@@ -1637,12 +1705,12 @@ def trim_replay_for_gameline(video_path, start_time, end_time, accurate=False):
     output_name = f"trimmed_{Path(video_path).stem}.mp4"
     trimmed_video = os.path.join(configuration.get_temporary_directory(), output_name)
 
-    command = ffmpeg_base_command_list + [
-        "-ss",
-        str(start_time),
-        "-i",
-        video_path,
-    ]
+    if accurate:
+        seek_input_args, seek_output_args = keyframe_seek_args(video_path, start_time)
+    else:
+        # Stream copy can only cut on keyframes, so let ffmpeg snap the input seek.
+        seek_input_args, seek_output_args = ["-ss", str(start_time)], []
+    command = ffmpeg_base_command_list + seek_input_args + ["-i", video_path] + seek_output_args
 
     duration = end_time - start_time
     if duration > 0:
@@ -0,0 +1,279 @@
+"""
+Keyframe index for saved OBS replay files.
+
+Every card extraction (audio window, screenshot, animation, black-bar detection)
+re-opens the same replay. Building a packet index once per replay lets those
+calls seek straight to the nearest preceding keyframe instead of asking ffmpeg
+to decode from the start of the file, and lets duration lookups skip ffprobe.
+
+The index is stored next to the replay as ``<replay>.gsmidx.json`` and kept in a
+small in-memory cache. It is validated against the replay's size and mtime, so
+a replay that OBS overwrites in place is re-indexed automatically.
+"""
+
+import bisect
+import json
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from GameSentenceMiner.util.config.configuration import get_ffprobe_path, logger
+
+INDEX_SUFFIX = ".gsmidx.json"
+INDEX_VERSION = 1
+MAX_CACHED_INDEXES = 8
+
+# Seeks closer than this to a keyframe are treated as landing on it.
+_SEEK_EPSILON = 0.0005
+
+_cache: "OrderedDict[str, ReplayIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+_build_locks: dict[str, threading.Lock] = {}
+
+
+@dataclass
+class ReplayIndex:
+    """Keyframe timestamps (seconds from file start) plus file identity."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    duration: float
+    keyframes: List[float] = field(default_factory=list)
+
+    def matches_file(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def keyframe_before(self, timestamp: float) -> float:
+        """Return the latest keyframe at or before ``timestamp`` (0.0 if none)."""
+        if not self.keyframes:
+            return 0.0
+        idx = bisect.bisect_right(self.keyframes, timestamp + _SEEK_EPSILON) - 1
+        if idx < 0:
+            return 0.0
+        return self.keyframes[idx]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "duration": self.duration,
+            "keyframes": self.keyframes,
+        }
+
+    @classmethod
+    def from_dict(cls, path: str, data: dict) -> Optional["ReplayIndex"]:
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        try:
+            return cls(
+                path=path,
+                size=int(data["size"]),
+                mtime_ns=int(data["mtime_ns"]),
+                duration=float(data["duration"]),
+                keyframes=[float(value) for value in data.get("keyframes", [])],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def get_index_path(video_path: str) -> str:
+    return f"{video_path}{INDEX_SUFFIX}"
+
+
+def _probe_keyframes(video_path: str) -> Optional[Tuple[float, List[float]]]:
+    """Scan packets (no decoding) and return (duration, keyframe times)."""
+    cmd = [
+        get_ffprobe_path(),
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags:format=duration,start_time",
+        "-of",
+        "json",
+        str(video_path),
+    ]
+    logger.debug(" ".join(cmd))
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        info = json.loads(result.stdout)
+    except Exception as e:
+        logger.debug(f"Could not index replay {video_path}: {e}")
+        return None
+
+    fmt = info.get("format") or {}
+    try:
+        duration = float(fmt.get("duration") or 0.0)
+    except (TypeError, ValueError):
+        duration = 0.0
+    try:
+        start_time = float(fmt.get("start_time") or 0.0)
+    except (TypeError, ValueError):
+        start_time = 0.0
+
+    keyframes = []
+    for packet in info.get("packets") or []:
+        if "K" not in str(packet.get("flags", "")):
+            continue
+        try:
+            pts_time = float(packet["pts_time"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        # ffmpeg's -ss is relative to the container start, packet pts is not.
+        keyframes.append(max(0.0, pts_time - start_time))
+    keyframes.sort()
+
+    if duration <= 0 and not keyframes:
+        return None
+    return duration, keyframes
+
+
+def _load_sidecar(video_path: str) -> Optional[ReplayIndex]:
+    index_path = get_index_path(video_path)
+    if not os.path.exists(index_path):
+        return None
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = ReplayIndex.from_dict(video_path, json.load(f))
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable replay index {index_path}: {e}")
+        return None
+    if index and index.matches_file():
+        return index
+    return None
+
+
+def _write_sidecar(index: ReplayIndex) -> None:
+    index_path = get_index_path(index.path)
+    tmp_path = f"{index_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        # Read-only replay folders still get the in-memory index.
+        logger.debug(f"Could not write replay index {index_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _remember(index: ReplayIndex) -> None:
+    with _cache_lock:
+        _cache[index.path] = index
+        _cache.move_to_end(index.path)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+
+
+def get_cached_replay_index(video_path) -> Optional[ReplayIndex]:
+    """Return an already-built index without probing the file."""
+    if not video_path:
+        return None
+    key = os.path.abspath(str(video_path))
+    with _cache_lock:
+        index = _cache.get(key)
+    if index and index.matches_file():
+        return index
+    index = _load_sidecar(key)
+    if index:
+        _remember(index)
+    return index
+
+
+def get_replay_index(video_path) -> Optional[ReplayIndex]:
+    """Return the keyframe index for a replay, building it on first use."""
+    if not video_path:
+        return None
+    key = os.path.abspath(str(video_path))
+    if not os.path.isfile(key):
+        return None
+
+    index = get_cached_replay_index(key)
+    if index:
+        return index
+
+    with _cache_lock:
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+    with build_lock:
+        # Another thread may have finished the build while we waited.
+        index = get_cached_replay_index(key)
+        if index:
+            return index
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        probed = _probe_keyframes(key)
+        if probed is None:
+            return None
+        duration, keyframes = probed
+        index = ReplayIndex(
+            path=key,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            duration=duration,
+            keyframes=keyframes,
+        )
+        _remember(index)
+        _write_sidecar(index)
+        logger.debug(f"Indexed replay {os.path.basename(key)}: {len(keyframes)} keyframes, {duration:.2f}s")
+    with _cache_lock:
+        _build_locks.pop(key, None)
+    return index
+
+
+def keyframe_seek_args(video_path, timestamp) -> Tuple[List[str], List[str]]:
+    """
+    Split a seek into (pre-input args, post-input args).
+
+    The input-side ``-ss`` lands exactly on the nearest preceding keyframe, so
+    ffmpeg never demuxes from the start of the file; the output-side ``-ss``
+    only discards the few frames between that keyframe and ``timestamp``.
+    Without an index this degrades to a plain input-side seek.
+    """
+    try:
+        timestamp = max(0.0, float(timestamp or 0))
+    except (TypeError, ValueError):
+        return [], []
+
+    index = get_replay_index(video_path)
+    if index is None or not index.keyframes:
+        return (["-ss", f"{timestamp}"] if timestamp > 0 else []), []
+
+    keyframe = index.keyframe_before(timestamp)
+    pre_input = ["-ss", f"{keyframe:.6f}"] if keyframe > 0 else []
+    remainder = timestamp - keyframe
+    post_input = ["-ss", f"{remainder:.6f}"] if remainder > _SEEK_EPSILON else []
+    return pre_input, post_input
+
+
+def remove_replay_index(video_path) -> None:
+    """Forget a replay's index and delete its sidecar file."""
+    if not video_path:
+        return
+    key = os.path.abspath(str(video_path))
+    with _cache_lock:
+        _cache.pop(key, None)
+    index_path = get_index_path(key)
+    try:
+        if os.path.exists(index_path):
+            os.remove(index_path)
+    except OSError as e:
+        logger.debug(f"Could not remove replay index {index_path}: {e}")
+
+
+def clear_replay_index_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,100 @@
+"""Skip periodic overlay OCR while the overlay area is static.
+
+Periodic overlay scans used to run a full local OCR every ``periodic_interval``
+even when nothing on screen had changed. ``OverlayChangeGate`` reduces each
+captured frame to a small grid of tile averages and only lets the scan through
+when some tile moved by more than ``tile_threshold`` (enough to ignore JPEG and
+compositor noise, far below what a new glyph does to a tile). Frames are
+compared against the last frame that was scanned, not the previous frame, so
+gradual changes such as typewriter text or fades still add up. While the screen
+stays static the suggested interval backs off geometrically up to
+``max_backoff`` times the configured interval, and resets on the next change.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+GRID_WIDTH = 32
+GRID_HEIGHT = 18
+TILE_THRESHOLD = 6
+BACKOFF_FACTOR = 1.5
+MAX_BACKOFF = 4.0
+
+
+def tile_signature(image: Image.Image, grid: tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT)) -> np.ndarray:
+    """Grayscale per-tile averages of ``image`` on a ``grid`` sized thumbnail."""
+    return np.asarray(image.convert("L").resize(grid, Image.Resampling.BOX), dtype=np.int16)
+
+
+class OverlayChangeGate:
+    def __init__(
+        self,
+        *,
+        grid: tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT),
+        tile_threshold: int = TILE_THRESHOLD,
+        backoff_factor: float = BACKOFF_FACTOR,
+        max_backoff: float = MAX_BACKOFF,
+    ):
+        self.grid = grid
+        self.tile_threshold = int(tile_threshold)
+        self.backoff_factor = float(backoff_factor)
+        self.max_backoff = float(max_backoff)
+        self._lock = threading.Lock()
+        # Signature of the last frame that let a scan through.
+        self._signature: Optional[np.ndarray] = None
+        self._static_streak = 0
+        self.scans = 0
+        self.skipped = 0
+
+    def observe(self, image: Image.Image) -> bool:
+        """True if ``image`` differs from the last changed frame, which it then replaces as the reference."""
+        signature = tile_signature(image, self.grid)
+        with self._lock:
+            reference = self._signature
+            changed = (
+                reference is None
+                or reference.shape != signature.shape
+                or bool(np.abs(signature - reference).max() > self.tile_threshold)
+            )
+            if changed:
+                self._signature = signature
+            return changed
+
+    def record_scan(self, image: Image.Image) -> None:
+        """Make ``image`` the reference after an ungated scan of it."""
+        signature = tile_signature(image, self.grid)
+        with self._lock:
+            self._signature = signature
+
+    def should_scan(self, image: Image.Image) -> bool:
+        """Gate a periodic scan: True when OCR should run on ``image``."""
+        changed = self.observe(image)
+        with self._lock:
+            if changed:
+                self.scans += 1
+                self._static_streak = 0
+            else:
+                self.skipped += 1
+                self._static_streak += 1
+        return changed
+
+    def next_interval(self, base_interval: float) -> float:
+        with self._lock:
+            streak = self._static_streak
+        if streak <= 0:
+            return base_interval
+        return base_interval * min(self.max_backoff, self.backoff_factor**streak)
+
+    def static_streak(self) -> int:
+        with self._lock:
+            return self._static_streak
+
+    def reset(self) -> None:
+        with self._lock:
+            self._signature = None
+            self._static_streak = 0
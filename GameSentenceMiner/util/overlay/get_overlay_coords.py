@@ -14,6 +14,8 @@ from typing import Dict, Any, List, Tuple, Optional
 
 # Updated imports to include window info helpers
 from GameSentenceMiner.obs import get_current_game, get_current_scene, get_screenshot_PIL
+from GameSentenceMiner.obs.frame_broker import SHARED_FRAME_MAX_AGE_MS
+from GameSentenceMiner.util.overlay.change_gate import OverlayChangeGate
 from GameSentenceMiner.ocr.gsm_ocr_config import (
     get_overlay_area_config,
     get_overlay_minimum_character_size as get_scene_overlay_minimum_character_size,
@@ -194,8 +196,11 @@ async def _overlay_loop():
                         await asyncio.sleep(overlay_cfg.periodic_interval)
                         continue
                     last_cursor_pos = cursor_pos
-                await overlay_processor.find_box_and_send_to_overlay(check_against_last=True, local_ocr_retry=0)
-                await asyncio.sleep(overlay_cfg.periodic_interval)
+                await overlay_processor.find_box_and_send_to_overlay(
+                    check_against_last=True, local_ocr_retry=0, change_gated=True
+                )
+                # Back off while the overlay area is static; resets on the next change.
+                await asyncio.sleep(overlay_processor.change_gate.next_interval(overlay_cfg.periodic_interval))
             elif first_time_run:
                 await overlay_processor.find_box_and_send_to_overlay(check_against_last=False, local_ocr_retry=0)
                 first_time_run = False
@@ -203,6 +208,7 @@ async def _overlay_loop():
                 await asyncio.sleep(3)
         else:
             first_time_run = True
+            overlay_processor.change_gate.reset()
             await asyncio.sleep(3)
 
 
@@ -338,6 +344,8 @@ class OverlayProcessor:
         self._last_overlay_capture_content_height: int = 0
         self._ocr_engine_unload_handle: Optional[asyncio.TimerHandle] = None
         self._ocr_engine_activity_generation = 0
+        # Skips periodic scans whose overlay area hasn't changed since the last scan.
+        self.change_gate = OverlayChangeGate()
 
     def _get_scaled_overlay_area_config(self, width: int, height: int):
         overlay_area_config = get_overlay_area_config()
@@ -1014,6 +1022,7 @@ class OverlayProcessor:
         sequence: int = None,
         local_ocr_retry=5,
         source: TextSource = None,
+        change_gated: bool = False,
     ):
         """Sends the detected text boxes to the overlay via WebSocket."""
         if sequence is not None and sequence != self._current_sequence:
@@ -1075,6 +1084,7 @@ class OverlayProcessor:
                 sequence=sequence,
                 local_ocr_retry=local_ocr_retry,
                 source=source,
+                change_gated=change_gated,
             )
         )
         try:
@@ -1093,6 +1103,7 @@ class OverlayProcessor:
         sequence: int = None,
         local_ocr_retry=5,
         source: TextSource = None,
+        change_gated: bool = False,
     ) -> List[Dict[str, Any]]:
         if sequence is not None and sequence != self._current_sequence:
             logger.debug(f"Skipping outdated OCR work (sequence {sequence}, current {self._current_sequence})")
@@ -1106,6 +1117,7 @@ class OverlayProcessor:
                 dict_from_ocr=dict_from_ocr,
                 local_ocr_retry=local_ocr_retry,
                 source=source,
+                change_gated=change_gated,
             )
         except Exception as e:
             logger.exception(f"Error during OCR processing: {e}")
@@ -1483,23 +1495,6 @@ class OverlayProcessor:
         except Exception:
             return OverlayManualBackgroundMode.OFF.value
 
-    @staticmethod
-    def _encode_pil_to_data_url(img: Image.Image, quality: int = 70) -> Optional[str]:
-        """JPEG-encode a PIL image into a base64 data URL for the overlay background."""
-        if img is None:
-            return None
-        try:
-            import base64
-            import io
-
-            buffer = io.BytesIO()
-            img.convert("RGB").save(buffer, format="JPEG", quality=quality)
-            encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
-            return f"data:image/jpeg;base64,{encoded}"
-        except Exception as e:
-            logger.debug(f"Failed to encode manual-mode background image: {e}")
-            return None
-
     def _capture_full_monitor_mss(self) -> Optional[Image.Image]:
         """Grab a fresh full-monitor frame via mss for the on-demand background."""
         if not mss or is_wayland():
@@ -1522,14 +1517,15 @@ class OverlayProcessor:
         if self._get_manual_background_mode() == OverlayManualBackgroundMode.OFF.value:
             return
 
-        img = self._capture_full_monitor_mss()
-        data_url = self._encode_pil_to_data_url(img)
-        if not data_url:
+        # The grab is blocking and encoding happens in the websocket layer on a
+        # worker thread, so the overlay loop never waits on either.
+        img = await asyncio.to_thread(self._capture_full_monitor_mss)
+        if img is None:
             logger.debug("Manual-mode background: no image to send.")
             return
         logger.info("Sending manual-mode desktop background to overlay.")
         try:
-            await send_manual_background_to_overlay(data_url)
+            await send_manual_background_to_overlay(img)
         except Exception as e:
             logger.debug(f"Failed to send manual-mode background to overlay: {e}")
 
@@ -1593,6 +1589,7 @@ class OverlayProcessor:
                         img_format="jpg",
                         width=self.obs_width,
                         height=self.obs_height,
+                        max_age_ms=SHARED_FRAME_MAX_AGE_MS,
                     )
 
                     if obs_img:
@@ -1660,7 +1657,9 @@ class OverlayProcessor:
 
         try:
             logger.debug("Attempting fallback screenshot via OBS sources (Full Scene)")
-            obs_img = get_screenshot_PIL(compression=90, img_format="jpg", width=None, height=None)
+            obs_img = get_screenshot_PIL(
+                compression=90, img_format="jpg", width=None, height=None, max_age_ms=SHARED_FRAME_MAX_AGE_MS
+            )
             if obs_img:
                 if CONVERT_TO_GRAYSCALE:
                     obs_img = obs_img.convert("L")
@@ -2278,8 +2277,13 @@ class OverlayProcessor:
         dict_from_ocr=None,
         local_ocr_retry=5,
         source: TextSource = None,
+        change_gated: bool = False,
     ) -> Tuple[List[Dict[str, Any]], int]:
-        """The main OCR workflow with cancellation support."""
+        """The main OCR workflow with cancellation support.
+
+        ``change_gated`` scans (the periodic loop) return early without OCR when
+        the captured overlay area matches the previous scan.
+        """
         # logger.background("Finding text for overlay...")
         start_time = datetime.now()
         timing_start = time.time()
@@ -2346,6 +2350,17 @@ class OverlayProcessor:
             op_start,
             f"Screenshot capture (width: {full_screenshot.width}, height: {full_screenshot.height})",
         )
+        if change_gated:
+            skipped_scans = self.change_gate.static_streak()
+            if not self.change_gate.should_scan(full_screenshot):
+                return []
+            if skipped_scans:
+                logger.background(
+                    f"Overlay area changed after {skipped_scans} skipped periodic scan(s) "
+                    f"({self.change_gate.skipped} skipped, {self.change_gate.scans} scanned this session)"
+                )
+        else:
+            self.change_gate.record_scan(full_screenshot)
 
         local_ocr_engine = self.oneocr or self.meikiocr or self.screenai
         crop_coords_list = []
@@ -2377,6 +2392,8 @@ class OverlayProcessor:
 
                         # Re-capture if retrying, otherwise we are OCRing the same static image
                         full_screenshot, off_x, off_y, monitor_width, monitor_height = self.get_image_to_ocr()
+                        if full_screenshot:
+                            self.change_gate.record_scan(full_screenshot)
                     except asyncio.CancelledError:
                         raise
 
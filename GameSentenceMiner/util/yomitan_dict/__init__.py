@@ -9,11 +9,14 @@ Components:
 - NameParser: Handles Japanese name parsing and reading generation
 - ImageHandler: Manages image decoding and formatting
 - ContentBuilder: Builds Yomitan structured content for character cards
+- FrequencyBankCache: Incrementally maintained term_meta_bank payloads for the frequency dictionary
+- YomitanDictArtifactCache: On-disk cache of built dictionary ZIPs keyed by revision
 """
 
+from .artifact_cache import YomitanDictArtifactCache
 from .content_builder import ContentBuilder
 from .dict_builder import YomitanDictBuilder
-from .freq_dict_builder import FrequencyDictBuilder
+from .freq_dict_builder import FrequencyBankCache, FrequencyDictBuilder
 from .image_handler import ImageHandler
 from .name_parser import NameParser
 from . import sudachi_user_dict
@@ -21,8 +24,10 @@ from . import sudachi_user_dict
 __all__ = [
     "YomitanDictBuilder",
     "FrequencyDictBuilder",
+    "FrequencyBankCache",
     "NameParser",
     "ImageHandler",
     "ContentBuilder",
+    "YomitanDictArtifactCache",
     "sudachi_user_dict",
 ]
@@ -0,0 +1,109 @@
+"""On-disk cache of generated Yomitan dictionary ZIPs.
+
+Building the character dictionary decodes every portrait and deflates a fresh
+ZIP, while the output is fully determined by the dictionary revision and its
+download URL. Artifacts are stored under ``cache_key(revision, download_url)``,
+which also serves as the HTTP ETag, so repeated downloads and Yomitan update
+checks reuse the stored bytes.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+# Distinct game_count/spoiler_level combinations rarely exceed a handful.
+DEFAULT_MAX_ARTIFACTS = 8
+
+
+def cache_key(revision: str, download_url: str) -> str:
+    """Key (and ETag) for the artifact built from ``revision`` for ``download_url``."""
+    raw = f"{revision}\x1f{download_url}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:24]
+
+
+class YomitanDictArtifactCache:
+    def __init__(self, directory: Optional[str] = None, max_artifacts: int = DEFAULT_MAX_ARTIFACTS):
+        self._directory = directory
+        self.max_artifacts = max(1, int(max_artifacts))
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            from GameSentenceMiner.util.config.configuration import get_app_directory
+
+            self._directory = os.path.join(get_app_directory(), "cache", "yomitan_dict")
+        return self._directory
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.zip")
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Stored ZIP bytes for ``key``, or None when it has not been built yet."""
+        try:
+            with open(self._path_for(key), "rb") as handle:
+                data = handle.read()
+        except OSError:
+            data = None
+        with self._lock:
+            self._stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(self._path_for(key))
+
+    def store(self, key: str, data: bytes) -> None:
+        """Atomically write ``data`` for ``key`` and trim the oldest artifacts."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(temp_path, self._path_for(key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        with self._lock:
+            self._stats["stores"] += 1
+        self._trim()
+
+    def _artifact_paths(self) -> list[str]:
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.endswith(".zip")]
+
+    def _trim(self) -> None:
+        paths = self._artifact_paths()
+        if len(paths) <= self.max_artifacts:
+            return
+        paths.sort(key=lambda path: os.path.getmtime(path), reverse=True)
+        for path in paths[self.max_artifacts :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def invalidate(self) -> int:
+        """Remove every stored artifact; returns how many were deleted."""
+        removed = 0
+        for path in self._artifact_paths():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._stats["invalidations"] += 1
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["artifacts"] = len(self._artifact_paths())
+        return snapshot
@@ -2,10 +2,284 @@
 
 from __future__ import annotations
 
-import io
+import hashlib
 import json
+import os
+import struct
+import tempfile
+import threading
 import time
-import zipfile
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class _ZipMember:
+    name: str
+    crc: int
+    compressed_size: int
+    size: int
+    read_compressed: Callable[[], bytes]
+
+
+def _deflate_json_array(items: Iterable) -> tuple[bytes, int, int]:
+    """Raw-deflate a JSON array (at most one bank's worth of entries); returns (payload, crc32, size)."""
+    encoded = json.dumps(list(items), ensure_ascii=False).encode("utf-8")
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return compressor.compress(encoded) + compressor.flush(), zlib.crc32(encoded), len(encoded)
+
+
+def _dos_timestamp(now: float) -> tuple[int, int]:
+    t = time.localtime(now)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((max(t.tm_year, 1980) - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+def _iter_zip(members: Iterable[_ZipMember]) -> Iterator[bytes]:
+    """Yield a ZIP archive member by member from already-deflated payloads."""
+    dos_time, dos_date = _dos_timestamp(time.time())
+    central_directory: list[bytes] = []
+    offset = 0
+    for member in members:
+        name = member.name.encode("utf-8")
+        common = struct.pack(
+            "<HHHHHIII",
+            20,  # version needed to extract
+            0x0800,  # UTF-8 file names
+            8,  # deflate
+            dos_time,
+            dos_date,
+            member.crc,
+            member.compressed_size,
+            member.size,
+        )
+        local_header = struct.pack("<I", 0x04034B50) + common + struct.pack("<HH", len(name), 0) + name
+        yield local_header
+        yield member.read_compressed()
+        central_directory.append(
+            struct.pack("<IH", 0x02014B50, 20)
+            + common
+            + struct.pack("<HHHHHII", len(name), 0, 0, 0, 0, 0, offset)
+            + name
+        )
+        offset += len(local_header) + member.compressed_size
+
+    directory = b"".join(central_directory)
+    yield directory
+    yield struct.pack(
+        "<IHHHHIIH",
+        0x06054B50,
+        0,
+        0,
+        len(central_directory),
+        len(central_directory),
+        len(directory),
+        offset,
+        0,
+    )
+
+
+def _in_memory_member(name: str, items: Iterable) -> _ZipMember:
+    payload, crc, size = _deflate_json_array(items)
+    return _ZipMember(name, crc, len(payload), size, lambda: payload)
+
+
+class FrequencyBankCache:
+    """Deflated ``term_meta_bank`` payloads kept on disk between frequency dictionary builds.
+
+    Banks are partitioned by word-id range (``BANK_WORD_SPAN`` ids each) rather
+    than by rank, so a count change only dirties the bank that owns the word.
+    Counts come from ``word_stats_cache``, which triggers keep current. New
+    occurrences are found through a high-water mark on ``word_occurrences.id``.
+    When the cached total no longer matches (deleted lines, orphan cleanup, a
+    cache rebuild), every bank's (count, sum, weighted sum) signature is
+    compared instead.
+    """
+
+    BANK_WORD_SPAN = 10_000
+    MANIFEST_VERSION = 1
+
+    def __init__(self, directory: str | None = None) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+        self.last_rebuilt_banks: list[int] = []
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            from GameSentenceMiner.util.config.configuration import get_app_directory
+
+            self._directory = os.path.join(get_app_directory(), "cache", "yomitan_freq")
+        return self._directory
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, "manifest.json")
+
+    def _bank_path(self, bank: int) -> str:
+        return os.path.join(self.directory, f"bank_{bank}.deflate")
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self._manifest_path(), "r", encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != self.MANIFEST_VERSION or manifest.get("span") != self.BANK_WORD_SPAN:
+            return {}
+        return manifest
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _bank_signatures(self, db, bank: int | None = None) -> dict[str, list[int]]:
+        """(entries, total count, id-weighted count) per bank, for all banks or just ``bank``."""
+        where_clause, params = "occurrence_count > 0", (self.BANK_WORD_SPAN,)
+        if bank is not None:
+            where_clause += " AND word_id >= ? AND word_id < ?"
+            params = (*params, bank * self.BANK_WORD_SPAN, (bank + 1) * self.BANK_WORD_SPAN)
+        rows = db.fetchall(
+            f"""
+            SELECT word_id / ?, COUNT(*), SUM(occurrence_count), SUM(word_id * occurrence_count)
+            FROM word_stats_cache
+            WHERE {where_clause}
+            GROUP BY 1
+            """,
+            params,
+        )
+        return {str(int(row[0])): [int(row[1]), int(row[2] or 0), int(row[3] or 0)] for row in rows}
+
+    def _build_bank(self, db, bank: int) -> tuple[bytes, int, int] | None:
+        low = bank * self.BANK_WORD_SPAN
+        rows = db.fetchall(
+            """
+            SELECT w.word, w.reading, wsc.occurrence_count
+            FROM word_stats_cache wsc
+            JOIN words w ON w.id = wsc.word_id
+            WHERE wsc.word_id >= ? AND wsc.word_id < ? AND wsc.occurrence_count > 0
+            ORDER BY wsc.occurrence_count DESC, wsc.word_id
+            """,
+            (low, low + self.BANK_WORD_SPAN),
+        )
+        if not rows:
+            return None
+        return _deflate_json_array(FrequencyDictBuilder._build_entry(row[0], row[1], row[2]) for row in rows)
+
+    def refresh(self, db) -> tuple[list[_ZipMember], str | None]:
+        """Bring the stored banks up to date; returns the bank members and the content revision."""
+        with self._lock:
+            banks, revision = self._refresh_locked(db)
+
+            # Payloads are read while the lock is held: a later refresh may replace a bank file
+            # while this response is still streaming, and the member headers must match the data.
+            members = []
+            for key in sorted(banks, key=int):
+                entry = banks[key]
+                payload = _read_file(self._bank_path(int(key)))
+                members.append(
+                    _ZipMember(
+                        "",
+                        entry["crc"],
+                        entry["compressed_size"],
+                        entry["size"],
+                        lambda payload=payload: payload,
+                    )
+                )
+            return members, revision
+
+    def current_revision(self, db) -> str | None:
+        """Bring the stored banks up to date and return the content revision, without reading any bank."""
+        with self._lock:
+            return self._refresh_locked(db)[1]
+
+    def _refresh_locked(self, db) -> tuple[dict[str, dict], str | None]:
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self._load_manifest()
+        banks: dict[str, dict] = manifest.get("banks", {})
+        last_occurrence_id = int(manifest.get("last_occurrence_id", 0))
+        last_total = int(manifest.get("total_occurrences", 0))
+
+        row = db.fetchone("SELECT COALESCE(MAX(id), 0) FROM word_occurrences")
+        current_occurrence_id = int(row[0]) if row else 0
+        row = db.fetchone("SELECT COALESCE(SUM(occurrence_count), 0) FROM word_stats_cache")
+        current_total = int(row[0]) if row else 0
+
+        dirty: set[str] = set()
+        if manifest and current_occurrence_id >= last_occurrence_id:
+            new_rows = db.fetchall(
+                "SELECT CAST(word_id AS INTEGER) / ?, COUNT(*) FROM word_occurrences WHERE id > ? GROUP BY 1",
+                (self.BANK_WORD_SPAN, last_occurrence_id),
+            )
+            dirty = {str(int(bank)) for bank, _ in new_rows}
+            appended = sum(int(count) for _, count in new_rows)
+            needs_signature_check = last_total + appended != current_total
+        else:
+            needs_signature_check = True
+
+        signatures: dict[str, list[int]] | None = None
+        if needs_signature_check:
+            signatures = self._bank_signatures(db)
+            dirty |= {
+                key
+                for key in set(signatures) | set(banks)
+                if banks.get(key, {}).get("signature") != signatures.get(key)
+            }
+        dirty |= {key for key in banks if not os.path.exists(self._bank_path(int(key)))}
+
+        rebuilt: list[int] = []
+        for key in sorted(dirty, key=int):
+            built = self._build_bank(db, int(key))
+            if built is None:
+                banks.pop(key, None)
+                try:
+                    os.remove(self._bank_path(int(key)))
+                except OSError:
+                    pass
+                continue
+            payload, crc, size = built
+            self._write_atomic(self._bank_path(int(key)), payload)
+            signature = (signatures if signatures is not None else self._bank_signatures(db, int(key))).get(key)
+            banks[key] = {"crc": crc, "compressed_size": len(payload), "size": size, "signature": signature}
+            rebuilt.append(int(key))
+
+        revision = self._revision(banks)
+        self._write_atomic(
+            self._manifest_path(),
+            json.dumps(
+                {
+                    "version": self.MANIFEST_VERSION,
+                    "span": self.BANK_WORD_SPAN,
+                    "last_occurrence_id": current_occurrence_id,
+                    "total_occurrences": current_total,
+                    "revision": revision,
+                    "banks": banks,
+                }
+            ).encode("utf-8"),
+        )
+        self.last_rebuilt_banks = rebuilt
+        return banks, revision
+
+    @staticmethod
+    def _revision(banks: dict[str, dict]) -> str:
+        """Content revision derived from every bank's checksum and signature."""
+        fingerprint = json.dumps(
+            [[key, banks[key]["crc"], banks[key]["size"], banks[key]["signature"]] for key in sorted(banks, key=int)]
+        )
+        return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
 
 
 class FrequencyDictBuilder:
@@ -14,10 +288,12 @@ class FrequencyDictBuilder:
     DICT_TITLE = "GSM Frequency Dictionary"
     MAX_ENTRIES_PER_FILE = 10_000
 
-    def __init__(self, download_url: str | None = None) -> None:
+    def __init__(self, download_url: str | None = None, bank_cache: FrequencyBankCache | None = None) -> None:
         self.download_url = download_url
         self.revision = str(int(time.time()))
         self.entries: list[list] = []
+        self.bank_cache = bank_cache
+        self._banks: list[_ZipMember] = []
 
     def _create_index(self) -> dict:
         """Return the index.json metadata dict."""
@@ -36,6 +312,16 @@ class FrequencyDictBuilder:
             index["isUpdatable"] = True
         return index
 
+    def load_revision(self) -> None:
+        """Set ``self.revision`` to the bank cache's content revision, as ``build_from_db`` would."""
+        from GameSentenceMiner.util.database.tokenization_tables import WordsTable
+
+        if self.bank_cache is None:
+            return
+        revision = self.bank_cache.current_revision(WordsTable._db)
+        if revision:
+            self.revision = revision
+
     @staticmethod
     def _build_entry(word: str, reading: str, count: int) -> list:
         """Build a single term_meta_bank entry."""
@@ -44,29 +330,69 @@ class FrequencyDictBuilder:
         return [word, "freq", count]
 
     def build_from_db(self) -> None:
-        """Query words + word_occurrences and populate self.entries."""
+        """Load frequencies from the maintained per-word counts in ``word_stats_cache``.
+
+        With a ``bank_cache`` only the banks whose word ranges changed are
+        regenerated and nothing is materialized here; otherwise ``self.entries``
+        is populated.
+        """
         from GameSentenceMiner.util.database.tokenization_tables import WordsTable
 
+        if self.bank_cache is not None:
+            self._banks, revision = self.bank_cache.refresh(WordsTable._db)
+            if revision:
+                self.revision = revision
+            return
+
         rows = WordsTable._db.fetchall(
-            "SELECT w.word, w.reading, COUNT(wo.id) as freq "
-            "FROM words w "
-            "INNER JOIN word_occurrences wo ON w.id = wo.word_id "
-            "GROUP BY w.id "
-            "HAVING freq > 0 "
-            "ORDER BY freq DESC"
+            "SELECT w.word, w.reading, wsc.occurrence_count as freq "
+            "FROM word_stats_cache wsc "
+            "INNER JOIN words w ON w.id = wsc.word_id "
+            "WHERE wsc.occurrence_count > 0 "
+            "ORDER BY wsc.occurrence_count DESC"
         )
         self.entries = [self._build_entry(row[0], row[1], row[2]) for row in rows]
 
-    def export_bytes(self) -> bytes:
-        """Create an in-memory ZIP with index.json and term_meta_bank_N.json files."""
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("index.json", json.dumps(self._create_index(), ensure_ascii=False))
-            for i in range(0, max(len(self.entries), 1), self.MAX_ENTRIES_PER_FILE):
-                chunk = self.entries[i : i + self.MAX_ENTRIES_PER_FILE]
-                bank_index = (i // self.MAX_ENTRIES_PER_FILE) + 1
-                zf.writestr(
+    def has_entries(self) -> bool:
+        return bool(self.entries or self._banks)
+
+    def _bank_members(self) -> Iterator[_ZipMember]:
+        if self._banks:
+            for bank_index, member in enumerate(self._banks, start=1):
+                yield _ZipMember(
                     f"term_meta_bank_{bank_index}.json",
-                    json.dumps(chunk, ensure_ascii=False),
+                    member.crc,
+                    member.compressed_size,
+                    member.size,
+                    member.read_compressed,
                 )
-        return buf.getvalue()
+            return
+        for i in range(0, max(len(self.entries), 1), self.MAX_ENTRIES_PER_FILE):
+            bank_index = (i // self.MAX_ENTRIES_PER_FILE) + 1
+            yield _in_memory_member(
+                f"term_meta_bank_{bank_index}.json",
+                self.entries[i : i + self.MAX_ENTRIES_PER_FILE],
+            )
+
+    def iter_zip_chunks(self) -> Iterator[bytes]:
+        """Stream the ZIP (index.json plus every term_meta_bank_N.json) one member at a time."""
+        index_payload = json.dumps(self._create_index(), ensure_ascii=False).encode("utf-8")
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        compressed_index = compressor.compress(index_payload) + compressor.flush()
+        index_member = _ZipMember(
+            "index.json",
+            zlib.crc32(index_payload),
+            len(compressed_index),
+            len(index_payload),
+            lambda: compressed_index,
+        )
+
+        def _members() -> Iterator[_ZipMember]:
+            yield index_member
+            yield from self._bank_members()
+
+        return _iter_zip(_members())
+
+    def export_bytes(self) -> bytes:
+        """Create the ZIP with index.json and term_meta_bank_N.json files in memory."""
+        return b"".join(self.iter_zip_chunks())
@@ -19,6 +19,7 @@ from threading import Lock
 
 from GameSentenceMiner.util.config.configuration import get_config
 from GameSentenceMiner.util.config.configuration import logger
+from GameSentenceMiner.util.database import data_generation
 from GameSentenceMiner.util.database.db import GameLinesTable
 from GameSentenceMiner.util.database.stats_rollup_table import StatsRollupTable
 from GameSentenceMiner.web.stats import (
@@ -139,6 +140,7 @@ def invalidate_anki_data_cache():
     with _anki_data_lock:
         _anki_data_cache = None
         _anki_data_ts = 0.0
+    data_generation.bump(data_generation.ANKI)
 
 
 def _parse_requested_anki_stats_sections(raw_sections: str | None, available_sections: dict[str, object]) -> list[str]:
@@ -209,6 +209,8 @@ def _delete_line_ids_batched(line_ids, chunk_size=500):
                     logger.warning(f"Failed to delete line {line_id}: {row_error}")
                     failed_ids.append(line_id)
 
+    if deleted_count:
+        GameLinesTable.mark_data_changed()
     return {"deleted_count": deleted_count, "failed_ids": failed_ids}
 
 
@@ -608,10 +610,10 @@ def register_database_api_routes(app):
                         base_query += " AND gl.game_name = ?"
                         params.append(game_filter)
                     if date_start_timestamp is not None:
-                        base_query += " AND CAST(gl.timestamp AS REAL) >= ?"
+                        base_query += " AND gl.timestamp >= ?"
                         params.append(date_start_timestamp)
                     if date_end_timestamp is not None:
-                        base_query += " AND CAST(gl.timestamp AS REAL) <= ?"
+                        base_query += " AND gl.timestamp <= ?"
                         params.append(date_end_timestamp)
 
                     # Count query (same filters, no sort/pagination)
@@ -625,10 +627,10 @@ def register_database_api_routes(app):
                         count_query += " AND gl.game_name = ?"
                         count_params.append(game_filter)
                     if date_start_timestamp is not None:
-                        count_query += " AND CAST(gl.timestamp AS REAL) >= ?"
+                        count_query += " AND gl.timestamp >= ?"
                         count_params.append(date_start_timestamp)
                     if date_end_timestamp is not None:
-                        count_query += " AND CAST(gl.timestamp AS REAL) <= ?"
+                        count_query += " AND gl.timestamp <= ?"
                         count_params.append(date_end_timestamp)
 
                     total_results = GameLinesTable._db.fetchone(count_query, count_params)[0]
@@ -794,17 +796,17 @@ def register_database_api_routes(app):
 
                 # Add date range filter if specified
                 if date_start_timestamp is not None:
-                    base_query += " AND CAST(timestamp AS REAL) >= ?"
+                    base_query += " AND timestamp >= ?"
                     params.append(date_start_timestamp)
                 if date_end_timestamp is not None:
-                    base_query += " AND CAST(timestamp AS REAL) <= ?"
+                    base_query += " AND timestamp <= ?"
                     params.append(date_end_timestamp)
 
                 # Add sorting
                 if sort_by == "date_desc":
-                    base_query += " ORDER BY CAST(timestamp AS REAL) DESC"
+                    base_query += " ORDER BY timestamp DESC"
                 elif sort_by == "date_asc":
-                    base_query += " ORDER BY CAST(timestamp AS REAL) ASC"
+                    base_query += " ORDER BY timestamp ASC"
                 elif sort_by == "game_name":
                     base_query += " ORDER BY game_name, timestamp DESC"
                 elif sort_by == "length_desc":
@@ -821,10 +823,10 @@ def register_database_api_routes(app):
                     count_query += " AND game_name = ?"
                     count_params.append(game_filter)
                 if date_start_timestamp is not None:
-                    count_query += " AND CAST(timestamp AS REAL) >= ?"
+                    count_query += " AND timestamp >= ?"
                     count_params.append(date_start_timestamp)
                 if date_end_timestamp is not None:
-                    count_query += " AND CAST(timestamp AS REAL) <= ?"
+                    count_query += " AND timestamp <= ?"
                     count_params.append(date_end_timestamp)
 
                 total_results = GameLinesTable._db.fetchone(count_query, count_params)[0]
@@ -910,8 +912,8 @@ def register_database_api_routes(app):
                 SELECT
                     game_name,
                     COUNT(*) AS sentence_count,
-                    MIN(CAST(timestamp AS REAL)) AS first_timestamp,
-                    MAX(CAST(timestamp AS REAL)) AS last_timestamp,
+                    MIN(timestamp) AS first_timestamp,
+                    MAX(timestamp) AS last_timestamp,
                     COALESCE(SUM(LENGTH(COALESCE(line_text, ''))), 0) AS total_characters
                 FROM {GameLinesTable._table}
                 WHERE game_name IS NOT NULL AND game_name != ''
@@ -1165,6 +1167,7 @@ def register_database_api_routes(app):
                             "status": "error",
                             "error": str(row_error),
                         }
+            GameLinesTable.mark_data_changed()
 
             # Check if any deletions were successful
             successful_deletions = [name for name, result in deletion_results.items() if result["status"] == "success"]
@@ -2620,6 +2623,7 @@ def register_database_api_routes(app):
 
                     # Add the count we calculated earlier
                     lines_moved += secondary_game_line_counts[game_name]
+                GameLinesTable.mark_data_changed()
 
                 # Update merge summary
                 merge_summary["lines_moved"] = lines_moved
@@ -2763,6 +2767,8 @@ def register_database_api_routes(app):
                     logger.warning(f"Failed to migrate line {line_id}: {e}")
                     failed_ids.append(line_id)
 
+            if migrated_count:
+                GameLinesTable.mark_data_changed()
             logger.info(f"Migrated {migrated_count} lines out of {len(line_ids)} requested to '{target_game}'")
 
             response_data = {
@@ -2832,6 +2838,7 @@ def register_database_api_routes(app):
                         updated_count += 1
 
             if updated_count > 0:
+                GameLinesTable.mark_data_changed()
                 try:
                     logger.info("Triggering stats rollup after regex deletion")
                     cron_scheduler.force_daily_rollup()
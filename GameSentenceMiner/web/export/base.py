@@ -67,16 +67,37 @@ class BaseStatsExporter(ABC):
         *,
         progress_cb: Callable[[int, int], None] | None = None,
     ) -> int:
-        rows = list(records)
-        total = len(rows)
+        """Stream ``records`` to ``output_path`` as UTF-8 CSV and return the row count.
 
-        with open(output_path, "w", encoding="utf-8-sig", newline="") as handle:
-            writer = csv.writer(handle, lineterminator="\n")
+        Rows are written as they are pulled from ``records``, so a generator is
+        never materialized. ``progress_cb`` receives ``(rows_written, bytes_written)``.
+        """
+        with open(output_path, "wb") as handle:
+            sink = _CountingTextSink(handle)
+            sink.write("\ufeff")
+            writer = csv.writer(sink, lineterminator="\n")
             writer.writerow(self.get_headers())
 
-            for index, record in enumerate(rows, start=1):
+            row_count = 0
+            for row_count, record in enumerate(records, start=1):
                 writer.writerow(self.build_row(record))
-                if progress_cb and (index == total or index % 50 == 0):
-                    progress_cb(index, total)
+                if progress_cb and row_count % 50 == 0:
+                    progress_cb(row_count, sink.bytes_written)
 
-        return total
+        if progress_cb:
+            progress_cb(row_count, sink.bytes_written)
+        return row_count
+
+
+class _CountingTextSink:
+    """Encodes ``csv.writer`` output straight into a binary file while counting bytes."""
+
+    def __init__(self, handle):
+        self._handle = handle
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        self._handle.write(data)
+        self.bytes_written += len(data)
+        return len(text)
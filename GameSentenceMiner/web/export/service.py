@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import heapq
 import json
 import os
 import tempfile
@@ -8,7 +9,9 @@ import threading
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Callable
+from itertools import chain, groupby
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator
 
 from GameSentenceMiner.util.config.configuration import get_config, logger
 from GameSentenceMiner.util.database.db import GameLinesTable
@@ -28,7 +31,12 @@ from GameSentenceMiner.web.export import (
     get_stats_exporter,
 )
 from GameSentenceMiner.web.stats import calculate_actual_reading_time
-from GameSentenceMiner.web.stats_repository import fetch_today_lines, query_stats_lines
+from GameSentenceMiner.web.stats_repository import iter_stats_lines
+
+# Rows per keyset-paginated query; bounds how much of the history is in memory at once.
+EXPORT_CHUNK_SIZE = 1000
+# Library covers are base64 blobs, so they are fetched in much smaller batches.
+LIBRARY_IMAGE_CHUNK_SIZE = 50
 
 
 def _clamp_progress(value: int) -> int:
@@ -372,176 +380,159 @@ def _group_line_records(
     return exported_records
 
 
+def _export_sort_key(record: NormalizedActivityRecord) -> tuple[str, str, str]:
+    return record.date, record.log_name.lower(), record.activity_type.lower()
+
+
+def _sorted_within_days(records: Iterable[NormalizedActivityRecord]) -> Iterator[NormalizedActivityRecord]:
+    """Re-order a date-ordered stream into export order, holding one day at a time."""
+    for _, day_records in groupby(records, key=attrgetter("date")):
+        yield from sorted(day_records, key=_export_sort_key)
+
+
+def _iter_grouped_line_records(
+    lines: Iterable,
+    *,
+    games_by_id: dict[str, GamesTable],
+    games_by_scene: dict[str, GamesTable],
+) -> Iterator[NormalizedActivityRecord]:
+    """Group timestamp-ordered lines per day and game, emitting each day as soon as it is complete."""
+    day_lines: list = []
+    current_date: str | None = None
+
+    for line in lines:
+        date_str = datetime.date.fromtimestamp(float(line.timestamp)).isoformat()
+        if day_lines and date_str != current_date:
+            yield from sorted(
+                _group_line_records(day_lines, games_by_id=games_by_id, games_by_scene=games_by_scene),
+                key=_export_sort_key,
+            )
+            day_lines = []
+        current_date = date_str
+        day_lines.append(line)
+
+    if day_lines:
+        yield from sorted(
+            _group_line_records(day_lines, games_by_id=games_by_id, games_by_scene=games_by_scene),
+            key=_export_sort_key,
+        )
+
+
+def _map_third_party_row(row: ThirdPartyStatsTable, language: str) -> NormalizedActivityRecord:
+    media_type, activity_type = _map_external_activity(row.source)
+    return NormalizedActivityRecord(
+        date=row.date,
+        log_name=row.label or row.source or "External Activity",
+        media_type=media_type,
+        duration_minutes=_seconds_to_minutes(float(row.time_read_seconds or 0.0)),
+        language=language,
+        characters=int(row.characters_read or 0),
+        activity_type=activity_type,
+    )
+
+
 def _load_historical_native_records(
     start_date: datetime.date,
     end_date: datetime.date,
     *,
-    progress_cb: Callable[[int, str], None] | None,
+    progress_cb: Callable[..., None] | None,
     games_by_id: dict[str, GamesTable],
     games_by_scene: dict[str, GamesTable],
-) -> list[NormalizedActivityRecord]:
+) -> Iterator[NormalizedActivityRecord]:
     if end_date < start_date:
-        return []
+        return
 
-    rollup_rows = GameDailyRollupTable.get_date_range(start_date.isoformat(), end_date.isoformat())
-    if rollup_rows:
+    rollup_rows = GameDailyRollupTable.iter_date_range(
+        start_date.isoformat(), end_date.isoformat(), chunk_size=EXPORT_CHUNK_SIZE
+    )
+    first_row = next(rollup_rows, None)
+    if first_row is not None:
         language = get_config().general.get_target_language_name()
-        total = len(rollup_rows)
-        records: list[NormalizedActivityRecord] = []
-        for index, row in enumerate(rollup_rows, start=1):
+
+        def _map_rollup(row: GameDailyRollupTable) -> NormalizedActivityRecord:
             title, game_type = _resolve_game_metadata(row.game_id, "", games_by_id, games_by_scene)
             media_type, activity_type = _map_native_activity(game_type)
-            records.append(
-                NormalizedActivityRecord(
-                    date=row.date,
-                    log_name=title,
-                    media_type=media_type,
-                    duration_minutes=_seconds_to_minutes(float(row.total_reading_time_seconds or 0.0)),
-                    language=language,
-                    characters=int(row.total_characters or 0),
-                    activity_type=activity_type,
-                )
+            return NormalizedActivityRecord(
+                date=row.date,
+                log_name=title,
+                media_type=media_type,
+                duration_minutes=_seconds_to_minutes(float(row.total_reading_time_seconds or 0.0)),
+                language=language,
+                characters=int(row.total_characters or 0),
+                activity_type=activity_type,
             )
-            if progress_cb and (index == total or index % 100 == 0):
-                progress_cb(
-                    _scale_progress(10, 55, index, total),
-                    f"Loaded {index:,}/{total:,} historical activity rows.",
-                )
-        return records
 
+        yield from _sorted_within_days(map(_map_rollup, chain([first_row], rollup_rows)))
+        return
+
+    if progress_cb:
+        progress_cb(10, "Historical rollups unavailable. Falling back to raw lines.")
     start_ts = datetime.datetime.combine(start_date, datetime.time.min).timestamp()
     end_ts = datetime.datetime.combine(end_date, datetime.time.max).timestamp()
-    raw_lines = query_stats_lines(
-        where_clause="timestamp >= ? AND timestamp <= ?",
-        params=(start_ts, end_ts),
-        include_media_fields=False,
-        parse_note_ids=False,
+    yield from _iter_grouped_line_records(
+        iter_stats_lines("timestamp >= ? AND timestamp <= ?", (start_ts, end_ts), chunk_size=EXPORT_CHUNK_SIZE),
+        games_by_id=games_by_id,
+        games_by_scene=games_by_scene,
     )
-    if progress_cb:
-        progress_cb(45, f"Historical rollups unavailable. Falling back to {len(raw_lines):,} raw lines.")
-    return _group_line_records(raw_lines, games_by_id=games_by_id, games_by_scene=games_by_scene)
 
 
 def _load_today_native_records(
     today: datetime.date,
     *,
-    progress_cb: Callable[[int, str], None] | None,
     games_by_id: dict[str, GamesTable],
     games_by_scene: dict[str, GamesTable],
-) -> list[NormalizedActivityRecord]:
-    today_lines = fetch_today_lines(today)
-    if progress_cb:
-        progress_cb(65, f"Loaded {len(today_lines):,} live lines for today.")
-    return _group_line_records(today_lines, games_by_id=games_by_id, games_by_scene=games_by_scene)
+) -> Iterator[NormalizedActivityRecord]:
+    today_start = datetime.datetime.combine(today, datetime.time.min).timestamp()
+    today_end = datetime.datetime.combine(today, datetime.time.max).timestamp()
+    return _iter_grouped_line_records(
+        iter_stats_lines("timestamp >= ? AND timestamp <= ?", (today_start, today_end), chunk_size=EXPORT_CHUNK_SIZE),
+        games_by_id=games_by_id,
+        games_by_scene=games_by_scene,
+    )
 
 
 def _load_third_party_records(
     start_date: datetime.date,
     end_date: datetime.date,
-    *,
-    progress_cb: Callable[[int, str], None] | None,
-) -> list[NormalizedActivityRecord]:
-    rows = ThirdPartyStatsTable.get_date_range(start_date.isoformat(), end_date.isoformat())
+) -> Iterator[NormalizedActivityRecord]:
     language = get_config().general.get_target_language_name()
-    total = len(rows)
-    records: list[NormalizedActivityRecord] = []
-
-    for index, row in enumerate(rows, start=1):
-        media_type, activity_type = _map_external_activity(row.source)
-        records.append(
-            NormalizedActivityRecord(
-                date=row.date,
-                log_name=row.label or row.source or "External Activity",
-                media_type=media_type,
-                duration_minutes=_seconds_to_minutes(float(row.time_read_seconds or 0.0)),
-                language=language,
-                characters=int(row.characters_read or 0),
-                activity_type=activity_type,
-            )
-        )
-        if progress_cb and (index == total or index % 100 == 0):
-            progress_cb(
-                _scale_progress(80, 92, index, total),
-                f"Loaded {index:,}/{total:,} external activity rows.",
-            )
-
-    return records
+    rows = ThirdPartyStatsTable.iter_date_range(
+        start_date.isoformat(), end_date.isoformat(), chunk_size=EXPORT_CHUNK_SIZE
+    )
+    return _sorted_within_days(_map_third_party_row(row, language) for row in rows)
 
 
 def _load_incremental_native_records(
     last_export_at: float,
     *,
-    progress_cb: Callable[[int, str], None] | None,
     games_by_id: dict[str, GamesTable],
     games_by_scene: dict[str, GamesTable],
-) -> list[NormalizedActivityRecord]:
-    raw_lines = query_stats_lines(
-        where_clause="last_modified > ?",
-        params=(last_export_at,),
-        include_media_fields=False,
-        parse_note_ids=False,
+) -> Iterator[NormalizedActivityRecord]:
+    return _iter_grouped_line_records(
+        iter_stats_lines("last_modified > ?", (last_export_at,), chunk_size=EXPORT_CHUNK_SIZE),
+        games_by_id=games_by_id,
+        games_by_scene=games_by_scene,
     )
-    if progress_cb:
-        progress_cb(55, f"Loaded {len(raw_lines):,} native lines changed since the last export.")
-    return _group_line_records(raw_lines, games_by_id=games_by_id, games_by_scene=games_by_scene)
 
 
-def _load_incremental_third_party_records(
-    last_export_at: float,
-    *,
-    progress_cb: Callable[[int, str], None] | None,
-) -> list[NormalizedActivityRecord]:
-    rows = ThirdPartyStatsTable._db.fetchall(
-        f"""
-        SELECT *
-        FROM {ThirdPartyStatsTable._table}
-        WHERE created_at > ?
-        ORDER BY created_at ASC
-        """,
-        (last_export_at,),
-    )
-    entries = [ThirdPartyStatsTable.from_row(row) for row in rows]
+def _load_incremental_third_party_records(last_export_at: float) -> Iterator[NormalizedActivityRecord]:
     language = get_config().general.get_target_language_name()
-    total = len(entries)
-    records: list[NormalizedActivityRecord] = []
+    rows = ThirdPartyStatsTable.iter_created_after(last_export_at, chunk_size=EXPORT_CHUNK_SIZE)
+    return _sorted_within_days(_map_third_party_row(row, language) for row in rows)
 
-    for index, row in enumerate(entries, start=1):
-        media_type, activity_type = _map_external_activity(row.source)
-        records.append(
-            NormalizedActivityRecord(
-                date=row.date,
-                log_name=row.label or row.source or "External Activity",
-                media_type=media_type,
-                duration_minutes=_seconds_to_minutes(float(row.time_read_seconds or 0.0)),
-                language=language,
-                characters=int(row.characters_read or 0),
-                activity_type=activity_type,
-            )
-        )
-        if progress_cb and (index == total or index % 100 == 0):
-            progress_cb(
-                _scale_progress(75, 90, index, total),
-                f"Loaded {index:,}/{total:,} external entries added since the last export.",
-            )
-
-    return records
 
-
-def _load_library_records(
-    *,
-    progress_cb: Callable[[int, str], None] | None,
-) -> list[NormalizedLibraryRecord]:
-    games = GamesTable.all()
+def _load_library_records(games: list[GamesTable]) -> Iterator[NormalizedLibraryRecord]:
+    """Yield library rows for ``games`` (loaded without images), fetching covers a chunk at a time."""
     last_activity_by_game_id = _build_library_activity_bounds()
     language = get_config().general.get_target_language_name()
-    total = len(games)
-    records: list[NormalizedLibraryRecord] = []
 
-    for index, game in enumerate(games, start=1):
-        title = _normalize_library_title(game)
-        media_type, content_type = _map_library_content(game.type or "")
-        records.append(
-            NormalizedLibraryRecord(
+    for offset in range(0, len(games), LIBRARY_IMAGE_CHUNK_SIZE):
+        chunk = games[offset : offset + LIBRARY_IMAGE_CHUNK_SIZE]
+        images = GamesTable.get_images_by_ids([game.id for game in chunk if game.id])
+        for game in chunk:
+            title = _normalize_library_title(game)
+            media_type, content_type = _map_library_content(game.type or "")
+            yield NormalizedLibraryRecord(
                 title=title,
                 media_type=media_type,
                 status=_map_library_status(game, last_activity_by_game_id),
@@ -549,42 +540,44 @@ def _load_library_records(
                 description=game.description or "",
                 content_type=content_type,
                 extra_data_json=_build_library_extra_data(game, title),
-                cover_image_base64=_normalize_cover_image_base64(game.image or ""),
-            )
-        )
-        if progress_cb and (index == total or index % 50 == 0):
-            progress_cb(
-                _scale_progress(15, 92, index, total),
-                f"Prepared {index:,}/{total:,} library rows.",
+                cover_image_base64=_normalize_cover_image_base64(images.get(game.id, "")),
             )
 
-    return sorted(records, key=lambda record: record.title.lower())
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
 
 
 def _build_library_export_file(
     exporter,
     *,
-    progress_cb: Callable[[int, str], None] | None = None,
+    progress_cb: Callable[..., None] | None = None,
 ) -> tuple[str, str, int]:
     if progress_cb:
         progress_cb(5, "Preparing library export.")
 
-    records = _load_library_records(progress_cb=progress_cb)
+    games = sorted(GamesTable.all_without_images(), key=lambda game: _normalize_library_title(game).lower())
+    total = len(games)
     temp_fd, temp_path = tempfile.mkstemp(prefix="gsm_stats_export_", suffix=".csv")
     os.close(temp_fd)
     filename = exporter.build_filename()
 
     if progress_cb:
-        progress_cb(94, f"Writing {len(records):,} library rows to CSV.")
+        progress_cb(10, f"Writing {total:,} library rows to CSV.")
 
     row_count = exporter.export_to_file(
-        records,
+        _load_library_records(games),
         temp_path,
         progress_cb=(
-            lambda current, total: (
+            lambda rows_written, bytes_written: (
                 progress_cb(
-                    _scale_progress(94, 99, current, total),
-                    f"Wrote {current:,}/{total:,} library rows.",
+                    _scale_progress(10, 99, rows_written, total),
+                    f"Wrote {rows_written:,}/{total:,} library rows ({_format_bytes(bytes_written)}).",
+                    bytes_written=bytes_written,
                 )
                 if progress_cb
                 else None
@@ -602,8 +595,15 @@ def build_export_file(
     format_key: str,
     options: dict,
     *,
-    progress_cb: Callable[[int, str], None] | None = None,
+    progress_cb: Callable[..., None] | None = None,
 ) -> tuple[str, str, int]:
+    """Write the export to a temp file and return ``(path, filename, row_count)``.
+
+    Records flow from keyset-paginated queries through a generator chain into the
+    CSV writer; at most one day's rows per source (or one chunk of library
+    covers) is held in memory. ``progress_cb(progress, message, bytes_written=...)``
+    is called as the file grows.
+    """
     exporter = get_stats_exporter(format_key)
     if exporter is None:
         raise ValueError(f"Unsupported export format: {format_key}")
@@ -632,24 +632,23 @@ def build_export_file(
     today = datetime.date.today()
     yesterday = today - datetime.timedelta(days=1)
 
-    native_records: list[NormalizedActivityRecord] = []
-    third_party_records: list[NormalizedActivityRecord] = []
+    sources: list[Iterable[NormalizedActivityRecord]] = []
 
     if scope == "since_last_export" and last_export_at is not None:
-        native_records.extend(
+        sources.append(
             _load_incremental_native_records(
                 last_export_at,
-                progress_cb=progress_cb,
                 games_by_id=games_by_id,
                 games_by_scene=games_by_scene,
             )
         )
         if include_external_stats:
-            third_party_records = _load_incremental_third_party_records(last_export_at, progress_cb=progress_cb)
+            sources.append(_load_incremental_third_party_records(last_export_at))
     else:
+        native_sources: list[Iterable[NormalizedActivityRecord]] = []
         historical_end = min(end_date, yesterday)
         if historical_end >= start_date:
-            native_records.extend(
+            native_sources.append(
                 _load_historical_native_records(
                     start_date,
                     historical_end,
@@ -660,38 +659,52 @@ def build_export_file(
             )
 
         if start_date <= today <= end_date:
-            native_records.extend(
+            native_sources.append(
                 _load_today_native_records(
                     today,
-                    progress_cb=progress_cb,
                     games_by_id=games_by_id,
                     games_by_scene=games_by_scene,
                 )
             )
+        # Historical rows end yesterday and live rows are today, so chaining keeps date order.
+        sources.append(chain.from_iterable(native_sources))
 
         if include_external_stats:
-            third_party_records = _load_third_party_records(start_date, end_date, progress_cb=progress_cb)
+            sources.append(_load_third_party_records(start_date, end_date))
 
-    records = sorted(
-        [*native_records, *third_party_records],
-        key=lambda record: (record.date, record.log_name.lower(), record.activity_type.lower()),
-    )
+    # Every source is already in export order, so a lazy k-way merge replaces the old global sort.
+    progress_state = {"date": start_date.isoformat()}
+
+    def _track_dates(records: Iterable[NormalizedActivityRecord]) -> Iterator[NormalizedActivityRecord]:
+        for record in records:
+            progress_state["date"] = record.date
+            yield record
+
+    def _date_progress() -> int:
+        try:
+            current = datetime.date.fromisoformat(progress_state["date"])
+        except ValueError:
+            return 10
+        total_days = (end_date - start_date).days + 1
+        elapsed_days = min(total_days, max(0, (current - start_date).days + 1))
+        return _scale_progress(10, 99, elapsed_days, total_days)
 
     temp_fd, temp_path = tempfile.mkstemp(prefix="gsm_stats_export_", suffix=".csv")
     os.close(temp_fd)
     filename = exporter.build_filename()
 
     if progress_cb:
-        progress_cb(94, f"Writing {len(records):,} rows to CSV.")
+        progress_cb(10, "Writing rows to CSV.")
 
     row_count = exporter.export_to_file(
-        records,
+        _track_dates(heapq.merge(*sources, key=_export_sort_key)),
         temp_path,
         progress_cb=(
-            lambda current, total: (
+            lambda rows_written, bytes_written: (
                 progress_cb(
-                    _scale_progress(94, 99, current, total),
-                    f"Wrote {current:,}/{total:,} rows.",
+                    _date_progress(),
+                    f"Wrote {rows_written:,} rows ({_format_bytes(bytes_written)}) through {progress_state['date']}.",
+                    bytes_written=bytes_written,
                 )
                 if progress_cb
                 else None
@@ -720,6 +733,7 @@ class StatsExportJob:
     file_path: str | None = None
     filename: str | None = None
     row_count: int = 0
+    bytes_written: int = 0
 
     def to_payload(self) -> dict:
         payload = {
@@ -729,6 +743,7 @@ class StatsExportJob:
             "progress": self.progress,
             "message": self.message,
             "row_count": self.row_count,
+            "bytes_written": self.bytes_written,
         }
         if self.error:
             payload["error"] = self.error
@@ -775,6 +790,7 @@ class StatsExportJobManager:
         file_path: str | None = None,
         filename: str | None = None,
         row_count: int | None = None,
+        bytes_written: int | None = None,
     ) -> None:
         with self._lock:
             job = self._jobs.get(job_id)
@@ -795,6 +811,8 @@ class StatsExportJobManager:
                 job.filename = filename
             if row_count is not None:
                 job.row_count = row_count
+            if bytes_written is not None:
+                job.bytes_written = bytes_written
             if status in {"completed", "failed"}:
                 job.completed_at = time.time()
             job.updated_at = time.time()
@@ -817,11 +835,12 @@ class StatsExportJobManager:
             file_path, filename, row_count = build_export_file(
                 format_key,
                 options,
-                progress_cb=lambda progress, message: self._set_job_state(
+                progress_cb=lambda progress, message, bytes_written=None: self._set_job_state(
                     job_id,
                     status="running",
                     progress=progress,
                     message=message,
+                    bytes_written=bytes_written,
                 ),
             )
             self._set_job_state(
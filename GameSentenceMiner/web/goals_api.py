@@ -6,13 +6,16 @@ Provides data for calculating progress on user-defined goals with date ranges.
 """
 
 import datetime
+import functools
 import json
+import threading
 from dataclasses import dataclass
 import pytz
 import time
 from flask import request, jsonify
 
 from GameSentenceMiner.util.config.configuration import logger
+from GameSentenceMiner.util.database import data_generation
 from GameSentenceMiner.util.database.db import GameLinesTable, GoalsTable
 from GameSentenceMiner.util.database.games_table import GamesTable
 from GameSentenceMiner.util.database.stats_rollup_table import StatsRollupTable
@@ -286,6 +289,27 @@ def sum_rollup_cards_by_type(start_date, end_date, media_type):
     return total_cards
 
 
+# Anki counts come from the card cache that sync refreshes in the background, so
+# memoized results that read them expire like the cache itself instead of
+# waiting for a generation bump. Queries record their errors on the calling
+# thread while a dashboard payload is being built.
+_ANKI_RESULT_TTL = 60.0  # seconds
+_anki_query_log = threading.local()
+
+
+def _recorded_anki_query(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        errors = getattr(_anki_query_log, "errors", None)
+        if errors is not None:
+            errors.append(result[1])
+        return result
+
+    return wrapper
+
+
+@_recorded_anki_query
 def query_anki_connect_mature_cards(deck_name=None, start_date=None, for_today=False):
     """
     Query the local Anki cache for mature cards (interval >= 21 days).
@@ -344,6 +368,7 @@ def query_anki_connect_mature_cards(deck_name=None, start_date=None, for_today=F
         return (0, error_msg)
 
 
+@_recorded_anki_query
 def query_anki_connect_new_cards(deck_name=None):
     """
     Query the local Anki cache for new cards (cards that haven't been studied yet).
@@ -377,6 +402,7 @@ def query_anki_connect_new_cards(deck_name=None):
         return (0, error_msg)
 
 
+@_recorded_anki_query
 def query_anki_connect_new_cards_cleared_on_day(deck_name=None, days_ago=0):
     """
     Query the local Anki cache for cards that were cleared from new status on a specific day.
@@ -423,6 +449,7 @@ def query_anki_connect_new_cards_cleared_on_day(deck_name=None, days_ago=0):
         return (0, error_msg)
 
 
+@_recorded_anki_query
 def query_anki_connect_mature_cards_on_day(deck_name=None, days_ago=0):
     """
     Query the local Anki cache for cards that matured on a specific day.
@@ -1002,6 +1029,61 @@ def resolve_goal_game_id(goal):
     return _resolve_game_id_from_name(game_name)
 
 
+# The dashboard is memoized process-wide in three layers, each keyed on the data
+# generations it reads: the whole payload, the rollup history before today and
+# today's live lines. A new line therefore only recomputes the live layer.
+_DASHBOARD_PAYLOAD_DOMAINS = (
+    data_generation.LINES,
+    data_generation.ROLLUPS,
+    data_generation.THIRD_PARTY,
+    data_generation.GAMES,
+    data_generation.GOALS,
+    data_generation.ANKI,
+)
+_DASHBOARD_HISTORY_DOMAINS = (data_generation.ROLLUPS,)
+_DASHBOARD_LIVE_DOMAINS = (data_generation.LINES, data_generation.GAMES)
+
+_dashboard_payload_memo = data_generation.GenerationMemo(max_entries=8)
+_dashboard_history_memo = data_generation.GenerationMemo(max_entries=4)
+_dashboard_live_memo = data_generation.GenerationMemo(max_entries=4)
+
+
+@dataclass(frozen=True)
+class _DashboardHistory:
+    rollups_30d: list
+    rollup_stats_30d: dict | None
+    # (start, end) -> aggregated rollups, filled lazily by dashboard builds
+    rollup_ranges: dict
+
+
+def _dashboard_history(today):
+    def build():
+        yesterday = today - datetime.timedelta(days=1)
+        thirty_days_ago = today - datetime.timedelta(days=30)
+        rollups_30d = StatsRollupTable.get_date_range(
+            thirty_days_ago.strftime("%Y-%m-%d"), yesterday.strftime("%Y-%m-%d")
+        )
+        return _DashboardHistory(
+            rollups_30d=rollups_30d,
+            rollup_stats_30d=aggregate_rollup_data(rollups_30d) if rollups_30d else None,
+            rollup_ranges={},
+        )
+
+    key = (today.isoformat(), data_generation.snapshot(_DASHBOARD_HISTORY_DOMAINS))
+    return _dashboard_history_memo.get_or_compute(key, build)
+
+
+def get_todays_live_data_memoized(today, user_tz=None):
+    """``get_todays_live_data`` answered from memory until a line or game changes.
+
+    The live stats dict is copied per call because combining and enriching stats
+    updates the dict it is handed in place.
+    """
+    key = (today.isoformat(), str(user_tz), data_generation.snapshot(_DASHBOARD_LIVE_DOMAINS))
+    today_lines, live_stats = _dashboard_live_memo.get_or_compute(key, lambda: get_todays_live_data(today, user_tz))
+    return today_lines, dict(live_stats) if live_stats else None
+
+
 def _build_goals_dashboard_payload(
     current_goals,
     goals_settings,
@@ -1012,20 +1094,43 @@ def _build_goals_dashboard_payload(
         user_tz = pytz.UTC
 
     today = get_today_in_timezone(user_tz)
+    inputs = json.dumps([current_goals, goals_settings, last_updated], sort_keys=True, default=str)
+    key = (
+        today.isoformat(),
+        str(user_tz),
+        data_generation.snapshot(_DASHBOARD_PAYLOAD_DOMAINS),
+        inputs,
+    )
+    anki_errors = []
+
+    def compute():
+        _anki_query_log.errors = anki_errors
+        try:
+            return _compute_goals_dashboard_payload(current_goals, goals_settings, last_updated, user_tz, today)
+        finally:
+            _anki_query_log.errors = None
+
+    def lifetime(_payload):
+        if any(anki_errors):
+            return 0  # never reuse a payload built while an Anki query failed
+        return _ANKI_RESULT_TTL if anki_errors else None
+
+    return _dashboard_payload_memo.get_or_compute(key, compute, lifetime)
+
+
+def _compute_goals_dashboard_payload(current_goals, goals_settings, last_updated, user_tz, today):
     today_str = today.strftime("%Y-%m-%d")
     yesterday = today - datetime.timedelta(days=1)
 
-    today_lines, live_stats_today = get_todays_live_data(today, user_tz)
+    today_lines, live_stats_today = get_todays_live_data_memoized(today, user_tz)
     today_lines = today_lines or []
     today_stats_only = combine_rollup_and_live_stats(None, live_stats_today) if live_stats_today else {}
 
     thirty_days_ago = today - datetime.timedelta(days=30)
-    thirty_days_ago_str = thirty_days_ago.strftime("%Y-%m-%d")
-    yesterday_str = yesterday.strftime("%Y-%m-%d")
-    rollups_30d = (
-        StatsRollupTable.get_date_range(thirty_days_ago_str, yesterday_str) if thirty_days_ago <= yesterday else []
-    )
-    rollup_stats_30d = aggregate_rollup_data(rollups_30d) if rollups_30d else None
+    history = _dashboard_history(today)
+    rollups_30d = history.rollups_30d
+    # Like the live stats, memoized rollup aggregates are copied before use.
+    rollup_stats_30d = dict(history.rollup_stats_30d) if history.rollup_stats_30d else None
     combined_stats_30d = combine_rollup_and_live_stats(rollup_stats_30d, live_stats_today)
 
     rollup_stats_cache = {}
@@ -1039,7 +1144,10 @@ def _build_goals_dashboard_payload(
             return None
         cache_key = (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
         if cache_key not in rollup_stats_cache:
-            rollup_stats_cache[cache_key] = get_rollup_stats_for_range(start_date, end_date)
+            if cache_key not in history.rollup_ranges:
+                history.rollup_ranges[cache_key] = get_rollup_stats_for_range(start_date, end_date)
+            stored = history.rollup_ranges[cache_key]
+            rollup_stats_cache[cache_key] = dict(stored) if stored else stored
         return rollup_stats_cache[cache_key]
 
     def get_cached_combined_stats(start_date, end_date):
@@ -1772,7 +1880,7 @@ def register_goals_api_routes(app):
             today_lines = None
             live_stats = None
             if window.include_today_live:
-                today_lines, live_stats = get_todays_live_data(today, user_tz)
+                today_lines, live_stats = get_todays_live_data_memoized(today, user_tz)
 
             # Combine rollup and live stats
             combined_stats = combine_stats_with_third_party(rollup_stats, live_stats, start_date_str, end_date_str)
@@ -1929,7 +2037,7 @@ def register_goals_api_routes(app):
             if is_static:
                 # For static goals: required = target_value (fixed daily), progress = today only
                 # Get today's live data
-                today_lines, live_stats = get_todays_live_data(today, user_tz)
+                today_lines, live_stats = get_todays_live_data_memoized(today, user_tz)
 
                 # Extract today's progress (map static type to base type)
                 base_metric_type = metric_type.replace("_static", "")
@@ -1989,7 +2097,7 @@ def register_goals_api_routes(app):
                 rollup_stats = get_rollup_stats_for_range(start_date, yesterday)
 
             # Get today's live data
-            today_lines, live_stats = get_todays_live_data(today, user_tz)
+            today_lines, live_stats = get_todays_live_data_memoized(today, user_tz)
 
             # Combine stats for total progress (including 3rd party data)
             combined_stats = combine_stats_with_third_party(
@@ -17,6 +17,17 @@ from GameSentenceMiner.util.port_diagnostics import (
     is_probably_gsm_process,
     terminate_process,
 )
+from GameSentenceMiner.web.overlay_background_protocol import (
+    BACKGROUND_TILES_V1,
+    OverlayBackgroundEncoder,
+    encode_data_url,
+)
+from GameSentenceMiner.web.overlay_box_protocol import (
+    OVERLAY_BOXES_ACK,
+    OVERLAY_PROTOCOL_HELLO,
+    WORD_BOXES_DELTA_V1,
+    OverlayBoxEncoder,
+)
 
 # Constants for server identification
 ID_HOOKER = "texthooker"
@@ -458,6 +469,12 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
         self._client_writer_tasks: Dict[Any, asyncio.Task] = {}
         self._client_send_locks: Dict[Any, asyncio.Lock] = {}
         self._client_output_capacity = 256
+        self._overlay_box_encoder = OverlayBoxEncoder()
+        # Overlay sockets that negotiated delta word boxes -> last acknowledged version.
+        self._overlay_box_clients: Dict[Any, int] = {}
+        self._overlay_background_encoder = OverlayBackgroundEncoder()
+        # Overlay sockets that negotiated binary backgrounds -> last frame id queued to them.
+        self._overlay_background_clients: Dict[Any, int] = {}
 
     @property
     def loop(self):
@@ -527,6 +544,9 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
                     self._v2_delta_buffers.pop(websocket, None)
                 return
 
+        if server_id == ID_OVERLAY and await self._handle_overlay_protocol_message(websocket, message):
+            return
+
         endpoint_spec = self.endpoint_specs.get(server_id)
         if not endpoint_spec:
             await self._send_client_direct(websocket, "False")
@@ -556,7 +576,74 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
 
         await self._send_client_direct(websocket, "False")
 
+    async def _handle_overlay_protocol_message(self, websocket, message) -> bool:
+        """Consume word-box protocol handshakes and acks; False for ordinary overlay messages."""
+        if not isinstance(message, str) or "overlay_" not in message:
+            return False
+        try:
+            payload = json.loads(message)
+        except (TypeError, json.JSONDecodeError):
+            return False
+        if not isinstance(payload, dict):
+            return False
+
+        message_type = payload.get("type")
+        if message_type == OVERLAY_PROTOCOL_HELLO:
+            # Until the hello arrives the socket is a legacy overlay and only
+            # ever receives JSON word_coordinates frames.
+            if payload.get("word_boxes") == WORD_BOXES_DELTA_V1:
+                self._overlay_box_clients[websocket] = 0
+                self._queue_overlay_box_snapshot(websocket)
+            if payload.get("background") == BACKGROUND_TILES_V1:
+                self._overlay_background_clients[websocket] = 0
+            return True
+        if message_type == OVERLAY_BOXES_ACK:
+            if websocket in self._overlay_box_clients:
+                try:
+                    version = int(payload.get("version") or 0)
+                except (TypeError, ValueError):
+                    version = 0
+                if version <= 0:
+                    # The client lost its base; resend everything it should be showing.
+                    self._overlay_box_clients[websocket] = 0
+                    self._queue_overlay_box_snapshot(websocket)
+                else:
+                    self._overlay_box_clients[websocket] = max(version, self._overlay_box_clients[websocket])
+            return True
+        return False
+
+    def _queue_overlay_box_snapshot(self, websocket) -> None:
+        version = self._overlay_box_encoder.current_version
+        output = self._client_output_queues.get(websocket)
+        if not version or output is None:
+            return
+        frame = self._overlay_box_encoder.encode(version, 0)
+        if frame is None:
+            return
+        try:
+            output.put_nowait(frame)
+        except asyncio.QueueFull:
+            pass
+
     async def _send_initial_overlay_state(self, websocket):
+        # A (re)connected overlay is a legacy client until it answers this
+        # advertisement with a hello; the hello then gets a full word-box snapshot.
+        self._overlay_box_clients.pop(websocket, None)
+        self._overlay_background_clients.pop(websocket, None)
+        try:
+            await self._send_client_direct(
+                websocket,
+                json.dumps(
+                    {
+                        "type": "overlay_protocol",
+                        "word_boxes": [WORD_BOXES_DELTA_V1],
+                        "background": [BACKGROUND_TILES_V1],
+                    }
+                ),
+            )
+        except Exception as error:
+            logger.debug(f"[{self.server_name}] Failed to advertise overlay protocol: {error}")
+
         try:
             from GameSentenceMiner.util.stats.live_stats import build_live_stats_payload, live_stats_tracker
 
@@ -642,6 +729,8 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
             self._v2_clients.discard(websocket)
             self._v2_syncing_clients.discard(websocket)
             self._v2_delta_buffers.pop(websocket, None)
+            self._overlay_box_clients.pop(websocket, None)
+            self._overlay_background_clients.pop(websocket, None)
             self._client_output_queues.pop(websocket, None)
             self._client_send_locks.pop(websocket, None)
             writer = self._client_writer_tasks.pop(websocket, None)
@@ -729,6 +818,72 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
             self._v2_clients.discard(client)
             await client.close(code=1013, reason="TextFeed client output queue exceeded")
 
+    async def _send_overlay_boxes_coroutine(self, payload: dict) -> None:
+        """Deliver word boxes as binary deltas to negotiated overlays and JSON to the rest."""
+        clients = self._get_clients(ID_OVERLAY)
+        if not clients:
+            await self._send_text_coroutine(ID_OVERLAY, json.dumps(payload))
+            return
+
+        version = self._overlay_box_encoder.push(payload)
+        json_text = None
+        slow_clients = []
+        for client in list(clients):
+            output = self._client_output_queues.get(client)
+            if output is None:
+                continue
+            acked_version = self._overlay_box_clients.get(client)
+            message = None
+            if acked_version is not None and version is not None:
+                message = self._overlay_box_encoder.encode(version, acked_version)
+            if message is None:
+                if json_text is None:
+                    json_text = json.dumps(payload)
+                message = json_text
+            try:
+                output.put_nowait(message)
+            except asyncio.QueueFull:
+                slow_clients.append(client)
+
+        for client in slow_clients:
+            clients.discard(client)
+            self._overlay_box_clients.pop(client, None)
+            await client.close(code=1013, reason="Overlay client output queue exceeded")
+
+    async def _send_overlay_background_coroutine(self, image) -> None:
+        """Deliver a manual-mode background as binary tiles or, for legacy overlays, a data URL."""
+        if not self._get_clients(ID_OVERLAY):
+            return
+        # Diffing and JPEG encoding are CPU-bound; keep them off the transport loop.
+        frame = await asyncio.to_thread(self._overlay_background_encoder.push, image)
+        json_text = None
+        clients = self._get_clients(ID_OVERLAY)
+        slow_clients = []
+        for client in list(clients):
+            last_frame_id = self._overlay_background_clients.get(client)
+            if last_frame_id is not None:
+                message = await asyncio.to_thread(frame.for_client, last_frame_id)
+            else:
+                if json_text is None:
+                    image_data_url = await asyncio.to_thread(frame.data_url)
+                    json_text = json.dumps({"type": "manual_mode_background", "image": image_data_url})
+                message = json_text
+            output = self._client_output_queues.get(client)
+            if output is None:
+                continue
+            try:
+                output.put_nowait(message)
+            except asyncio.QueueFull:
+                slow_clients.append(client)
+                continue
+            if last_frame_id is not None and client in self._overlay_background_clients:
+                self._overlay_background_clients[client] = frame.frame_id
+
+        for client in slow_clients:
+            clients.discard(client)
+            self._overlay_background_clients.pop(client, None)
+            await client.close(code=1013, reason="Overlay client output queue exceeded")
+
     async def send_payload(self, text: Any, server_id: str = ID_HOOKER):
         if text is None:
             return None
@@ -739,6 +894,14 @@ class MultiplexWebsocketServerThread(_PortConflictSupport, threading.Thread):
         future = asyncio.run_coroutine_threadsafe(self._send_text_coroutine(server_id, text), self.loop)
         return asyncio.wrap_future(future)
 
+    async def send_overlay_boxes(self, payload: dict):
+        future = asyncio.run_coroutine_threadsafe(self._send_overlay_boxes_coroutine(payload), self.loop)
+        return asyncio.wrap_future(future)
+
+    async def send_overlay_background(self, image):
+        future = asyncio.run_coroutine_threadsafe(self._send_overlay_background_coroutine(image), self.loop)
+        return asyncio.wrap_future(future)
+
     def send_payload_nowait(self, text: Any, server_id: str = ID_HOOKER):
         if text is None:
             return None
@@ -990,6 +1153,34 @@ class WebsocketManager:
 
         return futures
 
+    async def send_overlay_word_boxes(self, payload: dict):
+        """Send a ``word_coordinates`` payload, delta-encoded for overlays that negotiated it."""
+        result = None
+        for _, target_server in self._iter_server_targets(ID_OVERLAY):
+            if isinstance(target_server, MultiplexWebsocketServerThread):
+                current_result = await target_server.send_overlay_boxes(payload)
+            else:
+                current_result = await target_server.send_payload(payload)
+            if result is None:
+                result = current_result
+        return result
+
+    async def send_overlay_background(self, image):
+        """Send a manual-mode background image, as binary tiles where the overlay negotiated them."""
+        result = None
+        legacy_payload = None
+        for _, target_server in self._iter_server_targets(ID_OVERLAY):
+            if isinstance(target_server, MultiplexWebsocketServerThread):
+                current_result = await target_server.send_overlay_background(image)
+            else:
+                if legacy_payload is None:
+                    image_data_url = await asyncio.to_thread(encode_data_url, image)
+                    legacy_payload = {"type": "manual_mode_background", "image": image_data_url}
+                current_result = await target_server.send_payload(legacy_payload)
+            if result is None:
+                result = current_result
+        return result
+
     def send_textfeed_v2_nowait(self, message: Any):
         """Send a v2 domain event without exposing it to legacy socket clients."""
         server = self._servers.get(ID_HOOKER)
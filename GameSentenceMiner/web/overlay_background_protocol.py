@@ -0,0 +1,198 @@
+"""Binary, tiled frames for the manual-mode overlay background.
+
+The manual-mode desktop snapshot used to be JPEG-encoded, base64-wrapped into
+a data URL and escaped into a JSON message: about a third more bytes plus two
+copies of a multi-megabyte string. Overlays that send ``"background":
+"tiles-v1"`` in their protocol hello get binary frames instead. The snapshot is
+capped at ``max_width``. The first frame a client receives is a keyframe (one
+JPEG of the whole image). After that only the ``tile_size`` tiles that changed
+since the previous snapshot are sent, unless most of the screen changed, in
+which case a keyframe is cheaper.
+
+Frame layout (little-endian)::
+
+    "GSMI" u8 protocol u8 flags u16 n_tiles u32 frame_id u32 base_frame_id u16 width u16 height
+    n_tiles x { u16 x  u16 y  u16 w  u16 h  u32 jpeg_len  jpeg }
+
+``flags & FLAG_KEYFRAME`` marks a keyframe (``base_frame_id == 0``). All
+encoding is CPU-bound; callers run it on a worker thread.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import struct
+import threading
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+BACKGROUND_TILES_V1 = "tiles-v1"
+
+MAGIC = b"GSMI"
+PROTOCOL_VERSION = 1
+FLAG_KEYFRAME = 0x01
+
+TILE_SIZE = 256
+JPEG_QUALITY = 70
+MAX_WIDTH = 2560
+# Above this share of changed tiles a single keyframe JPEG is smaller.
+KEYFRAME_TILE_RATIO = 0.6
+
+_HEADER = struct.Struct("<4sBBHIIHH")
+_TILE = struct.Struct("<HHHHI")
+
+
+def _encode_jpeg(image: Image.Image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def encode_data_url(image: Image.Image, quality: int = JPEG_QUALITY) -> str:
+    """Legacy JSON form: the whole image as a base64 JPEG data URL."""
+    encoded = base64.b64encode(_encode_jpeg(image.convert("RGB"), quality)).decode("ascii")
+    return f"data:image/jpeg;base64,{encoded}"
+
+
+class BackgroundFrame:
+    """One snapshot, lazily encoded as a keyframe, a tile delta or a legacy data URL."""
+
+    def __init__(
+        self,
+        image: Image.Image,
+        frame_id: int,
+        base_frame_id: int,
+        changed_tiles: list[tuple[int, int, int, int]],
+        quality: int,
+    ):
+        self.image = image
+        self.frame_id = frame_id
+        self.base_frame_id = base_frame_id
+        self.changed_tiles = changed_tiles
+        self.quality = quality
+        self._lock = threading.Lock()
+        self._keyframe: Optional[bytes] = None
+        self._delta: Optional[bytes] = None
+        self._data_url: Optional[str] = None
+
+    def _pack(self, flags: int, base_frame_id: int, tiles: list[tuple[int, int, int, int, bytes]]) -> bytes:
+        parts = [
+            _HEADER.pack(
+                MAGIC,
+                PROTOCOL_VERSION,
+                flags,
+                len(tiles),
+                self.frame_id,
+                base_frame_id,
+                self.image.width,
+                self.image.height,
+            )
+        ]
+        for x, y, width, height, jpeg in tiles:
+            parts.append(_TILE.pack(x, y, width, height, len(jpeg)))
+            parts.append(jpeg)
+        return b"".join(parts)
+
+    def keyframe(self) -> bytes:
+        with self._lock:
+            if self._keyframe is None:
+                jpeg = _encode_jpeg(self.image, self.quality)
+                self._keyframe = self._pack(FLAG_KEYFRAME, 0, [(0, 0, self.image.width, self.image.height, jpeg)])
+            return self._keyframe
+
+    def for_client(self, last_frame_id: int) -> bytes:
+        """Frame bytes for a client whose last received frame is ``last_frame_id``."""
+        if not self.base_frame_id or last_frame_id != self.base_frame_id:
+            return self.keyframe()
+        with self._lock:
+            if self._delta is None:
+                tiles = [
+                    (x, y, width, height, _encode_jpeg(self.image.crop((x, y, x + width, y + height)), self.quality))
+                    for x, y, width, height in self.changed_tiles
+                ]
+                self._delta = self._pack(0, self.base_frame_id, tiles)
+            return self._delta
+
+    def data_url(self) -> str:
+        with self._lock:
+            if self._data_url is None:
+                self._data_url = encode_data_url(self.image, self.quality)
+            return self._data_url
+
+
+class OverlayBackgroundEncoder:
+    def __init__(
+        self,
+        *,
+        tile_size: int = TILE_SIZE,
+        quality: int = JPEG_QUALITY,
+        max_width: Optional[int] = MAX_WIDTH,
+        keyframe_tile_ratio: float = KEYFRAME_TILE_RATIO,
+    ):
+        self.tile_size = int(tile_size)
+        self.quality = int(quality)
+        self.max_width = max_width
+        self.keyframe_tile_ratio = float(keyframe_tile_ratio)
+        self._lock = threading.Lock()
+        self._previous: Optional[np.ndarray] = None
+        self._frame_id = 0
+
+    def _prepare(self, image: Image.Image) -> Image.Image:
+        image = image.convert("RGB")
+        if self.max_width and image.width > self.max_width:
+            height = max(1, round(image.height * self.max_width / image.width))
+            image = image.resize((self.max_width, height), Image.Resampling.BILINEAR)
+        return image
+
+    def push(self, image: Image.Image) -> BackgroundFrame:
+        """Record a new snapshot and work out which tiles changed since the last one."""
+        image = self._prepare(image)
+        pixels = np.asarray(image)
+        with self._lock:
+            previous = self._previous
+            base_frame_id = self._frame_id
+            self._frame_id = 1 if self._frame_id >= 0xFFFFFFFF else self._frame_id + 1
+            frame_id = self._frame_id
+            self._previous = pixels
+
+        tiles = [
+            (x, y, min(self.tile_size, image.width - x), min(self.tile_size, image.height - y))
+            for y in range(0, image.height, self.tile_size)
+            for x in range(0, image.width, self.tile_size)
+        ]
+        if previous is None or previous.shape != pixels.shape:
+            return BackgroundFrame(image, frame_id, 0, tiles, self.quality)
+
+        changed = [
+            (x, y, width, height)
+            for x, y, width, height in tiles
+            if not np.array_equal(pixels[y : y + height, x : x + width], previous[y : y + height, x : x + width])
+        ]
+        if len(changed) > len(tiles) * self.keyframe_tile_ratio:
+            base_frame_id = 0
+        return BackgroundFrame(image, frame_id, base_frame_id, changed, self.quality)
+
+
+def parse_background_frame(frame: bytes) -> dict:
+    """Decode a frame's header and tiles (reference for the Electron client)."""
+    magic, protocol, flags, tile_count, frame_id, base_frame_id, width, height = _HEADER.unpack_from(frame, 0)
+    if magic != MAGIC or protocol != PROTOCOL_VERSION:
+        raise ValueError("Not an overlay background frame")
+    offset = _HEADER.size
+    tiles = []
+    for _ in range(tile_count):
+        x, y, tile_width, tile_height, length = _TILE.unpack_from(frame, offset)
+        offset += _TILE.size
+        tiles.append({"x": x, "y": y, "width": tile_width, "height": tile_height, "jpeg": frame[offset : offset + length]})
+        offset += length
+    return {
+        "keyframe": bool(flags & FLAG_KEYFRAME),
+        "frame_id": frame_id,
+        "base_frame_id": base_frame_id,
+        "width": width,
+        "height": height,
+        "tiles": tiles,
+    }
@@ -0,0 +1,310 @@
+"""Versioned, delta-encoded ``word_coordinates`` frames for the overlay socket.
+
+Every overlay scan used to send the full list of lines, words and eight-float
+bounding rects as JSON, even when most boxes hadn't moved. Clients that send
+``{"type": "overlay_protocol_hello", "word_boxes": "delta-v1"}`` instead get
+binary frames that only carry boxes added, removed or moved relative to the
+last version the client acknowledged with ``{"type": "overlay_boxes_ack",
+"version": N}``. An ack of ``0`` (or a base the server no longer remembers)
+yields a full snapshot.
+
+Boxes keep a stable id for as long as their text stays on screen: each line
+is matched to the nearest line of the previous frame with the same text, and
+its words to the nearest same-text words of that line. Coordinates (fractions
+of the overlay area) are quantized to ``1 / QUANT_SCALE``.
+
+Frame layout (little-endian)::
+
+    "GSMB" u8 protocol u8 flags u16 reserved u32 version u32 base_version
+    u32 meta_len  meta (UTF-8 JSON: type, line_id, supplemental, ...)
+    u32 n_removed { u32 id }
+    u32 n_added   { u32 id  u8 kind  u16 text_len  text  8 x i16 rect }
+    u32 n_moved   { u32 id  8 x i16 rect }
+    u32 n_lines   { u32 line_id  u16 n_words { u32 word_id } }
+
+``flags & FLAG_SNAPSHOT`` marks a full snapshot (``base_version == 0``); the
+trailing line table always lists the complete frame in render order.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+OVERLAY_PROTOCOL_HELLO = "overlay_protocol_hello"
+OVERLAY_BOXES_ACK = "overlay_boxes_ack"
+WORD_BOXES_DELTA_V1 = "delta-v1"
+
+MAGIC = b"GSMB"
+PROTOCOL_VERSION = 1
+FLAG_SNAPSHOT = 0x01
+KIND_LINE = 0
+KIND_WORD = 1
+
+QUANT_SCALE = 16384
+RECT_KEYS = ("x1", "y1", "x2", "y2", "x3", "y3", "x4", "y4")
+HISTORY_SIZE = 16
+
+_HEADER = struct.Struct("<4sBBHII")
+_U32 = struct.Struct("<I")
+_RECT = struct.Struct("<8h")
+_ADDED_PREFIX = struct.Struct("<IBH")
+_LINE_PREFIX = struct.Struct("<IH")
+_QUANT_MIN = -32768
+_QUANT_MAX = 32767
+_META_KEYS = ("type", "line_id", "is_sentence_recycled", "supplemental", "is_final")
+
+Rect = tuple[int, int, int, int, int, int, int, int]
+
+
+def quantize_rect(rect: Any) -> Optional[Rect]:
+    if not isinstance(rect, dict):
+        return None
+    values = []
+    for key in RECT_KEYS:
+        value = rect.get(key)
+        if not isinstance(value, (int, float)):
+            return None
+        values.append(min(_QUANT_MAX, max(_QUANT_MIN, int(round(float(value) * QUANT_SCALE)))))
+    return tuple(values)
+
+
+def dequantize_rect(rect: Rect) -> dict:
+    return {key: value / QUANT_SCALE for key, value in zip(RECT_KEYS, rect)}
+
+
+@dataclass(frozen=True)
+class _Box:
+    kind: int
+    text: str
+    rect: Rect
+
+
+@dataclass
+class _Snapshot:
+    version: int
+    boxes: dict[int, _Box]
+    layout: list[tuple[int, list[int]]]
+    meta: dict
+
+
+def _rect_distance(a: Rect, b: Rect) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1]) + abs(a[4] - b[4]) + abs(a[5] - b[5])
+
+
+def _parse_lines(data: Any) -> Optional[list[tuple[str, Rect, list[tuple[str, Rect]]]]]:
+    """Return ``[(text, rect, [(word_text, word_rect)])]`` or None for shapes the codec can't carry."""
+    if not isinstance(data, list):
+        return None
+    lines = []
+    for line in data:
+        if not isinstance(line, dict) or set(line) - {"text", "bounding_rect", "words"}:
+            return None
+        text = line.get("text")
+        rect = quantize_rect(line.get("bounding_rect"))
+        if not isinstance(text, str) or rect is None:
+            return None
+        words = []
+        for word in line.get("words") or []:
+            if not isinstance(word, dict) or set(word) != {"text", "bounding_rect"}:
+                return None
+            word_rect = quantize_rect(word.get("bounding_rect"))
+            if not isinstance(word["text"], str) or word_rect is None:
+                return None
+            words.append((word["text"], word_rect))
+        lines.append((text, rect, words))
+    return lines
+
+
+class OverlayBoxEncoder:
+    """Assigns stable box ids to successive frames and encodes per-client deltas."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.history_size = int(history_size)
+        self._lock = threading.Lock()
+        self._history: OrderedDict[int, _Snapshot] = OrderedDict()
+        self._version = 0
+        self._next_id = 1
+        self._encoded: dict[tuple[int, int], bytes] = {}
+
+    @property
+    def current_version(self) -> int:
+        with self._lock:
+            return self._version if self._history else 0
+
+    def push(self, payload: dict) -> Optional[int]:
+        """Record ``payload`` as the newest frame; returns its version, or None if it can't be encoded."""
+        lines = _parse_lines(payload.get("data"))
+        if lines is None:
+            return None
+        meta = {key: payload[key] for key in _META_KEYS if key in payload}
+        with self._lock:
+            previous = self._history[self._version] if self._history else None
+            boxes, layout = self._assign_ids(lines, previous)
+            self._version += 1
+            self._history[self._version] = _Snapshot(self._version, boxes, layout, meta)
+            while len(self._history) > self.history_size:
+                self._history.popitem(last=False)
+            self._encoded = {key: value for key, value in self._encoded.items() if key[0] in self._history}
+            return self._version
+
+    def _new_id(self) -> int:
+        box_id = self._next_id
+        self._next_id = 1 if self._next_id >= 0xFFFFFFFF else self._next_id + 1
+        return box_id
+
+    def _assign_ids(self, lines, previous: Optional[_Snapshot]):
+        previous_lines: dict[str, list[tuple[int, list[int]]]] = {}
+        if previous is not None:
+            for line_id, word_ids in previous.layout:
+                previous_lines.setdefault(previous.boxes[line_id].text, []).append((line_id, word_ids))
+
+        boxes: dict[int, _Box] = {}
+        layout: list[tuple[int, list[int]]] = []
+        for text, rect, words in lines:
+            candidates = previous_lines.get(text) or []
+            match = None
+            if candidates:
+                match = min(candidates, key=lambda item: _rect_distance(previous.boxes[item[0]].rect, rect))
+                candidates.remove(match)
+            line_id = match[0] if match else self._new_id()
+            boxes[line_id] = _Box(KIND_LINE, text, rect)
+
+            unused_words = list(match[1]) if match else []
+            word_ids = []
+            for word_text, word_rect in words:
+                same_text = [wid for wid in unused_words if previous.boxes[wid].text == word_text]
+                if same_text:
+                    word_id = min(same_text, key=lambda wid: _rect_distance(previous.boxes[wid].rect, word_rect))
+                    unused_words.remove(word_id)
+                else:
+                    word_id = self._new_id()
+                boxes[word_id] = _Box(KIND_WORD, word_text, word_rect)
+                word_ids.append(word_id)
+            layout.append((line_id, word_ids))
+        return boxes, layout
+
+    def encode(self, version: int, base_version: int = 0) -> Optional[bytes]:
+        """Encode ``version`` relative to ``base_version`` (a snapshot if the base is unknown)."""
+        with self._lock:
+            snapshot = self._history.get(version)
+            if snapshot is None:
+                return None
+            base = self._history.get(base_version) if base_version and base_version < version else None
+            key = (version, base.version if base else 0)
+            cached = self._encoded.get(key)
+            if cached is None:
+                cached = _encode_frame(snapshot, base)
+                self._encoded[key] = cached
+            return cached
+
+    def reset(self) -> None:
+        with self._lock:
+            self._history.clear()
+            self._encoded.clear()
+
+
+def _encode_frame(snapshot: _Snapshot, base: Optional[_Snapshot]) -> bytes:
+    base_boxes = base.boxes if base else {}
+    removed = [box_id for box_id in base_boxes if box_id not in snapshot.boxes]
+    added = []
+    moved = []
+    for box_id, box in snapshot.boxes.items():
+        old = base_boxes.get(box_id)
+        if old is None:
+            added.append((box_id, box))
+        elif old.rect != box.rect:
+            moved.append((box_id, box.rect))
+
+    meta = json.dumps(snapshot.meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    parts = [
+        _HEADER.pack(MAGIC, PROTOCOL_VERSION, 0 if base else FLAG_SNAPSHOT, 0, snapshot.version, base.version if base else 0),
+        _U32.pack(len(meta)),
+        meta,
+        _U32.pack(len(removed)),
+    ]
+    parts.extend(_U32.pack(box_id) for box_id in removed)
+    parts.append(_U32.pack(len(added)))
+    for box_id, box in added:
+        text = box.text.encode("utf-8")[:0xFFFF]
+        parts.append(_ADDED_PREFIX.pack(box_id, box.kind, len(text)))
+        parts.append(text)
+        parts.append(_RECT.pack(*box.rect))
+    parts.append(_U32.pack(len(moved)))
+    for box_id, rect in moved:
+        parts.append(_U32.pack(box_id))
+        parts.append(_RECT.pack(*rect))
+    parts.append(_U32.pack(len(snapshot.layout)))
+    for line_id, word_ids in snapshot.layout:
+        parts.append(_LINE_PREFIX.pack(line_id, len(word_ids)))
+        parts.extend(_U32.pack(word_id) for word_id in word_ids)
+    return b"".join(parts)
+
+
+class OverlayBoxDecoder:
+    """Reference decoder (mirrors the Electron client); returns the JSON payload a frame stands for."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.history_size = int(history_size)
+        self._states: OrderedDict[int, dict[int, _Box]] = OrderedDict()
+
+    def decode(self, frame: bytes) -> Optional[dict]:
+        magic, protocol, flags, _reserved, version, base_version = _HEADER.unpack_from(frame, 0)
+        if magic != MAGIC or protocol != PROTOCOL_VERSION:
+            raise ValueError("Not an overlay box frame")
+        if flags & FLAG_SNAPSHOT:
+            boxes: dict[int, _Box] = {}
+        elif base_version in self._states:
+            boxes = dict(self._states[base_version])
+        else:
+            return None  # Unknown base: caller acks 0 to request a snapshot.
+
+        offset = _HEADER.size
+        (meta_len,) = _U32.unpack_from(frame, offset)
+        offset += 4
+        meta = json.loads(frame[offset : offset + meta_len].decode("utf-8"))
+        offset += meta_len
+
+        (count,) = _U32.unpack_from(frame, offset)
+        offset += 4
+        for _ in range(count):
+            boxes.pop(_U32.unpack_from(frame, offset)[0], None)
+            offset += 4
+        (count,) = _U32.unpack_from(frame, offset)
+        offset += 4
+        for _ in range(count):
+            box_id, kind, text_len = _ADDED_PREFIX.unpack_from(frame, offset)
+            offset += _ADDED_PREFIX.size
+            text = frame[offset : offset + text_len].decode("utf-8")
+            offset += text_len
+            boxes[box_id] = _Box(kind, text, _RECT.unpack_from(frame, offset))
+            offset += _RECT.size
+        (count,) = _U32.unpack_from(frame, offset)
+        offset += 4
+        for _ in range(count):
+            (box_id,) = _U32.unpack_from(frame, offset)
+            boxes[box_id] = _Box(boxes[box_id].kind, boxes[box_id].text, _RECT.unpack_from(frame, offset + 4))
+            offset += 4 + _RECT.size
+
+        (count,) = _U32.unpack_from(frame, offset)
+        offset += 4
+        data = []
+        for _ in range(count):
+            line_id, n_words = _LINE_PREFIX.unpack_from(frame, offset)
+            offset += _LINE_PREFIX.size
+            words = []
+            for _ in range(n_words):
+                word = boxes[_U32.unpack_from(frame, offset)[0]]
+                offset += 4
+                words.append({"text": word.text, "bounding_rect": dequantize_rect(word.rect)})
+            line = boxes[line_id]
+            data.append({"text": line.text, "bounding_rect": dequantize_rect(line.rect), "words": words})
+
+        self._states[version] = boxes
+        while len(self._states) > self.history_size:
+            self._states.popitem(last=False)
+        return {**meta, "data": data, "version": version}
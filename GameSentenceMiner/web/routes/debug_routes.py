@@ -3,14 +3,15 @@ Debug Routes
 
 Routes for debugging/utility:
 - Debug database info
+- SQLite read latency per query fingerprint
 - Re-pull game data
 - Manual refresh operations
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
 from GameSentenceMiner.util.config.configuration import logger
-from GameSentenceMiner.util.database.db import GameLinesTable
+from GameSentenceMiner.util.database.db import GameLinesTable, get_column_update_stats
 
 debug_bp = Blueprint("debug", __name__)
 
@@ -59,3 +60,34 @@ def api_debug_db():
     except Exception as e:
         logger.error(f"Error in debug endpoint: {e}")
         return jsonify({"error": f"Debug failed: {str(e)}"}), 500
+
+
+@debug_bp.route("/api/debug-db/query-stats", methods=["GET"])
+def api_debug_db_query_stats():
+    """Per-query read latency, reader pool usage and ORM column-update counts for the main database."""
+    db = GameLinesTable._db
+    metrics = db.query_metrics
+    sort_by = request.args.get("sort", "total_ms")
+    try:
+        limit = max(1, int(request.args.get("limit", 50)))
+    except ValueError:
+        limit = 50
+
+    return jsonify(
+        {
+            "enabled": metrics is not None,
+            "queries": metrics.snapshot(sort_by=sort_by, limit=limit) if metrics is not None else [],
+            "evicted_fingerprints": metrics.evicted if metrics is not None else 0,
+            "reader_pool": db.reader_pool_stats(),
+            "column_updates": get_column_update_stats(),
+        }
+    ), 200
+
+
+@debug_bp.route("/api/debug-db/query-stats", methods=["DELETE"])
+def api_debug_db_query_stats_reset():
+    """Clear the collected query latency metrics."""
+    metrics = GameLinesTable._db.query_metrics
+    if metrics is not None:
+        metrics.reset()
+    return jsonify({"reset": metrics is not None}), 200
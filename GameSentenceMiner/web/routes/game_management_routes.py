@@ -469,6 +469,7 @@ def api_delete_individual_game(game_id):
             (game_id,),
             commit=True,
         )
+        GameLinesTable.mark_data_changed()
 
         # Delete the game record from games table
         GameLinesTable._db.execute(f"DELETE FROM {GamesTable._table} WHERE id = ?", (game_id,), commit=True)
@@ -531,6 +532,7 @@ def api_delete_game_lines(game_id):
             (game_id,),
             commit=True,
         )
+        GameLinesTable.mark_data_changed()
 
         # Also delete the game record from games table
         GameLinesTable._db.execute(f"DELETE FROM {GamesTable._table} WHERE id = ?", (game_id,), commit=True)
@@ -672,6 +674,7 @@ def api_create_game():
                 (new_game.id, title_original),
                 commit=True,
             )
+            GameLinesTable.mark_data_changed()
 
             # Count how many lines were updated
             updated_count = GameLinesTable._db.fetchone(
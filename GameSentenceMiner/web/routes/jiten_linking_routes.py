@@ -252,6 +252,7 @@ def api_link_game_to_jiten(game_id):
                 (game_id, obs_scene_name),
                 commit=True,
             )
+            GameLinesTable.mark_data_changed()
 
             # Count how many lines were updated
             updated_count = GameLinesTable._db.fetchone(
@@ -49,6 +49,11 @@ from GameSentenceMiner.web.stats_repository import (
     get_date_range_params,
     query_stats_lines as query_stats_lines_repo,
 )
+from GameSentenceMiner.web.stats_response_cache import (
+    cached_stats_response,
+    get_stats_response_cache_stats,
+    mark_stats_response_uncacheable,
+)
 from GameSentenceMiner.web.stats_service import (
     build_combined_stats as build_combined_stats_service,
     build_current_game_stats as build_current_game_stats_service,
@@ -1294,6 +1299,7 @@ def register_stats_api_routes(app):
     """Register statistics API routes with the Flask app."""
 
     @app.route("/api/stats")
+    @cached_stats_response
     def api_stats():
         """
         Get aggregated statistics for charts and analytics
@@ -1681,6 +1687,7 @@ def register_stats_api_routes(app):
             return jsonify({"error": "Failed to generate statistics"}), 500
 
     @app.route("/api/stats/kanji-grid")
+    @cached_stats_response
     def api_stats_kanji_grid():
         """
         Get kanji frequency grid data for the kanji grid visualization.
@@ -1723,6 +1730,7 @@ def register_stats_api_routes(app):
             return jsonify(_build_kanji_grid_data(combined_stats))
         except Exception as e:
             logger.error(f"Error in kanji grid endpoint: {e}")
+            mark_stats_response_uncacheable()
             return jsonify({"kanji_data": [], "unique_count": 0, "max_frequency": 0})
 
     @app.route("/api/stats/game-milestones")
@@ -1749,7 +1757,41 @@ def register_stats_api_routes(app):
             logger.error(f"Error in game milestones endpoint: {e}")
             return jsonify(None)
 
+    @app.route("/api/stats/cache-stats")
+    def api_stats_cache_stats():
+        """
+        Get hit/miss counters for the stats response cache.
+        ---
+        tags:
+          - Statistics
+        responses:
+          200:
+            description: Response cache counters
+            schema:
+              type: object
+              properties:
+                hits:
+                  type: integer
+                misses:
+                  type: integer
+                not_modified:
+                  type: integer
+                  description: Hits answered with 304 Not Modified
+                uncacheable:
+                  type: integer
+                evictions:
+                  type: integer
+                entries:
+                  type: integer
+                bytes:
+                  type: integer
+                hit_rate:
+                  type: number
+        """
+        return jsonify(get_stats_response_cache_stats())
+
     @app.route("/api/stats/all-lines-data")
+    @cached_stats_response
     def api_stats_all_lines_data():
         """
         Get per-day line data for overview/heatmap streak calculations.
@@ -1840,9 +1882,11 @@ def register_stats_api_routes(app):
             return jsonify(all_lines_data)
         except Exception as e:
             logger.error(f"Error in all-lines-data endpoint: {e}")
+            mark_stats_response_uncacheable()
             return jsonify([])
 
     @app.route("/api/mining_heatmap")
+    @cached_stats_response
     def api_mining_heatmap():
         """
         Provides mining heatmap data showing daily mining activity.
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 import json
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from GameSentenceMiner.util.config.configuration import get_stats_config
 from GameSentenceMiner.util.database.db import (
@@ -238,6 +238,51 @@ def fetch_stats_lines_for_timestamp_range(
     )
 
 
+def iter_stats_lines(
+    where_clause: str,
+    params: tuple,
+    chunk_size: int = 1000,
+) -> Iterator[StatsLineRecord]:
+    """Yield lightweight line records in timestamp order, reading ``chunk_size`` rows per query.
+
+    Pages are keyset-paginated on ``(timestamp, id)`` so memory stays bounded by
+    the chunk size however many lines match. Lines without a timestamp are skipped.
+    """
+    stats_config = get_stats_config()
+    regex_out_repetitions = getattr(stats_config, "regex_out_repetitions", False)
+    extra_punctuation_regex = getattr(stats_config, "extra_punctuation_regex", "")
+    keyset: tuple | None = None
+
+    while True:
+        page_where, page_params = f"({where_clause}) AND timestamp IS NOT NULL", tuple(params)
+        if keyset is not None:
+            page_where += " AND (timestamp > ? OR (timestamp = ? AND id > ?))"
+            page_params = (*page_params, keyset[0], keyset[0], keyset[1])
+        rows = GameLinesTable._db.fetchall(
+            f"""
+            SELECT id, game_name, line_text, timestamp, game_id
+            FROM {GameLinesTable._table}
+            WHERE {page_where}
+            ORDER BY timestamp ASC, id ASC
+            LIMIT ?
+            """,
+            (*page_params, chunk_size),
+        )
+        for row in rows:
+            yield StatsLineRecord(
+                line_id=str(row[0] or ""),
+                game_name=str(row[1] or ""),
+                line_text=_clean_line_text_for_stats(row[2], regex_out_repetitions, extra_punctuation_regex),
+                timestamp=float(row[3]),
+                game_id=str(row[4] or ""),
+                note_ids=[],
+            )
+        if len(rows) < chunk_size:
+            return
+        # Keep the raw column values so the next page compares exactly like ORDER BY does.
+        keyset = (rows[-1][3], rows[-1][0])
+
+
 def build_game_mappings(
     all_games: Iterable[Any],
 ) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
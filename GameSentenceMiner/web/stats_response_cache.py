@@ -0,0 +1,235 @@
+"""
+Conditional GET and server-side response cache for the stats routes.
+
+Stats payloads are rebuilt from rollups plus live lines on every poll even
+though the underlying data rarely changes between two polls. Responses are
+fingerprinted by path, query string, the current day, the stats settings, and
+the database write generation; a repeat request is answered from memory (or
+with ``304 Not Modified`` when the client already holds the ETag) and gzip /
+brotli bodies are compressed once per entry instead of once per request.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Hashable, Optional
+
+from flask import g, make_response, request
+
+from GameSentenceMiner.util.config.configuration import get_stats_config, logger
+from GameSentenceMiner.util.database.db import GameLinesTable
+from GameSentenceMiner.util.database.games_table import GamesTable
+from GameSentenceMiner.util.database.stats_rollup_table import StatsRollupTable
+from GameSentenceMiner.util.database.third_party_stats_table import ThirdPartyStatsTable
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MAX_CACHED_RESPONSES = 32
+MAX_CACHED_BYTES = 64 * 1024 * 1024
+MIN_COMPRESS_BYTES = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_STATS_TABLES = (GameLinesTable, StatsRollupTable, ThirdPartyStatsTable, GamesTable)
+
+
+@dataclass
+class _CachedResponse:
+    etag: str
+    status: int
+    mimetype: str
+    body: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+
+class StatsResponseCache:
+    """Byte-bounded LRU of serialized stats responses keyed by request fingerprint."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESPONSES, max_bytes: int = MAX_CACHED_BYTES):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._entries: OrderedDict[Hashable, _CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "not_modified": 0, "uncacheable": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[_CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def put(self, key: Hashable, entry: _CachedResponse) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict_locked()
+
+    def encoded_body(self, entry: _CachedResponse, encoding: str) -> bytes:
+        """Return ``entry``'s body in ``encoding``, compressing it on first use."""
+        with self._lock:
+            data = entry.encoded.get(encoding)
+        if data is not None:
+            return data
+
+        data = _compress(entry.body, encoding)
+        with self._lock:
+            if encoding not in entry.encoded:
+                entry.encoded[encoding] = data
+                if any(cached is entry for cached in self._entries.values()):
+                    self._bytes += len(data)
+                    self._evict_locked()
+        return data
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._stats["evictions"] += 1
+
+
+stats_response_cache = StatsResponseCache()
+
+
+def get_stats_response_cache_stats() -> dict:
+    return stats_response_cache.stats()
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _available_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _choose_encoding(body: bytes) -> Optional[str]:
+    if len(body) < MIN_COMPRESS_BYTES:
+        return None
+    accepted = request.accept_encodings
+    for encoding in _available_encodings():
+        if accepted[encoding] > 0:
+            return encoding
+    return None
+
+
+def _database_generation() -> tuple:
+    databases = {id(table._db): table._db for table in _STATS_TABLES if table._db is not None}
+    return tuple(sorted(db.write_generation() for db in databases.values()))
+
+
+def _stats_config_fingerprint() -> str:
+    try:
+        return repr(get_stats_config())
+    except Exception:
+        return ""
+
+
+def _request_fingerprint() -> tuple:
+    return (
+        request.path,
+        tuple(sorted(request.args.items(multi=True))),
+        datetime.date.today().isoformat(),
+        _stats_config_fingerprint(),
+        _database_generation(),
+    )
+
+
+def mark_stats_response_uncacheable() -> None:
+    """Keep the current response out of the cache, e.g. a fallback served after an error."""
+    g.stats_response_uncacheable = True
+
+
+def _serve(entry: _CachedResponse):
+    if request.if_none_match.contains(entry.etag):
+        stats_response_cache.record("not_modified")
+        response = make_response("", 304)
+    else:
+        encoding = _choose_encoding(entry.body)
+        body = stats_response_cache.encoded_body(entry, encoding) if encoding else entry.body
+        response = make_response(body, entry.status)
+        response.mimetype = entry.mimetype
+        if encoding:
+            # Flask-Compress leaves responses that already carry an encoding alone.
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+    response.set_etag(entry.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def cached_stats_response(view: Callable):
+    """Serve ``view`` through the stats response cache with ETag revalidation."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            key = _request_fingerprint()
+        except Exception as e:
+            logger.debug(f"Stats response cache bypassed: {e}")
+            stats_response_cache.record("uncacheable")
+            return view(*args, **kwargs)
+
+        entry = stats_response_cache.get(key)
+        if entry is None:
+            response = make_response(view(*args, **kwargs))
+            if (
+                response.status_code != 200
+                or response.direct_passthrough
+                or response.headers.get("Content-Encoding")
+                or g.pop("stats_response_uncacheable", False)
+            ):
+                stats_response_cache.record("uncacheable")
+                return response
+            body = response.get_data()
+            entry = _CachedResponse(
+                etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+                status=response.status_code,
+                mimetype=response.mimetype,
+                body=body,
+            )
+            stats_response_cache.put(key, entry)
+        return _serve(entry)
+
+    return wrapper
@@ -849,7 +849,7 @@ def project_text_domain_event(event, line):
 
 async def send_word_coordinates_to_overlay(data):
     if data["data"] and len(data["data"]) > 0 and websocket_manager.has_clients(ID_OVERLAY):
-        await websocket_manager.send(ID_OVERLAY, data)
+        await websocket_manager.send_overlay_word_boxes(data)
 
 
 async def send_overlay_clear(line_id=None):
@@ -858,10 +858,10 @@ async def send_overlay_clear(line_id=None):
         await websocket_manager.send(ID_OVERLAY, {"type": "overlay_clear", "line_id": line_id})
 
 
-async def send_manual_background_to_overlay(image_data_url):
-    """Push a captured desktop snapshot to the overlay for exclusive-fullscreen manual mode."""
-    if image_data_url and websocket_manager.has_clients(ID_OVERLAY):
-        await websocket_manager.send(ID_OVERLAY, {"type": "manual_mode_background", "image": image_data_url})
+async def send_manual_background_to_overlay(image):
+    """Push a captured desktop snapshot (PIL image) to the overlay for exclusive-fullscreen manual mode."""
+    if image is not None and websocket_manager.has_clients(ID_OVERLAY):
+        await websocket_manager.send_overlay_background(image)
 
 
 @app.route("/update_checkbox", methods=["POST"])
@@ -1261,6 +1261,45 @@ def translate_multiple():
     return translation, 200
 
 
+@app.route("/translation-cache-stats", methods=["GET"])
+def translation_cache_stats():
+    """
+    Hit-rate metrics for the persistent AI translation cache
+    ---
+    tags:
+      - Text Processing
+    responses:
+      200:
+        description: Cache counters since startup plus the current entry count
+        schema:
+          type: object
+          properties:
+            hits:
+              type: integer
+            misses:
+              type: integer
+            hit_rate:
+              type: number
+            entries:
+              type: integer
+            speculative:
+              type: object
+              description: Speculative translator counters, or null when it is off
+            routing:
+              type: object
+              description: Per-model latency percentiles, error rates and circuit state
+    """
+    from GameSentenceMiner.ai.routing import model_router
+    from GameSentenceMiner.ai.speculative_translation import get_speculative_translator
+    from GameSentenceMiner.ai.translation_cache import translation_cache
+
+    stats = translation_cache.stats()
+    translator = get_speculative_translator()
+    stats["speculative"] = translator.stats() if translator is not None else None
+    stats["routing"] = model_router.health_snapshot()
+    return jsonify(stats), 200
+
+
 @app.route("/get_status", methods=["GET"])
 def get_status():
     """
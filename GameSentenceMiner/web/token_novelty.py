@@ -6,6 +6,12 @@ from collections import Counter
 from GameSentenceMiner.util.config.feature_flags import is_tokenization_enabled
 from GameSentenceMiner.util.database.db import GameLinesTable
 from GameSentenceMiner.util.database.games_table import GamesTable
+from GameSentenceMiner.util.database.word_novelty_tables import (
+    WORD_NOVELTY_DAILY_TABLE,
+    WORD_NOVELTY_LINES_TABLE,
+    WORD_NOVELTY_WORDS_TABLE,
+    ensure_word_novelty_current,
+)
 
 DEFAULT_GAME_BUCKET_SIZE = 10_000
 GAME_BUCKET_SIZE_OPTIONS = [10_000, 25_000, 50_000, 100_000]
@@ -38,6 +44,12 @@ def _has_word_novelty_support(db) -> bool:
     )
 
 
+def _ensure_novelty_aggregates(db) -> bool:
+    """Bring the materialized novelty tables up to date; False when they are unavailable."""
+    ensure_word_novelty_current(db)
+    return db.table_exists(WORD_NOVELTY_DAILY_TABLE)
+
+
 def _build_date_labels(start_date_str: str | None, end_date_str: str | None) -> list[str]:
     if not start_date_str or not end_date_str:
         return []
@@ -69,15 +81,12 @@ def _build_series(labels: list[str], counts_by_date: Counter[str]) -> dict:
     }
 
 
-def _timestamp_range_for_dates(start_date_str: str, end_date_str: str) -> tuple[float, float]:
+def _ordered_date_range(start_date_str: str, end_date_str: str) -> tuple[str, str]:
     start_date = datetime.date.fromisoformat(start_date_str)
     end_date = datetime.date.fromisoformat(end_date_str)
     if end_date < start_date:
         start_date, end_date = end_date, start_date
-
-    start_timestamp = datetime.datetime.combine(start_date, datetime.time.min).timestamp()
-    end_timestamp = datetime.datetime.combine(end_date, datetime.time.max).timestamp()
-    return start_timestamp, end_timestamp
+    return start_date.isoformat(), end_date.isoformat()
 
 
 def _empty_global_payload(labels: list[str]) -> dict:
@@ -168,20 +177,16 @@ def _get_game_display_titles() -> dict[str, str]:
     return titles
 
 
-def _build_new_words_by_game(db, start_timestamp: float, end_timestamp: float) -> dict[str, list]:
+def _build_new_words_by_game(db, start_date: str, end_date: str) -> dict[str, list]:
     game_titles = _get_game_display_titles()
     rows = db.fetchall(
         f"""
-        SELECT gl.game_id, gl.game_name, COUNT(*) AS new_word_count
-        FROM words w
-        JOIN {GameLinesTable._table} gl ON gl.id = w.first_seen_line_id
-        WHERE w.first_seen IS NOT NULL
-          AND gl.tokenized = 1
-          AND CAST(w.first_seen AS REAL) >= ?
-          AND CAST(w.first_seen AS REAL) <= ?
-        GROUP BY gl.game_id, gl.game_name
+        SELECT game_id, MAX(game_name), SUM(new_words) AS new_word_count
+        FROM {WORD_NOVELTY_DAILY_TABLE}
+        WHERE date >= ? AND date <= ?
+        GROUP BY game_id
         """,
-        (start_timestamp, end_timestamp),
+        (start_date, end_date),
     )
 
     ranked_games: list[tuple[str, int]] = []
@@ -202,41 +207,22 @@ def _build_new_words_by_game(db, start_timestamp: float, end_timestamp: float) -
 
 
 def _get_game_new_word_character_positions(db, game_id: str) -> tuple[int, list[int]]:
-    tokenized_line_rows = db.fetchall(
+    rows = db.fetchall(
         f"""
-        SELECT id, LENGTH(COALESCE(line_text, '')) AS char_count
-        FROM {GameLinesTable._table}
-        WHERE game_id = ? AND tokenized = 1
-        ORDER BY CAST(timestamp AS REAL) ASC, id ASC
+        SELECT char_count, new_words
+        FROM {WORD_NOVELTY_LINES_TABLE}
+        WHERE game_id = ?
+        ORDER BY timestamp ASC, line_id ASC
         """,
         (game_id,),
     )
 
     cumulative_chars = 0
-    line_end_positions: dict[str, int] = {}
-    for line_id, char_count in tokenized_line_rows:
+    positions: list[int] = []
+    for char_count, new_words in rows:
         cumulative_chars += int(char_count or 0)
-        line_end_positions[str(line_id)] = cumulative_chars
-
-    if not line_end_positions:
-        return 0, []
-
-    first_seen_rows = db.fetchall(
-        f"""
-        SELECT w.first_seen_line_id
-        FROM words w
-        JOIN {GameLinesTable._table} gl ON gl.id = w.first_seen_line_id
-        WHERE w.first_seen_line_id IS NOT NULL
-          AND gl.game_id = ?
-          AND gl.tokenized = 1
-        ORDER BY CAST(w.first_seen AS REAL) ASC, w.first_seen_line_id ASC
-        """,
-        (game_id,),
-    )
-
-    positions = [
-        line_end_positions[str(line_id)] for (line_id,) in first_seen_rows if str(line_id) in line_end_positions
-    ]
+        if new_words:
+            positions.extend([cumulative_chars] * int(new_words))
     return cumulative_chars, positions
 
 
@@ -253,7 +239,7 @@ def build_global_word_novelty(start_date_str: str, end_date_str: str) -> tuple[d
         )
 
     db = _get_db()
-    if not _has_word_novelty_support(db):
+    if not _has_word_novelty_support(db) or not _ensure_novelty_aggregates(db):
         return (
             tokenization_status,
             empty_payload["vocabularyStats"],
@@ -261,49 +247,36 @@ def build_global_word_novelty(start_date_str: str, end_date_str: str) -> tuple[d
             empty_payload["newWordsByGame"],
         )
 
-    start_timestamp, end_timestamp = _timestamp_range_for_dates(start_date_str, end_date_str)
+    start_date, end_date = _ordered_date_range(start_date_str, end_date_str)
     unique_words_row = db.fetchone(
         f"""
-        SELECT COUNT(DISTINCT wo.word_id)
-        FROM word_occurrences wo
-        JOIN {GameLinesTable._table} gl ON gl.id = wo.line_id
-        WHERE gl.tokenized = 1 AND CAST(gl.timestamp AS REAL) >= ? AND CAST(gl.timestamp AS REAL) <= ?
+        SELECT COUNT(DISTINCT word_id)
+        FROM {WORD_NOVELTY_WORDS_TABLE}
+        WHERE date >= ? AND date <= ?
         """,
-        (start_timestamp, end_timestamp),
+        (start_date, end_date),
     )
-    tokenized_chars_row = db.fetchone(
+    daily_rows = db.fetchall(
         f"""
-        SELECT COALESCE(SUM(LENGTH(COALESCE(line_text, ''))), 0)
-        FROM {GameLinesTable._table}
-        WHERE tokenized = 1 AND CAST(timestamp AS REAL) >= ? AND CAST(timestamp AS REAL) <= ?
-        """,
-        (start_timestamp, end_timestamp),
-    )
-    first_seen_rows = db.fetchall(
-        """
-        SELECT first_seen
-        FROM words
-        WHERE first_seen IS NOT NULL
-          AND CAST(first_seen AS REAL) >= ?
-          AND CAST(first_seen AS REAL) <= ?
-        ORDER BY CAST(first_seen AS REAL) ASC
+        SELECT date, SUM(new_words), SUM(tokenized_chars)
+        FROM {WORD_NOVELTY_DAILY_TABLE}
+        WHERE date >= ? AND date <= ?
+        GROUP BY date
         """,
-        (start_timestamp, end_timestamp),
+        (start_date, end_date),
     )
 
     counts_by_date: Counter[str] = Counter()
-    for row in first_seen_rows:
-        first_seen = row[0]
-        if first_seen is None:
-            continue
-        counts_by_date[datetime.datetime.fromtimestamp(float(first_seen)).date().isoformat()] += 1
+    tokenized_chars = 0
+    for date_str, new_words, chars in daily_rows:
+        counts_by_date[str(date_str)] += int(new_words or 0)
+        tokenized_chars += int(chars or 0)
 
     series = _build_series(labels, counts_by_date)
     unique_words_seen = int(unique_words_row[0]) if unique_words_row and unique_words_row[0] is not None else 0
-    tokenized_chars = int(tokenized_chars_row[0]) if tokenized_chars_row and tokenized_chars_row[0] is not None else 0
     new_words_first_seen = sum(series["dailyNew"])
     new_words_per_10k_chars = round((new_words_first_seen / tokenized_chars) * 10000, 1) if tokenized_chars > 0 else 0.0
-    new_words_by_game = _build_new_words_by_game(db, start_timestamp, end_timestamp)
+    new_words_by_game = _build_new_words_by_game(db, start_date, end_date)
 
     return (
         tokenization_status,
@@ -325,55 +298,32 @@ def build_game_word_novelty(game_id: str, first_date_str: str | None, last_date_
         return tokenization_status, empty_payload
 
     db = _get_db()
-    if not _has_word_novelty_support(db):
+    if not _has_word_novelty_support(db) or not _ensure_novelty_aggregates(db):
         return tokenization_status, empty_payload
 
     unique_words_row = db.fetchone(
-        f"""
-        SELECT COUNT(DISTINCT wo.word_id)
-        FROM word_occurrences wo
-        JOIN {GameLinesTable._table} gl ON gl.id = wo.line_id
-        WHERE gl.game_id = ? AND gl.tokenized = 1
-        """,
-        (game_id,),
-    )
-    tokenized_chars_row = db.fetchone(
-        f"""
-        SELECT COALESCE(SUM(LENGTH(COALESCE(line_text, ''))), 0)
-        FROM {GameLinesTable._table}
-        WHERE game_id = ? AND tokenized = 1
-        """,
+        f"SELECT COUNT(DISTINCT word_id) FROM {WORD_NOVELTY_WORDS_TABLE} WHERE game_id = ?",
         (game_id,),
     )
-    first_seen_rows = db.fetchall(
-        f"""
-        SELECT w.first_seen
-        FROM words w
-        JOIN {GameLinesTable._table} gl ON gl.id = w.first_seen_line_id
-        WHERE w.first_seen IS NOT NULL AND gl.game_id = ?
-        ORDER BY CAST(w.first_seen AS REAL) ASC
-        """,
+    daily_rows = db.fetchall(
+        f"SELECT date, new_words FROM {WORD_NOVELTY_DAILY_TABLE} WHERE game_id = ?",
         (game_id,),
     )
 
     counts_by_date: Counter[str] = Counter()
-    for row in first_seen_rows:
-        first_seen = row[0]
-        if first_seen is None:
-            continue
-        counts_by_date[datetime.datetime.fromtimestamp(float(first_seen)).date().isoformat()] += 1
+    for date_str, new_words in daily_rows:
+        counts_by_date[str(date_str)] += int(new_words or 0)
 
     series = _build_series(labels, counts_by_date)
     unique_words_in_game = int(unique_words_row[0]) if unique_words_row and unique_words_row[0] is not None else 0
-    tokenized_chars = int(tokenized_chars_row[0]) if tokenized_chars_row and tokenized_chars_row[0] is not None else 0
+    total_tokenized_chars, new_word_character_positions = _get_game_new_word_character_positions(db, game_id)
     globally_new_words_from_game = sum(series["dailyNew"])
     novelty_rate = (
         round((globally_new_words_from_game / unique_words_in_game) * 100, 1) if unique_words_in_game > 0 else 0.0
     )
     new_words_per_10k_chars = (
-        round((globally_new_words_from_game / tokenized_chars) * 10000, 1) if tokenized_chars > 0 else 0.0
+        round((globally_new_words_from_game / total_tokenized_chars) * 10000, 1) if total_tokenized_chars > 0 else 0.0
     )
-    total_tokenized_chars, new_word_character_positions = _get_game_new_word_character_positions(db, game_id)
 
     return tokenization_status, {
         "uniqueWordsInGame": unique_words_in_game,
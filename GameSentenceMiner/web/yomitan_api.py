@@ -7,26 +7,45 @@ for the most recently played games.
 
 import hashlib
 import json
-from flask import jsonify, make_response, request
-from typing import List
+import threading
+from flask import Response, jsonify, make_response, request
+from typing import List, Optional
 
 from GameSentenceMiner.util.config.configuration import get_config, logger
 from GameSentenceMiner.util.config.feature_flags import is_tokenization_enabled
 from GameSentenceMiner.util.database.games_table import GamesTable
-from GameSentenceMiner.util.yomitan_dict import FrequencyDictBuilder, YomitanDictBuilder
+from GameSentenceMiner.util.yomitan_dict import (
+    FrequencyBankCache,
+    FrequencyDictBuilder,
+    YomitanDictArtifactCache,
+    YomitanDictBuilder,
+)
+from GameSentenceMiner.util.yomitan_dict.artifact_cache import cache_key
 
 
 YOMITAN_CHARACTER_DICTIONARY_REVISION_VERSION = 1
+# Character updates tend to arrive in bursts (e.g. a jiten refresh), so prebuilds are debounced.
+YOMITAN_PREBUILD_DELAY_SECONDS = 2.0
+
+yomitan_dict_cache = YomitanDictArtifactCache()
+frequency_bank_cache = FrequencyBankCache()
+# (game_count, spoiler_level) combinations requested this session; these get prebuilt on changes.
+_requested_dictionary_params: set[tuple[int, int]] = set()
+_prebuild_lock = threading.Lock()
+_prebuild_timer: Optional[threading.Timer] = None
 
 
 def notify_yomitan_character_dictionary_changed(reason: str, game_id: str | None = None) -> None:
     """
     Ask connected overlays to refresh the installed GSM character dictionary.
 
-    The Yomitan dictionary itself is generated lazily from /api/yomitan-dict.
-    This notification only tells the overlay to ask Yomitan to re-check the
-    index immediately after character data changes.
+    Cached dictionary ZIPs are dropped and the variants requested this session
+    are rebuilt in the background, so the overlay's follow-up download is
+    served from disk. The notification itself only tells the overlay to ask
+    Yomitan to re-check the index immediately after character data changes.
     """
+    yomitan_dict_cache.invalidate()
+    schedule_yomitan_dictionary_prebuild()
     try:
         from GameSentenceMiner.web.gsm_websocket import ID_OVERLAY, websocket_manager
 
@@ -209,6 +228,82 @@ def get_recent_games(desired_count: int = 3, max_search: int = 50) -> List[Games
     return valid_games
 
 
+def _character_dictionary_download_url(game_count: int, spoiler_level: int) -> str:
+    port = get_config().general.single_port
+    return f"http://127.0.0.1:{port}/api/yomitan-dict?game_count={game_count}&spoiler_level={spoiler_level}"
+
+
+def build_character_dictionary_zip(
+    recent_games: List[GamesTable],
+    revision: str,
+    download_url: str,
+    game_count: int,
+    spoiler_level: int,
+) -> Optional[bytes]:
+    """Build the character dictionary ZIP, or return None when no entries were produced."""
+    builder = YomitanDictBuilder(
+        revision=revision,
+        download_url=download_url,
+        game_count=game_count,
+        spoiler_level=spoiler_level,
+    )
+
+    total_characters = 0
+    for game in recent_games:
+        char_count = builder.add_game_characters(game)
+        total_characters += char_count
+        logger.debug(
+            f"Yomitan: Added {char_count} characters from {game.title_original or game.title_romaji or 'Unknown'}"
+        )
+
+    if not builder.entries:
+        return None
+
+    logger.info(
+        f"Yomitan: Generated dictionary with {len(builder.entries)} total entries from {total_characters} characters across {len(recent_games)} games"
+    )
+    return builder.export_bytes()
+
+
+def prebuild_yomitan_dictionaries() -> int:
+    """Build and cache every dictionary variant requested this session; returns how many were built."""
+    with _prebuild_lock:
+        params = sorted(_requested_dictionary_params)
+
+    built = 0
+    for game_count, spoiler_level in params:
+        try:
+            recent_games = get_recent_games(desired_count=game_count, max_search=50)
+            if not recent_games:
+                continue
+            revision = compute_yomitan_dictionary_revision(recent_games, game_count, spoiler_level)
+            download_url = _character_dictionary_download_url(game_count, spoiler_level)
+            key = cache_key(revision, download_url)
+            if yomitan_dict_cache.contains(key):
+                continue
+            zip_bytes = build_character_dictionary_zip(recent_games, revision, download_url, game_count, spoiler_level)
+            if zip_bytes is None:
+                continue
+            yomitan_dict_cache.store(key, zip_bytes)
+            built += 1
+        except Exception as error:
+            logger.debug(f"Yomitan: background dictionary prebuild failed: {error}")
+    return built
+
+
+def schedule_yomitan_dictionary_prebuild(delay: float = YOMITAN_PREBUILD_DELAY_SECONDS) -> None:
+    """Prebuild requested dictionary variants after ``delay``, coalescing bursts of changes."""
+    global _prebuild_timer
+    with _prebuild_lock:
+        if not _requested_dictionary_params:
+            return
+        if _prebuild_timer is not None:
+            _prebuild_timer.cancel()
+        _prebuild_timer = threading.Timer(delay, prebuild_yomitan_dictionaries)
+        _prebuild_timer.daemon = True
+        _prebuild_timer.start()
+
+
 def register_yomitan_api_routes(app):
     """Register Yomitan dictionary API routes with the Flask app."""
 
@@ -300,45 +395,43 @@ def register_yomitan_api_routes(app):
                 }
             ), 404
 
-        # 2. Build dictionary combining all games
-        port = get_config().general.single_port
-        download_url = f"http://127.0.0.1:{port}/api/yomitan-dict?game_count={game_count}&spoiler_level={spoiler_level}"
-        revision = compute_yomitan_dictionary_revision(recent_games, game_count, spoiler_level)
-        builder = YomitanDictBuilder(
-            revision=revision,
-            download_url=download_url,
-            game_count=game_count,
-            spoiler_level=spoiler_level,
-        )
+        with _prebuild_lock:
+            _requested_dictionary_params.add((game_count, spoiler_level))
 
-        total_characters = 0
-        for game in recent_games:
-            char_count = builder.add_game_characters(game)
-            total_characters += char_count
-            logger.debug(
-                f"Yomitan: Added {char_count} characters from {game.title_original or game.title_romaji or 'Unknown'}"
-            )
+        # 2. Serve the cached ZIP for this revision, building it only on a miss
+        download_url = _character_dictionary_download_url(game_count, spoiler_level)
+        revision = compute_yomitan_dictionary_revision(recent_games, game_count, spoiler_level)
+        etag = cache_key(revision, download_url)
 
-        if not builder.entries:
-            game_titles = [g.title_original or g.title_romaji or g.title_english or "Unknown" for g in recent_games]
-            return jsonify(
-                {
-                    "error": "No character entries generated",
-                    "message": f"Character data validation passed but no entries were created from: {', '.join(game_titles)}",
-                    "action": "This may indicate a data format issue. Please report this on GitHub.",
-                }
-            ), 404
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
+            response.set_etag(etag)
+            response.headers["Access-Control-Allow-Origin"] = "*"
+            return response
 
-        logger.info(
-            f"Yomitan: Generated dictionary with {len(builder.entries)} total entries from {total_characters} characters across {len(recent_games)} games"
-        )
+        zip_bytes = yomitan_dict_cache.load(etag)
+        if zip_bytes is None:
+            zip_bytes = build_character_dictionary_zip(recent_games, revision, download_url, game_count, spoiler_level)
+            if zip_bytes is None:
+                game_titles = [g.title_original or g.title_romaji or g.title_english or "Unknown" for g in recent_games]
+                return jsonify(
+                    {
+                        "error": "No character entries generated",
+                        "message": f"Character data validation passed but no entries were created from: {', '.join(game_titles)}",
+                        "action": "This may indicate a data format issue. Please report this on GitHub.",
+                    }
+                ), 404
+            try:
+                yomitan_dict_cache.store(etag, zip_bytes)
+            except OSError as error:
+                logger.warning(f"Yomitan: failed to cache dictionary ZIP: {error}")
 
         # 3. Return ZIP as file download with CORS headers
-        zip_bytes = builder.export_bytes()
         response = make_response(zip_bytes)
         response.headers["Content-Type"] = "application/zip"
         response.headers["Content-Disposition"] = "attachment; filename=gsm_characters.zip"
         response.headers["Access-Control-Allow-Origin"] = "*"
+        response.set_etag(etag)
         return response
 
     @app.route("/api/yomitan-index")
@@ -455,19 +548,20 @@ def register_yomitan_api_routes(app):
         try:
             port = get_config().general.single_port
             download_url = f"http://127.0.0.1:{port}/api/yomitan-freq-dict"
-            builder = FrequencyDictBuilder(download_url=download_url)
+            builder = FrequencyDictBuilder(download_url=download_url, bank_cache=frequency_bank_cache)
             builder.build_from_db()
 
-            if not builder.entries:
+            if not builder.has_entries():
                 resp = jsonify({"error": "No frequency data available. Play some games with tokenization enabled."})
                 resp.status_code = 404
                 resp.headers["Access-Control-Allow-Origin"] = "*"
                 return resp
 
-            logger.info(f"Yomitan freq dict: Generated {len(builder.entries)} entries")
-            zip_bytes = builder.export_bytes()
-            response = make_response(zip_bytes)
-            response.headers["Content-Type"] = "application/zip"
+            logger.info(
+                f"Yomitan freq dict: serving revision {builder.revision} "
+                f"({len(frequency_bank_cache.last_rebuilt_banks)} bank(s) regenerated)"
+            )
+            response = Response(builder.iter_zip_chunks(), mimetype="application/zip")
             response.headers["Content-Disposition"] = "attachment; filename=gsm_frequency.zip"
             response.headers["Access-Control-Allow-Origin"] = "*"
             return response
@@ -487,10 +581,19 @@ def register_yomitan_api_routes(app):
             resp.headers["Access-Control-Allow-Origin"] = "*"
             return resp
 
-        port = get_config().general.single_port
-        download_url = f"http://127.0.0.1:{port}/api/yomitan-freq-dict"
-        builder = FrequencyDictBuilder(download_url=download_url)
-        index = builder._create_index()
+        try:
+            port = get_config().general.single_port
+            download_url = f"http://127.0.0.1:{port}/api/yomitan-freq-dict"
+            # Advertise the same content revision the ZIP carries, so Yomitan only updates on real changes.
+            builder = FrequencyDictBuilder(download_url=download_url, bank_cache=frequency_bank_cache)
+            builder.load_revision()
+            index = builder._create_index()
+        except Exception as e:
+            logger.error(f"Failed to build frequency dictionary index: {e}")
+            resp = jsonify({"error": f"Failed to build frequency dictionary index: {e}"})
+            resp.status_code = 500
+            resp.headers["Access-Control-Allow-Origin"] = "*"
+            return resp
 
         response = jsonify(index)
         response.headers["Access-Control-Allow-Origin"] = "*"
@@ -58,6 +58,9 @@ interface OCRConfig {
     optimize_second_scan: boolean;
     text_appears_instantly?: boolean;
     advanced_debug_logging?: boolean;
+    result_cache?: boolean;
+    result_cache_disk?: boolean;
+    per_rectangle_ocr?: boolean;
     ocr1: string;
     ocr2: string;
     scanRate: number;
@@ -262,6 +265,9 @@ export const store = new Store<StoreConfig>({
             optimize_second_scan: true,
             text_appears_instantly: false,
             advanced_debug_logging: false,
+            result_cache: true,
+            result_cache_disk: false,
+            per_rectangle_ocr: false,
             ocr1: DEFAULT_STABILITY_OCR,
             ocr2: "glens",
             language: "ja",
@@ -0,0 +1,164 @@
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from GameSentenceMiner.mecab.basic_mecab_controller import BasicMecabController  # noqa: E402
+from GameSentenceMiner.mecab.mecab_controller import MecabController, escape_text  # noqa: E402
+
+
+_SAMPLE_LINES = (
+    "カリン、自分でまいた種は自分で刈り取れ",
+    "昨日、林檎を2個買った。",
+    "真莉、大好きだよん＾＾",
+    "彼２０００万も使った。",
+    "昨日すき焼きを食べました",
+    "詳細はお気軽にお問い合わせ下さい。",
+    "粗末な家に住んでいる",
+    "放っておけない",
+    "いい気分に当たって",
+    "他人のアソコ弄ってる",
+)
+
+
+def load_lines(args: argparse.Namespace) -> list[str]:
+    if args.text_file:
+        source = [line.strip() for line in Path(args.text_file).read_text(encoding="utf-8").splitlines()]
+        source = [line for line in source if line]
+    else:
+        source = list(_SAMPLE_LINES)
+    # Suffix the index so neither MeCab nor any cache sees an exact repeat.
+    return [f"{source[i % len(source)]}{i}" for i in range(args.lines)]
+
+
+def _time(label: str, lines: list[str], fn: Callable[[list[str]], list[str]]) -> dict[str, Any]:
+    started = time.perf_counter()
+    outputs = fn(lines)
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": label,
+        "lines": len(lines),
+        "seconds": round(elapsed, 4),
+        "lines_per_second": round(len(lines) / elapsed, 1) if elapsed else 0.0,
+        "ms_per_line": round(elapsed * 1000 / len(lines), 3) if lines else 0.0,
+        "outputs": outputs,
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    lines = [escape_text(line) for line in load_lines(args)]
+    spawn_lines = lines[: args.spawn_lines] if args.spawn_lines else lines
+    mecab_args = MecabController._mecab_args
+    spawn = BasicMecabController(mecab_args=mecab_args, persistent=False)
+    pooled = BasicMecabController(mecab_args=mecab_args, workers=args.workers)
+
+    try:
+        # Start the workers (and load the dictionary) before timing anything.
+        pooled.run_batch(_SAMPLE_LINES[: args.workers])
+
+        results = [
+            _time("spawn_per_call", spawn_lines, lambda batch: [spawn.run_once(line) for line in batch]),
+            _time("pool_per_call", lines, lambda batch: [pooled.run(line) for line in batch]),
+            _time("pool_batch", lines, pooled.run_batch),
+        ]
+        if args.threads > 1:
+            with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                results.append(_time("pool_threaded", lines, lambda batch: list(executor.map(pooled.run, batch))))
+
+        # spawn_lines is a prefix of lines, so every mode can be checked against spawn_per_call.
+        reference = results[0]["outputs"]
+        for result in results:
+            result["matches_spawn"] = result.pop("outputs")[: len(reference)] == reference
+        return {
+            "workers": args.workers,
+            "threads": args.threads,
+            "results": results,
+            "speedup_vs_spawn": {
+                result["mode"]: round(results[0]["ms_per_line"] / result["ms_per_line"], 1)
+                for result in results[1:]
+                if result["ms_per_line"]
+            },
+            "pool_stats": pooled.worker_stats(),
+        }
+    finally:
+        pooled.close()
+
+
+def print_human_summary(payload: dict[str, Any]) -> None:
+    print(f"MeCab throughput ({payload['workers']} workers, {payload['threads']} caller threads)")
+    for result in payload["results"]:
+        print(
+            f"  {result['mode']:<16} {result['lines']:>7} lines  {result['seconds']:>9.3f}s  "
+            f"{result['lines_per_second']:>10.1f} lines/s  {result['ms_per_line']:>8.3f} ms/line  "
+            f"output {'matches' if result['matches_spawn'] else 'DIFFERS from'} spawn"
+        )
+    for mode, speedup in payload["speedup_vs_spawn"].items():
+        print(f"  {mode} speedup vs spawn_per_call: {speedup}x")
+    print(f"  pool stats: {payload['pool_stats']}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare MeCab spawn-per-call throughput against the worker pool.")
+    parser.add_argument(
+        "--lines",
+        type=int,
+        default=2000,
+        help="Number of lines to analyze per pooled mode.",
+    )
+    parser.add_argument(
+        "--spawn-lines",
+        type=int,
+        default=200,
+        help="Only time the first N lines in spawn-per-call mode (0 = all); it is orders of magnitude slower.",
+    )
+    parser.add_argument(
+        "--text-file",
+        default=None,
+        help="Optional UTF-8 file with one sentence per line. Defaults to built-in samples.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of persistent MeCab workers.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=4,
+        help="Concurrent caller threads for the pool_threaded mode (1 disables it).",
+    )
+    parser.add_argument(
+        "--json-out",
+        default=None,
+        help="Optional path for machine-readable benchmark output.",
+    )
+    return parser
+
+
+def main() -> int:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        payload = run_benchmarks(args)
+    except Exception as exc:
+        print(f"Benchmark failed: {exc}", file=sys.stderr)
+        return 1
+
+    print_human_summary(payload)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
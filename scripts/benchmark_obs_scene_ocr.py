@@ -158,9 +158,44 @@ def capture_obs_image(*, compression: int, img_format: str):
     return scene_name, source_name, image
 
 
-def run_ocr_once(engine_instance, pil_image):
+def crop_to_scene_rectangles(pil_image):
+    """Build the OCR1 composite for the current scene, as the OBS capture thread does."""
+    from GameSentenceMiner.ocr.gsm_ocr_config import get_scene_ocr_config
+
+    ocr_config = get_scene_ocr_config(refresh=True)
+    if not ocr_config or not getattr(ocr_config, "rectangles", None):
+        raise RuntimeError("The current scene has no OCR rectangles configured.")
+    ocr_config.scale_to_custom_size(pil_image.width, pil_image.height)
+    composite, crop_offset = run.apply_ocr_config_to_image(pil_image, ocr_config, return_full_size=False)
+    rectangles = [
+        list(rect.coordinates)
+        for rect in ocr_config.rectangles
+        if not (rect.is_excluded or rect.is_secondary or run._is_black_hole_rectangle(rect))
+    ]
+    metadata = {
+        "ocr_area_crop_offset": run.CompositeLayout.from_metadata(crop_offset).to_metadata(),
+        "ocr_area_rectangles": rectangles,
+    }
+    return composite, metadata
+
+
+def run_ocr_once(engine_instance, pil_image, image_metadata=None, region_runner=None):
     start = time.perf_counter()
-    result = engine_instance(pil_image, 0)
+    region_stats = None
+    if region_runner is not None:
+        from GameSentenceMiner.ocr.region_ocr import composite_region_boxes
+        from GameSentenceMiner.ocr.second_pass_scheduler import parallelism_for_engine
+
+        boxes = composite_region_boxes(image_metadata, pil_image.size)
+        result, region_stats = region_runner.run(
+            pil_image,
+            boxes or [(0, 0, pil_image.width, pil_image.height)],
+            lambda crop: engine_instance(crop, 0),
+            context=engine_instance.name,
+            parallelism=parallelism_for_engine(engine_instance.name),
+        )
+    else:
+        result = engine_instance(pil_image, 0)
     elapsed_seconds = time.perf_counter() - start
     success, text, coords, crop_coords_list, crop_coords, response_dict = (list(result) + [None] * 6)[:6]
     return {
@@ -171,6 +206,7 @@ def run_ocr_once(engine_instance, pil_image):
         "crop_coords": crop_coords,
         "response_dict": response_dict,
         "elapsed_seconds": elapsed_seconds,
+        "region_stats": region_stats,
     }
 
 
@@ -212,6 +248,19 @@ def build_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Capture a fresh OBS screenshot for every timed run instead of reusing one still image.",
     )
+    parser.add_argument(
+        "--scene-rectangles",
+        action="store_true",
+        help="OCR the composite of the scene's configured OCR rectangles instead of the full frame.",
+    )
+    parser.add_argument(
+        "--per-rectangle",
+        action="store_true",
+        help=(
+            "OCR each configured rectangle separately, skipping unchanged ones (implies --scene-rectangles). "
+            "Combine with --recapture-each-run to measure live dialogue."
+        ),
+    )
     parser.add_argument(
         "--keep-going",
         action="store_true",
@@ -244,6 +293,23 @@ def main() -> int:
         img_format=args.img_format,
     )
 
+    use_scene_rectangles = args.scene_rectangles or args.per_rectangle
+    region_runner = None
+    if args.per_rectangle:
+        from GameSentenceMiner.ocr.region_ocr import RegionOCRRunner
+
+        region_runner = RegionOCRRunner()
+
+    def next_image():
+        image = (
+            capture_obs_image(compression=args.compression, img_format=args.img_format)[2]
+            if args.recapture_each_run
+            else base_image
+        )
+        if use_scene_rectangles:
+            return crop_to_scene_rectangles(image)
+        return image, None
+
     print(f"Python executable: {sys.executable}")
     print(f"Engine: {engine_instance.name} ({engine_instance.readable_name})")
     print(f"Scene: {scene_name or '<unknown>'}")
@@ -253,6 +319,12 @@ def main() -> int:
         "Capture mode: "
         + ("fresh OBS screenshot every iteration" if args.recapture_each_run else "single OBS screenshot reused")
     )
+    if args.per_rectangle:
+        print("OCR area: per rectangle (unchanged rectangles reused)")
+    elif use_scene_rectangles:
+        print("OCR area: scene rectangle composite")
+    else:
+        print("OCR area: full frame")
     print(f"Warmup iterations: {args.warmup}")
     print(f"Timed iterations: {args.iterations}")
     print("")
@@ -260,12 +332,8 @@ def main() -> int:
     first_result = None
     warmup_failures = 0
     for _ in range(args.warmup):
-        image = (
-            capture_obs_image(compression=args.compression, img_format=args.img_format)[2]
-            if args.recapture_each_run
-            else base_image
-        )
-        result = run_ocr_once(engine_instance, image)
+        image, image_metadata = next_image()
+        result = run_ocr_once(engine_instance, image, image_metadata, region_runner)
         if first_result is None:
             first_result = result
         if not result["success"]:
@@ -278,17 +346,16 @@ def main() -> int:
     success_texts: list[str] = []
     failure_messages: list[str] = []
     failure_count = 0
+    region_totals = Counter()
     benchmark_started = time.perf_counter()
 
     for iteration_index in range(args.iterations):
-        image = (
-            capture_obs_image(compression=args.compression, img_format=args.img_format)[2]
-            if args.recapture_each_run
-            else base_image
-        )
-        result = run_ocr_once(engine_instance, image)
+        image, image_metadata = next_image()
+        result = run_ocr_once(engine_instance, image, image_metadata, region_runner)
         if first_result is None:
             first_result = result
+        if result["region_stats"]:
+            region_totals.update(result["region_stats"])
 
         if result["success"]:
             latencies.append(result["elapsed_seconds"])
@@ -334,6 +401,11 @@ def main() -> int:
     print(f"Median FPS-style speed: {summary['median_fps']:.2f}")
     print(f"1% low FPS-style speed: {summary['low_1_percent_fps']:.2f}")
     print(f"1% high FPS-style speed: {summary['high_1_percent_fps']:.2f}")
+    if region_totals:
+        print(
+            f"Rectangles OCR'd: {region_totals['changed']}/{region_totals['regions']} "
+            f"({region_totals['reused']} reused unchanged)"
+        )
     print(f"Unique OCR outputs: {unique_text_count}")
     print(f"Most common OCR output frequency: {most_common_text_count}/{len(success_texts)} ({stability_ratio:.2%})")
     print(f"First OCR preview: {preview_text or '<blank>'}")
@@ -24,6 +24,10 @@ Usage
 
     # custom resolution comparison
     python scripts/benchmark_obs_screenshot_capture.py --widths 1280 1920 --heights 720 1080
+
+    # end-to-end latency of each consumer's capture format (request + decode)
+    python scripts/benchmark_obs_screenshot_capture.py --methods obs_source \\
+        --profiles change_detection ocr lossless --widths 1280 --heights 720
 """
 
 from __future__ import annotations
@@ -128,6 +132,32 @@ def ms(s: float) -> float:
 # ---------------------------------------------------------------------------
 
 
+# Consumer capture formats from GameSentenceMiner.obs.screenshot_capture.
+CAPTURE_PROFILES = ("change_detection", "ocr", "lossless")
+
+
+def resolve_capture_profile(profile: str) -> tuple[str, int]:
+    """Return ``(img_format, compression)`` for a consumer capture profile."""
+    from GameSentenceMiner.obs.screenshot_capture import (
+        CAPTURE_FORMAT_CHANGE_DETECTION,
+        CAPTURE_FORMAT_LOSSLESS,
+        CAPTURE_FORMAT_OCR,
+    )
+
+    capture_format = {
+        "change_detection": CAPTURE_FORMAT_CHANGE_DETECTION,
+        "ocr": CAPTURE_FORMAT_OCR,
+        "lossless": CAPTURE_FORMAT_LOSSLESS,
+    }[profile]
+    return capture_format.img_format, capture_format.compression
+
+
+def decoder_for_format(img_format: str) -> str:
+    from GameSentenceMiner.obs.screenshot_capture import screenshot_decoder_name
+
+    return screenshot_decoder_name(img_format)
+
+
 class CaptureMethod(enum.Enum):
     OBS_SOURCE = "obs_source"  # websocket → best video source auto-detected in scene
     OBS_SCENE = "obs_scene"  # websocket → scene name used directly as the OBS source
@@ -142,6 +172,7 @@ class CaptureConfig:
     width: int | None = None
     height: int | None = None
     preprocess_mode: str = "none"
+    profile: str | None = None
 
     @property
     def label(self) -> str:
@@ -155,7 +186,8 @@ class CaptureConfig:
             res = "source"
         if self.method == CaptureMethod.WGC:
             return f"{self.method.value} {res}"
-        return f"{self.method.value} {self.img_format} q={self.compression} {res} pp={self.preprocess_mode}"
+        profile = f" profile={self.profile}" if self.profile else ""
+        return f"{self.method.value}{profile} {self.img_format} q={self.compression} {res} pp={self.preprocess_mode}"
 
 
 @dataclass
@@ -166,6 +198,7 @@ class BenchResult:
     image_size: tuple[int, int] | None = None
     image_bytes: int = 0
     cpu_pct: float | None = None  # avg process CPU% over the timed run
+    decoder: str | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -318,6 +351,16 @@ def build_parser() -> argparse.ArgumentParser:
         default=[90],
         help="Compression/quality values to test (OBS methods only, 0-100).",
     )
+    p.add_argument(
+        "--profiles",
+        nargs="+",
+        default=None,
+        choices=list(CAPTURE_PROFILES),
+        help=(
+            "Consumer capture profiles to test (OBS methods only). Replaces the "
+            "--formats/--compressions matrix with each profile's format and quality."
+        ),
+    )
     p.add_argument(
         "--widths",
         nargs="+",
@@ -393,20 +436,25 @@ def build_configs(args: argparse.Namespace, selected_methods: list[CaptureMethod
             for w, h in resolutions:
                 configs.append(CaptureConfig(method=method, width=w, height=h))
             continue
-        for fmt in args.formats:
-            for comp in args.compressions:
-                for w, h in resolutions:
-                    for pp in args.preprocess_modes:
-                        configs.append(
-                            CaptureConfig(
-                                method=method,
-                                img_format=fmt,
-                                compression=comp,
-                                width=w,
-                                height=h,
-                                preprocess_mode=pp,
-                            )
+        profiles = getattr(args, "profiles", None)
+        if profiles:
+            formats = [(resolve_capture_profile(profile), profile) for profile in profiles]
+        else:
+            formats = [((fmt, comp), None) for fmt in args.formats for comp in args.compressions]
+        for (fmt, comp), profile in formats:
+            for w, h in resolutions:
+                for pp in args.preprocess_modes:
+                    configs.append(
+                        CaptureConfig(
+                            method=method,
+                            img_format=fmt,
+                            compression=comp,
+                            width=w,
+                            height=h,
+                            preprocess_mode=pp,
+                            profile=profile,
                         )
+                    )
     return configs
 
 
@@ -481,6 +529,8 @@ def run_config(
     import psutil
 
     result = BenchResult(config=config)
+    if config.method != CaptureMethod.WGC:
+        result.decoder = decoder_for_format(config.img_format)
     kwargs = dict(source_name=source_name, scene_name=scene_name, window_handle=window_handle)
 
     for _ in range(warmup):
@@ -531,6 +581,8 @@ def print_result_detail(r: BenchResult, rank: int | None = None) -> None:
     cpu_str = f"{r.cpu_pct:.1f}%" if r.cpu_pct is not None else "n/a"
     print(f"{prefix}{r.config.label}")
     print(f"  Output size : {size_str}  |  Decoded PNG : {kb:.1f} KB")
+    if r.decoder:
+        print(f"  Decoder     : {r.decoder}")
     print(f"  Captures    : {len(r.latencies)}/{len(r.latencies) + r.failures}  failures={r.failures}")
     print(f"  CPU (proc)  : {cpu_str}  (avg process CPU% over timed run, 100%=1 core)")
     print(f"  Avg         : {ms(s['avg_s']):.2f} ms  ({s['avg_fps']:.1f} fps)")
@@ -602,8 +654,11 @@ def main() -> int:
     elif has_native_methods and not needs_obs:
         print("Pacing   : disabled (no OBS method for reference)")
     if any(m not in native_methods for m in selected_methods):
-        print(f"Formats  : {args.formats}")
-        print(f"Compress : {args.compressions}")
+        if args.profiles:
+            print(f"Profiles : {args.profiles}")
+        else:
+            print(f"Formats  : {args.formats}")
+            print(f"Compress : {args.compressions}")
         print(f"Preproc  : {args.preprocess_modes}")
     print("")
 
@@ -49,6 +49,14 @@ _BENCHMARK_TABLES = (
 _TEMP_ROOT = _normalise_windows_path(REPO_ROOT) / ".tmp_test_env" / "benchmark"
 _ANKI_PAGE_SECTIONS = "earliest_date,kanji_stats,game_stats"
 _ANKI_COMBINED_SECTIONS = "earliest_date,kanji_stats,game_stats,reading_impact"
+_LEGACY_TIMESTAMP_EXPR = "CAST(timestamp AS REAL)"
+_TIMESTAMP_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_game_lines_timestamp ON game_lines(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_game_lines_game_id_timestamp ON game_lines(game_id, timestamp)",
+)
+_TOKENIZED_TIMESTAMP_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_game_lines_tokenized_timestamp ON game_lines(tokenized, timestamp)"
+)
 
 
 @dataclass(frozen=True)
@@ -69,6 +77,17 @@ class EndpointMeasurement:
     max_ms: float
 
 
+@dataclass(frozen=True)
+class RangeQueryMeasurement:
+    query: str
+    rows: int
+    results_match: bool
+    legacy_mean_ms: float
+    sargable_mean_ms: float
+    legacy_plan: str
+    sargable_plan: str
+
+
 class _NoopLogger:
     def __getattr__(self, _name: str):
         def _noop(*_args, **_kwargs):
@@ -206,6 +225,97 @@ def resolve_selection(
     return BenchmarkSelection(game_id=game_id, today_date=today_date)
 
 
+def _table_columns(conn: sqlite3.Connection, table_name: str) -> set[str]:
+    return {str(row[1]) for row in conn.execute(f"PRAGMA table_info({table_name})").fetchall()}
+
+
+def ensure_timestamp_indexes(db_path: Path) -> None:
+    """Create the game_lines timestamp indexes on a snapshot that predates the migration."""
+    with sqlite3.connect(db_path, check_same_thread=False) as conn:
+        for statement in _TIMESTAMP_INDEXES:
+            conn.execute(statement)
+        if "tokenized" in _table_columns(conn, "game_lines"):
+            conn.execute(_TOKENIZED_TIMESTAMP_INDEX)
+
+
+def _range_queries(
+    columns: set[str],
+    selection: BenchmarkSelection,
+) -> dict[str, tuple[str, tuple]]:
+    """Date-bounded queries keyed by name, with ``{ts}`` standing in for the timestamp expression."""
+    day = datetime.date.fromisoformat(selection.today_date)
+    day_start = datetime.datetime.combine(day, datetime.time.min).timestamp()
+    day_end = datetime.datetime.combine(day, datetime.time.max).timestamp()
+    month_start = datetime.datetime.combine(day - datetime.timedelta(days=30), datetime.time.min).timestamp()
+
+    queries = {
+        "day_lines": (
+            "SELECT COUNT(*), SUM(LENGTH(line_text)) FROM game_lines WHERE {ts} >= ? AND {ts} <= ?",
+            (day_start, day_end),
+        ),
+        "day_lines_ordered": (
+            "SELECT id, timestamp FROM game_lines WHERE {ts} >= ? AND {ts} <= ? ORDER BY {ts} DESC LIMIT 100",
+            (day_start, day_end),
+        ),
+    }
+    if selection.game_id:
+        queries["game_month_lines"] = (
+            "SELECT COUNT(*) FROM game_lines WHERE game_id = ? AND {ts} >= ? AND {ts} <= ?",
+            (selection.game_id, month_start, day_end),
+        )
+    if "tokenized" in columns:
+        queries["untokenized_day_lines"] = (
+            "SELECT COUNT(*) FROM game_lines WHERE {ts} >= ? AND {ts} < ? AND tokenized = 0",
+            (day_start, day_end),
+        )
+    return queries
+
+
+def _time_query(conn: sqlite3.Connection, sql: str, params: tuple, iterations: int, warmup: int) -> tuple[float, list]:
+    rows: list = []
+    for _ in range(max(warmup, 0)):
+        conn.execute(sql, params).fetchall()
+    samples_ms: list[float] = []
+    for _ in range(max(iterations, 1)):
+        started_at = time.perf_counter()
+        rows = conn.execute(sql, params).fetchall()
+        samples_ms.append((time.perf_counter() - started_at) * 1000.0)
+    return statistics.mean(samples_ms), rows
+
+
+def _query_plan(conn: sqlite3.Connection, sql: str, params: tuple) -> str:
+    return "; ".join(str(row[-1]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall())
+
+
+def benchmark_range_queries(
+    db_path: Path,
+    selection: BenchmarkSelection,
+    iterations: int,
+    warmup: int,
+) -> list[RangeQueryMeasurement]:
+    """Time each date-bounded query with the legacy CAST predicate and the sargable one."""
+    measurements: list[RangeQueryMeasurement] = []
+    with _connect_read_only(db_path) as conn:
+        queries = _range_queries(_table_columns(conn, "game_lines"), selection)
+        for name, (template, params) in queries.items():
+            legacy_sql = template.format(ts=_LEGACY_TIMESTAMP_EXPR)
+            sargable_sql = template.format(ts="timestamp")
+            legacy_ms, legacy_rows = _time_query(conn, legacy_sql, params, iterations, warmup)
+            sargable_ms, sargable_rows = _time_query(conn, sargable_sql, params, iterations, warmup)
+            measurements.append(
+                RangeQueryMeasurement(
+                    query=name,
+                    rows=len(sargable_rows),
+                    results_match=legacy_rows == sargable_rows,
+                    legacy_mean_ms=legacy_ms,
+                    sargable_mean_ms=sargable_ms,
+                    legacy_plan=_query_plan(conn, legacy_sql, params),
+                    sargable_plan=_query_plan(conn, sargable_sql, params),
+                )
+            )
+    return measurements
+
+
 def _install_noop_logging_module() -> None:
     noop_logger = _NoopLogger()
     fake_logging_module = types.ModuleType("GameSentenceMiner.util.logging_config")
@@ -430,6 +540,7 @@ def build_output_payload(
     row_counts: dict[str, int],
     selection: BenchmarkSelection,
     measurements: list[EndpointMeasurement],
+    range_measurements: list[RangeQueryMeasurement] | None = None,
 ) -> dict[str, Any]:
     return {
         "db_metadata": {
@@ -440,6 +551,7 @@ def build_output_payload(
         },
         "selection": asdict(selection),
         "results": {measurement.endpoint: asdict(measurement) for measurement in measurements},
+        "range_queries": {measurement.query: asdict(measurement) for measurement in range_measurements or []},
     }
 
 
@@ -479,6 +591,14 @@ def print_human_summary(payload: dict[str, Any]) -> None:
             f"min={result['min_ms']:.2f}ms mean={result['mean_ms']:.2f}ms max={result['max_ms']:.2f}ms"
         )
 
+    for query_name, result in payload.get("range_queries", {}).items():
+        print(
+            f"range:{query_name}: rows={result['rows']} match={result['results_match']} "
+            f"cast={result['legacy_mean_ms']:.2f}ms sargable={result['sargable_mean_ms']:.2f}ms"
+        )
+        print(f"  cast plan: {result['legacy_plan']}")
+        print(f"  sargable plan: {result['sargable_plan']}")
+
 
 def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
     source_db_path = Path(args.db_path).expanduser().resolve()
@@ -493,6 +613,8 @@ def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
     benchmark_db_path = source_db_path
     if args.db_mode == "snapshot":
         benchmark_db_path = create_snapshot_db(source_db_path, snapshot_path)
+        if args.range_queries:
+            ensure_timestamp_indexes(benchmark_db_path)
 
     try:
         row_counts = get_table_row_counts(benchmark_db_path)
@@ -540,6 +662,12 @@ def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
         finally:
             benchmark_client.close()
 
+        range_measurements = (
+            benchmark_range_queries(benchmark_db_path, selection, args.iterations, args.warmup)
+            if args.range_queries
+            else []
+        )
+
         payload = build_output_payload(
             source_db_path=source_db_path,
             effective_db_path=benchmark_db_path,
@@ -547,6 +675,7 @@ def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
             row_counts=row_counts,
             selection=selection,
             measurements=measurements,
+            range_measurements=range_measurements,
         )
 
         if args.json_out:
@@ -602,6 +731,11 @@ def build_parser() -> argparse.ArgumentParser:
         default="latest-activity",
         help="Benchmark day for /api/today-stats: latest-activity or YYYY-MM-DD.",
     )
+    parser.add_argument(
+        "--range-queries",
+        action="store_true",
+        help="Also time date-bounded game_lines queries with and without CAST(timestamp AS REAL).",
+    )
     parser.add_argument(
         "--json-out",
         default=None,
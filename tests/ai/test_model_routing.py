@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+
+import pytest
+
+from GameSentenceMiner.ai.contracts import AIError, AIRequest, AIResponse
+from GameSentenceMiner.ai.routing import CIRCUIT_CLOSED, CIRCUIT_OPEN, ModelRouter
+from GameSentenceMiner.ai.service import AIService, snapshot_config
+from GameSentenceMiner.util import gsm_utils
+from GameSentenceMiner.util.config.configuration import AI_OLLAMA, Ai, General
+
+
+class _StubRegistry:
+    def __init__(self, client):
+        self._client = client
+
+    def get_client(self, _config):
+        return self._client
+
+
+class _StubModels:
+    """Local provider stub whose models can be made slow or failing."""
+
+    def __init__(self):
+        self.latency: dict[str, float] = {}
+        self.failing: set[str] = set()
+        self.models_seen: list[str] = []
+        self._lock = threading.Lock()
+
+    def generate(self, request: AIRequest) -> AIResponse:
+        with self._lock:
+            self.models_seen.append(request.model)
+        time.sleep(self.latency.get(request.model, 0.0))
+        if request.model in self.failing:
+            raise AIError(f"{request.model} failed", transient=True)
+        text = f'{{"output":"{request.model}"}}'
+        return AIResponse(provider=request.provider, model=request.model, text=text, raw_text=text, latency_ms=0)
+
+
+def _service(client, router) -> AIService:
+    ai_config = Ai(provider=AI_OLLAMA, ollama_model="primary", ollama_backup_model="backup")
+    return AIService(
+        config_snapshot=snapshot_config(ai_config, General()),
+        logger=logging.getLogger("test.ai.routing"),
+        registry=_StubRegistry(client),
+        router=router,
+    )
+
+
+def _run(service: AIService) -> AIResponse:
+    return service._execute_request(service._make_request('{"output":"hi"}', request_kind="raw"))
+
+
+@pytest.fixture
+def clock():
+    now = [0.0]
+
+    def _clock():
+        return now[0]
+
+    _clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+    return _clock
+
+
+def test_failing_primary_opens_circuit_and_half_open_probe_recovers(clock):
+    client = _StubModels()
+    router = ModelRouter(failure_threshold=2, cooldown_seconds=30, clock=clock)
+    service = _service(client, router)
+    client.failing.add("primary")
+
+    for _ in range(2):
+        assert _run(service).model == "backup"
+    client.models_seen.clear()
+    assert _run(service).model == "backup"
+    assert client.models_seen == ["backup"]
+    assert router.health_snapshot()["models"][f"{AI_OLLAMA}/primary"]["state"] == CIRCUIT_OPEN
+
+    client.failing.clear()
+    clock.advance(31)
+    client.models_seen.clear()
+    assert _run(service).model == "primary"
+    assert client.models_seen == ["primary"]
+    assert router.health_snapshot()["models"][f"{AI_OLLAMA}/primary"]["state"] == CIRCUIT_CLOSED
+
+
+def test_failed_half_open_probe_reopens_circuit(clock):
+    client = _StubModels()
+    router = ModelRouter(failure_threshold=1, cooldown_seconds=10, clock=clock)
+    service = _service(client, router)
+    client.failing.add("primary")
+
+    _run(service)
+    clock.advance(11)
+    client.models_seen.clear()
+    assert _run(service).model == "backup"
+
+    assert client.models_seen == ["primary", "backup"]
+    client.models_seen.clear()
+    _run(service)
+    assert client.models_seen == ["backup"]
+
+
+class _RecordingLogger:
+    """Keeps messages the way loguru would print them: no %-style argument merging."""
+
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def _record(self, message, *args):
+        self.messages.append(message)
+
+    info = warning = error = debug = _record
+
+
+def test_router_log_messages_are_formatted(clock):
+    client = _StubModels()
+    recorder = _RecordingLogger()
+    router = ModelRouter(failure_threshold=1, cooldown_seconds=30, clock=clock, logger=recorder)
+    service = _service(client, router)
+    client.failing.add("primary")
+
+    _run(service)
+    _run(service)
+
+    assert "AI model 'primary' circuit opened after 1 consecutive failures." in recorder.messages
+    assert "AI model 'primary' circuit is open; using backup 'backup'." in recorder.messages
+    assert not any("%" in message for message in recorder.messages)
+
+
+def test_slow_primary_is_hedged_to_backup_after_its_p95():
+    client = _StubModels()
+    router = ModelRouter(min_hedge_delay=0.05)
+    service = _service(client, router)
+    for _ in range(5):
+        _run(service)
+
+    client.latency["primary"] = 1.0
+    started = time.perf_counter()
+    response = _run(service)
+    elapsed = time.perf_counter() - started
+
+    assert response.model == "backup"
+    assert elapsed < 0.6
+    stats = router.health_snapshot()
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+
+
+def test_no_hedging_without_latency_history_or_backup():
+    client = _StubModels()
+    router = ModelRouter(min_hedge_delay=0.01)
+    client.latency["primary"] = 0.1
+    service = _service(client, router)
+
+    assert _run(service).model == "primary"
+    assert client.models_seen == ["primary"]
+
+
+def test_connectivity_probe_is_cached(monkeypatch):
+    calls = []
+
+    class _Connection:
+        def close(self):
+            pass
+
+    def fake_create_connection(address, timeout):
+        calls.append(address)
+        return _Connection()
+
+    monkeypatch.setattr(socket, "create_connection", fake_create_connection)
+    monkeypatch.setattr(gsm_utils, "_connectivity_checked_at", 0.0)
+
+    assert gsm_utils.is_connected_cached()
+    assert gsm_utils.is_connected_cached()
+    assert len(calls) == 1
+    monkeypatch.setattr(gsm_utils, "_connectivity_checked_at", time.monotonic() - gsm_utils.CONNECTIVITY_TTL_SECONDS)
+    assert gsm_utils.is_connected_cached()
+    assert len(calls) == 2
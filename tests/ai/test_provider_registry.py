@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from GameSentenceMiner.ai.providers import ollama_client
+from GameSentenceMiner.ai.registry import ProviderRegistry
+from GameSentenceMiner.util.config.configuration import AI_OLLAMA, Ai
+
+
+def test_concurrent_lookups_share_one_client(monkeypatch):
+    built = []
+
+    class _SlowClient:
+        def __init__(self, api_url, logger):
+            time.sleep(0.05)
+            built.append(self)
+
+    monkeypatch.setattr(ollama_client, "OllamaClient", _SlowClient)
+    registry = ProviderRegistry(logging.getLogger(__name__))
+    config = Ai(provider=AI_OLLAMA, ollama_url="http://localhost:11434", ollama_model="model")
+    start = threading.Barrier(4)
+    clients = []
+
+    def lookup():
+        start.wait()
+        clients.append(registry.get_client(config))
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(client is built[0] for client in clients)
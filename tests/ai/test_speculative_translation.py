@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from GameSentenceMiner import anki
+from GameSentenceMiner.ai import speculative_translation
+from GameSentenceMiner.ai.speculative_translation import SpeculativeTranslator, estimate_tokens
+from GameSentenceMiner.util.text_log import GameLine
+
+
+def _line(index: int, text: str = "") -> GameLine:
+    return GameLine(
+        id=f"spec-{index}", text=text or f"台詞{index}", time=datetime.now(), prev=None, next=None, index=index
+    )
+
+
+class _SlowProvider:
+    """Stub provider that injects a fixed latency per translation."""
+
+    def __init__(self, latency: float = 0.0, gate: threading.Event | None = None):
+        self.latency = latency
+        self.gate = gate
+        self.started = threading.Event()
+        self.translated: list[str] = []
+
+    def __call__(self, line: GameLine) -> str:
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.latency)
+        self.translated.append(line.id)
+        return f"EN {line.text}"
+
+
+@pytest.fixture
+def translator_factory():
+    created = []
+
+    def _make(provider, **kwargs):
+        translator = SpeculativeTranslator(provider, **kwargs)
+        created.append(translator)
+        return translator
+
+    yield _make
+    for translator in created:
+        translator.shutdown(wait=True)
+
+
+def test_mining_finds_translation_ready_after_background_latency(translator_factory, monkeypatch):
+    provider = _SlowProvider(latency=0.2)
+    translator = translator_factory(provider)
+    monkeypatch.setattr(speculative_translation, "_translator", translator)
+    monkeypatch.setattr(anki, "translate_sentence_for_line", lambda *_args: pytest.fail("provider called twice"))
+    line = _line(1)
+
+    assert translator.submit(line)
+    time.sleep(0.35)
+    started = time.perf_counter()
+    translation = anki.prefetch_ai_translation(line.text, line)
+    elapsed = time.perf_counter() - started
+
+    assert translation == f"EN {line.text}"
+    assert line.translation == translation
+    assert elapsed < 0.05
+    stats = translator.stats()
+    assert stats["completed"] == 1 and stats["ready_hits"] == 1
+    assert stats["avg_latency_ms"] >= 200
+
+
+def test_mining_waits_on_in_flight_work_instead_of_requesting_again(translator_factory):
+    translator = translator_factory(_SlowProvider(latency=0.2))
+    line = _line(2)
+
+    translator.submit(line)
+
+    assert translator.result_for(line, timeout=2.0) == f"EN {line.text}"
+    assert translator.stats()["waited_hits"] == 1
+
+
+def test_lines_scrolling_out_of_window_are_cancelled_before_running(translator_factory):
+    gate = threading.Event()
+    provider = _SlowProvider(gate=gate)
+    translator = translator_factory(provider, max_concurrency=1, window_size=2)
+    lines = [_line(index) for index in range(4)]
+
+    assert translator.submit(lines[0])
+    assert provider.started.wait(5)
+    for line in lines[1:]:
+        assert translator.submit(line)
+    gate.set()
+    for line in lines[2:]:
+        assert translator.result_for(line, timeout=2.0)
+
+    # Line 0 was already running; line 1 was still queued when it left the window.
+    assert provider.translated == ["spec-0", "spec-2", "spec-3"]
+    assert lines[1].translation == ""
+    assert translator.stats()["cancelled"] == 1
+
+
+def test_token_budget_defers_speculation_until_the_window_rolls(translator_factory):
+    now = [1000.0]
+    text = "あ" * 10
+    translator = translator_factory(
+        _SlowProvider(), tokens_per_minute=2 * estimate_tokens(text), clock=lambda: now[0]
+    )
+
+    assert translator.submit(_line(1, text))
+    assert translator.submit(_line(2, text))
+    assert not translator.submit(_line(3, text))
+    now[0] += 61
+    assert translator.submit(_line(4, text))
+    assert translator.stats()["over_budget"] == 1
+
+
+def test_lines_with_a_translation_are_not_resubmitted(translator_factory):
+    translator = translator_factory(_SlowProvider())
+    line = _line(5)
+    line.translation = "already"
+
+    assert not translator.submit(line)
+    assert translator.stats()["submitted"] == 0
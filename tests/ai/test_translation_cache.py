@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from GameSentenceMiner.ai.contracts import AIRequest
+from GameSentenceMiner.ai.service import AIService, snapshot_config
+from GameSentenceMiner.ai.translation_cache import TranslationCache, fingerprint
+from GameSentenceMiner.util.config.configuration import AI_OLLAMA, Ai, General
+from GameSentenceMiner.util.database.db import AITranslationCacheTable, SQLiteDB
+from GameSentenceMiner.util.text_log import GameLine
+
+
+class _OllamaStub:
+    """Local stand-in for an Ollama server's /api/chat endpoint."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["messages"][-1]["content"]
+                stub.prompts.append(prompt)
+                response = json.dumps(
+                    {
+                        "model": body["model"],
+                        "created_at": "2024-01-01T00:00:00Z",
+                        "message": {"role": "assistant", "content": json.dumps({"output": f"EN#{len(stub.prompts)}"})},
+                        "done": True,
+                    }
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *_args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def cache_db():
+    original_db = AITranslationCacheTable._db
+    db = SQLiteDB(":memory:")
+    AITranslationCacheTable.set_db(db)
+    yield db
+    db.close()
+    AITranslationCacheTable._db = original_db
+
+
+@pytest.fixture
+def ollama_stub():
+    stub = _OllamaStub()
+    yield stub
+    stub.close()
+
+
+def _lines(*texts):
+    return [
+        GameLine(id=f"line-{i}", text=text, time=datetime.now(), prev=None, next=None, index=i)
+        for i, text in enumerate(texts)
+    ]
+
+
+def _request(prompt: str, model: str = "llama3") -> AIRequest:
+    return AIRequest(provider=AI_OLLAMA, model=model, prompt=prompt, temperature=0.3, top_p=0.9, max_tokens=64)
+
+
+def test_same_line_mined_twice_is_translated_once(cache_db, ollama_stub):
+    cache = TranslationCache()
+    ai_config = Ai(provider=AI_OLLAMA, ollama_url=ollama_stub.url, ollama_model="llama3")
+    service = AIService(
+        config_snapshot=snapshot_config(ai_config, General()),
+        logger=logging.getLogger("test.ai.translation_cache"),
+        translation_cache=cache,
+    )
+
+    first_card = _lines("おはよう", "元気？")
+    second_card = _lines("おはよう", "元気？")
+    first = service.translate(first_card, "元気？", first_card[1])
+    second = service.translate(second_card, "元気？", second_card[1])
+    other = service.translate(first_card, "おはよう", first_card[0])
+
+    assert first == second == "EN#1"
+    assert second_card[1].translation == "EN#1"
+    assert other == "EN#2"
+    assert len(ollama_stub.prompts) == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+
+class _ContextProvider:
+    """Character context stub that records whether generation was allowed."""
+
+    def __init__(self, stored: str = "", generated: str = ""):
+        self.stored = stored
+        self.generated = generated
+        self.calls: list[bool] = []
+
+    def get_character_context(self, game_title, ai_service, generate=True):
+        self.calls.append(generate)
+        return self.generated if generate and not self.stored else self.stored
+
+
+def test_offline_miss_never_generates_character_context(cache_db, ollama_stub, monkeypatch):
+    from GameSentenceMiner.ai import service as service_module
+
+    ai_config = Ai(provider=AI_OLLAMA, ollama_url=ollama_stub.url, ollama_model="llama3")
+    service = AIService(
+        config_snapshot=snapshot_config(ai_config, General()),
+        logger=logging.getLogger("test.ai.translation_cache"),
+        translation_cache=TranslationCache(),
+    )
+    context = _ContextProvider(generated="Character A is calm.")
+    service.character_context_provider = context
+    card = _lines("おはよう")
+
+    monkeypatch.setattr(service_module, "_requires_internet", lambda _config: True)
+    monkeypatch.setattr(service_module, "is_connected_cached", lambda: False)
+    assert service.translate(card, "おはよう", card[0], game_title="Game") == ""
+    assert context.calls == [False]
+
+    monkeypatch.setattr(service_module, "is_connected_cached", lambda: True)
+    assert service.translate(card, "おはよう", card[0], game_title="Game") == "EN#1"
+    assert context.calls == [False, False, True]
+    assert "Character A is calm." in ollama_stub.prompts[0]
+
+
+def test_fingerprint_separates_models_and_prompt_versions():
+    request = _request("prompt")
+
+    assert fingerprint(request) != fingerprint(_request("prompt", model="qwen2.5"))
+    assert fingerprint(request, prompt_version="1") != fingerprint(request, prompt_version="2")
+    assert fingerprint(request) == fingerprint(_request("prompt"))
+
+
+def test_expired_entries_miss_and_eviction_keeps_recently_used(cache_db):
+    cache = TranslationCache(ttl_seconds=100)
+    for index in range(3):
+        AITranslationCacheTable.store(f"key-{index}", AI_OLLAMA, "llama3", "1", f"t{index}", now=1000.0 + index)
+    AITranslationCacheTable.lookup("key-0", min_created_at=0, now=2000.0)
+
+    evicted = AITranslationCacheTable.evict(min_created_at=0, max_entries=2)
+
+    assert evicted == 1
+    assert AITranslationCacheTable.lookup("key-1", min_created_at=0) is None
+    assert AITranslationCacheTable.lookup("key-0", min_created_at=0) == "t0"
+    # Everything stored above is far older than the 100 s TTL.
+    cache.put(_request("fresh"), "fresh translation")
+    assert cache.get(_request("fresh")) == "fresh translation"
+    assert AITranslationCacheTable.lookup("key-2", min_created_at=1500.0) is None
+    assert AITranslationCacheTable.count() == 2
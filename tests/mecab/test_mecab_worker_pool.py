@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from GameSentenceMiner.mecab.basic_mecab_controller import BasicMecabController
+from GameSentenceMiner.mecab.mecab_worker_pool import MecabWorkerPool, with_worker_eos
+
+# Speaks MeCab's line protocol: one response per input line, closed by the EOS format.
+_FAKE_MECAB = textwrap.dedent(
+    """
+    import sys, time
+
+    eos = "EOS\\\\n"
+    for arg in sys.argv[1:]:
+        if arg.startswith("--eos-format="):
+            eos = arg[len("--eos-format="):]
+    eos = eos.replace("\\\\n", "\\n").encode()
+    for raw in sys.stdin.buffer:
+        line = raw.rstrip(b"\\n")
+        if line == b"HANG":
+            time.sleep(60)
+        if line == b"CRASH":
+            sys.stdout.buffer.write(b"partial")
+            sys.stdout.buffer.flush()
+            sys.exit(3)
+        for word in line.split():
+            sys.stdout.buffer.write(word + b"\\tnoun\\n")
+        sys.stdout.buffer.write(eos)
+        sys.stdout.buffer.flush()
+    """
+)
+
+
+@pytest.fixture()
+def fake_mecab_cmd(tmp_path):
+    script = tmp_path / "fake_mecab.py"
+    script.write_text(_FAKE_MECAB, encoding="utf-8")
+    return [sys.executable, str(script)]
+
+
+@pytest.fixture()
+def make_pool(fake_mecab_cmd):
+    pools = []
+
+    def factory(**kwargs):
+        pool = MecabWorkerPool(fake_mecab_cmd, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+def test_worker_eos_keeps_the_callers_format():
+    assert with_worker_eos(["mecab", "--eos-format=<footer>", "-b", "1"]) == [
+        "mecab",
+        "-b",
+        "1",
+        "--eos-format=<footer><gsm_worker_eos>\\n",
+    ]
+    assert with_worker_eos(["mecab"])[-1] == "--eos-format=EOS\\n<gsm_worker_eos>\\n"
+
+
+def test_persistent_output_matches_spawn_per_call(fake_mecab_cmd):
+    persistent = BasicMecabController(mecab_cmd=fake_mecab_cmd, mecab_args=["--eos-format=<footer>"])
+    spawn = BasicMecabController(mecab_cmd=fake_mecab_cmd, mecab_args=["--eos-format=<footer>"], persistent=False)
+    try:
+        exprs = ["猫 が 好き", "", "一行目\n二行 目"]
+        assert persistent.run_batch(exprs) == [spawn.run_once(expr) for expr in exprs]
+        assert persistent.run("猫 が 好き") == "猫\tnoun\nが\tnoun\n好き\tnoun\n<footer>"
+        assert persistent.worker_stats()["started"] == 1
+    finally:
+        persistent.close()
+
+
+def test_concurrent_callers_get_their_own_responses(make_pool):
+    pool = make_pool(size=2)
+    errors = []
+
+    def caller(index: int) -> None:
+        exprs = [f"t{index} l{i}" for i in range(50)]
+        expected = [f"t{index}\tnoun\nl{i}\tnoun\nEOS\n".encode() for i in range(50)]
+        if pool.run_batch(exprs) != expected:
+            errors.append(index)
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert pool.stats()["started"] <= 2
+    assert pool.stats()["lines"] == 400
+
+
+def test_hung_worker_is_killed_and_the_rest_of_the_batch_resent(make_pool):
+    pool = make_pool(size=1, timeout=0.5)
+
+    assert pool.run_batch(["a", "HANG", "b"]) == [b"a\tnoun\nEOS\n", b"", b"b\tnoun\nEOS\n"]
+
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["restarts"] == 1
+    assert stats["started"] == 2
+
+
+def test_crashed_worker_is_replaced(make_pool):
+    pool = make_pool(size=1)
+
+    assert pool.run_batch(["CRASH", "c"]) == [b"partial", b"c\tnoun\nEOS\n"]
+    assert pool.run_batch(["d"]) == [b"d\tnoun\nEOS\n"]
+    assert pool.stats()["restarts"] == 1
+    assert pool.stats()["timeouts"] == 0
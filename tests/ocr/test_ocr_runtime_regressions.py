@@ -653,6 +653,60 @@ def test_second_ocr_prefers_google_lens_overlay_payload(monkeypatch):
     assert sent[0]["response_dict"]["line_coords"] == lens_payload["line_coords"]
 
 
+def test_interactive_second_ocr_does_not_wait_behind_queued_deliveries(monkeypatch):
+    sent = []
+    ctrl = SimpleNamespace(last_sent_result="", last_ocr2_result=[], config=gsm_ocr.TwoPassConfig())
+    sequencer = gsm_ocr.DeliverySequencer()
+    sequencer.take_ticket()  # A queued automatic task that is still running OCR.
+
+    monkeypatch.setattr(gsm_ocr, "second_pass_delivery", sequencer)
+    monkeypatch.setattr(gsm_ocr, "get_controller", lambda: ctrl)
+    monkeypatch.setattr(gsm_ocr, "get_ocr_ocr2", lambda: "glens")
+    monkeypatch.setattr(gsm_ocr, "capture_ocr_metrics_sample", lambda *args, **kwargs: None)
+    monkeypatch.setattr(gsm_ocr, "save_result_image", lambda *args, **kwargs: None)
+
+    async def _send_result(text, time, *, response_dict=None, source=None):
+        sent.append(text)
+
+    monkeypatch.setattr(gsm_ocr, "send_result", _send_result)
+    monkeypatch.setattr(
+        gsm_ocr.ocr_runtime,
+        "process_and_write_results",
+        lambda *args, **kwargs: (["手動"], "手動", None),
+    )
+
+    gsm_ocr.OCRProcessor().do_second_ocr(
+        "",
+        datetime(2026, 2, 22, 12, 0, 0),
+        Image.new("RGB", (2, 2), color=255),
+        filtering=None,
+        ignore_previous_result=True,
+        source=gsm_ocr.TextSource.OCR_MANUAL,
+    )
+
+    assert sent == ["手動"]
+
+
+def test_second_ocr_finishes_its_ticket_when_setup_fails(monkeypatch):
+    sequencer = gsm_ocr.DeliverySequencer()
+
+    def _broken_controller():
+        raise RuntimeError("controller unavailable")
+
+    monkeypatch.setattr(gsm_ocr, "second_pass_delivery", sequencer)
+    monkeypatch.setattr(gsm_ocr, "get_controller", _broken_controller)
+
+    gsm_ocr.OCRProcessor().do_second_ocr(
+        "",
+        datetime(2026, 2, 22, 12, 0, 0),
+        Image.new("RGB", (2, 2), color=255),
+        filtering=None,
+    )
+
+    # The next delivery gets its turn instead of waiting forever.
+    assert sequencer._turn == sequencer.take_ticket() == 1
+
+
 def test_second_ocr_formula_only_google_lens_payload_uses_ocr1_result(monkeypatch):
     sent = []
     ctrl = SimpleNamespace(
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+
+from PIL import Image, ImageDraw
+
+from GameSentenceMiner.ocr.composite_layout import CompositeLayout, LayoutRegion
+from GameSentenceMiner.ocr.region_ocr import RegionOCRRunner, composite_region_boxes, stitch_region_results
+from GameSentenceMiner.owocr.owocr import ocr_runtime
+
+
+def _metadata(rectangles, offset=(100, 400)):
+    return {
+        "ocr_area_crop_offset": CompositeLayout(offset).to_metadata(),
+        "ocr_area_rectangles": [list(rect) for rect in rectangles],
+    }
+
+
+NAME_BOX = (100, 400, 200, 40)
+DIALOGUE_BOX = (100, 460, 600, 120)
+COMPOSITE_SIZE = (600, 180)
+
+
+def _composite(cursor_on=False, dialogue_color=(200, 200, 200)):
+    image = Image.new("RGB", COMPOSITE_SIZE, (0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((10, 10, 60, 30), fill=(255, 255, 255))
+    draw.rectangle((20, 80, 400, 110), fill=dialogue_color)
+    if cursor_on:
+        draw.rectangle((560, 150, 570, 170), fill=(255, 0, 0))
+    return image
+
+
+def _engine_result(text, width, height):
+    return (
+        True,
+        text,
+        [{"text": text, "bounding_rect": {"x1": 1, "y1": 2, "x2": 11, "y2": 2, "x3": 11, "y3": 12, "x4": 1, "y4": 12}}],
+        [(1, 2, 11, 12, text)],
+        (1, 2, 11, 12),
+        {
+            "image_properties": {"width": width, "height": height},
+            "engine_capabilities": {
+                "words": True,
+                "word_bounding_boxes": True,
+                "lines": True,
+                "line_bounding_boxes": True,
+                "paragraphs": True,
+                "paragraph_bounding_boxes": True,
+            },
+            "paragraphs": [
+                {
+                    "bounding_box": {"center_x": 0.5, "center_y": 0.5, "width": 1.0, "height": 1.0},
+                    "lines": [],
+                }
+            ],
+        },
+    )
+
+
+class _RecordingEngine:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, crop):
+        with self.lock:
+            self.calls.append(crop.size)
+        return _engine_result(f"{crop.width}x{crop.height}", crop.width, crop.height)
+
+
+def test_region_boxes_come_from_rectangles_relative_to_crop_offset():
+    boxes = composite_region_boxes(_metadata([DIALOGUE_BOX, NAME_BOX]), COMPOSITE_SIZE)
+
+    assert boxes == [(0, 0, 200, 40), (0, 60, 600, 180)]
+
+
+def test_region_boxes_use_packed_layout_regions():
+    layout = CompositeLayout(
+        (0, 0),
+        [
+            LayoutRegion(dest_x=0, dest_y=0, width=50, height=20, src_x=300, src_y=10),
+            LayoutRegion(dest_x=0, dest_y=32, width=80, height=30, src_x=10, src_y=900),
+        ],
+    )
+
+    boxes = composite_region_boxes({"ocr_area_crop_offset": layout.to_metadata()}, (80, 62))
+
+    assert boxes == [(0, 0, 50, 20), (0, 32, 80, 62)]
+
+
+def test_overlapping_rectangles_fall_back_to_whole_composite():
+    assert composite_region_boxes(_metadata([(100, 400, 200, 100), (150, 450, 200, 100)]), COMPOSITE_SIZE) == []
+
+
+def test_stitch_shifts_coordinates_into_composite_space():
+    parts = [
+        ((0, 0, 200, 40), _engine_result("名前", 200, 40)),
+        ((0, 60, 600, 180), _engine_result("台詞", 600, 120)),
+    ]
+
+    ok, text, lines, crop_list, crop_coords, raw = stitch_region_results(parts, COMPOSITE_SIZE)
+
+    assert ok is True
+    assert text == "名前\n台詞"
+    assert lines[1]["bounding_rect"]["y1"] == 62
+    assert crop_list[1] == (1, 62, 11, 72, "台詞")
+    assert crop_coords == (1, 2, 11, 72)
+    dialogue_box = raw["paragraphs"][1]["bounding_box"]
+    assert dialogue_box["center_y"] == (0.5 * 120 + 60) / 180
+    assert dialogue_box["height"] == 120 / 180
+    assert ocr_runtime.dict_to_ocr_result(raw) is not None
+
+
+def test_only_changed_rectangles_are_ocrd():
+    runner = RegionOCRRunner()
+    engine = _RecordingEngine()
+    boxes = composite_region_boxes(_metadata([NAME_BOX, DIALOGUE_BOX]), COMPOSITE_SIZE)
+
+    runner.run(_composite(), boxes, engine, context="glens")
+    _result, stats = runner.run(_composite(cursor_on=True), boxes, engine, context="glens")
+
+    assert engine.calls == [(200, 40), (600, 120), (600, 120)]
+    assert stats == {"regions": 2, "changed": 1, "reused": 1}
+
+
+def test_context_change_forgets_previous_results():
+    runner = RegionOCRRunner()
+    engine = _RecordingEngine()
+    boxes = composite_region_boxes(_metadata([NAME_BOX, DIALOGUE_BOX]), COMPOSITE_SIZE)
+
+    runner.run(_composite(), boxes, engine, context="glens")
+    runner.run(_composite(), boxes, engine, context="meikiocr")
+
+    assert len(engine.calls) == 4
+
+
+def test_changed_rectangles_run_concurrently_when_allowed():
+    runner = RegionOCRRunner()
+    barrier = threading.Barrier(2, timeout=2)
+
+    def engine(crop):
+        barrier.wait()
+        return _engine_result("x", crop.width, crop.height)
+
+    boxes = composite_region_boxes(_metadata([NAME_BOX, DIALOGUE_BOX]), COMPOSITE_SIZE)
+    result, stats = runner.run(_composite(), boxes, engine, context="glens", parallelism=2)
+
+    assert result[0] is True
+    assert stats["changed"] == 2
+
+
+def test_failed_rectangle_is_reported_and_not_remembered():
+    runner = RegionOCRRunner()
+    boxes = composite_region_boxes(_metadata([NAME_BOX, DIALOGUE_BOX]), COMPOSITE_SIZE)
+
+    result, _stats = runner.run(_composite(), boxes, lambda crop: (False, "Connection error!"), context="glens")
+    engine = _RecordingEngine()
+    runner.run(_composite(), boxes, engine, context="glens")
+
+    assert result == (False, "Connection error!")
+    assert len(engine.calls) == 2
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+
+from PIL import Image, ImageDraw
+
+from GameSentenceMiner.ocr.result_cache import CacheKey, OCRResultCache, image_digest
+from GameSentenceMiner.owocr.owocr import ocr_runtime
+
+
+def _dialogue(text_boxes, size=(640, 160), noise=None):
+    image = Image.new("RGB", size, (20, 20, 40))
+    draw = ImageDraw.Draw(image)
+    for box in text_boxes:
+        draw.rectangle(box, fill=(240, 240, 240))
+    if noise is not None:
+        image.putpixel(noise, (25, 20, 40))
+    return image
+
+
+LINE_A = [(40 + i * 30, 50, 60 + i * 30, 80) for i in range(12)]
+LINE_B = [(40 + i * 30, 50, 60 + i * 30, 80) for i in range(12) if i not in (3, 7)]
+KEY = CacheKey(engine="glens", language="ja", furigana_filter_sensitivity=0, size=(640, 160))
+
+
+LINE_A_PLUS_ONE = LINE_A + [(40 + 12 * 30, 50, 60 + 12 * 30, 80)]
+
+
+def test_one_added_character_is_a_different_entry():
+    cache = OCRResultCache()
+    cache.store(KEY, image_digest(_dialogue(LINE_A)), (True, "今日はいい天気"))
+
+    assert image_digest(_dialogue(LINE_A)) == image_digest(_dialogue(LINE_A))
+    assert cache.lookup(KEY, image_digest(_dialogue(LINE_A_PLUS_ONE))) is None
+    assert cache.lookup(KEY, image_digest(_dialogue(LINE_A, noise=(5, 5)))) is None
+
+
+def test_lookup_returns_copy_for_exact_frames():
+    cache = OCRResultCache()
+    result = (True, "今日はいい天気", [{"text": "今日はいい天気"}], None, None, None)
+    line_a_hash = image_digest(_dialogue(LINE_A))
+    cache.store(KEY, line_a_hash, result)
+
+    exact = cache.lookup(KEY, line_a_hash)
+    exact[2][0]["text"] = "mutated"
+
+    assert cache.lookup(KEY, line_a_hash) == result
+    assert cache.lookup(KEY, image_digest(_dialogue(LINE_B))) is None
+    assert cache.lookup(CacheKey("meikiocr", "ja", 0, (640, 160)), line_a_hash) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+def test_memory_tier_is_size_bounded():
+    cache = OCRResultCache(max_entries=2)
+    for value in range(3):
+        cache.store(KEY, str(value), (True, str(value)))
+
+    assert cache.lookup(KEY, "0") is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_disk_tier_survives_a_new_cache_instance(tmp_path):
+    OCRResultCache(disk_dir=str(tmp_path)).store(KEY, "abc", (True, "保存", None, None, None, None))
+
+    reloaded = OCRResultCache(disk_dir=str(tmp_path))
+
+    assert reloaded.lookup(KEY, "abc") == [True, "保存", None, None, None, None]
+    assert reloaded.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_keeps_only_the_most_recent_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr("GameSentenceMiner.ocr.result_cache.DISK_PRUNE_INTERVAL", 1)
+    cache = OCRResultCache(disk_dir=str(tmp_path), max_disk_entries=3)
+    for value in range(5):
+        cache.store(KEY, f"h{value}", (True, str(value)))
+        path = cache._disk_path(KEY, f"h{value}")
+        os.utime(path, (1000 + value, 1000 + value))
+    cache.prune_disk()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(cache._disk_path(KEY, f"h{value}")) for value in (2, 3, 4)
+    )
+    assert cache.stats()["disk_evictions"] == 2
+
+
+class _CountingEngine:
+    name = "glens"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, img, furigana_filter_sensitivity=0):
+        self.calls += 1
+        return (True, f"call {self.calls}", None, None, None, None)
+
+
+def test_runtime_skips_engine_for_repeated_frame(monkeypatch):
+    monkeypatch.setattr(ocr_runtime, "_ocr_result_cache", None)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_result_cache", lambda: True)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_result_cache_disk", lambda: False)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_language", lambda: "ja")
+    engine = _CountingEngine()
+
+    first = ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=2)
+    second = ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=2)
+    third = ocr_runtime._run_engine_cached(engine, _dialogue(LINE_B), 0, debug_enabled=False, pass_number=2)
+
+    assert first == second == (True, "call 1", None, None, None, None)
+    assert third[1] == "call 2"
+    assert engine.calls == 2
+
+
+def test_runtime_never_caches_the_first_pass(monkeypatch):
+    monkeypatch.setattr(ocr_runtime, "_ocr_result_cache", None)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_result_cache", lambda: True)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_result_cache_disk", lambda: False)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_language", lambda: "ja")
+    engine = _CountingEngine()
+
+    ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=1)
+    ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=1)
+
+    assert engine.calls == 2
+
+
+def test_runtime_does_not_cache_when_disabled(monkeypatch):
+    monkeypatch.setattr(ocr_runtime, "_ocr_result_cache", None)
+    monkeypatch.setattr(ocr_runtime, "get_ocr_result_cache", lambda: False)
+    engine = _CountingEngine()
+
+    ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=2)
+    ocr_runtime._run_engine_cached(engine, _dialogue(LINE_A), 0, debug_enabled=False, pass_number=2)
+
+    assert engine.calls == 2
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import queue
+import threading
+
+import pytest
+
+from GameSentenceMiner.ocr import gsm_ocr
+from GameSentenceMiner.ocr.debug_logging import reset_ocr_debug_log_for_tests, start_ocr_debug_log
+from GameSentenceMiner.ocr.second_pass_scheduler import DeliverySequencer, SecondPassScheduler, parallelism_for_engine
+from GameSentenceMiner.util.text_log import TextSource
+
+
+def _task(text, source=TextSource.OCR, region=((0, 0, 100, 40),), queue_id=None):
+    metadata = {"ocr_area_rectangles": [list(rect) for rect in region]}
+    return (text, None, None, None, None, False, False, metadata, None, source, queue_id, None)
+
+
+def _scheduler(parallelism=1, maxsize=2048, debug_enabled=None):
+    return SecondPassScheduler(
+        maxsize=maxsize,
+        key_fn=gsm_ocr._second_pass_task_key,
+        source_fn=lambda task: task[9],
+        supersedes_fn=gsm_ocr._second_pass_task_supersedes,
+        parallelism_fn=lambda: parallelism,
+        debug_enabled=debug_enabled,
+        queue_id_fn=lambda task: task[10],
+    )
+
+
+def test_newer_frame_of_same_line_replaces_pending_task():
+    scheduler = _scheduler()
+    scheduler.put(_task("今日は"))
+    scheduler.put(_task("今日はいい天気ですね"))
+
+    assert scheduler.qsize() == 1
+    assert scheduler.get()[0] == "今日はいい天気ですね"
+    assert scheduler.metrics_snapshot()["superseded"] == 1
+
+
+def test_different_lines_and_regions_are_all_kept_in_order():
+    scheduler = _scheduler()
+    scheduler.put(_task("今日はいい天気ですね"))
+    scheduler.put(_task("明日は雨が降るそうだ"))
+    scheduler.put(_task("今日はいい天気ですね", region=((0, 50, 100, 90),)))
+
+    assert scheduler.qsize() == 3
+    assert scheduler.get()[0] == "今日はいい天気ですね"
+    scheduler.task_done()
+    assert scheduler.get()[0] == "明日は雨が降るそうだ"
+
+
+def test_manual_sources_run_before_automatic_backlog():
+    scheduler = _scheduler()
+    scheduler.put(_task("自動の行です"))
+    scheduler.put(_task("", source=TextSource.SCREEN_CROPPER, region=()))
+    scheduler.put(_task("", source=TextSource.SCREEN_CROPPER, region=()))
+
+    assert scheduler.get()[9] == TextSource.SCREEN_CROPPER
+    scheduler.task_done()
+    assert scheduler.get()[9] == TextSource.SCREEN_CROPPER
+    scheduler.task_done()
+    assert scheduler.get()[9] == TextSource.OCR
+
+
+def test_same_key_never_runs_twice_at_once_even_when_parallel():
+    scheduler = _scheduler(parallelism=2)
+    scheduler.put(_task("今日はいい天気ですね"))
+    scheduler.put(_task("明日は雨が降るそうだ"))
+    scheduler.put(_task("別の領域です", region=((0, 50, 100, 90),)))
+
+    first = scheduler.get()
+    second = []
+    worker = threading.Thread(target=lambda: second.append(scheduler.get()))
+    worker.start()
+    worker.join(1)
+
+    assert first[0] == "今日はいい天気ですね"
+    assert second[0][0] == "別の領域です"
+    assert scheduler.in_flight() == 2
+
+
+def test_parallelism_is_limited_to_concurrency_safe_engines():
+    assert parallelism_for_engine("glens") == 2
+    assert parallelism_for_engine("Google Lens") == 2
+    assert parallelism_for_engine("oneocr") == 1
+    assert parallelism_for_engine("meikiocr") == 1
+
+
+def test_close_drains_pending_tasks_then_returns_none():
+    scheduler = _scheduler()
+    scheduler.put(_task("最後の行です"))
+    scheduler.put_nowait(None)
+
+    assert scheduler.get()[0] == "最後の行です"
+    scheduler.task_done()
+    assert scheduler.get() is None
+
+
+def test_full_scheduler_rejects_new_work():
+    scheduler = _scheduler(maxsize=1)
+    scheduler.put(_task("一行目です"))
+
+    with pytest.raises(queue.Full):
+        scheduler.put(_task("まったく別の二行目", region=((0, 50, 100, 90),)), timeout=0.01)
+    assert scheduler.metrics_snapshot()["rejected"] == 1
+
+
+def test_blocked_worker_wakes_when_key_is_released():
+    scheduler = _scheduler(parallelism=2)
+    scheduler.put(_task("今日はいい天気ですね"))
+    scheduler.put(_task("明日は雨が降るそうだ"))
+    assert scheduler.get()[0] == "今日はいい天気ですね"
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(scheduler.get()))
+    worker.start()
+    worker.join(0.05)
+    assert worker.is_alive()
+
+    scheduler.task_done()
+    worker.join(1)
+    assert results[0][0] == "明日は雨が降るそうだ"
+
+
+def test_superseded_tasks_are_reported_to_debug_log(tmp_path):
+    reset_ocr_debug_log_for_tests()
+    try:
+        log_path, _ = start_ocr_debug_log(tmp_path)
+        scheduler = _scheduler(debug_enabled=lambda: True)
+        scheduler.put(_task("今日は", queue_id=1))
+        scheduler.put(_task("今日はいい天気", queue_id=2))
+        reset_ocr_debug_log_for_tests()
+
+        payloads = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    finally:
+        reset_ocr_debug_log_for_tests()
+
+    superseded = [p for p in payloads if p.get("outcome") == "superseded"]
+    assert superseded[0]["queue_id"] == 1
+    assert superseded[0]["replaced_by"] == 2
+    assert superseded[0]["superseded_total"] == 1
+
+
+def test_delivery_sequencer_sends_in_ticket_order_when_ocr_finishes_out_of_order():
+    sequencer = DeliverySequencer()
+    first, second = sequencer.take_ticket(), sequencer.take_ticket()
+    delivered = []
+    second_waiting = threading.Event()
+
+    def deliver_second():
+        second_waiting.set()
+        sequencer.wait_for_turn(second)
+        delivered.append("second")
+        sequencer.finish(second)
+
+    worker = threading.Thread(target=deliver_second)
+    worker.start()
+    second_waiting.wait(timeout=5)
+    assert delivered == []
+
+    sequencer.wait_for_turn(first)
+    delivered.append("first")
+    sequencer.finish(first)
+    worker.join(timeout=5)
+
+    assert delivered == ["first", "second"]
+
+
+def test_delivery_sequencer_skips_tickets_finished_without_delivery():
+    sequencer = DeliverySequencer()
+    dropped, kept = sequencer.take_ticket(), sequencer.take_ticket()
+
+    sequencer.finish(kept)
+    sequencer.finish(dropped)
+    sequencer.finish(dropped)
+    later = sequencer.take_ticket()
+
+    sequencer.wait_for_turn(later)
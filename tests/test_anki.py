@@ -2573,6 +2573,40 @@ def test_update_anki_card_marks_video_pending_for_background_work(monkeypatch):
     assert callable(assets.cleanup_callback)
 
 
+def test_video_cleanup_removes_replay_index_even_when_replay_is_gone(monkeypatch, tmp_path):
+    from GameSentenceMiner.util.media import replay_index
+
+    cfg = _base_config()
+    cfg.anki.show_update_confirmation_dialog_v2 = False
+    cfg.paths.remove_video = True
+    monkeypatch.setattr(anki, "get_config", lambda: cfg)
+    monkeypatch.setattr(anki, "_determine_update_conditions", lambda _note: (False, False))
+
+    assets = anki.MediaAssets()
+    monkeypatch.setattr(anki, "_generate_media_files", lambda *args, **kwargs: assets)
+    monkeypatch.setattr(anki, "_synchronize_deferred_media_metadata", lambda *args, **kwargs: None)
+    monkeypatch.setattr(anki, "_prepare_anki_note_fields", lambda note, *_args, **_kwargs: note)
+    monkeypatch.setattr(anki, "_prepare_anki_tags", lambda: [])
+    monkeypatch.setattr(anki, "submit_background_work", lambda func: None)
+    monkeypatch.setattr(anki.ffmpeg, "remove_replay_index", replay_index.remove_replay_index, raising=False)
+
+    video_path = str(tmp_path / "Replay.mp4")
+    sidecar = tmp_path / "Replay.mp4.gsmidx.json"
+    sidecar.write_text("{}", encoding="utf-8")
+
+    anki.update_anki_card(
+        last_note=SimpleNamespace(noteId=1),
+        note={"id": 1, "fields": {}},
+        video_path=video_path,
+        game_line=SimpleNamespace(id="line-1", text="line", TL=""),
+        selected_lines=[],
+    )
+    assets.cleanup_callback()
+
+    assert not sidecar.exists()
+    assert video_path not in anki.gsm_state.videos_with_pending_operations
+
+
 def test_check_and_update_note_runs_pipeline(monkeypatch):
     calls = []
     cfg = _base_config()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import threading
+
+from PIL import Image
+
+from GameSentenceMiner.obs.frame_broker import FrameBroker
+from GameSentenceMiner.obs.screenshot_capture import ScreenshotCapture
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_capture(size=(1280, 720)):
+    calls = []
+
+    def capture():
+        calls.append(size)
+        return Image.new("RGB", size, (10, 20, 30))
+
+    return capture, calls
+
+
+def test_fresh_frame_is_reused_and_downscaled():
+    clock = _Clock()
+    broker = FrameBroker(clock=clock)
+    capture, calls = _counting_capture()
+
+    first = broker.get_frame(("Game", "jpg", 90), capture, max_age_ms=100)
+    clock.now += 0.05
+    smaller = broker.get_frame(("Game", "jpg", 90), capture, width=640, max_age_ms=100)
+
+    assert len(calls) == 1
+    assert first.size == (1280, 720)
+    assert smaller.size == (640, 360)
+    assert broker.stats()["saved"] == 1
+
+
+def test_capturing_caller_cannot_alter_the_published_frame():
+    broker = FrameBroker(clock=_Clock())
+    capture, calls = _counting_capture((4, 4))
+
+    first = broker.get_frame("key", capture, max_age_ms=100)
+    first.paste((255, 255, 255), (0, 0, 4, 4))
+    second = broker.get_frame("key", capture, max_age_ms=100)
+
+    assert len(calls) == 1
+    assert second.getpixel((0, 0)) == (10, 20, 30)
+
+
+def test_stale_frame_and_uncached_callers_capture_again():
+    clock = _Clock()
+    broker = FrameBroker(clock=clock)
+    capture, calls = _counting_capture()
+
+    broker.get_frame("key", capture, max_age_ms=100)
+    clock.now += 0.2
+    broker.get_frame("key", capture, max_age_ms=100)
+    broker.get_frame("key", capture)
+
+    assert len(calls) == 3
+    assert broker.stats()["saved"] == 0
+
+
+def test_downscaled_frame_does_not_serve_larger_request():
+    broker = FrameBroker(clock=_Clock())
+    small_capture, small_calls = _counting_capture((640, 360))
+    native_capture, native_calls = _counting_capture()
+
+    broker.get_frame("key", small_capture, width=640, height=360, max_age_ms=100)
+    image = broker.get_frame("key", native_capture, max_age_ms=100)
+
+    assert image.size == (1280, 720)
+    assert (len(small_calls), len(native_calls)) == (1, 1)
+
+
+def test_concurrent_requests_share_one_in_flight_capture():
+    broker = FrameBroker()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_capture():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return Image.new("RGB", (320, 180))
+
+    results = []
+    owner = threading.Thread(target=lambda: results.append(broker.get_frame("key", slow_capture, max_age_ms=100)))
+    owner.start()
+    started.wait(2)
+    waiter = threading.Thread(target=lambda: results.append(broker.get_frame("key", slow_capture, max_age_ms=100)))
+    waiter.start()
+    release.set()
+    owner.join(2)
+    waiter.join(2)
+
+    assert len(calls) == 1
+    assert [image.size for image in results] == [(320, 180), (320, 180)]
+    assert broker.stats()["shared_captures"] == 1
+
+
+def test_screenshot_capture_reuses_frames_until_scene_change(monkeypatch):
+    capture = ScreenshotCapture()
+    obs_calls = []
+
+    monkeypatch.setattr(capture, "_get_configured_capture_backend", lambda: "obs")
+    monkeypatch.setattr(
+        capture,
+        "_capture_obs",
+        lambda *args: obs_calls.append(args) or Image.new("RGB", (640, 360)),
+    )
+
+    capture.capture("Game Source", compression=90, img_format="jpg", max_age_ms=1000)
+    capture.capture("Game Source", compression=90, img_format="jpg", max_age_ms=1000)
+    capture.invalidate_hwnd()
+    capture.capture("Game Source", compression=90, img_format="jpg", max_age_ms=1000)
+
+    assert len(obs_calls) == 2
+    assert capture.frame_broker.stats()["saved"] == 1
+
+
+def test_screenshot_capture_keeps_frames_per_backend(monkeypatch):
+    capture = ScreenshotCapture()
+    obs_calls = []
+
+    monkeypatch.setattr(capture, "_get_configured_capture_backend", lambda: "wgc")
+    monkeypatch.setattr(capture, "_should_use_wgc", lambda source_name: True)
+    monkeypatch.setattr(capture, "_capture_windows", lambda **kwargs: Image.new("RGB", (640, 360), (1, 1, 1)))
+    monkeypatch.setattr(
+        capture,
+        "_capture_obs",
+        lambda *args: obs_calls.append(args) or Image.new("RGB", (640, 360), (2, 2, 2)),
+    )
+
+    capture.capture("Game Source", max_age_ms=1000)
+    forced = capture.capture("Game Source", force_obs=True, max_age_ms=1000)
+
+    assert len(obs_calls) == 1
+    assert forced.getpixel((0, 0)) == (2, 2, 2)
@@ -1,4 +1,6 @@
+import base64
 import importlib
+import io
 import sys
 from types import SimpleNamespace
 
@@ -12,10 +14,13 @@ from GameSentenceMiner.util.config.configuration import (
     normalize_screenshot_capture_backend,
 )
 from GameSentenceMiner.obs.screenshot_capture import (
+    CAPTURE_FORMAT_CHANGE_DETECTION,
+    CAPTURE_FORMAT_LOSSLESS,
     ScreenshotCapture,
     _WGCCallbackPacer,
     _WGCSession,
     _resolve_output_size,
+    decode_screenshot_data,
 )
 from scripts import benchmark_obs_screenshot_capture as screenshot_benchmark
 
@@ -249,6 +254,64 @@ def test_benchmark_build_configs_includes_wgc_resolutions():
     ]
 
 
+def _encoded_screenshot(image, fmt):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return f"data:image/{fmt.lower()};base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def test_decode_screenshot_data_png_fast_path_keeps_rgba_pixels():
+    image = Image.new("RGBA", (4, 2), (255, 0, 0, 128))
+    image.putpixel((3, 1), (0, 0, 255, 255))
+
+    decoded = decode_screenshot_data(_encoded_screenshot(image, "PNG"))
+
+    assert decoded.mode == "RGBA"
+    assert decoded.tobytes() == image.tobytes()
+
+
+def test_decode_screenshot_data_jpeg_without_prefix(monkeypatch):
+    monkeypatch.setattr(screenshot_capture_module, "_get_simplejpeg", lambda: None)
+    image = Image.new("RGB", (16, 8), (0, 200, 0))
+    payload = _encoded_screenshot(image, "JPEG").split(",", 1)[1]
+
+    decoded = decode_screenshot_data(payload)
+
+    assert decoded.size == (16, 8)
+    assert decoded.getpixel((0, 0))[1] > 180
+
+
+def test_capture_defaults_to_jpeg_not_png(monkeypatch):
+    capture = ScreenshotCapture()
+    obs_calls = []
+
+    monkeypatch.setattr(capture, "_get_configured_capture_backend", lambda: SCREENSHOT_CAPTURE_BACKEND_OBS)
+    monkeypatch.setattr(capture, "_capture_obs", lambda *args: obs_calls.append(args) or Image.new("RGB", (4, 4)))
+
+    capture.capture("Game Source")
+
+    assert obs_calls[0][1:3] == (90, "jpg")
+
+
+def test_benchmark_profiles_replace_format_matrix():
+    args = SimpleNamespace(
+        widths=None,
+        heights=None,
+        formats=["jpg"],
+        compressions=[90],
+        preprocess_modes=["none"],
+        profiles=["change_detection", "lossless"],
+    )
+
+    configs = screenshot_benchmark.build_configs(args, [screenshot_benchmark.CaptureMethod.OBS_SOURCE])
+
+    assert [(config.profile, config.img_format, config.compression) for config in configs] == [
+        ("change_detection", CAPTURE_FORMAT_CHANGE_DETECTION.img_format, CAPTURE_FORMAT_CHANGE_DETECTION.compression),
+        ("lossless", CAPTURE_FORMAT_LOSSLESS.img_format, CAPTURE_FORMAT_LOSSLESS.compression),
+    ]
+    assert configs[0].label.startswith("obs_source profile=change_detection jpg")
+
+
 def test_benchmark_wgc_capture_uses_config_dimensions(monkeypatch):
     image = Image.new("RGB", (640, 360))
     calls = []
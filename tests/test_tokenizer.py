@@ -20,6 +20,10 @@ class _Backend:
         self.calls.append(("translate", text))
         return [self.name]
 
+    def translate_batch(self, texts: list[str]):
+        self.calls.append(("translate_batch", texts))
+        return [[self.name] for _text in texts]
+
     def reading(self, text: str) -> str:
         self.calls.append(("reading", text))
         return f"{self.name}:{text}"
@@ -132,6 +136,18 @@ def test_unavailable_sudachi_falls_back_to_mecab(monkeypatch) -> None:
     assert mecab.calls == [("translate", "文")]
 
 
+def test_translate_batch_goes_to_the_selected_backend_in_one_call(monkeypatch) -> None:
+    tokenizer, mecab, _sudachi, _availability_calls, _release_calls = _make_tokenizer(
+        monkeypatch,
+        enabled=True,
+        configured="mecab",
+        sudachi_available=False,
+    )
+
+    assert tokenizer.translate_batch(("一", "二")) == [["mecab"], ["mecab"]]
+    assert mecab.calls == [("translate_batch", ["一", "二"])]
+
+
 def test_tokenization_backend_defaults_to_sudachi(monkeypatch) -> None:
     master = SimpleNamespace(experimental=SimpleNamespace())
     monkeypatch.setattr(tokenizer_module, "get_master_config", lambda: master)
@@ -0,0 +1,146 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from GameSentenceMiner.util.cloud_sync import transport as transport_module
+from GameSentenceMiner.util.cloud_sync.service import CloudSyncService
+from GameSentenceMiner.util.cloud_sync.transport import CloudSyncTransport
+from GameSentenceMiner.util.database.db import GameLinesTable
+
+
+class _FakeSyncServer:
+    """Minimal /api/sync-db endpoint: records pushes and hands out queued server changes."""
+
+    def __init__(self, server_changes=None, reject_encoded=False):
+        self.requests = []
+        self.server_changes = list(server_changes or [])
+        self.reject_encoded = reject_encoded
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                encoding = self.headers.get("Content-Encoding")
+                if encoding and fake.reject_encoded:
+                    self.send_response(415)
+                    self.end_headers()
+                    return
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                payload = json.loads(body)
+                fake.requests.append({"encoding": encoding, "payload": payload})
+                changes, fake.server_changes = fake.server_changes, []
+                response = json.dumps(
+                    {
+                        "applied_client_changes": len(payload["changes"]),
+                        "ignored_client_changes": 0,
+                        "server_changes": changes,
+                        "next_since_seq": len(fake.requests),
+                        "has_more": False,
+                    }
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *_args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_sync_server():
+    servers = []
+
+    def _start(**kwargs):
+        server = _FakeSyncServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        server.close()
+
+
+def _reset_tables() -> None:
+    GameLinesTable._db.execute(f"DELETE FROM {GameLinesTable._table} WHERE id LIKE 'transport_%'", commit=True)
+    GameLinesTable._db.execute(f"DELETE FROM {GameLinesTable._sync_changes_table} WHERE 1=1", commit=True)
+
+
+def _service(monkeypatch, api_url: str, push_batch_size: int) -> CloudSyncService:
+    service = CloudSyncService()
+    config = {
+        "preview_enabled": True,
+        "enabled": True,
+        "auto_sync": True,
+        "api_url": api_url,
+        "email": "",
+        "state_identity": f"transport-test-{time.time()}",
+        "api_token": "token",
+        "device_id": "test-device",
+        "interval_seconds": 900,
+        "push_batch_size": push_batch_size,
+        "max_server_changes": 100,
+        "timeout_seconds": 5,
+    }
+    monkeypatch.setattr(service, "_load_runtime_config", lambda: dict(config))
+    return service
+
+
+def test_sync_pushes_compressed_pipelined_rounds_and_applies_server_changes(monkeypatch, fake_sync_server):
+    _reset_tables()
+    monkeypatch.setattr(transport_module, "MIN_COMPRESS_BYTES", 0)
+    base = time.time()
+    for index in range(5):
+        GameLinesTable(id=f"transport_{index}", game_name="Game", line_text=f"line {index}", timestamp=base).add()
+    server = fake_sync_server(
+        server_changes=[
+            {
+                "id": "transport_remote",
+                "operation": "upsert",
+                "changed_at": base,
+                "data": {"game_name": "Remote", "line_text": "from server", "timestamp": base},
+            }
+        ]
+    )
+
+    result = _service(monkeypatch, server.url, push_batch_size=2).sync_once(max_rounds=None)
+
+    assert result["status"] == "success", result
+    assert all(request["encoding"] == "gzip" for request in server.requests)
+    # The first three rounds come from the pipelined cursor: every local line exactly once.
+    # (Linking the remote line's game may re-queue unrelated lines for later rounds.)
+    assert [[change["id"] for change in request["payload"]["changes"]] for request in server.requests[:3]] == [
+        ["transport_0", "transport_1"],
+        ["transport_2", "transport_3"],
+        ["transport_4"],
+    ]
+    assert GameLinesTable.get("transport_remote").line_text == "from server"
+    assert result["pending_changes_after"] == 0
+
+
+def test_transport_falls_back_to_plain_json_when_server_rejects_encoding(monkeypatch, fake_sync_server):
+    monkeypatch.setattr(transport_module, "MIN_COMPRESS_BYTES", 0)
+    server = fake_sync_server(reject_encoded=True)
+    sync_transport = CloudSyncTransport()
+
+    first = sync_transport.post_json(f"{server.url}/api/sync-db", {"changes": []}, headers={}, timeout=5)
+    second = sync_transport.post_json(f"{server.url}/api/sync-db", {"changes": []}, headers={}, timeout=5)
+
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert sync_transport.content_encoding is None
+    assert [request["encoding"] for request in server.requests] == [None, None]
+    assert sync_transport.stats["requests"] == 3
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from GameSentenceMiner.util.database.chunked_backup import (
+    BACKUP_CHUNK_DIRNAME,
+    load_backup_manifest,
+    restore_database_backup,
+    verify_database_backup,
+)
+from GameSentenceMiner.util.database.db import backup_db
+from GameSentenceMiner.util.database.sqlite_core import DatabaseIntegrityError
+
+
+def _create_source(path) -> None:
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("CREATE TABLE sample (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.executemany(
+            "INSERT INTO sample (value) VALUES (?)",
+            [(f"line {i} " + "x" * 200,) for i in range(5000)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _chunk_files(backup_dir):
+    return sorted((backup_dir / BACKUP_CHUNK_DIRNAME).glob("*/*.z"))
+
+
+def test_consecutive_backups_share_unchanged_chunks(tmp_path):
+    db_path = tmp_path / "source.db"
+    backup_dir = tmp_path / "backups"
+    _create_source(db_path)
+
+    first = backup_db(str(db_path), backup_dir=str(backup_dir), now=datetime(2026, 1, 1))
+    chunks_after_first = _chunk_files(backup_dir)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("UPDATE sample SET value = 'changed' WHERE id = 4000")
+        conn.commit()
+    finally:
+        conn.close()
+    second = backup_db(str(db_path), backup_dir=str(backup_dir), now=datetime(2026, 1, 2))
+
+    first_chunks = load_backup_manifest(first).chunks
+    second_chunks = load_backup_manifest(second).chunks
+    assert len(first_chunks) > 2
+    assert first_chunks != second_chunks
+    assert len(set(second_chunks) - set(first_chunks)) < len(second_chunks) // 2
+    assert len(_chunk_files(backup_dir)) == len(chunks_after_first) + len(set(second_chunks) - set(first_chunks))
+
+
+def test_restore_reassembles_the_snapshot(tmp_path):
+    db_path = tmp_path / "source.db"
+    restored_path = tmp_path / "restored.db"
+    _create_source(db_path)
+
+    manifest = backup_db(str(db_path), backup_dir=str(tmp_path / "backups"), now=datetime(2026, 1, 1))
+    verify_database_backup(manifest)
+    restore_database_backup(manifest, restored_path)
+
+    conn = sqlite3.connect(restored_path)
+    try:
+        assert conn.execute("SELECT COUNT(*), MAX(value) FROM sample").fetchone() == (5000, "line 999 " + "x" * 200)
+    finally:
+        conn.close()
+
+
+def test_verify_rejects_a_corrupted_chunk(tmp_path):
+    db_path = tmp_path / "source.db"
+    backup_dir = tmp_path / "backups"
+    _create_source(db_path)
+    manifest = backup_db(str(db_path), backup_dir=str(backup_dir), now=datetime(2026, 1, 1))
+
+    _chunk_files(backup_dir)[0].write_bytes(b"not a chunk")
+
+    with pytest.raises(DatabaseIntegrityError):
+        verify_database_backup(manifest)
+    with pytest.raises(DatabaseIntegrityError):
+        restore_database_backup(manifest, tmp_path / "restored.db")
+    assert not (tmp_path / "restored.db").exists()
+
+
+def test_retention_collects_chunks_only_the_expired_backup_used(tmp_path):
+    db_path = tmp_path / "source.db"
+    backup_dir = tmp_path / "backups"
+    _create_source(db_path)
+
+    oldest = backup_db(str(db_path), backup_dir=str(backup_dir), retention_count=1, now=datetime(2026, 1, 1))
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("DELETE FROM sample WHERE id > 2500")
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    oldest_chunks = set(load_backup_manifest(oldest).chunks)
+    os.utime(oldest, (datetime(2026, 1, 1).timestamp(), datetime(2026, 1, 1).timestamp()))
+
+    newest = backup_db(str(db_path), backup_dir=str(backup_dir), retention_count=1, now=datetime(2026, 1, 2))
+
+    newest_chunks = set(load_backup_manifest(newest).chunks)
+    remaining = {path.name[: -len(".z")] for path in _chunk_files(backup_dir)}
+    assert not os.path.exists(oldest)
+    assert remaining == newest_chunks
+    assert oldest_chunks - newest_chunks
+    verify_database_backup(newest)
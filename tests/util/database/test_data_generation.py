@@ -0,0 +1,86 @@
+"""
+Unit tests for the process-wide data generation counters and GenerationMemo.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from GameSentenceMiner.util.database import data_generation
+from GameSentenceMiner.util.database.db import SQLiteDB, SQLiteDBTable
+
+
+class _TrackedModel(SQLiteDBTable):
+    _table = "test_generation_tracked"
+    _pk = "id"
+    _auto_increment = True
+    _data_domain = "test_tracked"
+    _fields = ["name"]
+    _types = [int, str]
+
+
+@pytest.fixture()
+def tracked_db():
+    original = _TrackedModel._db
+    db = SQLiteDB(":memory:")
+    _TrackedModel.set_db(db)
+    yield db
+    db.close()
+    _TrackedModel._db = original
+
+
+def test_table_writes_bump_their_domain(tracked_db):
+    before = data_generation.current("test_tracked")
+
+    row = _TrackedModel()
+    row.id = None
+    row.name = "a"
+    row.save()
+    after_insert = data_generation.current("test_tracked")
+    row.name = "b"
+    row.save()
+    after_update = data_generation.current("test_tracked")
+    row.delete()
+
+    assert before < after_insert < after_update < data_generation.current("test_tracked")
+
+
+def test_memo_recomputes_only_when_generation_changes():
+    memo = data_generation.GenerationMemo(max_entries=2)
+    calls = []
+
+    def lookup():
+        key = ("payload", data_generation.snapshot(["test_memo"]))
+        return memo.get_or_compute(key, lambda: calls.append(key) or len(calls))
+
+    assert lookup() == 1
+    assert lookup() == 1
+    data_generation.bump("test_memo")
+    assert lookup() == 2
+    assert memo.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+
+def test_memo_evicts_least_recently_used_entries():
+    memo = data_generation.GenerationMemo(max_entries=2)
+    memo.get_or_compute("a", lambda: 1)
+    memo.get_or_compute("b", lambda: 2)
+    memo.get_or_compute("a", lambda: 0)
+    memo.get_or_compute("c", lambda: 3)
+
+    assert memo.get_or_compute("a", lambda: -1) == 1
+    assert memo.get_or_compute("b", lambda: -2) == -2
+
+
+def test_memo_lifetime_expires_entries_and_can_skip_storing(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(data_generation.time, "monotonic", lambda: clock[0])
+    memo = data_generation.GenerationMemo()
+
+    assert memo.get_or_compute("timed", lambda: 1, lambda _value: 60) == 1
+    clock[0] += 59
+    assert memo.get_or_compute("timed", lambda: 2, lambda _value: 60) == 1
+    clock[0] += 2
+    assert memo.get_or_compute("timed", lambda: 3, lambda _value: 60) == 3
+
+    assert memo.get_or_compute("skipped", lambda: 4, lambda _value: 0) == 4
+    assert memo.get_or_compute("skipped", lambda: 5, lambda _value: 0) == 5
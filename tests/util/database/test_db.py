@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import gzip
 import sqlite3
 import tempfile
 import threading
@@ -11,6 +10,7 @@ from pathlib import Path
 import pytest
 
 from GameSentenceMiner.util.database import db as db_module
+from GameSentenceMiner.util.database.chunked_backup import restore_database_backup
 from GameSentenceMiner.util.database.db import (
     AIModelsTable,
     SQLiteDB,
@@ -204,10 +204,9 @@ def test_backup_db_uses_online_snapshot_that_includes_wal_changes(tmp_path):
         conn.close()
 
     assert backup_path is not None
-    assert backup_path.endswith(os.path.join("backup", "database", "gsm_2026-01-01.db.gz"))
+    assert backup_path.endswith(os.path.join("backup", "database", "gsm_2026-01-01.manifest.json"))
 
-    with gzip.open(backup_path, "rb") as source, open(restored_path, "wb") as restored:
-        restored.write(source.read())
+    restore_database_backup(backup_path, restored_path)
 
     restored_conn = sqlite3.connect(restored_path)
     try:
@@ -228,7 +227,7 @@ def test_backup_db_can_write_to_a_custom_directory(tmp_path):
         now=datetime(2026, 1, 1),
     )
 
-    assert Path(backup_path) == backup_dir / "gsm_2026-01-01.db.gz"
+    assert Path(backup_path) == backup_dir / "gsm_2026-01-01.manifest.json"
     assert Path(backup_path).is_file()
 
 
@@ -238,7 +237,7 @@ def test_backup_db_skips_existing_daily_backup_without_copying(tmp_path, monkeyp
 
     backup_dir = tmp_path / "backup" / "database"
     backup_dir.mkdir(parents=True)
-    existing_backup = backup_dir / "gsm_2026-01-01.db.gz"
+    existing_backup = backup_dir / "gsm_2026-01-01.manifest.json"
     existing_backup.write_bytes(b"already backed up")
 
     def fail_if_called(*_args, **_kwargs):
@@ -292,7 +291,7 @@ def test_backup_db_keeps_only_the_configured_number_of_backups(tmp_path):
     assert not oldest_backup.exists()
     assert not middle_backup.exists()
     assert newest_existing_backup.exists()
-    assert (backup_dir / "gsm_2026-01-01.db.gz").exists()
+    assert (backup_dir / "gsm_2026-01-01.manifest.json").exists()
 
 
 def test_schedule_database_backup_runs_in_bounded_pool_without_waiting(tmp_path, monkeypatch):
@@ -217,3 +217,78 @@ def test_transaction_context_manager_rejects_non_writer_threads(db):
     with pytest.raises(RuntimeError):
         with db.transaction():
             pass
+
+
+def test_write_generation_moves_only_after_commits(db):
+    before = db.write_generation()
+    db.fetchall("SELECT value FROM sample")
+    assert db.write_generation() == before
+
+    db.execute("INSERT INTO sample (value) VALUES (?)", (1,), commit=True)
+    after_local_write = db.write_generation()
+    assert after_local_write != before
+
+    other = SQLiteDB(db.db_path)
+    try:
+        other.execute("INSERT INTO sample (value) VALUES (?)", (2,), commit=True)
+    finally:
+        other.close()
+    assert db.write_generation() != after_local_write
+
+
+def test_reader_of_an_exited_thread_is_reused_by_the_next_thread(db):
+    seen = []
+
+    def reader() -> None:
+        seen.append(db._get_read_connection())
+        db.fetchone("SELECT COUNT(*) FROM sample")
+
+    for _ in range(5):
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(timeout=5)
+
+    assert len({id(conn) for conn in seen}) == 1
+    stats = db.reader_pool_stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 4
+
+
+def test_reader_pool_is_bounded_under_concurrency():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    database = SQLiteDB(path, read_pool_size=2)
+    database.execute("CREATE TABLE sample (value INTEGER)", commit=True)
+    barrier = threading.Barrier(5)
+
+    def reader() -> None:
+        database.fetchone("SELECT COUNT(*) FROM sample")
+        barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=reader) for _ in range(5)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        stats = database.reader_pool_stats()
+    finally:
+        database.close()
+        os.unlink(path)
+
+    assert stats["open"] == 2
+    assert stats["created"] == 2
+    assert stats["shared"] == 3
+
+
+def test_reads_are_recorded_by_query_fingerprint(db):
+    db.execute("INSERT INTO sample (value) VALUES (?)", (1,), commit=True)
+    db.fetchall("SELECT value FROM sample WHERE value = 1")
+    db.fetchall("SELECT value   FROM sample WHERE value = 2")
+    db.fetchone("SELECT COUNT(*) FROM sample")
+
+    queries = {entry["query"]: entry for entry in db.query_metrics.snapshot()}
+
+    assert queries["SELECT value FROM sample WHERE value = ?"]["count"] == 2
+    assert queries["SELECT value FROM sample WHERE value = ?"]["rows"] == 1
+    assert queries["SELECT COUNT(*) FROM sample"]["count"] == 1
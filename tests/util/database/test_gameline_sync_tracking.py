@@ -74,13 +74,41 @@ def test_acknowledge_and_queue_all_lines_for_sync() -> None:
     pending = GameLinesTable.get_pending_sync_changes(limit=10)
     assert len(pending) == 2
 
-    removed = GameLinesTable.acknowledge_sync_changes(["sync_line_2"])
+    sent = next(change for change in pending if change["id"] == "sync_line_2")
+    removed = GameLinesTable.acknowledge_sync_changes([(sent["id"], sent["changed_at"])])
     assert removed == 1
     remaining = GameLinesTable.get_pending_sync_changes(limit=10)
     assert len(remaining) == 1
     assert remaining[0]["id"] == "sync_line_3"
 
 
+def test_acknowledge_keeps_changes_made_after_sending() -> None:
+    _reset_tables()
+
+    line = GameLinesTable(
+        id="sync_line_4",
+        game_name="Game C",
+        line_text="before",
+        timestamp=time.time(),
+        last_modified=1000.0,
+    )
+    line.add()
+    sent = GameLinesTable.get_pending_sync_changes(limit=10)
+    assert [(change["id"], change["changed_at"]) for change in sent] == [("sync_line_4", 1000.0)]
+
+    line.line_text = "edited while the request was in flight"
+    line.last_modified = 1001.0
+    line.save()
+
+    assert GameLinesTable.acknowledge_sync_changes([("sync_line_4", 1000.0)]) == 0
+    remaining = GameLinesTable.get_pending_sync_changes(limit=10)
+    assert [(change["id"], change["changed_at"]) for change in remaining] == [("sync_line_4", 1001.0)]
+    assert remaining[0]["data"]["line_text"] == "edited while the request was in flight"
+
+    assert GameLinesTable.acknowledge_sync_changes([("sync_line_4", 1001.0)]) == 1
+    assert GameLinesTable.get_pending_sync_changes(limit=10) == []
+
+
 def test_apply_remote_sync_changes_clears_local_tracking() -> None:
     _reset_tables()
 
@@ -130,3 +158,49 @@ def test_apply_remote_sync_changes_clears_local_tracking() -> None:
     assert delete_stats["deletes"] == 1
     assert GameLinesTable.get("remote_line_1") is None
     assert GameLinesTable.get_pending_sync_changes() == []
+
+
+def test_pending_sync_changes_join_matches_loaded_lines_and_pages_by_cursor() -> None:
+    _reset_tables()
+    base = time.time()
+    for index in range(3):
+        GameLinesTable(
+            id=f"cursor_line_{index}",
+            game_name="Cursor Game",
+            line_text=f"line {index}",
+            timestamp=base + index,
+            note_ids=[f"note-{index}"],
+        ).add()
+    GameLinesTable._db.execute(
+        f"INSERT OR REPLACE INTO {GameLinesTable._sync_changes_table} (line_id, change_type, changed_at) "
+        "VALUES ('vanished_line', 'upsert', ?)",
+        (base + 10,),
+        commit=True,
+    )
+
+    first = GameLinesTable.get_pending_sync_changes(limit=2)
+    cursor = (first[-1]["changed_at"], first[-1]["id"])
+    rest = GameLinesTable.get_pending_sync_changes(limit=10, after=cursor)
+
+    assert [change["id"] for change in first + rest] == [
+        "cursor_line_0",
+        "cursor_line_1",
+        "cursor_line_2",
+        "vanished_line",
+    ]
+    line = GameLinesTable.get("cursor_line_1")
+    assert first[1]["data"] == GameLinesTable._serialize_line_for_sync(line)
+    assert rest[-1]["operation"] == "delete"
+
+
+def test_update_writes_only_the_given_columns() -> None:
+    _reset_tables()
+    GameLinesTable(id="sync_line_4", game_name="Game", line_text="line", timestamp=time.time()).add()
+
+    GameLinesTable.update("sync_line_4", audio_path="a.mp3", note_id="42")
+    GameLinesTable.update("sync_line_4", note_id="42")
+
+    line = GameLinesTable.get("sync_line_4")
+    assert line.audio_path == "a.mp3"
+    assert line.line_text == "line"
+    assert line.note_ids == ["42"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from GameSentenceMiner.util.database.query_metrics import QueryLatencyMetrics, normalize_sql
+
+
+def test_normalize_sql_collapses_literals_whitespace_and_in_lists():
+    assert normalize_sql("SELECT *\n  FROM game_lines WHERE id IN (?, ?, ?) AND timestamp >= 1700000000.5;") == (
+        "SELECT * FROM game_lines WHERE id IN (?...) AND timestamp >= ?"
+    )
+    assert normalize_sql("SELECT * FROM games WHERE title = 'it''s' LIMIT 10") == (
+        "SELECT * FROM games WHERE title = ? LIMIT ?"
+    )
+    assert normalize_sql("SELECT t1.id FROM table1 t1") == "SELECT t1.id FROM table1 t1"
+
+
+def test_metrics_report_histogram_and_percentiles():
+    metrics = QueryLatencyMetrics()
+    for elapsed_ms in (1, 2, 3, 4, 100):
+        metrics.record("SELECT * FROM game_lines WHERE id = ?", elapsed_ms / 1000.0, rows=1)
+    metrics.record("SELECT 1", 0.00005)
+
+    slowest = metrics.snapshot(limit=1)
+
+    assert len(slowest) == 1
+    assert slowest[0]["query"] == "SELECT * FROM game_lines WHERE id = ?"
+    assert slowest[0]["count"] == 5
+    assert slowest[0]["rows"] == 5
+    assert slowest[0]["max_ms"] == 100.0
+    assert slowest[0]["p50_ms"] == 3.0
+    assert slowest[0]["histogram"] == {"<=1ms": 1, "<=2.5ms": 1, "<=5ms": 2, "<=100ms": 1}
+
+
+def test_metrics_evict_least_recently_seen_fingerprints():
+    metrics = QueryLatencyMetrics(max_fingerprints=2)
+    metrics.record("SELECT a FROM t", 0.001)
+    metrics.record("SELECT b FROM t", 0.001)
+    metrics.record("SELECT a FROM t", 0.001)
+    metrics.record("SELECT c FROM t", 0.001)
+
+    assert {entry["query"] for entry in metrics.snapshot()} == {"SELECT a FROM t", "SELECT c FROM t"}
+    assert metrics.evicted == 1
@@ -5,6 +5,7 @@ Tests:
 - First-insert of AnkiNotesTable with a set note_id
 - Update of existing row preserves data
 - Auto-increment table still works with pk=None
+- Rows read from the DB are saved with a column-diff UPDATE
 
 Validates: Requirements 9.1, 9.2, 12.3
 """
@@ -16,7 +17,7 @@ import tempfile
 
 import pytest
 
-from GameSentenceMiner.util.database.db import SQLiteDB, SQLiteDBTable
+from GameSentenceMiner.util.database.db import SQLiteDB, SQLiteDBTable, get_column_update_stats
 from GameSentenceMiner.util.database.anki_tables import AnkiNotesTable
 
 
@@ -141,3 +142,69 @@ def test_auto_increment_insert_with_pk_none(db):
     assert row is not None
     assert row[1] == "test"
     assert row[2] == "data"
+
+
+# ---------------------------------------------------------------------------
+# Test: loaded rows only write the columns that changed
+# ---------------------------------------------------------------------------
+
+
+def _capture_writes(db, monkeypatch):
+    writes = []
+    original_execute = db.execute
+
+    def recording_execute(query, params=(), commit=False, **kwargs):
+        if commit:
+            writes.append((query, params))
+        return original_execute(query, params, commit=commit, **kwargs)
+
+    monkeypatch.setattr(db, "execute", recording_execute)
+    return writes
+
+
+def test_loaded_row_saves_only_changed_columns(db, monkeypatch):
+    AnkiNotesTable(note_id=7, model_name="Basic", fields_json="{}", tags="[]", mod=1, synced_at=1.0).save()
+    note = AnkiNotesTable.get(7)
+    writes = _capture_writes(db, monkeypatch)
+
+    note.save()
+    assert writes == []
+
+    note.mod = 2
+    note.tags = '["new"]'
+    assert note.dirty_fields() == ["tags", "mod"]
+    note.save()
+
+    assert writes == [("UPDATE anki_notes SET tags=?, mod=? WHERE note_id=?", ('["new"]', 2, 7))]
+    assert note.dirty_fields() == []
+    assert AnkiNotesTable.get(7).mod == 2
+    assert AnkiNotesTable.get(7).model_name == "Basic"
+    stats = get_column_update_stats()["anki_notes"]
+    assert stats["noop_saves"] >= 1
+    assert stats["diff_updates"] >= 1
+
+
+def test_loaded_row_deleted_meanwhile_is_rewritten_in_full(db):
+    AnkiNotesTable(note_id=9, model_name="Basic", fields_json="{}", tags="[]", mod=1, synced_at=1.0).save()
+    loaded = AnkiNotesTable.get(9)
+    db.execute("DELETE FROM anki_notes WHERE note_id = ?", (9,), commit=True)
+
+    loaded.mod = 3
+    loaded.save()
+
+    restored = AnkiNotesTable.get(9)
+    assert restored.mod == 3
+    assert restored.model_name == "Basic"
+
+
+def test_update_fields_skips_the_pre_read(db, monkeypatch):
+    AnkiNotesTable(note_id=8, model_name="Basic", fields_json="{}", tags="[]", mod=1, synced_at=1.0).save()
+    monkeypatch.setattr(db, "fetchone", lambda *_args, **_kwargs: pytest.fail("update_fields must not read"))
+
+    assert AnkiNotesTable.update_fields(8, mod=5) == 1
+    assert AnkiNotesTable.update_fields(404, mod=5) == 0
+    with pytest.raises(ValueError):
+        AnkiNotesTable.update_fields(8, not_a_column=1)
+
+    monkeypatch.undo()
+    assert AnkiNotesTable.get(8).mod == 5
@@ -57,6 +57,16 @@ from GameSentenceMiner.util.database.tokenization_tables import (
     refresh_word_stats_active_global_ranks,
     _migrate_kanji_unique_index,
 )
+from GameSentenceMiner.util.database.word_novelty_tables import (
+    WORD_NOVELTY_DAILY_TABLE,
+    WORD_NOVELTY_LINES_TABLE,
+    WORD_NOVELTY_STATE_TABLE,
+    WORD_NOVELTY_WORDS_TABLE,
+    ensure_word_novelty_current,
+    rebuild_word_novelty,
+    refresh_word_novelty,
+    word_novelty_is_dirty,
+)
 from GameSentenceMiner.util.cron.tokenize_lines import (
     _run_realtime_tokenization_process,
     tokenize_line,
@@ -113,6 +123,10 @@ def _ensure_tokenization_tables():
         "words",
         "kanji",
         WORD_STATS_CACHE_TABLE,
+        WORD_NOVELTY_LINES_TABLE,
+        WORD_NOVELTY_WORDS_TABLE,
+        WORD_NOVELTY_DAILY_TABLE,
+        WORD_NOVELTY_STATE_TABLE,
         "anki_notes",
         "anki_cards",
         "anki_reviews",
@@ -157,6 +171,7 @@ def _make_mock_mecab(monkeypatch, token_map: dict):
 
     mock_mecab = MagicMock()
     mock_mecab.translate = MagicMock(side_effect=lambda text: token_map.get(text, []))
+    mock_mecab.translate_batch = MagicMock(side_effect=lambda texts: [token_map.get(text, []) for text in texts])
 
     monkeypatch.setattr(tokenizer_mod, "tokenizer", mock_mecab)
     return mock_mecab
@@ -621,6 +636,57 @@ class TestRunTokenizeBackfill:
         result = run_tokenize_backfill()
         assert result["processed"] == 1  # Only bf_5
 
+    def test_translates_each_batch_in_one_call(self, monkeypatch):
+        text_a = "テスト"
+        text_b = "猫"
+        mock = _make_mock_mecab(
+            monkeypatch,
+            {
+                text_a: [_tok("テスト", "テスト", "テスト", PartOfSpeech.noun)],
+                text_b: [_tok("猫", "猫", "ネコ", PartOfSpeech.noun)],
+            },
+        )
+        monkeypatch.setattr(
+            "GameSentenceMiner.util.cron.tokenize_lines.is_tokenization_enabled",
+            lambda: True,
+        )
+        monkeypatch.setattr(
+            "GameSentenceMiner.util.cron.tokenize_lines.is_tokenization_low_performance",
+            lambda: False,
+        )
+
+        _insert_line("bf_batch_1", text_a)
+        _insert_line("bf_batch_2", text_b)
+        _insert_line("bf_batch_3", "   ")
+
+        result = run_tokenize_backfill()
+
+        assert result["processed"] == 3
+        mock.translate_batch.assert_called_once()
+        assert sorted(mock.translate_batch.call_args.args[0]) == sorted([text_a, text_b])
+        mock.translate.assert_not_called()
+        assert WordsTable.get_by_word("猫") is not None
+
+    def test_batch_failure_falls_back_to_per_line(self, monkeypatch):
+        text = "テスト"
+        mock = _make_mock_mecab(monkeypatch, {text: [_tok("テスト", "テスト", "テスト", PartOfSpeech.noun)]})
+        mock.translate_batch.side_effect = RuntimeError("MeCab crashed")
+        monkeypatch.setattr(
+            "GameSentenceMiner.util.cron.tokenize_lines.is_tokenization_enabled",
+            lambda: True,
+        )
+        monkeypatch.setattr(
+            "GameSentenceMiner.util.cron.tokenize_lines.is_tokenization_low_performance",
+            lambda: False,
+        )
+
+        _insert_line("bf_fallback", text)
+
+        result = run_tokenize_backfill()
+
+        assert result["processed"] == 1
+        mock.translate.assert_called_once_with(text)
+
     def test_zero_lines(self, monkeypatch):
         monkeypatch.setattr(
             "GameSentenceMiner.util.cron.tokenize_lines.is_tokenization_enabled",
@@ -1697,6 +1763,103 @@ class TestTokenizeLineFirstSeen:
         assert word.first_seen_line_id == "fs_2a"
 
 
+class TestWordNoveltyAggregates:
+    """Verify the materialized novelty tables track tokenize_line and self-heal."""
+
+    def setup_method(self):
+        _ensure_tokenization_tables()
+        _reset_game_lines()
+
+    def _tokenize_fixture_lines(self, monkeypatch) -> tuple[str, str]:
+        token_map = {
+            "猫が好き": [
+                _tok("猫", "猫", "ネコ", PartOfSpeech.noun),
+                _tok("好き", "好き", "スキ", PartOfSpeech.noun),
+            ],
+            "犬と猫": [
+                _tok("犬", "犬", "イヌ", PartOfSpeech.noun),
+                _tok("猫", "猫", "ネコ", PartOfSpeech.noun),
+            ],
+        }
+        _make_mock_mecab(monkeypatch, token_map)
+        day_one = datetime(2025, 1, 1, 12).timestamp()
+        day_two = datetime(2025, 1, 2, 12).timestamp()
+
+        rebuild_word_novelty(gsm_db)
+        for line_id, text, timestamp in [
+            ("nov_1", "猫が好き", day_one),
+            ("nov_2", "犬と猫", day_two),
+            ("nov_3", "   ", day_two + 60),
+        ]:
+            _insert_line(line_id, text, timestamp=timestamp)
+            assert tokenize_line(line_id, text, line_timestamp=timestamp) is True
+        return "2025-01-01", "2025-01-02"
+
+    @staticmethod
+    def _snapshot() -> dict[str, list]:
+        return {
+            table: gsm_db.fetchall(f"SELECT * FROM {table} ORDER BY 1, 2")
+            for table in (WORD_NOVELTY_LINES_TABLE, WORD_NOVELTY_WORDS_TABLE, WORD_NOVELTY_DAILY_TABLE)
+        }
+
+    def test_tokenize_line_updates_aggregates_like_a_full_rebuild(self, monkeypatch):
+        day_one, day_two = self._tokenize_fixture_lines(monkeypatch)
+
+        incremental = self._snapshot()
+        assert ensure_word_novelty_current(gsm_db) is False
+        assert gsm_db.fetchall(
+            f"""
+            SELECT date, new_words, tokenized_chars, tokenized_lines, unique_words
+            FROM {WORD_NOVELTY_DAILY_TABLE}
+            ORDER BY date
+            """
+        ) == [(day_one, 2, 4, 1, 2), (day_two, 1, 6, 2, 2)]
+
+        rebuild_word_novelty(gsm_db)
+        assert self._snapshot() == incremental
+
+    def test_deleted_line_queues_a_background_rebuild_on_next_read(self, monkeypatch):
+        from GameSentenceMiner.util.concurrency import work_pool
+
+        _, day_two = self._tokenize_fixture_lines(monkeypatch)
+        queued = []
+        monkeypatch.setattr(work_pool, "submit_background_work", queued.append)
+
+        gsm_db.execute("DELETE FROM game_lines WHERE id = ?", ("nov_2",), commit=True)
+
+        assert ensure_word_novelty_current(gsm_db) is True
+        assert ensure_word_novelty_current(gsm_db) is True
+        assert len(queued) == 1
+        queued[0]()
+        assert gsm_db.fetchone(
+            f"""
+            SELECT new_words, tokenized_chars, tokenized_lines, unique_words
+            FROM {WORD_NOVELTY_DAILY_TABLE}
+            WHERE date = ?
+            """,
+            (day_two,),
+        ) == (0, 3, 1, 0)
+        assert ensure_word_novelty_current(gsm_db) is False
+
+    def test_first_seen_moved_off_a_recorded_line_marks_aggregates_dirty(self, monkeypatch):
+        self._tokenize_fixture_lines(monkeypatch)
+        assert word_novelty_is_dirty(gsm_db) is False
+
+        word = WordsTable.get_by_word("犬")
+        gsm_db.execute(
+            "UPDATE words SET first_seen = ?, first_seen_line_id = ? WHERE id = ?",
+            (datetime(2025, 1, 1, 12).timestamp(), "nov_1", word.id),
+            commit=True,
+        )
+
+        assert word_novelty_is_dirty(gsm_db) is True
+        assert refresh_word_novelty(gsm_db) is True
+        assert gsm_db.fetchall(
+            f"SELECT line_id, new_words FROM {WORD_NOVELTY_LINES_TABLE} WHERE new_words > 0 ORDER BY line_id"
+        ) == [("nov_1", 3)]
+        assert refresh_word_novelty(gsm_db) is False
+
+
 # ---------------------------------------------------------------------------
 # tokenize_line last_seen integration tests (Task 2.3)
 # ---------------------------------------------------------------------------
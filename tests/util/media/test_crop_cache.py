@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+from PIL import Image, ImageDraw
+
+from GameSentenceMiner.util.media import crop_cache, ffmpeg
+
+
+def _frame(width=1920, height=1080, content_box=None, fill=(180, 140, 90)):
+    """Black frame with a bright content rectangle (defaults to the full frame)."""
+    image = Image.new("RGB", (width, height), (0, 0, 0))
+    box = content_box or (0, 0, width, height)
+    ImageDraw.Draw(image).rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill=fill)
+    return image
+
+
+@pytest.fixture(autouse=True)
+def _clear_crop_cache():
+    crop_cache.clear()
+    yield
+    crop_cache.clear()
+
+
+def test_validate_accepts_matching_pillarbox_crop():
+    sample = crop_cache.prepare_sample(_frame(content_box=(240, 0, 1680, 1080)))
+
+    assert crop_cache.validate(sample, 1920, 1080, "crop=1440:1080:240:0")
+
+
+def test_validate_rejects_pillarbox_crop_after_switch_to_widescreen():
+    sample = crop_cache.prepare_sample(_frame())
+
+    assert not crop_cache.validate(sample, 1920, 1080, "crop=1440:1080:240:0")
+
+
+def test_validate_rejects_no_crop_once_bars_appear():
+    sample = crop_cache.prepare_sample(_frame(content_box=(240, 0, 1680, 1080)))
+
+    assert not crop_cache.validate(sample, 1920, 1080, None)
+    assert crop_cache.validate(crop_cache.prepare_sample(_frame()), 1920, 1080, None)
+
+
+def test_validate_rejects_crop_when_letterbox_grows():
+    sample = crop_cache.prepare_sample(_frame(content_box=(240, 140, 1680, 940)))
+
+    assert not crop_cache.validate(sample, 1920, 1080, "crop=1440:1080:240:0")
+
+
+def _install_detection(monkeypatch, crop="crop=1440:1080:240:0"):
+    detections = []
+
+    def fake_run(command, **_kwargs):
+        if "cropdetect=limit=16:round=2" in command:
+            detections.append(command)
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr=f"[Parsed_cropdetect_0] {crop}\n")
+        return subprocess.CompletedProcess(command, 1, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr(ffmpeg, "get_video_dimensions", lambda _video: (1920, 1080))
+    monkeypatch.setattr(ffmpeg.FFmpegHelper, "run", fake_run)
+    monkeypatch.setattr(ffmpeg.obs, "get_current_scene", lambda: "Scene A")
+    return detections
+
+
+def test_find_black_bars_reuses_validated_crop(monkeypatch, tmp_path):
+    detections = _install_detection(monkeypatch)
+    frame_path = tmp_path / "frame.png"
+    _frame(content_box=(240, 0, 1680, 1080)).save(frame_path)
+
+    first = ffmpeg.find_black_bars("replay.mkv", 10.0, frame_path)
+    second = ffmpeg.find_black_bars("replay.mkv", 12.0, frame_path)
+
+    assert first == second == "crop=1440:1080:240:0"
+    assert len(detections) == 1
+    assert crop_cache.get_stats()["hits"] == 1
+
+
+def test_find_black_bars_redetects_when_cached_crop_no_longer_matches(monkeypatch, tmp_path):
+    detections = _install_detection(monkeypatch)
+    pillarboxed = tmp_path / "pillarboxed.png"
+    widescreen = tmp_path / "widescreen.png"
+    _frame(content_box=(240, 0, 1680, 1080)).save(pillarboxed)
+    _frame().save(widescreen)
+
+    ffmpeg.find_black_bars("replay.mkv", 10.0, pillarboxed)
+    ffmpeg.find_black_bars("replay.mkv", 12.0, widescreen)
+
+    assert len(detections) == 2
+    assert crop_cache.get_stats()["invalidations"] == 1
+
+
+def test_find_black_bars_cache_is_keyed_by_scene(monkeypatch, tmp_path):
+    detections = _install_detection(monkeypatch)
+    frame_path = tmp_path / "frame.png"
+    _frame(content_box=(240, 0, 1680, 1080)).save(frame_path)
+
+    ffmpeg.find_black_bars("replay.mkv", 10.0, frame_path)
+    monkeypatch.setattr(ffmpeg.obs, "get_current_scene", lambda: "Scene B")
+    ffmpeg.find_black_bars("replay.mkv", 10.0, frame_path)
+
+    assert len(detections) == 2
@@ -406,7 +406,7 @@ def test_static_webp_jpeg_fallback_keeps_black_bar_crop(monkeypatch, tmp_path):
         "get_config",
         lambda: _screenshot_config(trim_black_bars_wip=True, width=640),
     )
-    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing: "crop=1280:720:0:120")
+    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing, _frame=None: "crop=1280:720:0:120")
     monkeypatch.setattr(ffmpeg.FFmpegHelper, "run", fake_run)
 
     result = ffmpeg.encode_screenshot(
@@ -439,7 +439,7 @@ def test_get_screenshot_png_fallback_keeps_black_bar_crop(monkeypatch, tmp_path)
     )
     monkeypatch.setattr(ffmpeg, "get_temporary_directory", lambda: str(tmp_path))
     monkeypatch.setattr(ffmpeg.obs, "get_current_game", lambda sanitize=True: "game")
-    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing: "crop=1280:720:0:120")
+    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing, _frame=None: "crop=1280:720:0:120")
     monkeypatch.setattr(ffmpeg.FFmpegHelper, "run", fake_run)
 
     result = ffmpeg.get_screenshot("source.mp4", 12.5)
@@ -467,7 +467,7 @@ def test_process_image_png_fallback_keeps_screenshot_filters(monkeypatch, tmp_pa
     )
     monkeypatch.setattr(ffmpeg, "get_temporary_directory", lambda: str(tmp_path))
     monkeypatch.setattr(ffmpeg.obs, "get_current_game", lambda sanitize=True: "game")
-    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing: "crop=1280:720:0:120")
+    monkeypatch.setattr(ffmpeg, "find_black_bars", lambda _video, _timing, _frame=None: "crop=1280:720:0:120")
     monkeypatch.setattr(ffmpeg.FFmpegHelper, "run", fake_run)
 
     result = ffmpeg.process_image(str(input_image), source_video_path="source.mp4", screenshot_timing=12.5)
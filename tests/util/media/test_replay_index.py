@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+
+import pytest
+
+from GameSentenceMiner.util.media import replay_index
+
+
+def _probe_output(keyframes, duration=30.0, start_time=0.0, fps=10):
+    packets = []
+    frame = 0.0
+    while frame < duration:
+        flags = "K__" if any(abs(frame - kf) < 1e-6 for kf in keyframes) else "___"
+        packets.append({"pts_time": f"{frame + start_time:.6f}", "flags": flags})
+        frame += 1.0 / fps
+    return json.dumps(
+        {
+            "packets": packets,
+            "format": {"duration": f"{duration}", "start_time": f"{start_time}"},
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    replay_index.clear_replay_index_cache()
+    yield
+    replay_index.clear_replay_index_cache()
+
+
+@pytest.fixture
+def replay(tmp_path):
+    path = tmp_path / "Replay 2026-01-01.mkv"
+    path.write_bytes(b"video-bytes")
+    return path
+
+
+def _install_probe(monkeypatch, output):
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=output, stderr="")
+
+    monkeypatch.setattr(replay_index.subprocess, "run", fake_run)
+    return calls
+
+
+def test_index_is_built_once_and_written_alongside_replay(monkeypatch, replay):
+    calls = _install_probe(monkeypatch, _probe_output([0.0, 2.0, 4.0]))
+
+    index = replay_index.get_replay_index(replay)
+
+    assert index is not None
+    assert index.duration == 30.0
+    assert index.keyframes == [0.0, 2.0, 4.0]
+    assert os.path.exists(replay_index.get_index_path(str(replay)))
+
+    replay_index.clear_replay_index_cache()
+    reloaded = replay_index.get_replay_index(replay)
+
+    assert reloaded.keyframes == [0.0, 2.0, 4.0]
+    assert len(calls) == 1
+
+
+def test_keyframes_are_relative_to_container_start(monkeypatch, replay):
+    _install_probe(monkeypatch, _probe_output([0.0, 2.0], start_time=1.5))
+
+    index = replay_index.get_replay_index(replay)
+
+    assert index.keyframes == [0.0, 2.0]
+
+
+def test_seek_args_split_at_nearest_preceding_keyframe(monkeypatch, replay):
+    _install_probe(monkeypatch, _probe_output([0.0, 2.0, 4.0]))
+
+    pre_input, post_input = replay_index.keyframe_seek_args(replay, 3.25)
+
+    assert pre_input == ["-ss", "2.000000"]
+    assert post_input == ["-ss", "1.250000"]
+
+
+def test_seek_on_keyframe_needs_no_output_seek(monkeypatch, replay):
+    _install_probe(monkeypatch, _probe_output([0.0, 2.0, 4.0]))
+
+    assert replay_index.keyframe_seek_args(replay, 4.0) == (["-ss", "4.000000"], [])
+
+
+def test_seek_args_fall_back_to_input_seek_without_index(monkeypatch, replay):
+    def failing_run(cmd, **_kwargs):
+        raise subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(replay_index.subprocess, "run", failing_run)
+
+    assert replay_index.keyframe_seek_args(replay, 12.5) == (["-ss", "12.5"], [])
+    assert replay_index.keyframe_seek_args("missing.mkv", 12.5) == (["-ss", "12.5"], [])
+
+
+def test_stale_sidecar_is_rebuilt_when_replay_changes(monkeypatch, replay):
+    calls = _install_probe(monkeypatch, _probe_output([0.0, 2.0]))
+    replay_index.get_replay_index(replay)
+
+    replay.write_bytes(b"a different, longer replay")
+    replay_index.clear_replay_index_cache()
+    replay_index.get_replay_index(replay)
+
+    assert len(calls) == 2
+
+
+def test_remove_replay_index_deletes_sidecar(monkeypatch, replay):
+    _install_probe(monkeypatch, _probe_output([0.0]))
+    replay_index.get_replay_index(replay)
+
+    replay_index.remove_replay_index(replay)
+
+    assert not os.path.exists(replay_index.get_index_path(str(replay)))
+    assert replay_index.get_cached_replay_index(replay) is None
@@ -0,0 +1,71 @@
+import asyncio
+
+from PIL import Image, ImageDraw
+
+from GameSentenceMiner.util.overlay import get_overlay_coords
+from GameSentenceMiner.util.overlay.change_gate import OverlayChangeGate
+
+
+def _frame(text_width=0, noise=False):
+    image = Image.new("RGB", (640, 360), (30, 30, 60))
+    draw = ImageDraw.Draw(image)
+    if text_width:
+        draw.rectangle((40, 280, 40 + text_width, 300), fill=(240, 240, 240))
+    if noise:
+        image.putpixel((5, 5), (36, 33, 64))
+    return image
+
+
+def test_gate_skips_static_frames_and_ignores_capture_noise():
+    gate = OverlayChangeGate()
+
+    assert gate.should_scan(_frame(200))
+    assert not gate.should_scan(_frame(200, noise=True))
+    assert gate.should_scan(_frame(260))
+    assert (gate.scans, gate.skipped) == (2, 1)
+
+
+def test_interval_backs_off_while_static_and_resets_on_change():
+    gate = OverlayChangeGate(backoff_factor=2.0, max_backoff=4.0)
+    gate.should_scan(_frame(200))
+
+    intervals = []
+    for _ in range(3):
+        gate.should_scan(_frame(200))
+        intervals.append(gate.next_interval(0.5))
+    gate.should_scan(_frame(300))
+
+    assert intervals == [1.0, 2.0, 2.0]
+    assert gate.next_interval(0.5) == 0.5
+
+
+def test_slow_gradient_accumulates_until_it_crosses_the_threshold():
+    gate = OverlayChangeGate(tile_threshold=6)
+
+    # Each frame brightens by 1, well below the threshold frame to frame.
+    frames = [Image.new("RGB", (640, 360), (30 + step, 30 + step, 60 + step)) for step in range(49)]
+    decisions = [gate.should_scan(frame) for frame in frames]
+
+    assert decisions[0]
+    assert decisions.count(True) == 7
+    assert [step for step, scanned in enumerate(decisions) if scanned][:3] == [0, 7, 14]
+
+
+def test_periodic_do_work_skips_local_ocr_on_unchanged_screen(monkeypatch):
+    processor = get_overlay_coords.OverlayProcessor()
+    engine_calls = []
+
+    def fake_engine(image, **_kwargs):
+        engine_calls.append(image.size)
+        return (False, "", None, None, None, None)
+
+    processor.oneocr = fake_engine
+    monkeypatch.setattr(processor, "_get_effective_engine", lambda: "oneocr")
+    monkeypatch.setattr(processor, "_send_sentence_recycled_status", lambda **_kwargs: None)
+    monkeypatch.setattr(processor, "get_image_to_ocr", lambda: (_frame(200), 0, 0, 640, 360))
+
+    for _ in range(3):
+        asyncio.run(processor._do_work(check_against_last=True, local_ocr_retry=0, change_gated=True))
+
+    assert len(engine_calls) == 1
+    assert processor.change_gate.skipped == 2
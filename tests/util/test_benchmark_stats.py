@@ -286,3 +286,24 @@ def test_goals_benchmark_cli_smoke_run(benchmark_db_path, tmp_path):
     assert result["status_code"] == 200
     assert result["response_bytes"] > 0
     assert len(result["samples_ms"]) == 1
+
+
+def test_range_query_benchmark_compares_cast_and_sargable_predicates(benchmark_db_path, tmp_path):
+    module = _load_benchmark_module()
+    snapshot_path = module.create_snapshot_db(benchmark_db_path, tmp_path / "snapshot")
+    module.ensure_timestamp_indexes(snapshot_path)
+
+    selection = module.BenchmarkSelection(game_id="game-1", today_date="2026-03-09")
+    measurements = {
+        measurement.query: measurement
+        for measurement in module.benchmark_range_queries(snapshot_path, selection, iterations=1, warmup=0)
+    }
+
+    assert {"day_lines", "day_lines_ordered", "game_month_lines"} <= set(measurements)
+    assert all(measurement.results_match for measurement in measurements.values())
+    assert measurements["day_lines_ordered"].rows == 2
+
+    game_month = measurements["game_month_lines"]
+    assert "idx_game_lines_game_id_timestamp" in game_month.sargable_plan
+    assert "timestamp>?" in game_month.sargable_plan.replace(" ", "")
+    assert "timestamp>?" not in game_month.legacy_plan.replace(" ", "")
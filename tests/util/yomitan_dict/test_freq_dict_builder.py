@@ -126,3 +126,144 @@ class TestBuildFromDb:
 
         if original_db is not None:
             monkeypatch.setattr(WordsTable, "_db", original_db)
+
+
+class TestFrequencyBankCache:
+    @pytest.fixture
+    def token_db(self):
+        from GameSentenceMiner.util.database.db import SQLiteDB
+        from GameSentenceMiner.util.database.global_frequency_tables import create_global_frequency_tables
+        from GameSentenceMiner.util.database.tokenization_tables import (
+            WordOccurrencesTable,
+            WordsTable,
+            create_tokenization_trigger,
+            create_word_stats_cache_table,
+        )
+
+        db = SQLiteDB(":memory:")
+        originals = {cls: getattr(cls, "_db", None) for cls in (WordsTable, WordOccurrencesTable)}
+        db.execute("CREATE TABLE game_lines (id TEXT PRIMARY KEY)", commit=True)
+        WordsTable.set_db(db)
+        WordOccurrencesTable.set_db(db)
+        create_word_stats_cache_table(db)
+        create_global_frequency_tables(db)
+        create_tokenization_trigger(db)
+        yield db
+        for cls, original in originals.items():
+            cls._db = original
+        db.close()
+
+    @staticmethod
+    def _add(word: str, reading: str, lines: list[str]) -> int:
+        from GameSentenceMiner.util.database.tokenization_tables import WordOccurrencesTable, WordsTable
+
+        word_id = WordsTable.get_or_create(word, reading, "名詞")
+        for line_id in lines:
+            WordOccurrencesTable.insert_occurrence(word_id, line_id)
+        return word_id
+
+    @staticmethod
+    def _zip_entries(builder: FrequencyDictBuilder) -> dict[str, list]:
+        with zipfile.ZipFile(io.BytesIO(builder.export_bytes())) as zf:
+            assert zf.testzip() is None
+            return {
+                name: json.loads(zf.read(name))
+                for name in zf.namelist()
+                if name.startswith("term_meta_bank_")
+            }
+
+    def test_only_touched_banks_are_rebuilt(self, token_db, tmp_path, monkeypatch):
+        from GameSentenceMiner.util.database.tokenization_tables import WordOccurrencesTable
+        from GameSentenceMiner.util.yomitan_dict.freq_dict_builder import FrequencyBankCache
+
+        monkeypatch.setattr(FrequencyBankCache, "BANK_WORD_SPAN", 2)
+        cache = FrequencyBankCache(directory=str(tmp_path))
+        self._add("猫", "ねこ", ["l1", "l2"])  # id 1 -> bank 0
+        self._add("犬", "いぬ", ["l1"])  # id 2 -> bank 1
+        bird_id = self._add("鳥", "とり", ["l3"])  # id 3 -> bank 1
+
+        first = FrequencyDictBuilder(bank_cache=cache)
+        first.build_from_db()
+        assert cache.last_rebuilt_banks == [0, 1]
+        assert self._zip_entries(first) == {
+            "term_meta_bank_1.json": [["猫", "freq", {"frequency": 2, "reading": "ねこ"}]],
+            "term_meta_bank_2.json": [
+                ["犬", "freq", {"frequency": 1, "reading": "いぬ"}],
+                ["鳥", "freq", {"frequency": 1, "reading": "とり"}],
+            ],
+        }
+
+        unchanged = FrequencyDictBuilder(bank_cache=cache)
+        unchanged.build_from_db()
+        assert cache.last_rebuilt_banks == []
+        assert unchanged.revision == first.revision
+
+        WordOccurrencesTable.insert_occurrence(bird_id, "l4")
+        grown = FrequencyDictBuilder(bank_cache=cache)
+        grown.build_from_db()
+        assert cache.last_rebuilt_banks == [1]
+        assert self._zip_entries(grown)["term_meta_bank_2.json"][0] == [
+            "鳥",
+            "freq",
+            {"frequency": 2, "reading": "とり"},
+        ]
+
+    def test_index_revision_matches_the_zip_revision(self, token_db, tmp_path):
+        from GameSentenceMiner.util.database.tokenization_tables import WordOccurrencesTable
+        from GameSentenceMiner.util.yomitan_dict.freq_dict_builder import FrequencyBankCache
+
+        cache = FrequencyBankCache(directory=str(tmp_path))
+        cat_id = self._add("猫", "ねこ", ["l1"])
+        built = FrequencyDictBuilder(bank_cache=cache)
+        built.build_from_db()
+
+        index = FrequencyDictBuilder(bank_cache=cache)
+        index.load_revision()
+        assert index.revision == built.revision
+
+        WordOccurrencesTable.insert_occurrence(cat_id, "l2")
+        index.load_revision()
+        rebuilt = FrequencyDictBuilder(bank_cache=cache)
+        rebuilt.build_from_db()
+        assert index.revision == rebuilt.revision != built.revision
+
+    def test_deleted_occurrences_are_detected_by_signature(self, token_db, tmp_path, monkeypatch):
+        from GameSentenceMiner.util.yomitan_dict.freq_dict_builder import FrequencyBankCache
+
+        monkeypatch.setattr(FrequencyBankCache, "BANK_WORD_SPAN", 2)
+        cache = FrequencyBankCache(directory=str(tmp_path))
+        self._add("猫", "ねこ", ["l1", "l2"])
+        self._add("犬", "いぬ", ["l1"])
+        self._add("鳥", "とり", ["l3"])
+        FrequencyDictBuilder(bank_cache=cache).build_from_db()
+
+        token_db.execute("DELETE FROM word_occurrences WHERE line_id = ?", ("l3",), commit=True)
+        builder = FrequencyDictBuilder(bank_cache=cache)
+        builder.build_from_db()
+
+        assert cache.last_rebuilt_banks == [1]
+        assert self._zip_entries(builder)["term_meta_bank_2.json"] == [
+            ["犬", "freq", {"frequency": 1, "reading": "いぬ"}]
+        ]
+
+    def test_streamed_banks_survive_a_concurrent_refresh(self, token_db, tmp_path, monkeypatch):
+        from GameSentenceMiner.util.database.tokenization_tables import WordOccurrencesTable
+        from GameSentenceMiner.util.yomitan_dict.freq_dict_builder import FrequencyBankCache
+
+        monkeypatch.setattr(FrequencyBankCache, "BANK_WORD_SPAN", 2)
+        cache = FrequencyBankCache(directory=str(tmp_path))
+        cat_id = self._add("猫", "ねこ", ["l1"])
+        first = FrequencyDictBuilder(bank_cache=cache)
+        first.build_from_db()
+
+        WordOccurrencesTable.insert_occurrence(cat_id, "l2")
+        second = FrequencyDictBuilder(bank_cache=cache)
+        second.build_from_db()
+
+        assert second.revision != first.revision
+        assert self._zip_entries(first)["term_meta_bank_1.json"] == [
+            ["猫", "freq", {"frequency": 1, "reading": "ねこ"}]
+        ]
+        assert self._zip_entries(second)["term_meta_bank_1.json"] == [
+            ["猫", "freq", {"frequency": 2, "reading": "ねこ"}]
+        ]
@@ -20,6 +20,7 @@ from GameSentenceMiner.util.database.tokenization_tables import (
     WordsTable,
     setup_tokenization,
 )
+from GameSentenceMiner.util.database.word_novelty_tables import rebuild_word_novelty
 
 
 @pytest.fixture(autouse=True)
@@ -320,6 +321,8 @@ def test_game_stats_reports_word_novelty_for_words_first_seen_in_that_game(clien
     WordOccurrencesTable.insert_occurrence(alpha_id, "novelty-line-2")
     WordOccurrencesTable.insert_occurrence(beta_id, "novelty-line-2")
     WordOccurrencesTable.insert_occurrence(carry_id, "novelty-line-2")
+    # Written around the tokenizer, so rebuild the aggregates like the daily reconcile.
+    rebuild_word_novelty(_in_memory_db)
 
     response = client.get(f"/api/game/{game_id}/stats")
 
@@ -464,6 +464,142 @@ class TestGoalsDashboard:
         assert active_goal["today"]["required"] == 100
 
 
+class TestGoalsDashboardMemo:
+    def _seed_character_goal(self, today):
+        yesterday = today - datetime.timedelta(days=1)
+        _seed_rollup(yesterday, characters=100)
+        _seed_current_goals(
+            goals=[
+                {
+                    "id": "goal_active",
+                    "name": "Read chars",
+                    "metricType": "characters",
+                    "targetValue": 310,
+                    "startDate": yesterday.isoformat(),
+                    "endDate": (today + datetime.timedelta(days=2)).isoformat(),
+                    "mediaType": "ALL",
+                }
+            ]
+        )
+
+    def test_unchanged_dashboard_is_served_from_memory(self, client, monkeypatch):
+        from GameSentenceMiner.web import goals_api
+
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        self._seed_character_goal(today)
+        _seed_today_line(today, text="x" * 30)
+
+        first = client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"}).get_json()
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("memoized dashboard should not hit the database")
+
+        monkeypatch.setattr(goals_api, "get_todays_live_data", fail)
+        monkeypatch.setattr(goals_api, "get_rollup_stats_for_range", fail)
+        second = client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"}).get_json()
+
+        assert second == first
+        assert second["today_progress"]["goal_active"]["total_progress"] == 130
+
+    def test_new_line_recomputes_only_todays_live_component(self, client, monkeypatch):
+        from GameSentenceMiner.web import goals_api
+
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        self._seed_character_goal(today)
+        _seed_today_line(today, text="x" * 30)
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+
+        live_calls = []
+        original_live = goals_api.get_todays_live_data
+
+        def tracking_live(*args, **kwargs):
+            live_calls.append(args)
+            return original_live(*args, **kwargs)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("rollup history should still be memoized")
+
+        monkeypatch.setattr(goals_api, "get_todays_live_data", tracking_live)
+        monkeypatch.setattr(goals_api, "get_rollup_stats_for_range", fail)
+        _seed_today_line(today, text="x" * 20)
+
+        data = client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"}).get_json()
+
+        assert len(live_calls) == 1
+        assert data["today_progress"]["goal_active"]["progress"] == 50
+        assert data["today_progress"]["goal_active"]["total_progress"] == 150
+
+    def test_goal_update_invalidates_dashboard(self, client):
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        self._seed_character_goal(today)
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+
+        resp = client.post(
+            "/api/goals/update",
+            json={"current_goals": [{"id": "goal_new", "name": "New", "metricType": "hours_static", "targetValue": 1}]},
+        )
+        assert resp.status_code == 200
+
+        data = client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"}).get_json()
+        assert [goal["id"] for goal in data["current_goals"]] == ["goal_new"]
+        assert "goal_active" not in data["today_progress"]
+
+    def _seed_mature_cards_goal(self, today, monkeypatch, anki_lookup):
+        from GameSentenceMiner.util.database.anki_tables import AnkiCardsTable
+
+        monkeypatch.setattr(AnkiCardsTable, "_db", GoalsTable._db)
+        monkeypatch.setattr(AnkiCardsTable, "one", anki_lookup)
+        _seed_current_goals(
+            goals=[
+                {
+                    "id": "goal_mature",
+                    "name": "Mature cards",
+                    "metricType": "mature_cards",
+                    "targetValue": 100,
+                    "startDate": today.isoformat(),
+                    "endDate": (today + datetime.timedelta(days=10)).isoformat(),
+                    "mediaType": "ALL",
+                }
+            ]
+        )
+
+    def test_payload_with_anki_counts_expires(self, client, monkeypatch):
+        from GameSentenceMiner.util.database import data_generation
+
+        clock = [1000.0]
+        monkeypatch.setattr(data_generation.time, "monotonic", lambda: clock[0])
+        anki_lookups = []
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        self._seed_mature_cards_goal(today, monkeypatch, lambda *args, **kwargs: anki_lookups.append(1))
+
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+        built = len(anki_lookups)
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+        assert built > 0
+        assert len(anki_lookups) == built
+
+        clock[0] += 61
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+        assert len(anki_lookups) == 2 * built
+
+    def test_payload_with_failed_anki_query_is_not_memoized(self, client, monkeypatch):
+        anki_lookups = []
+
+        def failing_lookup(*_args, **_kwargs):
+            anki_lookups.append(1)
+            raise RuntimeError("Anki is closed")
+
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        self._seed_mature_cards_goal(today, monkeypatch, failing_lookup)
+
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+        built = len(anki_lookups)
+        client.get("/api/goals/dashboard", headers={"X-Timezone": "UTC"})
+
+        assert built > 0
+        assert len(anki_lookups) == 2 * built
+
+
 # ===================================================================
 # /api/goals/update POST
 # ===================================================================
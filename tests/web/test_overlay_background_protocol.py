@@ -0,0 +1,91 @@
+import asyncio
+import json
+import queue
+
+from PIL import Image, ImageDraw
+
+from GameSentenceMiner.util.overlay import get_overlay_coords
+from GameSentenceMiner.web.gsm_websocket import EndpointSpec, ID_OVERLAY, MultiplexWebsocketServerThread
+from GameSentenceMiner.web.overlay_background_protocol import OverlayBackgroundEncoder, parse_background_frame
+
+
+def _snapshot(marker_x=None):
+    image = Image.new("RGB", (1024, 512), (40, 60, 90))
+    if marker_x is not None:
+        ImageDraw.Draw(image).rectangle((marker_x, 20, marker_x + 40, 60), fill=(250, 250, 250))
+    return image
+
+
+def test_first_frame_is_keyframe_and_later_frames_carry_changed_tiles_only():
+    encoder = OverlayBackgroundEncoder(tile_size=256)
+
+    first = encoder.push(_snapshot())
+    second = encoder.push(_snapshot(marker_x=300))
+
+    keyframe = parse_background_frame(first.for_client(0))
+    delta = parse_background_frame(second.for_client(first.frame_id))
+    assert keyframe["keyframe"] and len(keyframe["tiles"]) == 1
+    assert (keyframe["width"], keyframe["height"]) == (1024, 512)
+    assert not delta["keyframe"] and delta["base_frame_id"] == first.frame_id
+    assert [(tile["x"], tile["y"]) for tile in delta["tiles"]] == [(256, 0)]
+    # A client that missed the base frame gets a full keyframe instead.
+    assert parse_background_frame(second.for_client(0))["keyframe"]
+
+
+def test_wide_snapshots_are_downscaled_before_encoding():
+    encoder = OverlayBackgroundEncoder(max_width=512)
+
+    frame = parse_background_frame(encoder.push(_snapshot()).keyframe())
+
+    assert (frame["width"], frame["height"]) == (512, 256)
+
+
+def test_multiplex_server_sends_binary_background_only_to_negotiated_overlays():
+    server = MultiplexWebsocketServerThread(
+        name="test",
+        get_port_func=lambda: 0,
+        msg_queue=queue.Queue(),
+        is_paused_func=lambda: False,
+        endpoint_specs={ID_OVERLAY: EndpointSpec(read_mode=True, message_callback=lambda _message: None)},
+    )
+    legacy = object()
+    negotiated = object()
+
+    async def scenario():
+        server._get_clients(ID_OVERLAY).update({legacy, negotiated})
+        server._client_output_queues[legacy] = asyncio.Queue(maxsize=4)
+        server._client_output_queues[negotiated] = asyncio.Queue(maxsize=4)
+        await server._handle_incoming_message(
+            ID_OVERLAY, negotiated, json.dumps({"type": "overlay_protocol_hello", "background": "tiles-v1"})
+        )
+        await server._send_overlay_background_coroutine(_snapshot())
+        await server._send_overlay_background_coroutine(_snapshot(marker_x=600))
+        legacy_frames = [server._client_output_queues[legacy].get_nowait() for _ in range(2)]
+        negotiated_frames = [server._client_output_queues[negotiated].get_nowait() for _ in range(2)]
+        return legacy_frames, negotiated_frames
+
+    legacy_frames, negotiated_frames = asyncio.run(scenario())
+
+    legacy_message = json.loads(legacy_frames[0])
+    assert legacy_message["type"] == "manual_mode_background"
+    assert legacy_message["image"].startswith("data:image/jpeg;base64,")
+    assert parse_background_frame(negotiated_frames[0])["keyframe"]
+    assert len(parse_background_frame(negotiated_frames[1])["tiles"]) == 1
+    assert len(negotiated_frames[1]) < len(negotiated_frames[0])
+
+
+def test_manual_background_capture_hands_the_image_to_the_transport(monkeypatch):
+    processor = get_overlay_coords.OverlayProcessor()
+    sent = []
+    image = _snapshot()
+
+    async def fake_send(payload):
+        sent.append(payload)
+
+    monkeypatch.setattr(processor, "_get_manual_background_mode", lambda: "on_demand")
+    monkeypatch.setattr(processor, "_capture_full_monitor_mss", lambda: image)
+    monkeypatch.setattr(get_overlay_coords, "send_manual_background_to_overlay", fake_send)
+
+    asyncio.run(processor.capture_and_send_manual_background())
+
+    assert sent == [image]
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import queue
+
+from GameSentenceMiner.web.gsm_websocket import EndpointSpec, ID_OVERLAY, MultiplexWebsocketServerThread
+from GameSentenceMiner.web.overlay_box_protocol import (
+    OverlayBoxDecoder,
+    OverlayBoxEncoder,
+    QUANT_SCALE,
+)
+
+
+def _rect(x, y, width=0.1, height=0.05):
+    return {
+        "x1": x,
+        "y1": y,
+        "x2": x + width,
+        "y2": y,
+        "x3": x + width,
+        "y3": y + height,
+        "x4": x,
+        "y4": y + height,
+    }
+
+
+def _line(text, x, y):
+    return {
+        "text": text,
+        "bounding_rect": _rect(x, y, 0.1 * len(text)),
+        "words": [{"text": char, "bounding_rect": _rect(x + index * 0.1, y)} for index, char in enumerate(text)],
+    }
+
+
+def _payload(*lines, **meta):
+    return {"type": "word_coordinates", "data": list(lines), "is_sentence_recycled": False, **meta}
+
+
+def _assert_same_boxes(decoded, payload):
+    assert [line["text"] for line in decoded["data"]] == [line["text"] for line in payload["data"]]
+    for decoded_line, line in zip(decoded["data"], payload["data"]):
+        for key, value in line["bounding_rect"].items():
+            assert abs(decoded_line["bounding_rect"][key] - value) <= 1 / QUANT_SCALE
+        assert [word["text"] for word in decoded_line["words"]] == [word["text"] for word in line["words"]]
+
+
+def test_delta_frames_round_trip_and_only_carry_changed_boxes():
+    encoder = OverlayBoxEncoder()
+    decoder = OverlayBoxDecoder()
+    first = _payload(_line("猫が", 0.1, 0.1), _line("犬", 0.1, 0.5))
+    second = _payload(_line("猫が", 0.1, 0.1), _line("鳥", 0.3, 0.6), is_final=True)
+
+    v1 = encoder.push(first)
+    _assert_same_boxes(decoder.decode(encoder.encode(v1, 0)), first)
+    v2 = encoder.push(second)
+    delta = encoder.encode(v2, v1)
+    decoded = decoder.decode(delta)
+
+    _assert_same_boxes(decoded, second)
+    assert decoded["is_final"] is True
+    assert len(delta) < len(encoder.encode(v2, 0)) < len(json.dumps(second))
+
+
+def test_unknown_base_falls_back_to_snapshot_and_unencodable_payloads_are_skipped():
+    encoder = OverlayBoxEncoder(history_size=2)
+    versions = [encoder.push(_payload(_line(text, 0.1, 0.1))) for text in ("一", "二", "三")]
+
+    # Version 1 fell out of history, so the client gets a full snapshot.
+    assert OverlayBoxDecoder().decode(encoder.encode(versions[-1], versions[0]))["data"][0]["text"] == "三"
+    assert OverlayBoxDecoder().decode(encoder.encode(versions[-1], versions[1])) is None
+    assert encoder.push({"type": "word_coordinates", "data": [{"text": "x", "bounding_rect": None}]}) is None
+
+
+def test_multiplex_server_sends_binary_deltas_only_to_negotiated_overlays():
+    server = MultiplexWebsocketServerThread(
+        name="test",
+        get_port_func=lambda: 0,
+        msg_queue=queue.Queue(),
+        is_paused_func=lambda: False,
+        endpoint_specs={ID_OVERLAY: EndpointSpec(read_mode=True, message_callback=lambda _message: None)},
+    )
+
+    class FakeWebsocket:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, message):
+            self.sent.append(message)
+
+    legacy = FakeWebsocket()
+    negotiated = FakeWebsocket()
+    payload = _payload(_line("猫", 0.2, 0.2))
+
+    async def scenario():
+        server._get_clients(ID_OVERLAY).update({legacy, negotiated})
+        server._client_output_queues[legacy] = asyncio.Queue(maxsize=4)
+        server._client_output_queues[negotiated] = asyncio.Queue(maxsize=4)
+
+        await server._handle_incoming_message(
+            ID_OVERLAY, negotiated, json.dumps({"type": "overlay_protocol_hello", "word_boxes": "delta-v1"})
+        )
+        await server._send_overlay_boxes_coroutine(payload)
+        await server._handle_incoming_message(
+            ID_OVERLAY, negotiated, json.dumps({"type": "overlay_boxes_ack", "version": 1})
+        )
+        await server._send_overlay_boxes_coroutine(payload)
+
+        legacy_frames = [server._client_output_queues[legacy].get_nowait() for _ in range(2)]
+        negotiated_frames = [server._client_output_queues[negotiated].get_nowait() for _ in range(2)]
+        return legacy_frames, negotiated_frames
+
+    legacy_frames, negotiated_frames = asyncio.run(scenario())
+
+    assert [json.loads(frame) for frame in legacy_frames] == [payload, payload]
+    assert all(isinstance(frame, bytes) for frame in negotiated_frames)
+    decoder = OverlayBoxDecoder()
+    assert decoder.decode(negotiated_frames[0])["data"][0]["text"] == "猫"
+    assert decoder.decode(negotiated_frames[1])["version"] == 2
+    # Handshake and acks are consumed by the transport, not answered like overlay commands.
+    assert negotiated.sent == []
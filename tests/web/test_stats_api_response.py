@@ -29,6 +29,7 @@ from GameSentenceMiner.util.database.tokenization_tables import (
     WordsTable,
     setup_tokenization,
 )
+from GameSentenceMiner.util.database.word_novelty_tables import rebuild_word_novelty
 
 
 # ---------------------------------------------------------------------------
@@ -322,6 +323,8 @@ class TestStatsResponseShape:
         WordOccurrencesTable.insert_occurrence(alpha_id, "novelty-2")
         WordOccurrencesTable.insert_occurrence(beta_id, "novelty-2")
         WordOccurrencesTable.insert_occurrence(gamma_id, "novelty-2")
+        # Written around the tokenizer, so rebuild the aggregates like the daily reconcile.
+        rebuild_word_novelty(_in_memory_db)
 
         start_ts = datetime.datetime.combine(day_one, datetime.time.min).timestamp()
         end_ts = datetime.datetime.combine(day_two, datetime.time.max).timestamp()
@@ -399,6 +402,8 @@ class TestStatsResponseShape:
         WordsTable.set_first_seen_if_missing(alpha_id, timestamps["alpha"], "line-alpha")
         WordsTable.set_first_seen_if_missing(beta_id, timestamps["beta"], "line-beta")
         WordsTable.set_first_seen_if_missing(carry_id, timestamps["carry"], "line-carry")
+        # Written around the tokenizer, so rebuild the aggregates like the daily reconcile.
+        rebuild_word_novelty(_in_memory_db)
 
         start_ts = datetime.datetime.combine(target_day, datetime.time.min).timestamp()
         end_ts = datetime.datetime.combine(target_day, datetime.time.max).timestamp()
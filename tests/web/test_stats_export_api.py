@@ -436,3 +436,84 @@ def test_stats_export_job_builds_kechimochi_media_library_csv_from_games(client)
     assert planned_row["Content Type"] == "Anime"
     assert planned_row["Cover Image (Base64)"] == ""
     assert '"aniList_ID": "52991"' in planned_row["Extra Data"]
+
+
+def test_stats_export_streams_across_chunk_boundaries_in_export_order(client, monkeypatch):
+    from GameSentenceMiner.web.export import service as export_service
+
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_SIZE", 2)
+    today = datetime.date.today()
+    start = today - datetime.timedelta(days=5)
+
+    for index, title in enumerate(["Zeta", "alpha", "Mid"]):
+        GamesTable(id=f"game-{index}", title_original=title, game_type="Visual Novel").save()
+    for day in range(5):
+        for index in range(3):
+            GameDailyRollupTable(
+                date=(start + datetime.timedelta(days=day)).isoformat(),
+                game_id=f"game-{index}",
+                total_characters=100 * (day + 1),
+                total_lines=1,
+                total_reading_time_seconds=600,
+            ).save()
+    for day in (0, 2, 2, 4):
+        ThirdPartyStatsTable(
+            date=(start + datetime.timedelta(days=day)).isoformat(),
+            characters_read=50,
+            time_read_seconds=60,
+            source="mokuro",
+            label="Book",
+        ).save()
+    noon_ts = datetime.datetime.combine(today, datetime.time(hour=12)).timestamp()
+    for index in range(5):
+        GameLinesTable(
+            id=f"line-{index}",
+            game_name="Scene",
+            game_id="game-0",
+            line_text="あいう",
+            timestamp=noon_ts + index,
+            language="ja",
+        ).save()
+
+    response = client.post(
+        "/api/stats-export/jobs",
+        json={"format": "kechimochi", "scope": "all_time", "include_external_stats": True},
+    )
+    payload = _wait_for_job_completion(client, response.get_json()["job_id"])
+    assert payload["status"] == "completed"
+
+    download_response = client.get(payload["download_url"])
+    rows = _parse_csv_response(download_response)
+
+    assert len(rows) == 5 * 3 + 4 + 1
+    assert payload["row_count"] == len(rows)
+    keys = [(row["Date"], row["Log Name"].lower(), row["Activity Type"].lower()) for row in rows]
+    assert keys == sorted(keys)
+    today_row = next(row for row in rows if row["Date"] == today.isoformat())
+    assert today_row["Characters"] == "15"
+    assert payload["bytes_written"] == len(download_response.get_data())
+
+
+def test_stats_export_library_fetches_covers_in_chunks(client, monkeypatch):
+    from GameSentenceMiner.web.export import service as export_service
+
+    monkeypatch.setattr(export_service, "LIBRARY_IMAGE_CHUNK_SIZE", 2)
+    fetched_chunks = []
+    original_get_images = GamesTable.get_images_by_ids.__func__
+
+    def _recording_get_images(cls, game_ids):
+        fetched_chunks.append(list(game_ids))
+        return original_get_images(cls, game_ids)
+
+    monkeypatch.setattr(GamesTable, "get_images_by_ids", classmethod(_recording_get_images))
+    for index, title in enumerate(["delta", "Alpha", "charlie", "Bravo", "echo"]):
+        GamesTable(id=f"game-{index}", title_original=title, image=f"data:image/png;base64,Y292ZXI{index}").save()
+
+    response = client.post("/api/stats-export/jobs", json={"format": "kechimochi_library"})
+    payload = _wait_for_job_completion(client, response.get_json()["job_id"])
+    assert payload["status"] == "completed"
+
+    rows = _parse_csv_response(client.get(payload["download_url"]))
+    assert [row["Title"] for row in rows] == ["Alpha", "Bravo", "charlie", "delta", "echo"]
+    assert rows[0]["Cover Image (Base64)"] == "Y292ZXI1"
+    assert [len(chunk) for chunk in fetched_chunks] == [2, 2, 1]
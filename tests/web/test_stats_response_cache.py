@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+
+import flask
+import pytest
+
+from GameSentenceMiner.util.database.db import SQLiteDB, GameLinesTable
+from GameSentenceMiner.util.database.games_table import GamesTable
+from GameSentenceMiner.util.database.stats_rollup_table import StatsRollupTable
+from GameSentenceMiner.web import stats_response_cache as cache_mod
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_db():
+    orig_games = GamesTable._db
+    orig_lines = GameLinesTable._db
+    orig_stats = StatsRollupTable._db
+    db = SQLiteDB(":memory:")
+    GamesTable.set_db(db)
+    GameLinesTable.set_db(db)
+    StatsRollupTable.set_db(db)
+    yield db
+    db.close()
+    GamesTable._db = orig_games
+    GameLinesTable._db = orig_lines
+    StatsRollupTable._db = orig_stats
+
+
+@pytest.fixture()
+def response_cache(monkeypatch):
+    cache = cache_mod.StatsResponseCache()
+    monkeypatch.setattr(cache_mod, "stats_response_cache", cache)
+    monkeypatch.setattr(cache_mod, "MIN_COMPRESS_BYTES", 0)
+    return cache
+
+
+@pytest.fixture()
+def client(response_cache, monkeypatch):
+    monkeypatch.setattr(
+        "GameSentenceMiner.web.stats_service.get_third_party_stats_by_date",
+        lambda *_args, **_kwargs: {},
+    )
+    test_app = flask.Flask(__name__)
+    test_app.config["TESTING"] = True
+    from GameSentenceMiner.web.stats_api import register_stats_api_routes
+
+    register_stats_api_routes(test_app)
+    return test_app.test_client()
+
+
+def _save_rollup(date: datetime.date, characters: int) -> None:
+    StatsRollupTable(
+        date=date.isoformat(),
+        total_lines=1,
+        total_characters=characters,
+        total_reading_time_seconds=60.0,
+        anki_cards_created=0,
+        game_activity_data=json.dumps({}),
+        kanji_frequency_data=json.dumps({}),
+        hourly_activity_data=json.dumps({}),
+        hourly_reading_speed_data=json.dumps({}),
+        genre_activity_data=json.dumps({}),
+        type_activity_data=json.dumps({}),
+    ).save()
+
+
+def _count_range_loads(monkeypatch) -> list:
+    import GameSentenceMiner.web.stats_api as stats_api
+
+    calls = []
+    original = stats_api._load_stats_range_context
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(stats_api, "_load_stats_range_context", counting)
+    return calls
+
+
+def test_repeat_request_is_served_from_cache_until_database_changes(client, response_cache, monkeypatch):
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    _save_rollup(yesterday, 100)
+    calls = _count_range_loads(monkeypatch)
+
+    first = client.get("/api/stats/all-lines-data")
+    second = client.get("/api/stats/all-lines-data")
+
+    assert first.get_json() == second.get_json()
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert len(calls) == 1
+
+    _save_rollup(yesterday - datetime.timedelta(days=1), 50)
+    third = client.get("/api/stats/all-lines-data")
+
+    assert len(calls) == 2
+    assert [entry["characters"] for entry in third.get_json()] == [50, 100]
+    assert third.headers["ETag"] != first.headers["ETag"]
+    assert response_cache.stats()["hits"] == 1
+    assert response_cache.stats()["misses"] == 2
+
+
+def test_query_parameters_are_part_of_the_fingerprint(client, monkeypatch):
+    calls = _count_range_loads(monkeypatch)
+
+    client.get("/api/stats/all-lines-data?start=0")
+    client.get("/api/stats/all-lines-data?start=1")
+    client.get("/api/stats/all-lines-data?start=0")
+
+    assert len(calls) == 2
+
+
+def test_matching_etag_returns_not_modified(client, response_cache):
+    _save_rollup(datetime.date.today() - datetime.timedelta(days=1), 100)
+    etag = client.get("/api/stats/all-lines-data").headers["ETag"].strip('"')
+
+    resp = client.get("/api/stats/all-lines-data", headers={"If-None-Match": f'"{etag}"'})
+
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert response_cache.stats()["not_modified"] == 1
+
+
+def test_gzip_body_is_compressed_once_and_reused(client, response_cache, monkeypatch):
+    _save_rollup(datetime.date.today() - datetime.timedelta(days=1), 100)
+    compress_calls = []
+    original_compress = cache_mod._compress
+    monkeypatch.setattr(
+        cache_mod,
+        "_compress",
+        lambda body, encoding: compress_calls.append(encoding) or original_compress(body, encoding),
+    )
+
+    plain = client.get("/api/stats/all-lines-data")
+    first = client.get("/api/stats/all-lines-data", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/api/stats/all-lines-data", headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in first.headers["Vary"]
+    assert gzip.decompress(first.data) == plain.data
+    assert second.data == first.data
+    assert compress_calls == ["gzip"]
+
+
+def test_error_fallbacks_are_not_cached(client, response_cache, monkeypatch):
+    monkeypatch.setattr(
+        "GameSentenceMiner.web.stats_api._load_stats_range_context",
+        lambda *_args, **_kwargs: (_ for _ in ()).throw(RuntimeError("boom")),
+    )
+
+    assert client.get("/api/stats/all-lines-data").get_json() == []
+    assert client.get("/api/stats/all-lines-data").get_json() == []
+
+    assert response_cache.stats()["hits"] == 0
+    assert response_cache.stats()["entries"] == 0
+
+
+def test_cache_stats_endpoint_reports_counters(client):
+    client.get("/api/stats/all-lines-data")
+    client.get("/api/stats/all-lines-data")
+
+    stats = client.get("/api/stats/cache-stats").get_json()
+
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
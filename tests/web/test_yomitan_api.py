@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import flask
+import io
 import pytest
 import sys
+import zipfile
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -97,7 +99,7 @@ def test_yomitan_index_revision_changes_when_character_data_changes():
     assert first.get_json()["revision"] != second.get_json()["revision"]
 
 
-def test_notify_yomitan_character_dictionary_changed_sends_overlay_event(monkeypatch):
+def test_notify_yomitan_character_dictionary_changed_sends_overlay_event(monkeypatch, artifact_cache):
     from GameSentenceMiner.web.yomitan_api import notify_yomitan_character_dictionary_changed
 
     sent = []
@@ -119,3 +121,82 @@ def test_notify_yomitan_character_dictionary_changed_sends_overlay_event(monkeyp
             },
         )
     ]
+
+
+_CHARACTER_DATA = '{"characters":{"main":[{"id":"c1","name":"Tesuto","name_original":"テスト"}]}}'
+
+
+@pytest.fixture()
+def artifact_cache(tmp_path, monkeypatch):
+    from GameSentenceMiner.util.yomitan_dict import YomitanDictArtifactCache
+    from GameSentenceMiner.web import yomitan_api
+
+    cache = YomitanDictArtifactCache(directory=str(tmp_path / "yomitan_dict"))
+    monkeypatch.setattr(yomitan_api, "yomitan_dict_cache", cache)
+    monkeypatch.setattr(yomitan_api, "_requested_dictionary_params", set())
+    return cache
+
+
+def test_yomitan_dict_is_built_once_per_revision_and_honours_if_none_match(artifact_cache):
+    from GameSentenceMiner.web import yomitan_api
+
+    client = _create_client()
+    games = [_make_game(game_id="game-1", title="Example Game", character_data=_CHARACTER_DATA)]
+    builds = []
+    original_build = yomitan_api.build_character_dictionary_zip
+
+    def _counting_build(*args, **kwargs):
+        builds.append(args[1])
+        return original_build(*args, **kwargs)
+
+    with patch("GameSentenceMiner.web.yomitan_api.get_config", return_value=_mock_config(8123)):
+        with patch("GameSentenceMiner.web.yomitan_api.get_recent_games", return_value=games):
+            with patch("GameSentenceMiner.web.yomitan_api.build_character_dictionary_zip", side_effect=_counting_build):
+                first = client.get("/api/yomitan-dict?game_count=1&spoiler_level=0")
+                second = client.get("/api/yomitan-dict?game_count=1&spoiler_level=0")
+                etag = first.headers["ETag"]
+                not_modified = client.get(
+                    "/api/yomitan-dict?game_count=1&spoiler_level=0",
+                    headers={"If-None-Match": etag},
+                )
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert len(builds) == 1
+    assert second.headers["ETag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    stats = artifact_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["artifacts"]) == (1, 1, 1)
+
+
+def test_character_change_invalidates_and_prebuilds_requested_variants(artifact_cache, monkeypatch):
+    from GameSentenceMiner.web import yomitan_api
+
+    monkeypatch.setitem(
+        sys.modules,
+        "GameSentenceMiner.web.gsm_websocket",
+        SimpleNamespace(ID_OVERLAY="overlay", websocket_manager=SimpleNamespace(send_nowait=lambda *_: None)),
+    )
+    scheduled = []
+    monkeypatch.setattr(yomitan_api, "schedule_yomitan_dictionary_prebuild", lambda: scheduled.append(True))
+    client = _create_client()
+    games = [_make_game(game_id="game-1", title="Example Game", character_data=_CHARACTER_DATA)]
+
+    with patch("GameSentenceMiner.web.yomitan_api.get_config", return_value=_mock_config(8123)):
+        with patch("GameSentenceMiner.web.yomitan_api.get_recent_games", return_value=games):
+            client.get("/api/yomitan-dict?game_count=1&spoiler_level=0")
+            assert artifact_cache.stats()["artifacts"] == 1
+
+            games[0].vndb_character_data = _CHARACTER_DATA.replace("テスト", "テスター")
+            yomitan_api.notify_yomitan_character_dictionary_changed("test-reason", "game-1")
+            assert artifact_cache.stats()["artifacts"] == 0
+            assert scheduled == [True]
+
+            assert yomitan_api.prebuild_yomitan_dictionaries() == 1
+            response = client.get("/api/yomitan-dict?game_count=1&spoiler_level=0")
+
+    assert response.status_code == 200
+    assert artifact_cache.stats()["hits"] == 1
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert "テスター" in archive.read("term_bank_1.json").decode("utf-8")
@@ -128,7 +128,12 @@ class TestFreqIndexEndpoint:
         assert resp.status_code == 404
 
     def test_returns_json_with_cors(self, client, enabled_config):
-        with patch("GameSentenceMiner.web.yomitan_api.get_config", return_value=_mock_config()):
+        bank_cache = MagicMock()
+        bank_cache.current_revision.return_value = "3f2a9c0d1e4b5a67"
+        with (
+            patch("GameSentenceMiner.web.yomitan_api.get_config", return_value=_mock_config()),
+            patch("GameSentenceMiner.web.yomitan_api.frequency_bank_cache", bank_cache),
+        ):
             resp = client.get("/api/yomitan-freq-index")
             assert resp.status_code == 200
             assert resp.headers.get("Access-Control-Allow-Origin") == "*"
@@ -136,6 +141,7 @@ class TestFreqIndexEndpoint:
             assert data["title"] == "GSM Frequency Dictionary"
             assert data["format"] == 3
             assert data["frequencyMode"] == "occurrence-based"
+            assert data["revision"] == "3f2a9c0d1e4b5a67"
             assert data["isUpdatable"] is True
             assert "/api/yomitan-freq-dict" in data["downloadUrl"]
             assert "/api/yomitan-freq-index" in data["indexUrl"]